@@ -0,0 +1,106 @@
+# Copyright (c) Microsoft. All rights reserved.
+import asyncio
+import time
+from typing import Annotated
+
+from semantic_kernel.agents.open_ai.azure_assistant_agent import AzureAssistantAgent
+from semantic_kernel.agents.open_ai.open_ai_assistant_agent import OpenAIAssistantAgent
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.kernel import Kernel
+
+#####################################################################
+# The following sample demonstrates how to stream the response of   #
+# an OpenAI assistant. The run is consumed as an event stream, so   #
+# the text is printed as it is generated and function results are   #
+# submitted as soon as the run requires them, without polling the   #
+# run status. The time to the first token and to the end of the     #
+# response is compared with the polling invoke method.              #
+#####################################################################
+
+HOST_NAME = "Host"
+HOST_INSTRUCTIONS = "Answer questions about the menu."
+
+# Note: you may toggle this to switch between AzureOpenAI and OpenAI
+use_azure_openai = True
+
+
+# Define a sample plugin for the sample
+class MenuPlugin:
+    """A sample Menu Plugin used for the concept sample."""
+
+    @kernel_function(description="Provides a list of specials from the menu.")
+    def get_specials(self) -> Annotated[str, "Returns the specials from the menu."]:
+        return """
+        Special Soup: Clam Chowder
+        Special Salad: Cobb Salad
+        Special Drink: Chai Tea
+        """
+
+    @kernel_function(description="Provides the price of the requested menu item.")
+    def get_item_price(
+        self, menu_item: Annotated[str, "The name of the menu item."]
+    ) -> Annotated[str, "Returns the price of the menu item."]:
+        return "$9.99"
+
+
+async def invoke_agent_stream(agent: OpenAIAssistantAgent, thread_id: str, input: str) -> None:
+    """Invoke the agent with the user input and stream the response."""
+    await agent.add_chat_message(thread_id=thread_id, message=ChatMessageContent(role=AuthorRole.USER, content=input))
+
+    print(f"# {AuthorRole.USER}: '{input}'")
+
+    start = time.perf_counter()
+    first_token: float | None = None
+    messages: list[ChatMessageContent] = []
+    print(f"# {AuthorRole.ASSISTANT}: ", end="")
+    async for content in agent.invoke_stream(thread_id=thread_id, messages=messages):
+        if first_token is None:
+            first_token = time.perf_counter() - start
+        print(content.content, end="", flush=True)
+    print()
+    function_calls = sum(1 for message in messages if message.role == AuthorRole.TOOL)
+    print(
+        f"  streaming: first token after {first_token or 0:.2f}s, done after {time.perf_counter() - start:.2f}s, "
+        f"{function_calls} tool messages"
+    )
+
+
+async def invoke_agent(agent: OpenAIAssistantAgent, thread_id: str, input: str) -> None:
+    """Invoke the agent with the user input and wait for the complete response."""
+    await agent.add_chat_message(thread_id=thread_id, message=ChatMessageContent(role=AuthorRole.USER, content=input))
+
+    start = time.perf_counter()
+    async for content in agent.invoke(thread_id=thread_id):
+        if content.role != AuthorRole.TOOL:
+            print(f"# {content.role}: {content.content}")
+    print(f"  polling: done after {time.perf_counter() - start:.2f}s")
+
+
+async def main():
+    kernel = Kernel()
+    kernel.add_plugin(plugin=MenuPlugin(), plugin_name="menu")
+
+    if use_azure_openai:
+        agent = await AzureAssistantAgent.create(
+            kernel=kernel, service_id="agent", name=HOST_NAME, instructions=HOST_INSTRUCTIONS
+        )
+    else:
+        agent = await OpenAIAssistantAgent.create(
+            kernel=kernel, service_id="agent", name=HOST_NAME, instructions=HOST_INSTRUCTIONS
+        )
+
+    thread_id = await agent.create_thread()
+
+    try:
+        for input in ["What is the special soup?", "How much does it cost?"]:
+            await invoke_agent_stream(agent, thread_id=thread_id, input=input)
+            await invoke_agent(agent, thread_id=thread_id, input=input)
+    finally:
+        await agent.delete_thread(thread_id)
+        await agent.delete()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
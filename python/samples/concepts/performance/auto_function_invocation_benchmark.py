@@ -0,0 +1,167 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from semantic_kernel.connectors.ai.auto_function_invocation_loop import (
+    AutoFunctionInvocationLoop,
+    MessageCache,
+    prepare_messages_with_cache,
+)
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.connectors.ai.tool_call_scheduler import ToolCallScheduler
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.text_content import TextContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.contents.utils.finish_reason import FinishReason
+from semantic_kernel.functions import kernel_function
+from semantic_kernel.kernel import Kernel
+
+# This benchmark runs the AutoFunctionInvocationLoop, which all chat completion connectors use for
+# auto function invocation, against a fake connector. The connector answers TOOL_ROUNDS responses with
+# CALLS_PER_ROUND tool calls each and then a text answer. The first call of a round is a slow search,
+# the others are fast lookups, and the arguments of each call stream in CHUNKS_PER_CALL chunks.
+# It compares running the tool calls one at a time, concurrently, and, when streaming, concurrently while the
+# response is still streaming, which overlaps the search with the streaming of the lookups.
+# It also counts the messages the connector converts with and without the message cache of the loop,
+# with which prepare_messages_with_cache only converts the new messages of a round.
+# Replace the fake connector with a real one to measure a model, the loop does not change.
+
+TOOL_ROUNDS = 3
+CALLS_PER_ROUND = 4
+REQUEST_LATENCY = 0.05
+CHUNK_LATENCY = 0.01
+CHUNKS_PER_CALL = 4
+SEARCH_LATENCY = 0.15
+LOOKUP_LATENCY = 0.02
+HISTORY_LENGTH = 50
+
+
+class DataPlugin:
+    @kernel_function(name="search", description="Searches the documents.")
+    async def search(self, key: str) -> str:
+        await asyncio.sleep(SEARCH_LATENCY)
+        return f"documents about {key}"
+
+    @kernel_function(name="lookup", description="Looks up a value.")
+    async def lookup(self, key: str) -> str:
+        await asyncio.sleep(LOOKUP_LATENCY)
+        return f"value of {key}"
+
+
+class FakeConnector:
+    """Implements the AutoFunctionInvocationClient protocol with simulated latencies."""
+
+    def __init__(self, use_cache: bool) -> None:
+        self.use_cache = use_cache
+        self.converted_messages = 0
+
+    def _prepare_messages(self, chat_history: ChatHistory, message_cache: MessageCache | None) -> list[dict[str, Any]]:
+        def prepare_message(message: ChatMessageContent) -> dict[str, Any]:
+            self.converted_messages += 1
+            return message.to_dict()
+
+        if self.use_cache and message_cache is not None:
+            return prepare_messages_with_cache(chat_history, message_cache, prepare_message)
+        return [prepare_message(message) for message in chat_history.messages]
+
+    def _tool_calls(self, chat_history: ChatHistory) -> list[FunctionCallContent]:
+        round_index = sum(1 for message in chat_history.messages if message.role == AuthorRole.TOOL) // CALLS_PER_ROUND
+        if round_index >= TOOL_ROUNDS:
+            return []
+        return [
+            FunctionCallContent(
+                id=f"call_{round_index}_{index}",
+                index=index,
+                name="data-search" if index == 0 else "data-lookup",
+                arguments=json.dumps({"key": f"{round_index}.{index}"}),
+            )
+            for index in range(CALLS_PER_ROUND)
+        ]
+
+    async def _send_chat_request(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings, message_cache: MessageCache | None = None
+    ) -> list[ChatMessageContent]:
+        self._prepare_messages(chat_history, message_cache)
+        function_calls = self._tool_calls(chat_history)
+        await asyncio.sleep(REQUEST_LATENCY + CHUNK_LATENCY * (CHUNKS_PER_CALL * len(function_calls) + 1))
+        items: list[Any] = function_calls or [TextContent(text="done")]
+        return [ChatMessageContent(role=AuthorRole.ASSISTANT, items=items)]
+
+    async def _send_chat_streaming_request(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings, message_cache: MessageCache | None = None
+    ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
+        self._prepare_messages(chat_history, message_cache)
+        function_calls = self._tool_calls(chat_history)
+        await asyncio.sleep(REQUEST_LATENCY)
+        # the arguments of each tool call stream in CHUNKS_PER_CALL chunks, the finish reason comes last
+        for function_call in function_calls:
+            arguments = str(function_call.arguments)
+            size = -(-len(arguments) // CHUNKS_PER_CALL)
+            for start in range(0, len(arguments), size):
+                await asyncio.sleep(CHUNK_LATENCY)
+                part = FunctionCallContent(
+                    id=function_call.id if start == 0 else None,
+                    index=function_call.index,
+                    name=function_call.name if start == 0 else None,
+                    arguments=arguments[start : start + size],
+                )
+                yield [StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=0, items=[part])]
+        await asyncio.sleep(CHUNK_LATENCY)
+        yield [
+            StreamingChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                choice_index=0,
+                content=None if function_calls else "done",
+                finish_reason=FinishReason.TOOL_CALLS if function_calls else FinishReason.STOP,
+            )
+        ]
+
+
+def create_chat_history() -> ChatHistory:
+    chat_history = ChatHistory()
+    for index in range(HISTORY_LENGTH):
+        chat_history.add_user_message(f"earlier question {index}")
+        chat_history.add_assistant_message(f"earlier answer {index}")
+    chat_history.add_user_message("look up the values")
+    return chat_history
+
+
+async def measure(name: str, streaming: bool, use_cache: bool = True, **scheduler_kwargs: Any) -> None:
+    kernel = Kernel()
+    kernel.add_plugin(DataPlugin(), plugin_name="data")
+    settings = PromptExecutionSettings(
+        function_choice_behavior=FunctionChoiceBehavior.Auto(tool_call_scheduler=ToolCallScheduler(**scheduler_kwargs))
+    )
+    connector = FakeConnector(use_cache)
+    loop = AutoFunctionInvocationLoop(connector, settings, kernel)
+    chat_history = create_chat_history()
+
+    start = time.perf_counter()
+    if streaming:
+        async for _ in loop.get_streaming_chat_message_contents(chat_history):
+            pass
+    else:
+        await loop.get_chat_message_contents(chat_history)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<46} {elapsed * 1000:6.0f}ms, {connector.converted_messages:4d} messages converted")
+
+
+async def main() -> None:
+    await measure("sequential tool calls", streaming=False, max_concurrency=1)
+    await measure("concurrent tool calls, without message cache", streaming=False, use_cache=False)
+    await measure("concurrent tool calls", streaming=False)
+    await measure("streaming, sequential tool calls", streaming=True, max_concurrency=1)
+    await measure("streaming, concurrent tool calls", streaming=True)
+    await measure("streaming, dispatched while streaming", streaming=True, dispatch_while_streaming=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,52 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+from typing import Any
+
+import numpy as np
+
+from semantic_kernel.connectors.ai.embeddings.batching_embedding_generator import BatchingEmbeddingGenerator
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+
+# This benchmark simulates a local embedding model that is called by many concurrent requests with one text each,
+# as a search API does for every query. A forward pass has a fixed cost and a small cost per text,
+# and the model runs one pass at a time, so combining the calls into batches raises the throughput.
+# Replace the simulated model with a HuggingFaceTextEmbedding to measure a real model.
+
+REQUESTS = 512
+PASS_OVERHEAD = 0.004
+PER_TEXT = 0.0002
+
+
+class SimulatedLocalModel(EmbeddingGeneratorBase):
+    def model_post_init(self, __context: Any) -> None:
+        self._lock = asyncio.Lock()
+
+    async def generate_embeddings(self, texts, settings=None, **kwargs):
+        async with self._lock:
+            await asyncio.to_thread(time.sleep, PASS_OVERHEAD + PER_TEXT * len(texts))
+        return np.ones((len(texts), 384))
+
+
+async def measure(name: str, generator: EmbeddingGeneratorBase) -> None:
+    start = time.perf_counter()
+    await asyncio.gather(*(generator.generate_embeddings([f"query {index}"]) for index in range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<22} {REQUESTS / elapsed:8.0f} texts per second")
+
+
+async def main() -> None:
+    await measure("one pass per call", SimulatedLocalModel(ai_model_id="simulated"))
+    batching = BatchingEmbeddingGenerator(
+        SimulatedLocalModel(ai_model_id="simulated"), max_batch_size=64, max_wait_time=0.002
+    )
+    await measure("micro-batching", batching)
+    print(
+        f"{batching.batches} batches, {batching.average_batch_size:.1f} texts per batch, "
+        f"{batching.average_batch_latency * 1000:.1f}ms per batch"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
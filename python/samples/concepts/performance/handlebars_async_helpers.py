@@ -0,0 +1,65 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+from semantic_kernel import Kernel
+from semantic_kernel.functions import KernelArguments, kernel_function
+from semantic_kernel.prompt_template import HandlebarsPromptTemplate, PromptTemplateConfig
+
+# This benchmark renders a Handlebars template that calls three slow kernel functions.
+# By default each function call runs to completion inside the helper, one after the other,
+# blocking the event loop (nest_asyncio runs the call on the same loop, so other tasks are not
+# safely interleaved, which is why the heartbeat only runs with enable_async).
+# With enable_async the calls are resolved concurrently with await before the final render,
+# and a heartbeat task measures how long the event loop is blocked.
+
+LATENCY_SECONDS = 0.3
+TEMPLATE = "{{lookup-weather city='Paris'}} {{lookup-weather city='London'}} {{lookup-weather city='Rome'}}"
+
+
+class LookupPlugin:
+    @kernel_function(name="weather")
+    async def weather(self, city: str) -> str:
+        await asyncio.sleep(LATENCY_SECONDS)
+        return f"{city}: sunny"
+
+
+async def heartbeat(stop: asyncio.Event) -> float:
+    """Return the longest gap between two ticks of the event loop."""
+    longest = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.01)
+        now = time.perf_counter()
+        longest = max(longest, now - last)
+        last = now
+    return longest
+
+
+async def run(kernel: Kernel, enable_async: bool) -> None:
+    template = HandlebarsPromptTemplate(
+        prompt_template_config=PromptTemplateConfig(template=TEMPLATE, template_format="handlebars"),
+        enable_async=enable_async,
+    )
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(heartbeat(stop)) if enable_async else None
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    rendered = await template.render(kernel, KernelArguments())
+    elapsed = time.perf_counter() - start
+    stop.set()
+    print(f"enable_async={enable_async!s:<5} rendered in {elapsed:.2f}s: {rendered}")
+    if monitor:
+        print(f"{'':<19}loop blocked up to {await monitor:.3f}s")
+
+
+async def main() -> None:
+    kernel = Kernel()
+    kernel.add_plugin(LookupPlugin(), "lookup")
+    await run(kernel, enable_async=False)
+    await run(kernel, enable_async=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+import httpx
+from aiohttp import web
+
+from semantic_kernel import Kernel
+from semantic_kernel.core_plugins.http_plugin import HttpPlugin
+
+# This benchmark compares a new http client per request, as the HttpPlugin and the OpenAPI runner do without a pool,
+# with the pooled client of the kernel that keeps the connection alive between requests.
+# The OpenAPI plugins added to a kernel use its pool, the HttpPlugin uses it when it is passed in.
+# It runs against a local server, so the difference is the connection setup only, without TLS.
+
+REQUESTS = 300
+
+
+async def handler(request: web.Request) -> web.Response:
+    return web.Response(text="ok")
+
+
+async def main() -> None:
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"  # type: ignore
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        async with httpx.AsyncClient() as client:
+            (await client.get(url)).raise_for_status()
+    print(f"{'new client per request':<25} {(time.perf_counter() - start) / REQUESTS * 1000:.2f}ms per request")
+
+    async with Kernel() as kernel:
+        plugin = HttpPlugin(http_client_pool=kernel.http_client_pool)
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            await plugin.get(url)
+        print(f"{'pooled client':<25} {(time.perf_counter() - start) / REQUESTS * 1000:.2f}ms per request")
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+from semantic_kernel.connectors.ai.hugging_face import HuggingFaceInferenceExecutor, HuggingFaceTextEmbedding
+
+# This benchmark shows how long the event loop is blocked while a local Hugging Face model runs.
+# Calling the model on the event loop, as the services used to do, stalls every other coroutine
+# for the duration of the inference, the services now run the model on the threads of an inference executor.
+# The model is downloaded from the Hugging Face model hub on the first run.
+
+MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+REQUESTS = 8
+TEXTS = [f"This is sentence number {index} of the benchmark." for index in range(256)]
+
+
+async def heartbeat(stop: asyncio.Event, delays: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.005)
+        delays.append(time.perf_counter() - start - 0.005)
+
+
+async def measure(name: str, requests) -> None:
+    stop = asyncio.Event()
+    delays: list[float] = []
+    beat = asyncio.create_task(heartbeat(stop, delays))
+    start = time.perf_counter()
+    await asyncio.gather(*requests)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    print(f"{name:<22} {elapsed * 1000:.0f}ms, longest event loop stall {max(delays, default=0) * 1000:.0f}ms")
+
+
+async def main() -> None:
+    service = HuggingFaceTextEmbedding(ai_model_id=MODEL, executor=HuggingFaceInferenceExecutor(max_workers=2))
+    await service.generate_embeddings(TEXTS[:1])
+
+    async def on_the_loop():
+        return service.generator.encode(sentences=TEXTS, convert_to_numpy=True)
+
+    await measure("encode on the loop", [on_the_loop() for _ in range(REQUESTS)])
+    await measure("inference executor", [service.generate_embeddings(TEXTS) for _ in range(REQUESTS)])
+    service.executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
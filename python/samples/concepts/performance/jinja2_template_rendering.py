@@ -0,0 +1,54 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+from semantic_kernel import Kernel
+from semantic_kernel.functions import KernelArguments, KernelPlugin, kernel_function
+from semantic_kernel.prompt_template import Jinja2PromptTemplate, PromptTemplateConfig
+
+# This benchmark shows the cost of rendering a Jinja2 prompt template with a kernel that has many plugins.
+# The first render compiles the template and creates the helpers for the functions of the kernel,
+# the following renders reuse both and only bind the arguments.
+
+PLUGINS = 40
+FUNCTIONS_PER_PLUGIN = 5
+RENDERS = 1_000
+
+TEMPLATE = """You are a helpful assistant.
+{% for item in items %}- {{ item }}
+{% endfor %}The answer is {{ plugin_0_function_0(value=question) }}."""
+
+
+def create_plugin(index: int) -> KernelPlugin:
+    functions = []
+    for function_index in range(FUNCTIONS_PER_PLUGIN):
+
+        @kernel_function(name=f"function_{function_index}")
+        def function(value: str) -> str:
+            return value.upper()
+
+        functions.append(function)
+    return KernelPlugin(name=f"plugin_{index}", functions=functions)
+
+
+async def main() -> None:
+    kernel = Kernel()
+    kernel.add_plugins([create_plugin(index) for index in range(PLUGINS)])
+    template = Jinja2PromptTemplate(
+        prompt_template_config=PromptTemplateConfig(template=TEMPLATE, template_format="jinja2")
+    )
+    arguments = KernelArguments(items=["one", "two", "three"], question="forty-two")
+
+    start = time.perf_counter()
+    await template.render(kernel, arguments)
+    print(f"first render:      {(time.perf_counter() - start) * 1000:.2f}ms")
+
+    start = time.perf_counter()
+    for _ in range(RENDERS):
+        await template.render(kernel, arguments)
+    print(f"following renders: {(time.perf_counter() - start) / RENDERS * 1000:.3f}ms per render")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+from semantic_kernel import Kernel
+from semantic_kernel.functions import KernelArguments, kernel_function
+from semantic_kernel.prompt_template import KernelPromptTemplate, PromptTemplateConfig
+
+# This benchmark renders a prompt template with three independent function calls that each take a while.
+# By default the code blocks are rendered one after the other, so the render takes the sum of the latencies,
+# with enable_concurrent_rendering they run at the same time and the render takes the longest latency.
+
+TEMPLATE = """Search results: {{search.web $query}}
+Memories: {{memory.recall $query}}
+Current time: {{time.now}}"""
+
+
+class SearchPlugin:
+    @kernel_function(name="web")
+    async def web(self, query: str) -> str:
+        await asyncio.sleep(0.3)
+        return f"web results for {query}"
+
+
+class MemoryPlugin:
+    @kernel_function(name="recall")
+    async def recall(self, query: str) -> str:
+        await asyncio.sleep(0.2)
+        return f"memories about {query}"
+
+
+class TimePlugin:
+    @kernel_function(name="now")
+    async def now(self) -> str:
+        await asyncio.sleep(0.1)
+        return "noon"
+
+
+async def main() -> None:
+    kernel = Kernel()
+    kernel.add_plugin(SearchPlugin(), "search")
+    kernel.add_plugin(MemoryPlugin(), "memory")
+    kernel.add_plugin(TimePlugin(), "time")
+    arguments = KernelArguments(query="semantic kernel")
+
+    for enable_concurrent_rendering in (False, True):
+        template = KernelPromptTemplate(
+            prompt_template_config=PromptTemplateConfig(template=TEMPLATE),
+            enable_concurrent_rendering=enable_concurrent_rendering,
+        )
+        start = time.perf_counter()
+        await template.render(kernel, arguments)
+        elapsed = time.perf_counter() - start
+        print(f"enable_concurrent_rendering={enable_concurrent_rendering!s:<5} rendered in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import base64
+import json
+import time
+from functools import cache
+
+import numpy as np
+from aiohttp import web
+from openai import AsyncOpenAI
+
+from semantic_kernel.connectors.ai.open_ai import OpenAITextEmbedding
+
+# This benchmark compares the client CPU time of decoding embeddings received as JSON floats,
+# as base64 that the openai package converts back to lists (its default when numpy is installed),
+# and as base64 that OpenAITextEmbedding decodes into a single float32 matrix (binary_embeddings=True).
+# It runs against a local stub of the OpenAI embeddings endpoint that returns pre-serialized responses,
+# so no API key or network access is needed and the time is spent almost entirely on the client.
+
+DIMENSIONS = 3072
+TEXTS = [f"chunk number {i}" for i in range(512)]
+BATCH_SIZE = 128
+ROUNDS = 2
+
+
+@cache
+def response_body(count: int, encoding_format: str) -> bytes:
+    rng = np.random.default_rng(0)
+    rows = rng.standard_normal((count, DIMENSIONS)).astype("<f4")
+    data = [
+        {
+            "object": "embedding",
+            "index": index,
+            "embedding": base64.b64encode(row.tobytes()).decode() if encoding_format == "base64" else row.tolist(),
+        }
+        for index, row in enumerate(rows)
+    ]
+    usage = {"prompt_tokens": count, "total_tokens": count}
+    return json.dumps({"object": "list", "model": "stub", "data": data, "usage": usage}).encode()
+
+
+async def embeddings_handler(request: web.Request) -> web.Response:
+    body = await request.json()
+    encoding_format = body.get("encoding_format") or "float"
+    return web.Response(body=response_body(len(body["input"]), encoding_format), content_type="application/json")
+
+
+async def run(service: OpenAITextEmbedding, label: str, **kwargs) -> None:
+    # warm up the stub cache, so only the client work is measured
+    await service.generate_embeddings(TEXTS[:BATCH_SIZE], batch_size=BATCH_SIZE, **kwargs)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        embeddings = await service.generate_embeddings(TEXTS, batch_size=BATCH_SIZE, **kwargs)
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    print(f"{label:<40} {embeddings.shape} {embeddings.dtype} in {elapsed:.2f}s")
+
+
+async def main() -> None:
+    app = web.Application(client_max_size=1024**3)
+    app.router.add_post("/v1/embeddings", embeddings_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+
+    client = AsyncOpenAI(api_key="stub", base_url=f"http://127.0.0.1:{port}/v1")
+    service = OpenAITextEmbedding(ai_model_id="text-embedding-3-large", async_client=client)
+    try:
+        await run(service, "JSON floats", encoding_format="float")
+        await run(service, "base64, converted to lists")
+        service.binary_embeddings = True
+        await run(service, "base64, decoded into a float32 matrix")
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
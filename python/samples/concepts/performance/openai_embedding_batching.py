@@ -0,0 +1,67 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+from aiohttp import web
+from openai import AsyncOpenAI
+
+from semantic_kernel.connectors.ai.open_ai import OpenAITextEmbedding
+from semantic_kernel.utils.rate_limiter import RateLimiter
+
+# This benchmark compares sending embedding batches one after another with sending them concurrently.
+# It runs against a local stub of the OpenAI embeddings endpoint that answers after a fixed latency,
+# so no API key or network access is needed.
+
+LATENCY_SECONDS = 0.2
+DIMENSIONS = 64
+TEXTS = [f"chunk number {i}" for i in range(2_000)]
+BATCH_SIZE = 50
+
+
+async def embeddings_handler(request: web.Request) -> web.Response:
+    body = await request.json()
+    await asyncio.sleep(LATENCY_SECONDS)
+    return web.json_response({
+        "object": "list",
+        "model": body["model"],
+        "data": [
+            {"object": "embedding", "index": index, "embedding": [0.1] * DIMENSIONS}
+            for index in range(len(body["input"]))
+        ],
+        "usage": {"prompt_tokens": len(body["input"]), "total_tokens": len(body["input"])},
+    })
+
+
+async def run(service: OpenAITextEmbedding, label: str) -> None:
+    start = time.perf_counter()
+    embeddings = await service.generate_raw_embeddings(TEXTS, batch_size=BATCH_SIZE)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {len(embeddings)} embeddings in {elapsed:.2f}s")
+
+
+async def main() -> None:
+    app = web.Application()
+    app.router.add_post("/v1/embeddings", embeddings_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+
+    client = AsyncOpenAI(api_key="stub", base_url=f"http://127.0.0.1:{port}/v1")
+    service = OpenAITextEmbedding(ai_model_id="text-embedding-3-small", async_client=client)
+    try:
+        await run(service, "serial batches")
+        for concurrency in (4, 16):
+            service.max_concurrent_requests = concurrency
+            await run(service, f"{concurrency} concurrent batches")
+        service.rate_limiter = RateLimiter(requests_per_minute=1_200)
+        await run(service, "16 concurrent batches, 1200 RPM budget")
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
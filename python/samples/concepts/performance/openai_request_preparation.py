@@ -0,0 +1,61 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+from semantic_kernel import Kernel
+from semantic_kernel.connectors.ai.auto_function_invocation_loop import MessageCache
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion, OpenAIChatPromptExecutionSettings
+from semantic_kernel.contents import ChatHistory
+from semantic_kernel.functions import KernelPlugin, kernel_function
+
+# This benchmark measures the time spent preparing the request payload in each round of auto function invocation,
+# with a long chat history and 60 functions. Without a message cache and with fresh settings every message and tool
+# is serialized again. Within a run of auto function invocation the service passes the message cache of the run
+# and reuses the settings, so only the new messages are serialized and the tools are reused.
+# No request is sent, so no API key is needed.
+
+ROUNDS = 50
+
+
+def create_plugin(index: int) -> KernelPlugin:
+    functions = []
+    for function_index in range(6):
+
+        @kernel_function(name=f"function_{function_index}", description="Looks something up.")
+        def function(query: str, limit: int = 3, tags: list[str] | None = None) -> str:
+            return query
+
+        functions.append(function)
+    return KernelPlugin(name=f"plugin_{index}", functions=functions)
+
+
+def run(label: str, service: OpenAIChatCompletion, kernel: Kernel, reuse: bool) -> None:
+    chat_history = ChatHistory()
+    for index in range(200):
+        chat_history.add_user_message(f"question {index} " * 20)
+        chat_history.add_assistant_message(f"answer {index} " * 20)
+    settings = OpenAIChatPromptExecutionSettings(function_choice_behavior=FunctionChoiceBehavior.Auto())
+    message_cache: MessageCache = {}
+    start = time.perf_counter()
+    for index in range(ROUNDS):
+        if not reuse:
+            message_cache = {}
+            settings = OpenAIChatPromptExecutionSettings(function_choice_behavior=FunctionChoiceBehavior.Auto())
+        chat_history.add_assistant_message(f"tool round {index}")
+        service._update_settings(settings, chat_history, kernel=kernel, message_cache=message_cache)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20} {elapsed / ROUNDS * 1000:.2f}ms per round")
+
+
+async def main() -> None:
+    kernel = Kernel()
+    kernel.add_plugins([create_plugin(index) for index in range(10)])
+    service = OpenAIChatCompletion(ai_model_id="gpt-4o", api_key="not-used")
+    run("without reuse", service, kernel, reuse=False)
+    run("with reuse", service, kernel, reuse=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
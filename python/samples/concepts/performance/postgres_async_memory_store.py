@@ -0,0 +1,82 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+import numpy as np
+
+from semantic_kernel.connectors.memory.postgres import AsyncPostgresMemoryStore, PostgresMemoryStore
+from semantic_kernel.memory.memory_record import MemoryRecord
+
+# This benchmark compares the PostgresMemoryStore, which blocks the event loop on every query,
+# with the AsyncPostgresMemoryStore, which runs the queries on an async connection pool.
+# It needs a Postgres database with the pgvector extension,
+# set POSTGRES_CONNECTION_STRING in the environment or in a .env file.
+#
+# While the queries run, a heartbeat task measures how long the event loop is blocked,
+# with the async store the concurrent queries overlap and the heartbeat keeps ticking.
+
+DIMENSIONS = 256
+RECORDS = 20_000
+QUERIES = 32
+COLLECTION = "performance_sample"
+
+
+def create_records() -> list[MemoryRecord]:
+    rng = np.random.default_rng(42)
+    return [
+        MemoryRecord.local_record(
+            id=f"record-{index}",
+            text=f"text {index}",
+            description=None,
+            additional_metadata=None,
+            embedding=rng.random(DIMENSIONS),
+        )
+        for index in range(RECORDS)
+    ]
+
+
+async def heartbeat(stop: asyncio.Event, delays: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.005)
+        delays.append(time.perf_counter() - start - 0.005)
+
+
+async def run_queries(store: PostgresMemoryStore | AsyncPostgresMemoryStore, name: str) -> None:
+    rng = np.random.default_rng(7)
+    stop = asyncio.Event()
+    delays: list[float] = []
+    beat = asyncio.create_task(heartbeat(stop, delays))
+    start = time.perf_counter()
+    await asyncio.gather(*(store.get_nearest_matches(COLLECTION, rng.random(DIMENSIONS), 10) for _ in range(QUERIES)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    print(
+        f"{name:<28} {QUERIES} concurrent queries in {elapsed * 1000:.0f}ms, "
+        f"longest event loop stall {max(delays, default=0) * 1000:.0f}ms"
+    )
+
+
+async def main() -> None:
+    records = create_records()
+    async with AsyncPostgresMemoryStore(
+        connection_string=None, default_dimensionality=DIMENSIONS, min_pool=1, max_pool=8
+    ) as store:  # type: ignore
+        await store.delete_collection(COLLECTION)
+        await store.create_collection(COLLECTION)
+        start = time.perf_counter()
+        await store.upsert_batch(COLLECTION, records)
+        print(f"{'COPY upsert_batch':<28} {RECORDS} records in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+        sync_store = PostgresMemoryStore(
+            connection_string=None, default_dimensionality=DIMENSIONS, min_pool=1, max_pool=8
+        )  # type: ignore
+        await run_queries(sync_store, "PostgresMemoryStore")
+        await run_queries(store, "AsyncPostgresMemoryStore")
+        await store.delete_collection(COLLECTION)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import os
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from redis.asyncio.client import Redis
+
+from semantic_kernel.connectors.memory.redis.redis_collection import RedisHashsetCollection
+from semantic_kernel.data.vector_store_model_definition import VectorStoreRecordDefinition
+from semantic_kernel.data.vector_store_record_fields import (
+    VectorStoreRecordDataField,
+    VectorStoreRecordKeyField,
+    VectorStoreRecordVectorField,
+)
+
+# This benchmark compares the bulk upsert and get of a RedisHashsetCollection, which now sends the commands
+# in chunked pipelines, with the previous approach of one hset/hgetall per record through asyncio.gather.
+# It uses the Redis server in REDIS_CONNECTION_STRING (for instance a redis/redis-stack container),
+# or an in-process fakeredis server (pip install fakeredis), which has no network round trips,
+# so the difference against a real server is larger than the one shown with fakeredis.
+
+RECORDS = 10_000
+DIMENSIONS = 384
+
+definition = VectorStoreRecordDefinition(
+    fields={
+        "id": VectorStoreRecordKeyField(),
+        "content": VectorStoreRecordDataField(has_embedding=True, embedding_property_name="vector"),
+        "vector": VectorStoreRecordVectorField(dimensions=DIMENSIONS),
+    }
+)
+
+
+class GatherHashsetCollection(RedisHashsetCollection):
+    """The collection as it was: one command per record, sent concurrently with asyncio.gather."""
+
+    async def _inner_upsert(self, records: Sequence[Any], **kwargs: Any) -> Sequence[str]:
+        await asyncio.gather(*[self.redis_database.hset(**record) for record in records])
+        return [self._unget_redis_key(record["name"]) for record in records]
+
+    async def _inner_get(self, keys: Sequence[str], **kwargs: Any) -> Sequence[dict[bytes, bytes]] | None:
+        results = await asyncio.gather(*[self.redis_database.hgetall(self._get_redis_key(key)) for key in keys])
+        return [result for result in results if result]
+
+
+def get_redis() -> Redis:
+    if connection_string := os.getenv("REDIS_CONNECTION_STRING"):
+        return Redis.from_url(connection_string)
+    from fakeredis import FakeAsyncRedis
+
+    return FakeAsyncRedis()
+
+
+async def run(name: str, collection: RedisHashsetCollection, records: list[dict[str, Any]]) -> None:
+    keys = [record["id"] for record in records]
+    start = time.perf_counter()
+    await collection.upsert_batch(records)
+    upserted = time.perf_counter()
+    results = await collection.get_batch(keys)
+    got = time.perf_counter()
+    await collection.delete_batch(keys)
+    assert len(results) == RECORDS  # nosec
+    print(f"{name:<28} upsert {(upserted - start) * 1000:8.1f}ms  get {(got - upserted) * 1000:8.1f}ms")
+
+
+async def main():
+    redis = get_redis()
+    vectors = np.random.default_rng(0).random((RECORDS, DIMENSIONS)).tolist()
+    records = [{"id": f"doc{i}", "content": f"content {i}", "vector": vectors[i]} for i in range(RECORDS)]
+
+    for name, collection in [
+        ("gather per record", GatherHashsetCollection),
+        ("pipelined", RedisHashsetCollection),
+    ]:
+        await run(
+            name,
+            collection(
+                data_model_type=dict,
+                data_model_definition=definition,
+                collection_name="bench",
+                redis_database=redis,
+                prefix_collection_name_to_key_names=True,
+            ),
+            records,
+        )
+    await run(
+        "pipelined, transactional",
+        RedisHashsetCollection(
+            data_model_type=dict,
+            data_model_definition=definition,
+            collection_name="bench",
+            redis_database=redis,
+            prefix_collection_name_to_key_names=True,
+            pipeline_transaction=True,
+        ),
+        records,
+    )
+    await redis.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
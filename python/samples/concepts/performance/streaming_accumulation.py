@@ -0,0 +1,60 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+from functools import reduce
+
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.streaming_content_accumulator import StreamingContentAccumulator
+from semantic_kernel.contents.utils.author_role import AuthorRole
+
+# This benchmark compares combining streaming chunks with `+` (which re-merges every item for every chunk)
+# with the StreamingContentAccumulator, which joins the text and argument fragments once at the end.
+# The chunks look like a streamed response with some text followed by a tool call with long arguments.
+
+
+def make_chunks(count: int) -> list[StreamingChatMessageContent]:
+    half = count // 2
+    chunks = [
+        StreamingChatMessageContent(choice_index=0, role=AuthorRole.ASSISTANT, content=f"token {i} ")
+        for i in range(half)
+    ]
+    chunks.append(
+        StreamingChatMessageContent(
+            choice_index=0,
+            role=AuthorRole.ASSISTANT,
+            items=[FunctionCallContent(id="call_1", index=0, name="plugin-function", arguments='{"text": "')],
+        )
+    )
+    chunks.extend(
+        StreamingChatMessageContent(
+            choice_index=0, role=AuthorRole.ASSISTANT, items=[FunctionCallContent(index=0, arguments=f"word{i} ")]
+        )
+        for i in range(count - half - 2)
+    )
+    chunks.append(
+        StreamingChatMessageContent(
+            choice_index=0, role=AuthorRole.ASSISTANT, items=[FunctionCallContent(index=0, arguments='"}')]
+        )
+    )
+    return chunks
+
+
+def timed(label: str, count: int, combine) -> float:
+    chunks = make_chunks(count)
+    start = time.perf_counter()
+    combine(chunks)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<14} {count:>6} chunks in {elapsed * 1000:9.1f}ms ({elapsed / count * 1e6:7.1f}us per chunk)")
+    return elapsed
+
+
+async def main() -> None:
+    for count in (250, 500, 1_000, 2_000):
+        timed("reduce(+)", count, lambda chunks: reduce(lambda x, y: x + y, chunks))
+        timed("accumulator", count, StreamingContentAccumulator.combine)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pyarrow as pa
+
+from semantic_kernel.connectors.memory.usearch import USearchMemoryStore
+from semantic_kernel.connectors.memory.usearch.usearch_memory_store import (
+    _embeddings_data_schema,
+    memoryrecords_to_pyarrow_table,
+    pyarrow_table_to_memoryrecords,
+)
+from semantic_kernel.memory.memory_record import MemoryRecord
+
+# This benchmark compares the row-wise conversions between MemoryRecords and Arrow tables that the
+# USearchMemoryStore used (pandas iterrows and from_pylist), with the column-wise conversions,
+# and the time to open a persisted store with and without memory-mapping its files.
+
+RECORDS = 20_000
+DIMENSIONS = 384
+
+
+def rowwise_to_table(records: list[MemoryRecord]) -> pa.Table:
+    rows = [{attr: getattr(record, "_" + attr) for attr in _embeddings_data_schema.names} for record in records]
+    return pa.Table.from_pylist(rows, schema=_embeddings_data_schema)
+
+
+def rowwise_to_records(table: pa.Table, vectors: np.ndarray) -> list[MemoryRecord]:
+    return [MemoryRecord(**row.to_dict(), embedding=vectors[index]) for index, row in table.to_pandas().iterrows()]
+
+
+def timed(name: str, func, *args) -> None:
+    start = time.perf_counter()
+    func(*args)
+    print(f"{name:<36} {(time.perf_counter() - start) * 1000:8.1f}ms")
+
+
+async def main() -> None:
+    rng = np.random.default_rng(42)
+    vectors = rng.random((RECORDS, DIMENSIONS), dtype=np.float32)
+    records = [
+        MemoryRecord.local_record(
+            id=f"record-{index}",
+            text=f"text {index}",
+            description="description",
+            additional_metadata="metadata",
+            embedding=vectors[index],
+            timestamp=datetime.now(),
+        )
+        for index in range(RECORDS)
+    ]
+    table = memoryrecords_to_pyarrow_table(records)
+
+    timed("records to table, row-wise", rowwise_to_table, records)
+    timed("records to table, column-wise", memoryrecords_to_pyarrow_table, records)
+    timed("table to records, row-wise", rowwise_to_records, table, vectors)
+    timed("table to records, column-wise", pyarrow_table_to_memoryrecords, table, vectors)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = USearchMemoryStore(directory)
+        await store.create_collection("benchmark", ndim=DIMENSIONS)
+        await store.upsert_batch("benchmark", records)
+        start = time.perf_counter()
+        await store.get_nearest_matches("benchmark", vectors[0], limit=1000)
+        print(f"{'get_nearest_matches, limit 1000':<36} {(time.perf_counter() - start) * 1000:8.1f}ms")
+        await store.close()
+
+        for memory_map in (False, True):
+            start = time.perf_counter()
+            store = USearchMemoryStore(directory, memory_map=memory_map)
+            print(f"{f'open store, memory_map={memory_map}':<36} {(time.perf_counter() - start) * 1000:8.1f}ms")
+            await store.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
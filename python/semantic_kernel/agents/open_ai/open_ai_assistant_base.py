@@ -13,13 +13,15 @@ from openai.resources.beta.threads.runs.runs import Run
 from openai.types.beta import AssistantResponseFormat
 from openai.types.beta.assistant_tool import CodeInterpreterTool, FileSearchTool
 from openai.types.beta.threads.image_file_content_block import ImageFileContentBlock
-from openai.types.beta.threads.runs import RunStep
+from openai.types.beta.threads.message_delta_event import MessageDeltaEvent
+from openai.types.beta.threads.runs import RunStep, RunStepDeltaEvent
 from openai.types.beta.threads.text_content_block import TextContentBlock
 from pydantic import Field
 
 from semantic_kernel.agents.agent import Agent
 from semantic_kernel.agents.open_ai.run_polling_options import RunPollingOptions
 from semantic_kernel.connectors.ai.function_calling_utils import kernel_function_metadata_to_function_call_format
+from semantic_kernel.connectors.ai.tool_call_scheduler import ToolCallScheduler
 from semantic_kernel.contents.annotation_content import AnnotationContent
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
@@ -27,6 +29,8 @@ from semantic_kernel.contents.file_reference_content import FileReferenceContent
 from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.function_result_content import FunctionResultContent
 from semantic_kernel.contents.image_content import ImageContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.streaming_text_content import StreamingTextContent
 from semantic_kernel.contents.text_content import TextContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
 from semantic_kernel.exceptions.agent_exceptions import (
@@ -36,6 +40,7 @@ from semantic_kernel.exceptions.agent_exceptions import (
     AgentInvokeError,
 )
 from semantic_kernel.utils.experimental_decorator import experimental_class
+from semantic_kernel.utils.ttl_cache import TTLCache
 
 if TYPE_CHECKING:
     from openai.types.beta.threads.annotation import Annotation
@@ -72,10 +77,18 @@ class OpenAIAssistantBase(Agent):
     max_prompt_tokens: int | None = Field(None)
     parallel_tool_calls_enabled: bool | None = Field(True)
     truncation_message_count: int | None = Field(None)
+    assistant_cache: TTLCache[str, Assistant] = Field(default_factory=TTLCache, exclude=True)
+    tool_call_scheduler: ToolCallScheduler = Field(default_factory=ToolCallScheduler)
 
     allowed_message_roles: ClassVar[list[str]] = [AuthorRole.USER, AuthorRole.ASSISTANT]
     polling_status: ClassVar[list[str]] = ["queued", "in_progress", "cancelling"]
     error_message_states: ClassVar[list[str]] = ["failed", "canceled", "expired"]
+    error_stream_events: ClassVar[list[str]] = [
+        "thread.run.failed",
+        "thread.run.cancelled",
+        "thread.run.expired",
+        "thread.run.incomplete",
+    ]
 
     _is_deleted: bool = False
 
@@ -104,6 +117,7 @@ class OpenAIAssistantBase(Agent):
         max_prompt_tokens: int | None = None,
         parallel_tool_calls_enabled: bool | None = True,
         truncation_message_count: int | None = None,
+        assistant_cache: TTLCache[str, Assistant] | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize an OpenAIAssistant Base.
@@ -130,6 +144,8 @@ class OpenAIAssistantBase(Agent):
             max_prompt_tokens (int): The max prompt tokens. Defaults to None. (optional)
             parallel_tool_calls_enabled (bool): Enable parallel tool calls. Defaults to True. (optional)
             truncation_message_count (int): The truncation message count. Defaults to None. (optional)
+            assistant_cache (TTLCache[str, Assistant]): The cache of the assistants that created the thread
+                messages, it can be shared by agents. Defaults to a cache of the agent. (optional)
             kwargs (Any): The keyword arguments.
         """
         args: dict[str, Any] = {}
@@ -160,6 +176,8 @@ class OpenAIAssistantBase(Agent):
             args["id"] = id
         if kernel is not None:
             args["kernel"] = kernel
+        if assistant_cache is not None:
+            args["assistant_cache"] = assistant_cache
         if kwargs:
             args.update(kwargs)
 
@@ -477,31 +495,47 @@ class OpenAIAssistantBase(Agent):
             metadata=metadata,
         )
 
-    async def get_thread_messages(self, thread_id: str) -> AsyncIterable[ChatMessageContent]:
-        """Get the messages for the specified thread.
+    async def get_thread_messages(self, thread_id: str, page_size: int = 100) -> AsyncIterable[ChatMessageContent]:
+        """Get the messages for the specified thread, newest first.
+
+        All pages of the thread are read, the next page is requested while the current page is consumed.
+        The names of the assistants that created the messages are looked up in the assistant cache.
 
         Args:
             thread_id (str): The thread id.
+            page_size (int): The number of messages requested per page, at most 100. Defaults to 100. (optional)
 
         Yields:
             ChatMessageContent: The chat message.
         """
-        agent_names: dict[str, Any] = {}
-
-        thread_messages = await self.client.beta.threads.messages.list(thread_id=thread_id, limit=100, order="desc")
-        for message in thread_messages.data:
-            assistant_name = None
-            if message.assistant_id and message.assistant_id not in agent_names:
-                agent = await self.client.beta.assistants.retrieve(message.assistant_id)
-                if agent.name:
-                    agent_names[message.assistant_id] = agent.name
-            assistant_name = agent_names.get(message.assistant_id) if message.assistant_id else message.assistant_id
-            assistant_name = assistant_name or message.assistant_id
+        next_page: "asyncio.Future[Any] | None" = None
+        try:
+            page = await self.client.beta.threads.messages.list(thread_id=thread_id, limit=page_size, order="desc")
+            while True:
+                if self._has_more_messages(page, page_size):
+                    next_page = asyncio.ensure_future(
+                        self.client.beta.threads.messages.list(
+                            thread_id=thread_id, limit=page_size, order="desc", after=page.data[-1].id
+                        )
+                    )
+                for message in page.data:
+                    assistant_name = (
+                        await self._get_assistant_name(message.assistant_id)
+                        if message.assistant_id
+                        else message.assistant_id
+                    )
 
-            content: ChatMessageContent = self._generate_message_content(str(assistant_name), message)
+                    content: ChatMessageContent = self._generate_message_content(str(assistant_name), message)
 
-            if len(content.items) > 0:
-                yield content
+                    if len(content.items) > 0:
+                        yield content
+                if next_page is None:
+                    break
+                page = await next_page
+                next_page = None
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
     # region Agent Invoke Methods
 
@@ -705,6 +739,135 @@ class OpenAIAssistantBase(Agent):
                             yield True, content
                 processed_step_ids.add(completed_step.id)
 
+    async def invoke_stream(
+        self,
+        thread_id: str,
+        *,
+        messages: list[ChatMessageContent] | None = None,
+        ai_model_id: str | None = None,
+        enable_code_interpreter: bool | None = False,
+        enable_file_search: bool | None = False,
+        enable_json_response: bool | None = None,
+        max_completion_tokens: int | None = None,
+        max_prompt_tokens: int | None = None,
+        parallel_tool_calls_enabled: bool | None = True,
+        truncation_message_count: int | None = None,
+        temperature: float | None = None,
+        top_p: float | None = None,
+        metadata: dict[str, str] | None = {},
+        **kwargs: Any,
+    ) -> AsyncIterable[StreamingChatMessageContent]:
+        """Invoke the chat assistant and stream the response as it is generated.
+
+        The run is created as an event stream instead of being polled: text and code interpreter input
+        are yielded as they arrive, and the outputs of function calls are submitted as soon as the run
+        requires them, which continues the run on a new event stream.
+
+        The supplied arguments will take precedence over the specified assistant level attributes.
+
+        Args:
+            thread_id (str): The thread id.
+            messages (list[ChatMessageContent]): A list the complete messages of the run are added to,
+                including the function calls and results. Defaults to None. (optional)
+            ai_model_id (str): The AI model id. Defaults to None. (optional)
+            enable_code_interpreter (bool): Enable code interpreter. Defaults to False. (optional)
+            enable_file_search (bool): Enable file search. Defaults to False. (optional)
+            enable_json_response (bool): Enable JSON response. Defaults to False. (optional)
+            max_completion_tokens (int): The max completion tokens. Defaults to None. (optional)
+            max_prompt_tokens (int): The max prompt tokens. Defaults to None. (optional)
+            parallel_tool_calls_enabled (bool): Enable parallel tool calls. Defaults to True. (optional)
+            truncation_message_count (int): The truncation message count. Defaults to None. (optional)
+            temperature (float): The temperature. Defaults to None. (optional)
+            top_p (float): The top p. Defaults to None. (optional)
+            metadata (dict[str, str]): The metadata. Defaults to {}. (optional)
+            kwargs (Any): Extra keyword arguments.
+
+        Yields:
+            StreamingChatMessageContent: The streaming chat message content.
+        """
+        if not self.assistant:
+            raise AgentInitializationError("The assistant has not been created.")
+
+        self._check_if_deleted()
+        tools = self._get_tools()
+
+        run_options = self._generate_options(
+            ai_model_id=ai_model_id,
+            enable_code_interpreter=enable_code_interpreter,
+            enable_file_search=enable_file_search,
+            enable_json_response=enable_json_response,
+            max_completion_tokens=max_completion_tokens,
+            max_prompt_tokens=max_prompt_tokens,
+            parallel_tool_calls_enabled=parallel_tool_calls_enabled,
+            truncation_message_count=truncation_message_count,
+            temperature=temperature,
+            top_p=top_p,
+            metadata=metadata,
+            kwargs=kwargs,
+        )
+
+        # Filter out None values to avoid passing them as kwargs
+        run_options = {k: v for k, v in run_options.items() if v is not None}
+
+        stream: Any = await self.client.beta.threads.runs.create(
+            assistant_id=self.assistant.id,
+            thread_id=thread_id,
+            instructions=self.assistant.instructions,
+            tools=tools,  # type: ignore
+            stream=True,
+            **run_options,
+        )
+
+        function_steps: dict[str, FunctionCallContent] = {}
+
+        while stream is not None:
+            tool_outputs_stream: Any = None
+            async for event in stream:
+                if event.event == "thread.message.delta":
+                    content = self._generate_streaming_message_content(self.name, event.data)
+                    if content:
+                        yield content
+                elif event.event == "thread.run.step.delta":
+                    content = self._generate_streaming_code_interpreter_content(self.name, event.data)
+                    if content:
+                        yield content
+                elif event.event == "thread.run.step.completed":
+                    if messages is not None and event.data.type == "tool_calls":
+                        messages.extend(self._generate_tool_call_step_contents(event.data, function_steps))
+                elif event.event == "thread.message.completed":
+                    if messages is not None:
+                        message_content = self._generate_message_content(self.name, event.data)
+                        if len(message_content.items) > 0:
+                            messages.append(message_content)
+                elif event.event == "thread.run.requires_action":
+                    run = event.data
+                    fccs = self._get_function_call_contents(run, function_steps)
+                    if fccs:
+                        if messages is not None:
+                            messages.append(self._generate_function_call_content(agent_name=self.name, fccs=fccs))
+
+                        chat_history = ChatHistory()
+                        _ = await self._invoke_function_calls(fccs=fccs, chat_history=chat_history)
+
+                        tool_outputs = self._format_tool_outputs(chat_history)
+                        tool_outputs_stream = await self.client.beta.threads.runs.submit_tool_outputs(
+                            run_id=run.id,
+                            thread_id=thread_id,
+                            tool_outputs=tool_outputs,  # type: ignore
+                            stream=True,
+                        )
+                elif event.event in self.error_stream_events:
+                    raise AgentInvokeError(
+                        f"Run failed with status: `{event.data.status}` for agent `{self.name}` "
+                        f"and thread `{thread_id}`"
+                    )
+                elif event.event == "error":
+                    raise AgentInvokeError(
+                        f"Run failed with error: `{event.data.message}` for agent `{self.name}` "
+                        f"and thread `{thread_id}`"
+                    )
+            stream = tool_outputs_stream
+
     # endregion
 
     # region Content Generation Methods
@@ -732,6 +895,72 @@ class OpenAIAssistantBase(Agent):
         )
         return function_call_content
 
+    def _generate_tool_call_step_contents(
+        self, step: RunStep, function_steps: dict[str, FunctionCallContent]
+    ) -> list[ChatMessageContent]:
+        """Generate the contents of the tool calls of a completed run step."""
+        contents: list[ChatMessageContent] = []
+        assert hasattr(step.step_details, "tool_calls")  # nosec
+        for tool_call in step.step_details.tool_calls:
+            if tool_call.type == "code_interpreter":
+                contents.append(
+                    self._generate_code_interpreter_content(
+                        self.name,
+                        tool_call.code_interpreter.input,  # type: ignore
+                    )
+                )
+            elif tool_call.type == "function":
+                function_step = function_steps.get(tool_call.id)
+                if function_step is not None:
+                    contents.append(
+                        self._generate_function_result_content(
+                            agent_name=self.name, function_step=function_step, tool_call=tool_call
+                        )
+                    )
+        return contents
+
+    def _generate_streaming_message_content(
+        self, agent_name: str, message_delta: MessageDeltaEvent
+    ) -> StreamingChatMessageContent | None:
+        """Generate streaming message content from the text of a message delta."""
+        items: list[Any] = [
+            StreamingTextContent(choice_index=0, text=item_content.text.value)
+            for item_content in message_delta.delta.content or []
+            if item_content.type == "text" and item_content.text and item_content.text.value
+        ]
+        if not items:
+            return None
+        return StreamingChatMessageContent(
+            role=AuthorRole(message_delta.delta.role or AuthorRole.ASSISTANT),
+            choice_index=0,
+            items=items,
+            name=agent_name,
+            inner_content=message_delta,
+        )
+
+    def _generate_streaming_code_interpreter_content(
+        self, agent_name: str, step_delta: RunStepDeltaEvent
+    ) -> StreamingChatMessageContent | None:
+        """Generate streaming code interpreter content from the code input of a run step delta."""
+        step_details = step_delta.delta.step_details
+        if step_details is None or step_details.type != "tool_calls":
+            return None
+        code = "".join(
+            tool_call.code_interpreter.input
+            for tool_call in step_details.tool_calls or []
+            if tool_call.type == "code_interpreter" and tool_call.code_interpreter and tool_call.code_interpreter.input
+        )
+        if not code:
+            return None
+        return StreamingChatMessageContent(
+            role=AuthorRole.ASSISTANT,
+            choice_index=0,
+            items=[StreamingTextContent(choice_index=0, text=code)],
+            name=agent_name,
+            inner_content=step_delta,
+            metadata={"code": True},
+        )
+
     def _generate_code_interpreter_content(self, agent_name: str, code: str) -> ChatMessageContent:
         """Generate code interpreter content."""
         return ChatMessageContent(
@@ -873,6 +1102,23 @@ class OpenAIAssistantBase(Agent):
         logger.info(f"Polled run status: {run.status}, {run.id}, threadId: {thread_id}")
         return run
 
+    @staticmethod
+    def _has_more_messages(page: Any, page_size: int) -> bool:
+        """Whether there is a page of messages after this one."""
+        has_more = getattr(page, "has_more", None)
+        if isinstance(has_more, bool):
+            return has_more and len(page.data) > 0
+        return len(page.data) >= page_size
+
+    async def _get_assistant_name(self, assistant_id: str) -> str:
+        """Get the name of an assistant from the assistant cache, or the id when it has no name."""
+        if self.assistant is not None and self.assistant.id == assistant_id:
+            return self.assistant.name or assistant_id
+        assistant = await self.assistant_cache.get_or_add(
+            assistant_id, lambda: self.client.beta.assistants.retrieve(assistant_id)
+        )
+        return assistant.name or assistant_id
+
     async def _retrieve_message(self, thread_id: str, message_id: str) -> Message | None:
         """Retrieve a message from a thread."""
         message: Message | None = None
@@ -994,11 +1240,13 @@ class OpenAIAssistantBase(Agent):
         Returns:
             List[Any]: The results.
         """
-        tasks = [
-            self.kernel.invoke_function_call(function_call=function_call, chat_history=chat_history)
-            for function_call in fccs
-        ]
-        return await asyncio.gather(*tasks)
+        return await self.tool_call_scheduler.invoke_function_calls(
+            fccs,
+            lambda function_call: self.kernel.invoke_function_call(
+                function_call=function_call, chat_history=chat_history
+            ),
+            chat_history,
+        )
 
     def _format_tool_outputs(self, chat_history: ChatHistory) -> list[dict[str, str]]:
         """Format tool outputs from chat history for submission.
@@ -1010,14 +1258,13 @@ class OpenAIAssistantBase(Agent):
             list[dict[str, str]]: The formatted tool outputs
         """
         tool_outputs = []
-        for tool_call in chat_history.messages[0].items:
-            if isinstance(tool_call, FunctionResultContent):
-                tool_outputs.append(
-                    {
+        for message in chat_history.messages:
+            for tool_call in message.items:
+                if isinstance(tool_call, FunctionResultContent):
+                    tool_outputs.append({
                         "tool_call_id": tool_call.id,
                         "output": tool_call.result,
-                    }
-                )
+                    })
         return tool_outputs
 
     # endregion
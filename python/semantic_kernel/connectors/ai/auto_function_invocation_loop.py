@@ -0,0 +1,267 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.streaming_content_accumulator import StreamingContentAccumulator
+from semantic_kernel.exceptions import ServiceInvalidExecutionSettingsError
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+    from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+    from semantic_kernel.contents.chat_history import ChatHistory
+    from semantic_kernel.contents.chat_message_content import ChatMessageContent
+    from semantic_kernel.filters.auto_function_invocation.auto_function_invocation_context import (
+        AutoFunctionInvocationContext,
+    )
+    from semantic_kernel.functions.kernel_arguments import KernelArguments
+    from semantic_kernel.kernel import Kernel
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+MessageCache = dict[int, tuple["ChatMessageContent", Any]]
+
+
+class AutoFunctionInvocationClient(Protocol):
+    """The requests a chat completion service implements to use the AutoFunctionInvocationLoop.
+
+    Both requests send the chat history and return the responses with the tool calls
+    parsed into FunctionCallContent items. The message cache holds the messages converted by the earlier
+    requests of the same run of the loop, see prepare_messages_with_cache.
+    """
+
+    async def _send_chat_request(
+        self,
+        chat_history: "ChatHistory",
+        settings: "PromptExecutionSettings",
+        message_cache: MessageCache | None = None,
+    ) -> list["ChatMessageContent"]:
+        """Send one chat request."""
+        ...
+
+    def _send_chat_streaming_request(
+        self,
+        chat_history: "ChatHistory",
+        settings: "PromptExecutionSettings",
+        message_cache: MessageCache | None = None,
+    ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
+        """Send one streaming chat request."""
+        ...
+
+
+def prepare_messages_with_cache(
+    chat_history: "ChatHistory",
+    message_cache: MessageCache,
+    prepare_message: Callable[["ChatMessageContent"], T | None],
+) -> list[T]:
+    """Convert the messages of the chat history for a request, reusing the messages in the cache.
+
+    A round of auto function invocation sends the chat history of the previous round plus a few new messages,
+    so only the new messages are converted. The cache belongs to a single run of the AutoFunctionInvocationLoop,
+    it is updated with the messages of this request. Messages are matched by identity,
+    a message that is changed in place during the run is not converted again.
+
+    Args:
+        chat_history (ChatHistory): The chat history.
+        message_cache (MessageCache): The messages converted by the earlier requests of the run.
+        prepare_message (Callable): Converts one message, messages converted to None are not sent.
+
+    Returns:
+        list[T]: The converted messages.
+    """
+    serialized_messages: MessageCache = {}
+    for message in chat_history.messages:
+        cached = message_cache.get(id(message))
+        if cached is None or cached[0] is not message:
+            cached = (message, prepare_message(message))
+        serialized_messages[id(message)] = cached
+    message_cache.clear()
+    message_cache.update(serialized_messages)
+    return [
+        prepared for message in chat_history.messages if (prepared := serialized_messages[id(message)][1]) is not None
+    ]
+
+
+@experimental_class
+class AutoFunctionInvocationLoop:
+    """Runs the requests and tool calls of auto function invocation for a chat completion service.
+
+    Each round sends the chat history to the service, adds the response to the chat history
+    and invokes the tool calls of the response through the ToolCallScheduler of the function choice behavior,
+    which adds the results to the chat history. The loop stops when a response has no tool calls,
+    when a tool call terminates, or after maximum_auto_invoke_attempts rounds, in which case a final request is sent
+    whose tool calls are not invoked (streaming stops instead).
+
+    When streaming, the tool calls are invoked while the response streams if the scheduler has
+    dispatch_while_streaming set, see StreamingToolCallTracker.
+
+    The service implements the AutoFunctionInvocationClient protocol. The loop passes its message cache
+    to each request, with prepare_messages_with_cache the service only converts the new messages of a round.
+    """
+
+    def __init__(
+        self,
+        client: AutoFunctionInvocationClient,
+        settings: "PromptExecutionSettings",
+        kernel: "Kernel | None",
+        arguments: "KernelArguments | None" = None,
+        invoke_function_call: Callable[..., Awaitable["AutoFunctionInvocationContext | None"]] | None = None,
+        update_settings: Callable[["ChatHistory"], None] | None = None,
+        message_cache: MessageCache | None = None,
+    ) -> None:
+        """Create the loop for one call of a chat completion service.
+
+        Args:
+            client (AutoFunctionInvocationClient): The service that sends the requests.
+            settings (PromptExecutionSettings): The settings, with a function choice behavior
+                that auto invokes kernel functions.
+            kernel (Kernel | None): The kernel with the functions, it is required.
+            arguments (KernelArguments | None): The arguments for the functions.
+            invoke_function_call (Callable | None): Invokes a single tool call, with the arguments of
+                `Kernel.invoke_function_call`, defaults to `kernel.invoke_function_call`.
+            update_settings (Callable | None): Updates the settings with the chat history before
+                each request after the first one.
+            message_cache (MessageCache | None): The cache for the converted messages of this run,
+                pass it when the first request was prepared before the loop, defaults to an empty cache.
+
+        Raises:
+            ServiceInvalidExecutionSettingsError: When the kernel or the function choice behavior is missing.
+        """
+        from semantic_kernel.kernel import Kernel
+
+        if not isinstance(kernel, Kernel):
+            raise ServiceInvalidExecutionSettingsError("Kernel is required for auto invoking functions.")
+        if not settings.function_choice_behavior:
+            raise ServiceInvalidExecutionSettingsError(
+                "Function choice behavior is required for auto invoking functions."
+            )
+        self.client = client
+        self.settings = settings
+        self.kernel = kernel
+        self.arguments = arguments
+        self.function_choice_behavior: FunctionChoiceBehavior = settings.function_choice_behavior
+        self.invoke_function_call = invoke_function_call or kernel.invoke_function_call
+        self.update_settings = update_settings
+        self.message_cache: MessageCache = message_cache if message_cache is not None else {}
+
+    async def get_chat_message_contents(self, chat_history: "ChatHistory") -> list["ChatMessageContent"]:
+        """Run the loop and return the last response.
+
+        Args:
+            chat_history (ChatHistory): The chat history, the responses and tool results are added to it.
+
+        Returns:
+            list[ChatMessageContent]: The last response.
+        """
+        for request_index in range(self.function_choice_behavior.maximum_auto_invoke_attempts):
+            self._prepare_request(chat_history, request_index)
+            completions = await self.client._send_chat_request(chat_history, self.settings, self.message_cache)
+            # there is only one chat message, the services check this
+            chat_history.add_message(message=completions[0])
+            function_calls = [item for item in completions[0].items if isinstance(item, FunctionCallContent)]
+            if not function_calls:
+                return completions
+
+            results = await self._invoke_function_calls(function_calls, chat_history, request_index)
+            if any(result.terminate for result in results if result is not None):
+                return completions
+
+        # do a final request, without invoking its tool calls, when the maximum number of rounds has been reached
+        self._prepare_request(chat_history, self.function_choice_behavior.maximum_auto_invoke_attempts)
+        return await self.client._send_chat_request(chat_history, self.settings, self.message_cache)
+
+    async def get_streaming_chat_message_contents(
+        self, chat_history: "ChatHistory"
+    ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
+        """Run the loop and stream the responses of all rounds.
+
+        Args:
+            chat_history (ChatHistory): The chat history, the combined responses and tool results are added to it.
+
+        Yields:
+            list[StreamingChatMessageContent]: The streamed messages.
+        """
+        scheduler = self.function_choice_behavior.tool_call_scheduler
+        for request_index in range(self.function_choice_behavior.maximum_auto_invoke_attempts):
+            self._prepare_request(chat_history, request_index)
+            all_messages: list[StreamingChatMessageContent] = []
+            function_call_returned = False
+            tracker = None
+            if scheduler.dispatch_while_streaming:
+                # invoke the tool calls as soon as they are complete, while the rest of the response streams
+                tracker = scheduler.track_stream(
+                    partial(
+                        self.invoke_function_call,
+                        arguments=self.arguments,
+                        request_index=request_index,
+                        function_behavior=self.function_choice_behavior,
+                    ),
+                    chat_history,
+                )
+            try:
+                async for messages in self.client._send_chat_streaming_request(
+                    chat_history, self.settings, self.message_cache
+                ):
+                    for message in messages:
+                        if message is not None:
+                            all_messages.append(message)
+                            if any(isinstance(item, FunctionCallContent) for item in message.items):
+                                function_call_returned = True
+                            if tracker is not None:
+                                tracker.add(message)
+                    yield messages
+            except BaseException:
+                if tracker is not None:
+                    tracker.cancel()
+                raise
+
+            if not function_call_returned:
+                # note that the finish reason is not checked, as a service may return a finish reason of "stop"
+                # even if there are tool calls to be made, in particular if a required tool is specified.
+                return
+
+            # there is one response in the messages, depending on the prompt it may contain text as well
+            full_completion = StreamingContentAccumulator.combine(all_messages)
+            assert isinstance(full_completion, StreamingChatMessageContent)  # nosec
+            function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
+            chat_history.add_message(message=full_completion)
+
+            if tracker is not None:
+                results = await tracker.finish(function_calls)
+            else:
+                results = await self._invoke_function_calls(function_calls, chat_history, request_index)
+            if any(result.terminate for result in results if result is not None):
+                return
+
+    def _prepare_request(self, chat_history: "ChatHistory", request_index: int) -> None:
+        if request_index > 0 and self.update_settings is not None:
+            self.update_settings(chat_history)
+
+    async def _invoke_function_calls(
+        self, function_calls: list[FunctionCallContent], chat_history: "ChatHistory", request_index: int
+    ) -> list["AutoFunctionInvocationContext | None"]:
+        """Invoke the tool calls, either updating the chat history with the results or terminating.
+
+        Exceptions are not caught, that is up to the developer, can be done with a filter.
+        """
+        logger.info(f"processing {len(function_calls)} tool calls in parallel.")
+        return await self.function_choice_behavior.tool_call_scheduler.invoke_function_calls(
+            function_calls,
+            partial(
+                self.invoke_function_call,
+                chat_history=chat_history,
+                arguments=self.arguments,
+                function_call_count=len(function_calls),
+                request_index=request_index,
+                function_behavior=self.function_choice_behavior,
+            ),
+            chat_history,
+        )
@@ -1,10 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import asyncio
 import logging
 import sys
 from collections.abc import AsyncGenerator
-from functools import reduce
 from typing import TYPE_CHECKING, Any
 
 from semantic_kernel.utils.telemetry.user_agent import SEMANTIC_KERNEL_USER_AGENT
@@ -27,6 +25,11 @@ from azure.ai.inference.models import (
 from azure.core.credentials import AzureKeyCredential
 from pydantic import ValidationError
 
+from semantic_kernel.connectors.ai.auto_function_invocation_loop import (
+    AutoFunctionInvocationLoop,
+    MessageCache,
+    prepare_messages_with_cache,
+)
 from semantic_kernel.connectors.ai.azure_ai_inference import (
     AzureAIInferenceChatPromptExecutionSettings,
     AzureAIInferenceSettings,
@@ -35,7 +38,6 @@ from semantic_kernel.connectors.ai.azure_ai_inference.services.azure_ai_inferenc
 from semantic_kernel.connectors.ai.azure_ai_inference.services.utils import MESSAGE_CONVERTERS
 from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
 from semantic_kernel.connectors.ai.function_calling_utils import update_settings_from_function_call_configuration
-from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.chat_message_content import ITEM_TYPES, ChatMessageContent
 from semantic_kernel.contents.function_call_content import FunctionCallContent
@@ -49,7 +51,6 @@ from semantic_kernel.exceptions.service_exceptions import (
     ServiceInitializationError,
     ServiceInvalidExecutionSettingsError,
 )
-from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.kernel import Kernel
 from semantic_kernel.utils.experimental_decorator import experimental_class
 
@@ -148,36 +149,19 @@ class AzureAIInferenceChatCompletion(ChatCompletionClientBase, AzureAIInferenceB
         self._verify_function_choice_behavior(settings)
         self._configure_function_choice_behavior(settings, kernel)
 
-        for request_index in range(settings.function_choice_behavior.maximum_auto_invoke_attempts):
-            completions = await self._send_chat_request(chat_history, settings)
-            chat_history.add_message(message=completions[0])
-            function_calls = [item for item in chat_history.messages[-1].items if isinstance(item, FunctionCallContent)]
-            if (fc_count := len(function_calls)) == 0:
-                return completions
-
-            results = await self._invoke_function_calls(
-                function_calls=function_calls,
-                chat_history=chat_history,
-                kernel=kernel,
-                arguments=kwargs.get("arguments", None),
-                function_call_count=fc_count,
-                request_index=request_index,
-                function_behavior=settings.function_choice_behavior,
-            )
-
-            if any(result.terminate for result in results if result is not None):
-                return completions
-        else:
-            # do a final call without auto function calling
-            return await self._send_chat_request(chat_history, settings)
+        loop = AutoFunctionInvocationLoop(self, settings, kernel, kwargs.get("arguments", None))
+        return await loop.get_chat_message_contents(chat_history)
 
     async def _send_chat_request(
-        self, chat_history: ChatHistory, settings: AzureAIInferenceChatPromptExecutionSettings
+        self,
+        chat_history: ChatHistory,
+        settings: AzureAIInferenceChatPromptExecutionSettings,
+        message_cache: MessageCache | None = None,
     ) -> list[ChatMessageContent]:
         """Send a chat request to the Azure AI Inference service."""
         assert isinstance(self.client, ChatCompletionsClient)  # nosec
         response: ChatCompletions = await self.client.complete(
-            messages=self._prepare_chat_history_for_request(chat_history),
+            messages=self._prepare_messages_for_request(chat_history, message_cache),
             model_extras=settings.extra_parameters,
             **settings.prepare_settings_dict(),
         )
@@ -275,50 +259,21 @@ class AzureAIInferenceChatCompletion(ChatCompletionClientBase, AzureAIInferenceB
         self._verify_function_choice_behavior(settings)
         self._configure_function_choice_behavior(settings, kernel)
 
-        # mypy doesn't recognize the settings.function_choice_behavior is not None by the check above
-        request_attempts = settings.function_choice_behavior.maximum_auto_invoke_attempts  # type: ignore
-
-        for request_index in range(request_attempts):
-            all_messages: list[StreamingChatMessageContent] = []
-            function_call_returned = False
-            async for messages in self._send_chat_streaming_request(chat_history, settings):
-                for message in messages:
-                    if message:
-                        all_messages.append(message)
-                        if any(isinstance(item, FunctionCallContent) for item in message.items):
-                            function_call_returned = True
-                yield messages
-
-            if not function_call_returned:
-                # Response doesn't contain any function calls. No need to proceed to the next request.
-                return
-
-            full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
-            function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
-            chat_history.add_message(message=full_completion)
-
-            results = await self._invoke_function_calls(
-                function_calls=function_calls,
-                chat_history=chat_history,
-                kernel=kernel,
-                arguments=kwargs.get("arguments", None),
-                function_call_count=len(function_calls),
-                request_index=request_index,
-                # mypy doesn't recognize the settings.function_choice_behavior is not None by the check above
-                function_behavior=settings.function_choice_behavior,  # type: ignore
-            )
-
-            if any(result.terminate for result in results if result is not None):
-                return
+        loop = AutoFunctionInvocationLoop(self, settings, kernel, kwargs.get("arguments", None))
+        async for messages in loop.get_streaming_chat_message_contents(chat_history):
+            yield messages
 
     async def _send_chat_streaming_request(
-        self, chat_history: ChatHistory, settings: AzureAIInferenceChatPromptExecutionSettings
+        self,
+        chat_history: ChatHistory,
+        settings: AzureAIInferenceChatPromptExecutionSettings,
+        message_cache: MessageCache | None = None,
     ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
         """Send a streaming chat request to the Azure AI Inference service."""
         assert isinstance(self.client, ChatCompletionsClient)  # nosec
         response: AsyncStreamingChatCompletions = await self.client.complete(
             stream=True,
-            messages=self._prepare_chat_history_for_request(chat_history),
+            messages=self._prepare_messages_for_request(chat_history, message_cache),
             model_extras=settings.extra_parameters,
             **settings.prepare_settings_dict(),
         )
@@ -387,12 +342,28 @@ class AzureAIInferenceChatCompletion(ChatCompletionClientBase, AzureAIInferenceB
         role_key: str = "role",
         content_key: str = "content",
     ) -> list[ChatRequestMessage]:
-        chat_request_messages: list[ChatRequestMessage] = []
+        return [self._prepare_message_for_request(message) for message in chat_history.messages]
+
+    def _prepare_messages_for_request(
+        self, chat_history: ChatHistory, message_cache: MessageCache | None = None
+    ) -> list[ChatRequestMessage]:
+        """Convert the messages of the chat history for a request.
 
-        for message in chat_history.messages:
-            chat_request_messages.append(MESSAGE_CONVERTERS[message.role](message))
+        The messages are converted with `_prepare_chat_history_for_request`. With a message cache,
+        and unless a subclass overrides that method, they are converted one at a time
+        with `_prepare_message_for_request` instead, reusing the messages in the cache.
+        """
+        if (
+            message_cache is None
+            or type(self)._prepare_chat_history_for_request
+            is not AzureAIInferenceChatCompletion._prepare_chat_history_for_request
+        ):
+            return self._prepare_chat_history_for_request(chat_history)
+        return prepare_messages_with_cache(chat_history, message_cache, self._prepare_message_for_request)
 
-        return chat_request_messages
+    def _prepare_message_for_request(self, message: ChatMessageContent) -> ChatRequestMessage:
+        """Convert a message of the chat history to a message of the request."""
+        return MESSAGE_CONVERTERS[message.role](message)
 
     def _get_metadata_from_response(self, response: ChatCompletions | StreamingChatCompletionsUpdate) -> dict[str, Any]:
         """Get metadata from the response.
@@ -433,33 +404,6 @@ class AzureAIInferenceChatCompletion(ChatCompletionClientBase, AzureAIInferenceB
             kernel=kernel, update_settings_callback=update_settings_from_function_call_configuration, settings=settings
         )
 
-    async def _invoke_function_calls(
-        self,
-        function_calls: list[FunctionCallContent],
-        chat_history: ChatHistory,
-        kernel: Kernel,
-        arguments: KernelArguments | None,
-        function_call_count: int,
-        request_index: int,
-        function_behavior: FunctionChoiceBehavior,
-    ):
-        """Invoke function calls."""
-        logger.info(f"processing {function_call_count} tool calls in parallel.")
-
-        return await asyncio.gather(
-            *[
-                kernel.invoke_function_call(
-                    function_call=function_call,
-                    chat_history=chat_history,
-                    arguments=arguments,
-                    function_call_count=function_call_count,
-                    request_index=request_index,
-                    function_behavior=function_behavior,
-                )
-                for function_call in function_calls
-            ],
-        )
-
     @override
     def get_prompt_execution_settings_class(
         self,
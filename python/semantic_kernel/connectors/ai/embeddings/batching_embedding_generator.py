@@ -0,0 +1,233 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+import sys
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from numpy import ndarray
+from pydantic import Field, PrivateAttr
+
+if sys.version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@experimental_class
+class EmbeddingBatchMetrics(KernelBaseModel):
+    """The metrics of a single batch of a BatchingEmbeddingGenerator.
+
+    Args:
+        size (int): The number of texts in the batch.
+        requests (int): The number of calls that were combined into the batch.
+        wait_time (float): The seconds between the first call of the batch and the start of the batch.
+        latency (float): The seconds the wrapped embedding generator took for the batch.
+    """
+
+    size: int
+    requests: int
+    wait_time: float
+    latency: float
+
+
+class _Batch:
+    """The texts of the calls that are combined, and the future for the embeddings of all of them."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.texts: list[str] = []
+        self.requests = 0
+        self.created = time.perf_counter()
+        self.future: asyncio.Future[Any] = loop.create_future()
+        self.timer: asyncio.TimerHandle | None = None
+
+
+@experimental_class
+class BatchingEmbeddingGenerator(EmbeddingGeneratorBase):
+    """An embedding generator that combines concurrent calls into a single call to another embedding generator.
+
+    The texts of the calls that arrive within `max_wait_time` seconds of the first call of a batch are sent
+    to the wrapped generator together, up to `max_batch_size` texts, and each caller receives its own rows.
+    A batch is started as soon as it is full, a call with at least `max_batch_size` texts is not batched.
+    Only calls with the same settings, keyword arguments and kind (raw or not) are combined.
+    This trades a few milliseconds of latency for the throughput of batched inference,
+    which helps most for local models that are called with one or two texts at a time.
+
+    The generator takes over the service_id of the wrapped service,
+    so it can be added to the kernel or passed to SemanticTextMemory in its place.
+
+    The batch metrics are summed up in the batches, batched_texts, batched_requests and batch_latency fields,
+    the metrics of each batch are passed to the `on_batch` callback.
+    """
+
+    embedding_generator: EmbeddingGeneratorBase
+    max_batch_size: int = Field(default=64, gt=0)
+    max_wait_time: float = Field(default=0.005, ge=0)
+    on_batch: Callable[[EmbeddingBatchMetrics], None] | None = Field(default=None, exclude=True)
+    batches: int = Field(default=0, exclude=True)
+    batched_texts: int = Field(default=0, exclude=True)
+    batched_requests: int = Field(default=0, exclude=True)
+    batch_latency: float = Field(default=0.0, exclude=True)
+
+    _pending: dict[tuple[Any, ...], _Batch] = PrivateAttr(default_factory=dict)
+
+    def __init__(
+        self,
+        embedding_generator: EmbeddingGeneratorBase,
+        max_batch_size: int = 64,
+        max_wait_time: float = 0.005,
+        on_batch: Callable[[EmbeddingBatchMetrics], None] | None = None,
+        service_id: str | None = None,
+    ) -> None:
+        """Create a batching wrapper around an embedding generator.
+
+        Args:
+            embedding_generator (EmbeddingGeneratorBase): The embedding generator to batch the calls of.
+            max_batch_size (int): The maximum number of texts in a batch. (default: 64)
+            max_wait_time (float): The maximum number of seconds a call waits for other calls. (default: 0.005)
+            on_batch (Callable[[EmbeddingBatchMetrics], None] | None): Called with the metrics of each batch,
+                for instance to record them in a metrics system.
+            service_id (str | None): The service id, defaults to the service id of the embedding generator.
+        """
+        super().__init__(
+            ai_model_id=embedding_generator.ai_model_id,
+            service_id=service_id or embedding_generator.service_id,
+            embedding_generator=embedding_generator,
+            max_batch_size=max_batch_size,
+            max_wait_time=max_wait_time,
+            on_batch=on_batch,
+        )
+
+    @property
+    def average_batch_size(self) -> float:
+        """The average number of texts per batch."""
+        return self.batched_texts / self.batches if self.batches else 0.0
+
+    @property
+    def average_batch_latency(self) -> float:
+        """The average number of seconds the wrapped embedding generator took per batch."""
+        return self.batch_latency / self.batches if self.batches else 0.0
+
+    @override
+    async def generate_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> ndarray:
+        return await self._get_embeddings(texts, settings, raw=False, **kwargs)
+
+    @override
+    async def generate_raw_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> Any:
+        return await self._get_embeddings(texts, settings, raw=True, **kwargs)
+
+    @override
+    def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
+        return self.embedding_generator.get_prompt_execution_settings_class()
+
+    async def _get_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None",
+        raw: bool,
+        **kwargs: Any,
+    ) -> Any:
+        if len(texts) >= self.max_batch_size:
+            return await self._generate(list(texts), 1, time.perf_counter(), settings, raw, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        key = (
+            loop,
+            raw,
+            settings.model_dump_json() if settings is not None else None,
+            repr(sorted(kwargs.items())),
+        )
+        batch = self._pending.get(key)
+        if batch is not None and len(batch.texts) + len(texts) > self.max_batch_size:
+            self._dispatch(key, batch, settings, raw, kwargs)
+            batch = None
+        if batch is None:
+            batch = self._pending[key] = _Batch(loop)
+            batch.timer = loop.call_later(self.max_wait_time, self._dispatch, key, batch, settings, raw, kwargs)
+
+        start = len(batch.texts)
+        batch.texts.extend(texts)
+        batch.requests += 1
+        if len(batch.texts) >= self.max_batch_size:
+            self._dispatch(key, batch, settings, raw, kwargs)
+
+        # shield the batch, so a cancelled caller does not cancel the call for the other callers
+        embeddings = await asyncio.shield(batch.future)
+        return embeddings[start : start + len(texts)]
+
+    def _dispatch(
+        self,
+        key: tuple[Any, ...],
+        batch: _Batch,
+        settings: "PromptExecutionSettings | None",
+        raw: bool,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Start the call for a batch, when it is full or when the wait time is over."""
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+            batch.timer = None
+        task = asyncio.ensure_future(
+            self._generate(batch.texts, batch.requests, batch.created, settings, raw, **kwargs)
+        )
+
+        def set_result(task: "asyncio.Task[Any]") -> None:
+            if batch.future.cancelled():
+                return  # pragma: no cover
+            if task.cancelled():
+                batch.future.cancel()
+            elif task.exception() is not None:
+                batch.future.set_exception(task.exception())  # type: ignore[arg-type]
+            else:
+                batch.future.set_result(task.result())
+
+        task.add_done_callback(set_result)
+
+    async def _generate(
+        self,
+        texts: list[str],
+        requests: int,
+        created: float,
+        settings: "PromptExecutionSettings | None",
+        raw: bool,
+        **kwargs: Any,
+    ) -> Any:
+        start = time.perf_counter()
+        if raw:
+            embeddings = await self.embedding_generator.generate_raw_embeddings(texts, settings, **kwargs)
+        else:
+            embeddings = await self.embedding_generator.generate_embeddings(texts, settings, **kwargs)
+        metrics = EmbeddingBatchMetrics(
+            size=len(texts), requests=requests, wait_time=start - created, latency=time.perf_counter() - start
+        )
+        self.batches += 1
+        self.batched_texts += metrics.size
+        self.batched_requests += metrics.requests
+        self.batch_latency += metrics.latency
+        logger.debug(f"Generated the embeddings of a batch of {metrics.size} texts for {metrics.requests} calls.")
+        if self.on_batch is not None:
+            self.on_batch(metrics)
+        return embeddings
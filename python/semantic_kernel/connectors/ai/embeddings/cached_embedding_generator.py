@@ -0,0 +1,119 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import hashlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy import ndarray
+from pydantic import Field
+
+if sys.version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from semantic_kernel.connectors.ai.embeddings.embedding_cache import EmbeddingCacheBase, InMemoryEmbeddingCache
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+
+
+@experimental_class
+class CachedEmbeddingGenerator(EmbeddingGeneratorBase):
+    """An embedding generator that caches the embeddings of another embedding generator.
+
+    The embeddings are cached by the ai_model_id of the wrapped service, the dimensions setting and
+    a hash of the text. Only the texts that are not in the cache are sent to the wrapped service,
+    and texts that appear multiple times in one call are only sent once.
+
+    The generator takes over the service_id of the wrapped service,
+    so it can be added to the kernel or passed to SemanticTextMemory in its place.
+
+    The hits count the texts that did not need a call to the wrapped service, the misses the texts that did.
+    """
+
+    embedding_generator: EmbeddingGeneratorBase
+    cache: EmbeddingCacheBase
+    hits: int = Field(default=0, exclude=True)
+    misses: int = Field(default=0, exclude=True)
+
+    def __init__(
+        self,
+        embedding_generator: EmbeddingGeneratorBase,
+        cache: EmbeddingCacheBase | None = None,
+        service_id: str | None = None,
+    ) -> None:
+        """Create a caching wrapper around an embedding generator.
+
+        Args:
+            embedding_generator (EmbeddingGeneratorBase): The embedding generator to cache.
+            cache (EmbeddingCacheBase | None): The cache to use, defaults to an InMemoryEmbeddingCache.
+            service_id (str | None): The service id, defaults to the service id of the embedding generator.
+        """
+        super().__init__(
+            ai_model_id=embedding_generator.ai_model_id,
+            service_id=service_id or embedding_generator.service_id,
+            embedding_generator=embedding_generator,
+            cache=cache or InMemoryEmbeddingCache(),
+        )
+
+    @override
+    async def generate_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> ndarray:
+        embeddings = await self._get_embeddings(texts, settings, raw=False, **kwargs)
+        return np.stack(embeddings) if embeddings else np.array([])
+
+    @override
+    async def generate_raw_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> Any:
+        return [embedding.tolist() for embedding in await self._get_embeddings(texts, settings, raw=True, **kwargs)]
+
+    @override
+    def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
+        return self.embedding_generator.get_prompt_execution_settings_class()
+
+    async def _get_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None",
+        raw: bool,
+        **kwargs: Any,
+    ) -> list[ndarray]:
+        keys = [self._cache_key(text, settings, **kwargs) for text in texts]
+        embeddings = await self.cache.get_many(keys)
+
+        missing: dict[str, str] = {}
+        for key, text, embedding in zip(keys, texts, embeddings):
+            if embedding is None:
+                missing.setdefault(key, text)
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        if not missing:
+            return embeddings  # type: ignore[return-value]
+
+        missing_texts = list(missing.values())
+        if raw:
+            generated = await self.embedding_generator.generate_raw_embeddings(missing_texts, settings, **kwargs)
+        else:
+            generated = await self.embedding_generator.generate_embeddings(missing_texts, settings, **kwargs)
+        new_items = {key: np.asarray(embedding) for key, embedding in zip(missing, generated)}
+        await self.cache.set_many(new_items)
+        return [embedding if embedding is not None else new_items[key] for key, embedding in zip(keys, embeddings)]
+
+    def _cache_key(self, text: str, settings: "PromptExecutionSettings | None", **kwargs: Any) -> str:
+        dimensions = kwargs.get("dimensions", getattr(settings, "dimensions", None))
+        if dimensions is None and settings is not None:
+            dimensions = settings.extension_data.get("dimensions")
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.embedding_generator.ai_model_id}:{dimensions}:{digest}"
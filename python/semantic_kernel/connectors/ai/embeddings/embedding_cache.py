@@ -0,0 +1,145 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import numpy as np
+from numpy import ndarray
+
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+
+@experimental_class
+class EmbeddingCacheBase(ABC):
+    """Base class for a cache of embeddings, keyed by strings built by the CachedEmbeddingGenerator."""
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> list[ndarray | None]:
+        """Get the embeddings for the keys, None for the keys that are not in the cache.
+
+        Args:
+            keys (Sequence[str]): The keys to look up.
+
+        Returns:
+            list[ndarray | None]: The embeddings, in the order of the keys.
+        """
+        ...
+
+    @abstractmethod
+    async def set_many(self, items: dict[str, ndarray]) -> None:
+        """Store the embeddings.
+
+        Args:
+            items (dict[str, ndarray]): The embeddings by key.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Close the cache."""
+        return
+
+
+@experimental_class
+class InMemoryEmbeddingCache(EmbeddingCacheBase):
+    """A least-recently-used in-memory embedding cache."""
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """Create an in-memory embedding cache.
+
+        Args:
+            max_size (int): The maximum number of embeddings to keep, the least recently used are evicted first.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0.")
+        self.max_size = max_size
+        self._items: OrderedDict[str, ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        """The number of embeddings in the cache."""
+        return len(self._items)
+
+    async def get_many(self, keys: Sequence[str]) -> list[ndarray | None]:
+        """Get the embeddings for the keys, marking the hits as recently used."""
+        results: list[ndarray | None] = []
+        for key in keys:
+            embedding = self._items.get(key)
+            if embedding is not None:
+                self._items.move_to_end(key)
+            results.append(embedding)
+        return results
+
+    async def set_many(self, items: dict[str, ndarray]) -> None:
+        """Store the embeddings, evicting the least recently used ones over max_size."""
+        for key, embedding in items.items():
+            self._items[key] = embedding
+            self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+
+@experimental_class
+class SqliteEmbeddingCache(EmbeddingCacheBase):
+    """An on-disk embedding cache in a sqlite database.
+
+    The embeddings are stored as raw bytes with their dtype, the database calls run in a worker thread.
+    """
+
+    _SQLITE_MAX_VARIABLES = 900
+
+    def __init__(self, path: str, table_name: str = "embeddings") -> None:
+        """Create or open an on-disk embedding cache.
+
+        Args:
+            path (str): The path to the sqlite database file, use ':memory:' for a non-persistent database.
+            table_name (str): The name of the table to store the embeddings in.
+        """
+        if not table_name.isidentifier():
+            raise ValueError(f"Invalid table name: {table_name}")
+        self.path = path
+        self.table_name = table_name
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} (key TEXT PRIMARY KEY, dtype TEXT, embedding BLOB)"  # nosec
+            )
+
+    async def get_many(self, keys: Sequence[str]) -> list[ndarray | None]:
+        """Get the embeddings for the keys."""
+        found = await asyncio.to_thread(self._select, list(keys))
+        return [found.get(key) for key in keys]
+
+    async def set_many(self, items: dict[str, ndarray]) -> None:
+        """Store the embeddings."""
+        if items:
+            await asyncio.to_thread(self._insert, items)
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _select(self, keys: list[str]) -> dict[str, ndarray]:
+        found: dict[str, ndarray] = {}
+        with self._lock:
+            for start in range(0, len(keys), self._SQLITE_MAX_VARIABLES):
+                chunk = keys[start : start + self._SQLITE_MAX_VARIABLES]
+                rows = self._connection.execute(
+                    f"SELECT key, dtype, embedding FROM {self.table_name} "  # nosec
+                    f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for key, dtype, embedding in rows:
+                    found[key] = np.frombuffer(embedding, dtype=dtype)
+        return found
+
+    def _insert(self, items: dict[str, ndarray]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, dtype, embedding) VALUES (?, ?, ?)",  # nosec
+                [(key, embedding.dtype.str, embedding.tobytes()) for key, embedding in items.items()],
+            )
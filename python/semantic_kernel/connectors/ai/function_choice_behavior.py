@@ -5,9 +5,11 @@ from collections.abc import Callable
 from enum import Enum
 from typing import TYPE_CHECKING, Literal, TypeVar
 
+from pydantic import Field
 from typing_extensions import deprecated
 
 from semantic_kernel.connectors.ai.function_calling_utils import _combine_filter_dicts
+from semantic_kernel.connectors.ai.tool_call_scheduler import ToolCallScheduler
 from semantic_kernel.exceptions.service_exceptions import ServiceInitializationError
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 from semantic_kernel.utils.experimental_decorator import experimental_class
@@ -46,6 +48,8 @@ class FunctionChoiceBehavior(KernelBaseModel):
         filters: Filters for the function choice behavior. Available options are: excluded_plugins,
             included_plugins, excluded_functions, or included_functions.
         type_: The type of function choice behavior.
+        tool_call_scheduler: Controls the concurrency, timeouts and early termination of the tool calls
+            that are auto-invoked, by default all tool calls of a response run concurrently.
 
     Properties:
         auto_invoke_kernel_functions: Check if the kernel functions should be auto-invoked.
@@ -74,6 +78,7 @@ class FunctionChoiceBehavior(KernelBaseModel):
         | None
     ) = None
     type_: FunctionChoiceType | None = None
+    tool_call_scheduler: ToolCallScheduler = Field(default_factory=ToolCallScheduler)
 
     @classmethod
     @deprecated("The `FunctionCallBehavior` class is deprecated; use `FunctionChoiceBehavior` instead.")
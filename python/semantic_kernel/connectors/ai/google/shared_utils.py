@@ -1,20 +1,17 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import asyncio
 import logging
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior, FunctionChoiceType
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceType
 from semantic_kernel.contents.chat_history import ChatHistory
-from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.function_result_content import FunctionResultContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
 from semantic_kernel.exceptions.service_exceptions import (
     ServiceInvalidExecutionSettingsError,
     ServiceInvalidRequestError,
 )
-from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
 from semantic_kernel.kernel import Kernel
 
@@ -47,33 +44,6 @@ def filter_system_message(chat_history: ChatHistory) -> str | None:
     return None
 
 
-async def invoke_function_calls(
-    function_calls: list[FunctionCallContent],
-    chat_history: ChatHistory,
-    kernel: Kernel,
-    arguments: KernelArguments | None,
-    function_call_count: int,
-    request_index: int,
-    function_behavior: FunctionChoiceBehavior,
-):
-    """Invoke function calls."""
-    logger.info(f"processing {function_call_count} tool calls in parallel.")
-
-    return await asyncio.gather(
-        *[
-            kernel.invoke_function_call(
-                function_call=function_call,
-                chat_history=chat_history,
-                arguments=arguments,
-                function_call_count=function_call_count,
-                request_index=request_index,
-                function_behavior=function_behavior,
-            )
-            for function_call in function_calls
-        ],
-    )
-
-
 FUNCTION_CHOICE_TYPE_TO_GOOGLE_FUNCTION_CALLING_MODE = {
     FunctionChoiceType.AUTO: "AUTO",
     FunctionChoiceType.NONE: "NONE",
@@ -2,7 +2,6 @@
 
 import sys
 from collections.abc import AsyncGenerator, AsyncIterable
-from functools import reduce
 from typing import Any
 
 import vertexai
@@ -10,11 +9,15 @@ from google.cloud.aiplatform_v1beta1.types.content import Content
 from pydantic import ValidationError
 from vertexai.generative_models import Candidate, GenerationResponse, GenerativeModel
 
+from semantic_kernel.connectors.ai.auto_function_invocation_loop import (
+    AutoFunctionInvocationLoop,
+    MessageCache,
+    prepare_messages_with_cache,
+)
 from semantic_kernel.connectors.ai.google.shared_utils import (
     configure_function_choice_behavior,
     filter_system_message,
     format_gemini_function_name_to_kernel_function_fully_qualified_name,
-    invoke_function_calls,
 )
 from semantic_kernel.connectors.ai.google.vertex_ai.services.utils import (
     finish_reason_from_vertex_ai_to_semantic_kernel,
@@ -122,31 +125,14 @@ class VertexAIChatCompletion(VertexAIBase, ChatCompletionClientBase):
 
         configure_function_choice_behavior(settings, kernel, update_settings_from_function_choice_configuration)
 
-        for request_index in range(settings.function_choice_behavior.maximum_auto_invoke_attempts):
-            completions = await self._send_chat_request(chat_history, settings)
-            chat_history.add_message(message=completions[0])
-            function_calls = [item for item in chat_history.messages[-1].items if isinstance(item, FunctionCallContent)]
-            if (fc_count := len(function_calls)) == 0:
-                return completions
-
-            results = await invoke_function_calls(
-                function_calls=function_calls,
-                chat_history=chat_history,
-                kernel=kernel,
-                arguments=kwargs.get("arguments", None),
-                function_call_count=fc_count,
-                request_index=request_index,
-                function_behavior=settings.function_choice_behavior,
-            )
-
-            if any(result.terminate for result in results if result is not None):
-                return completions
-        else:
-            # do a final call without auto function calling
-            return await self._send_chat_request(chat_history, settings)
+        loop = AutoFunctionInvocationLoop(self, settings, kernel, kwargs.get("arguments", None))
+        return await loop.get_chat_message_contents(chat_history)
 
     async def _send_chat_request(
-        self, chat_history: ChatHistory, settings: VertexAIChatPromptExecutionSettings
+        self,
+        chat_history: ChatHistory,
+        settings: VertexAIChatPromptExecutionSettings,
+        message_cache: MessageCache | None = None,
     ) -> list[ChatMessageContent]:
         """Send a chat request to the Vertex AI service."""
         vertexai.init(project=self.service_settings.project_id, location=self.service_settings.region)
@@ -156,7 +142,7 @@ class VertexAIChatCompletion(VertexAIBase, ChatCompletionClientBase):
         )
 
         response: GenerationResponse = await model.generate_content_async(
-            contents=self._prepare_chat_history_for_request(chat_history),
+            contents=self._prepare_messages_for_request(chat_history, message_cache),
             generation_config=settings.prepare_settings_dict(),
             tools=settings.tools,
             tool_config=settings.tool_config,
@@ -240,49 +226,18 @@ class VertexAIChatCompletion(VertexAIBase, ChatCompletionClientBase):
         kernel = kwargs.get("kernel")
         if not isinstance(kernel, Kernel):
             raise ServiceInvalidExecutionSettingsError("Kernel is required for auto invoking functions.")
-        if not settings.function_choice_behavior:
-            raise ServiceInvalidExecutionSettingsError(
-                "Function choice behavior is required for auto invoking functions."
-            )
 
         configure_function_choice_behavior(settings, kernel, update_settings_from_function_choice_configuration)
 
-        for request_index in range(settings.function_choice_behavior.maximum_auto_invoke_attempts):
-            all_messages: list[StreamingChatMessageContent] = []
-            function_call_returned = False
-            async for messages in self._send_chat_streaming_request(chat_history, settings):
-                for message in messages:
-                    if message:
-                        all_messages.append(message)
-                        if any(isinstance(item, FunctionCallContent) for item in message.items):
-                            function_call_returned = True
-                yield messages
-
-            if not function_call_returned:
-                # Response doesn't contain any function calls. No need to proceed to the next request.
-                return
-
-            full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
-            function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
-            chat_history.add_message(message=full_completion)
-
-            results = await invoke_function_calls(
-                function_calls=function_calls,
-                chat_history=chat_history,
-                kernel=kernel,
-                arguments=kwargs.get("arguments", None),
-                function_call_count=len(function_calls),
-                request_index=request_index,
-                function_behavior=settings.function_choice_behavior,
-            )
-
-            if any(result.terminate for result in results if result is not None):
-                return
+        loop = AutoFunctionInvocationLoop(self, settings, kernel, kwargs.get("arguments", None))
+        async for messages in loop.get_streaming_chat_message_contents(chat_history):
+            yield messages
 
     async def _send_chat_streaming_request(
         self,
         chat_history: ChatHistory,
         settings: VertexAIChatPromptExecutionSettings,
+        message_cache: MessageCache | None = None,
     ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
         """Send a streaming chat request to the Vertex AI service."""
         vertexai.init(project=self.service_settings.project_id, location=self.service_settings.region)
@@ -292,7 +247,7 @@ class VertexAIChatCompletion(VertexAIBase, ChatCompletionClientBase):
         )
 
         response: AsyncIterable[GenerationResponse] = await model.generate_content_async(
-            contents=self._prepare_chat_history_for_request(chat_history),
+            contents=self._prepare_messages_for_request(chat_history, message_cache),
             generation_config=settings.prepare_settings_dict(),
             tools=settings.tools,
             tool_config=settings.tool_config,
@@ -363,21 +318,42 @@ class VertexAIChatCompletion(VertexAIBase, ChatCompletionClientBase):
         role_key: str = "role",
         content_key: str = "content",
     ) -> list[Content]:
-        chat_request_messages: list[Content] = []
-
-        for message in chat_history.messages:
-            if message.role == AuthorRole.SYSTEM:
-                # Skip system messages since they are not part of the chat request.
-                # System message will be provided as system_instruction in the model.
-                continue
-            if message.role == AuthorRole.USER:
-                chat_request_messages.append(Content(role="user", parts=format_user_message(message)))
-            elif message.role == AuthorRole.ASSISTANT:
-                chat_request_messages.append(Content(role="model", parts=format_assistant_message(message)))
-            elif message.role == AuthorRole.TOOL:
-                chat_request_messages.append(Content(role="function", parts=format_tool_message(message)))
-
-        return chat_request_messages
+        return [
+            content
+            for message in chat_history.messages
+            if (content := self._prepare_message_for_request(message)) is not None
+        ]
+
+    def _prepare_messages_for_request(
+        self, chat_history: ChatHistory, message_cache: MessageCache | None = None
+    ) -> list[Content]:
+        """Convert the messages of the chat history for a request.
+
+        The messages are converted with `_prepare_chat_history_for_request`. With a message cache,
+        and unless a subclass overrides that method, they are converted one at a time
+        with `_prepare_message_for_request` instead, reusing the messages in the cache.
+        """
+        if (
+            message_cache is None
+            or type(self)._prepare_chat_history_for_request
+            is not VertexAIChatCompletion._prepare_chat_history_for_request
+        ):
+            return self._prepare_chat_history_for_request(chat_history)
+        return prepare_messages_with_cache(chat_history, message_cache, self._prepare_message_for_request)
+
+    def _prepare_message_for_request(self, message: ChatMessageContent) -> Content | None:
+        """Convert a message of the chat history to the content of a request, None if it is not sent."""
+        if message.role == AuthorRole.SYSTEM:
+            # Skip system messages since they are not part of the chat request.
+            # System message will be provided as system_instruction in the model.
+            return None
+        if message.role == AuthorRole.USER:
+            return Content(role="user", parts=format_user_message(message))
+        if message.role == AuthorRole.ASSISTANT:
+            return Content(role="model", parts=format_assistant_message(message))
+        if message.role == AuthorRole.TOOL:
+            return Content(role="function", parts=format_tool_message(message))
+        return None
 
     def _get_metadata_from_response(self, response: GenerationResponse) -> dict[str, Any]:
         """Get metadata from the response.
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from semantic_kernel.connectors.ai.hugging_face.hf_inference_executor import HuggingFaceInferenceExecutor
 from semantic_kernel.connectors.ai.hugging_face.hf_prompt_execution_settings import (
     HuggingFacePromptExecutionSettings,
 )
@@ -11,6 +12,7 @@ from semantic_kernel.connectors.ai.hugging_face.services.hf_text_embedding impor
 )
 
 __all__ = [
+    "HuggingFaceInferenceExecutor",
     "HuggingFacePromptExecutionSettings",
     "HuggingFaceTextCompletion",
     "HuggingFaceTextEmbedding",
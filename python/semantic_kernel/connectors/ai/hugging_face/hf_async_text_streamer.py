@@ -0,0 +1,50 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from typing import Any
+
+from transformers import TextIteratorStreamer
+
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+
+@experimental_class
+class AsyncTextIteratorStreamer(TextIteratorStreamer):
+    """A TextIteratorStreamer that is iterated with `async for`, without blocking the event loop.
+
+    The generation runs on another thread and hands the decoded text to the event loop
+    the streamer was created on, call `stop` when the generation failed to end the iteration.
+    It must be created from a coroutine.
+
+    Args:
+        tokenizer (Any): The tokenizer used to decode the tokens.
+        skip_prompt (bool): Whether to skip the prompt. (default: False)
+        decode_kwargs (Any): Keyword arguments for the decode method of the tokenizer.
+    """
+
+    def __init__(self, tokenizer: Any, skip_prompt: bool = False, **decode_kwargs: Any) -> None:
+        """Create a streamer for the running event loop."""
+        super().__init__(tokenizer, skip_prompt=skip_prompt, **decode_kwargs)
+        self.loop = asyncio.get_running_loop()
+        self.text_queue: asyncio.Queue[str | None] = asyncio.Queue()  # type: ignore[assignment]
+
+    def on_finalized_text(self, text: str, stream_end: bool = False) -> None:
+        """Hand the text to the event loop, called from the generation thread."""
+        self.loop.call_soon_threadsafe(self.text_queue.put_nowait, text)
+        if stream_end:
+            self.loop.call_soon_threadsafe(self.text_queue.put_nowait, self.stop_signal)
+
+    def stop(self) -> None:
+        """Stop the iteration after the text received so far, called on the event loop when the generation failed."""
+        self.text_queue.put_nowait(self.stop_signal)
+
+    def __aiter__(self) -> "AsyncTextIteratorStreamer":
+        """Iterate the text as it is generated."""
+        return self
+
+    async def __anext__(self) -> str:
+        """Wait for the next text."""
+        value = await self.text_queue.get()
+        if value is self.stop_signal:
+            raise StopAsyncIteration
+        return value  # type: ignore[return-value]
@@ -0,0 +1,69 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import contextvars
+import functools
+import logging
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@experimental_class
+class HuggingFaceInferenceExecutor:
+    """Runs the blocking inference of local Hugging Face models on worker threads, off the event loop.
+
+    The models run in the process that loaded them, torch releases the GIL during inference,
+    so threads are used rather than processes, which would need a copy of the model each.
+    At most `max_workers + max_queue_size` calls are handed to the threads at any time,
+    the other calls wait on the event loop, where they can still be cancelled.
+    One executor can be shared by several services, for instance to serialize the use of a single GPU.
+
+    Args:
+        max_workers (int): The number of inference threads. (default: 1)
+        max_queue_size (int): The number of calls that are queued for the threads
+            while all threads are busy. (default: 0)
+    """
+
+    def __init__(self, max_workers: int = 1, max_queue_size: int = 0) -> None:
+        """Create an inference executor."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must not be negative.")
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sk-hf-inference")
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking function on an inference thread and wait for the result.
+
+        Args:
+            func (Callable): The blocking function, such as a pipeline or the encode method of a model.
+            args (Any): The positional arguments of the function.
+            kwargs (Any): The keyword arguments of the function.
+
+        Returns:
+            The result of the function, exceptions of the function are raised.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_workers + self.max_queue_size)
+        context = contextvars.copy_context()
+        async with semaphore:
+            return await loop.run_in_executor(self._executor, functools.partial(context.run, func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the inference threads, after the running calls are finished if wait is True."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
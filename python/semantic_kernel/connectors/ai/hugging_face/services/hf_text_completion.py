@@ -1,9 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
 import sys
 from collections.abc import AsyncGenerator
-from threading import Thread
 from typing import Any, Literal
 
 if sys.version_info >= (3, 12):
@@ -12,8 +12,11 @@ else:
     from typing_extensions import override  # pragma: no cover
 
 import torch
-from transformers import AutoTokenizer, TextIteratorStreamer, pipeline
+from pydantic import PrivateAttr
+from transformers import AutoTokenizer, pipeline
 
+from semantic_kernel.connectors.ai.hugging_face.hf_async_text_streamer import AsyncTextIteratorStreamer
+from semantic_kernel.connectors.ai.hugging_face.hf_inference_executor import HuggingFaceInferenceExecutor
 from semantic_kernel.connectors.ai.hugging_face.hf_prompt_execution_settings import HuggingFacePromptExecutionSettings
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.connectors.ai.text_completion_client_base import TextCompletionClientBase
@@ -25,11 +28,17 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 class HuggingFaceTextCompletion(TextCompletionClientBase):
-    """Hugging Face text completion service."""
+    """Hugging Face text completion service.
+
+    The model runs on the threads of the inference executor, so it does not block the event loop.
+    """
 
     task: Literal["summarization", "text-generation", "text2text-generation"]
     device: str
     generator: Any
+    executor: HuggingFaceInferenceExecutor
+
+    _tokenizer: Any = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -39,6 +48,7 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
         service_id: str | None = None,
         model_kwargs: dict[str, Any] | None = None,
         pipeline_kwargs: dict[str, Any] | None = None,
+        executor: HuggingFaceInferenceExecutor | None = None,
     ) -> None:
         """Initializes a new instance of the HuggingFaceTextCompletion class.
 
@@ -60,6 +70,8 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
             pipeline_kwargs (dict[str, Any]): Additional keyword arguments passed along
                 to the specific pipeline init (see the documentation for the corresponding pipeline class
                 for possible values). (optional)
+            executor (HuggingFaceInferenceExecutor): The executor that runs the model,
+                defaults to an executor with a single thread for this service. (optional)
 
         Note that this model will be downloaded from the Hugging Face model hub.
         """
@@ -77,6 +89,7 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
             task=task,
             device=resolved_device,
             generator=generator,
+            executor=executor or HuggingFaceInferenceExecutor(),
         )
 
     async def get_text_contents(
@@ -98,7 +111,7 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
         assert isinstance(settings, HuggingFacePromptExecutionSettings)  # nosec
 
         try:
-            results = self.generator(prompt, **settings.prepare_settings_dict())
+            results = await self.executor.run(self.generator, prompt, **settings.prepare_settings_dict())
         except Exception as e:
             raise ServiceResponseException("Hugging Face completion failed") from e
         if isinstance(results, list):
@@ -138,24 +151,32 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
                     If you need multiple responses, please use the complete method.",
             )
         try:
-            streamer = TextIteratorStreamer(AutoTokenizer.from_pretrained(self.ai_model_id))
+            streamer = AsyncTextIteratorStreamer(self._get_tokenizer())
             # See https://github.com/huggingface/transformers/blob/main/src/transformers/generation/streamers.py#L159
-            thread = Thread(
-                target=self.generator, args={prompt}, kwargs=settings.prepare_settings_dict(streamer=streamer)
+            generation = asyncio.ensure_future(
+                self.executor.run(self.generator, prompt, **settings.prepare_settings_dict(streamer=streamer))
             )
-            thread.start()
+            generation.add_done_callback(lambda _: streamer.stop())
 
-            for new_text in streamer:
+            async for new_text in streamer:
                 yield [
                     StreamingTextContent(
                         choice_index=0, inner_content=new_text, text=new_text, ai_model_id=self.ai_model_id
                     )
                 ]
 
-            thread.join()
+            await generation
         except Exception as e:
             raise ServiceResponseException("Hugging Face completion failed") from e
 
+    def _get_tokenizer(self) -> Any:
+        """Get the tokenizer of the pipeline, or load the tokenizer of the model once."""
+        if self._tokenizer is None:
+            self._tokenizer = getattr(self.generator, "tokenizer", None) or AutoTokenizer.from_pretrained(
+                self.ai_model_id
+            )
+        return self._tokenizer
+
     @override
     def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
         """Create a request settings object."""
@@ -14,6 +14,7 @@ import torch
 from numpy import ndarray
 
 from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.hugging_face.hf_inference_executor import HuggingFaceInferenceExecutor
 from semantic_kernel.exceptions import ServiceResponseException
 from semantic_kernel.utils.experimental_decorator import experimental_class
 
@@ -27,16 +28,21 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 @experimental_class
 class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
-    """Hugging Face text embedding service."""
+    """Hugging Face text embedding service.
+
+    The model runs on the threads of the inference executor, so it does not block the event loop.
+    """
 
     device: str
     generator: Any
+    executor: HuggingFaceInferenceExecutor
 
     def __init__(
         self,
         ai_model_id: str,
         device: int = -1,
         service_id: str | None = None,
+        executor: HuggingFaceInferenceExecutor | None = None,
     ) -> None:
         """Initializes a new instance of the HuggingFaceTextEmbedding class.
 
@@ -45,6 +51,8 @@ class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
                 https://huggingface.co/sentence-transformers
             device (int): Device to run the model on, -1 for CPU, 0+ for GPU. (optional)
             service_id (str): Service ID for the model. (optional)
+            executor (HuggingFaceInferenceExecutor): The executor that runs the model,
+                defaults to an executor with a single thread for this service. (optional)
 
         Note that this model will be downloaded from the Hugging Face model hub.
         """
@@ -54,6 +62,7 @@ class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
             service_id=service_id,
             device=resolved_device,
             generator=sentence_transformers.SentenceTransformer(model_name_or_path=ai_model_id, device=resolved_device),
+            executor=executor or HuggingFaceInferenceExecutor(),
         )
 
     @override
@@ -65,7 +74,7 @@ class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
     ) -> ndarray:
         try:
             logger.info(f"Generating embeddings for {len(texts)} texts.")
-            return self.generator.encode(sentences=texts, convert_to_numpy=True, **kwargs)
+            return await self.executor.run(self.generator.encode, sentences=texts, convert_to_numpy=True, **kwargs)
         except Exception as e:
             raise ServiceResponseException("Hugging Face embeddings failed", e) from e
 
@@ -78,6 +87,6 @@ class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
     ) -> "list[Tensor] | ndarray | Tensor":
         try:
             logger.info(f"Generating raw embeddings for {len(texts)} texts.")
-            return self.generator.encode(sentences=texts, **kwargs)
+            return await self.executor.run(self.generator.encode, sentences=texts, **kwargs)
         except Exception as e:
             raise ServiceResponseException("Hugging Face embeddings failed", e) from e
@@ -9,7 +9,7 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self  # pragma: no cover
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 
 from semantic_kernel.connectors.ai.function_call_behavior import FunctionCallBehavior
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
@@ -75,6 +75,9 @@ class OpenAIChatPromptExecutionSettings(OpenAIPromptExecutionSettings):
         None,
         description="Do not set this manually. It is set by the service based on the function choice configuration.",
     )
+    # the tools with the functions they were created from,
+    # kept by the service to only serialize the tools again when the functions change
+    _serialized_tools: tuple[str, list[Any], list[dict[str, Any]]] | None = PrivateAttr(default=None)
 
     @field_validator("functions", "function_call", mode="after")
     @classmethod
@@ -14,6 +14,7 @@ from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_embedding_base
 from semantic_kernel.connectors.ai.open_ai.settings.azure_open_ai_settings import AzureOpenAISettings
 from semantic_kernel.exceptions.service_exceptions import ServiceInitializationError
 from semantic_kernel.utils.experimental_decorator import experimental_class
+from semantic_kernel.utils.rate_limiter import RateLimiter
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -35,6 +36,9 @@ class AzureTextEmbedding(AzureOpenAIConfigBase, OpenAITextEmbeddingBase):
         default_headers: Mapping[str, str] | None = None,
         async_client: AsyncAzureOpenAI | None = None,
         env_file_path: str | None = None,
+        binary_embeddings: bool = False,
+        max_concurrent_requests: int = 1,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         """Initialize an AzureTextEmbedding service.
 
@@ -57,6 +61,12 @@ class AzureTextEmbedding(AzureOpenAIConfigBase, OpenAITextEmbeddingBase):
         async_client (Optional[AsyncAzureOpenAI]): An existing client to use. (Optional)
         env_file_path (str | None): Use the environment settings file as a fallback to
             environment variables. (Optional)
+        binary_embeddings (bool): Whether to receive the embeddings base64 encoded and decode them
+            into a float32 matrix. (Optional) The default value is False.
+        max_concurrent_requests (int): The maximum number of batches sent at the same time
+            when generating embeddings with a batch_size. (Optional) The default value is 1.
+        rate_limiter (RateLimiter | None): A requests-per-minute and tokens-per-minute budget
+            the batches wait for. (Optional)
         """
         try:
             azure_openai_settings = AzureOpenAISettings.create(
@@ -85,6 +95,9 @@ class AzureTextEmbedding(AzureOpenAIConfigBase, OpenAITextEmbeddingBase):
             ai_model_type=OpenAIModelTypes.EMBEDDING,
             client=async_client,
         )
+        self.binary_embeddings = binary_embeddings
+        self.max_concurrent_requests = max_concurrent_requests
+        self.rate_limiter = rate_limiter
 
     @classmethod
     def from_dict(cls, settings: dict[str, Any]) -> "AzureTextEmbedding":
@@ -106,4 +119,7 @@ class AzureTextEmbedding(AzureOpenAIConfigBase, OpenAITextEmbeddingBase):
             ad_token_provider=settings.get("ad_token_provider"),
             default_headers=settings.get("default_headers"),
             env_file_path=settings.get("env_file_path"),
+            binary_embeddings=settings.get("binary_embeddings", False),
+            max_concurrent_requests=settings.get("max_concurrent_requests", 1),
+            rate_limiter=settings.get("rate_limiter"),
         )
@@ -1,10 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import asyncio
 import logging
 import sys
 from collections.abc import AsyncGenerator
-from functools import reduce
+from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if sys.version_info >= (3, 12):
@@ -18,6 +17,11 @@ from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
 from typing_extensions import deprecated
 
+from semantic_kernel.connectors.ai.auto_function_invocation_loop import (
+    AutoFunctionInvocationLoop,
+    MessageCache,
+    prepare_messages_with_cache,
+)
 from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
 from semantic_kernel.connectors.ai.function_call_behavior import FunctionCallBehavior
 from semantic_kernel.connectors.ai.function_calling_utils import update_settings_from_function_call_configuration
@@ -41,6 +45,7 @@ from semantic_kernel.filters.auto_function_invocation.auto_function_invocation_c
 from semantic_kernel.utils.telemetry.decorators import trace_chat_completion
 
 if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.function_call_choice_configuration import FunctionCallChoiceConfiguration
     from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
     from semantic_kernel.functions.kernel_arguments import KernelArguments
     from semantic_kernel.kernel import Kernel
@@ -98,50 +103,19 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
                 )
 
         # behavior for non-function calling or for enable, but not auto-invoke.
-        self._prepare_settings(settings, chat_history, stream_request=False, kernel=kernel)
+        # the messages converted for the first request are reused by the next requests of auto function invocation
+        message_cache: MessageCache = {}
+        self._prepare_settings(settings, chat_history, stream_request=False, kernel=kernel, message_cache=message_cache)
         if settings.function_choice_behavior is None or (
             settings.function_choice_behavior and not settings.function_choice_behavior.auto_invoke_kernel_functions
         ):
-            return await self._send_chat_request(settings)
+            return await self._send_chat_request(chat_history, settings)
 
         # loop for auto-invoke function calls
-        for request_index in range(settings.function_choice_behavior.maximum_auto_invoke_attempts):
-            completions = await self._send_chat_request(settings)
-            # there is only one chat message, this was checked earlier
-            chat_history.add_message(message=completions[0])
-            # get the function call contents from the chat message
-            function_calls = [item for item in chat_history.messages[-1].items if isinstance(item, FunctionCallContent)]
-            if (fc_count := len(function_calls)) == 0:
-                return completions
-
-            logger.info(f"processing {fc_count} tool calls in parallel.")
-
-            # this function either updates the chat history with the function call results
-            # or returns the context, with terminate set to True
-            # in which case the loop will break and the function calls are returned.
-            results = await asyncio.gather(
-                *[
-                    self._process_function_call(
-                        function_call=function_call,
-                        chat_history=chat_history,
-                        kernel=kernel,
-                        arguments=kwargs.get("arguments", None),
-                        function_call_count=fc_count,
-                        request_index=request_index,
-                        function_call_behavior=settings.function_choice_behavior,
-                    )
-                    for function_call in function_calls
-                ],
-            )
-
-            if any(result.terminate for result in results if result is not None):
-                return completions
-
-            self._update_settings(settings, chat_history, kernel=kernel)
-        else:
-            # do a final call, without function calling when the max has been reached.
-            settings.function_choice_behavior.auto_invoke_kernel_functions = False
-            return await self._send_chat_request(settings)
+        loop = self._create_auto_function_invocation_loop(
+            settings, kernel, kwargs.get("arguments", None), message_cache
+        )
+        return await loop.get_chat_message_contents(chat_history)
 
     @override
     async def get_streaming_chat_message_contents(
@@ -174,85 +148,45 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
                 )
 
         # Prepare settings for streaming requests
-        self._prepare_settings(settings, chat_history, stream_request=True, kernel=kernel)
-
-        request_attempts = (
-            settings.function_choice_behavior.maximum_auto_invoke_attempts
-            if (settings.function_choice_behavior and settings.function_choice_behavior.auto_invoke_kernel_functions)
-            else 1
-        )
-        # hold the messages, if there are more than one response, it will not be used, so we flatten
-        for request_index in range(request_attempts):
-            all_messages: list[StreamingChatMessageContent] = []
-            function_call_returned = False
-            async for messages in self._send_chat_stream_request(settings):
-                for msg in messages:
-                    if msg is not None:
-                        all_messages.append(msg)
-                        if any(isinstance(item, FunctionCallContent) for item in msg.items):
-                            function_call_returned = True
+        # the messages converted for the first request are reused by the next requests of auto function invocation
+        message_cache: MessageCache = {}
+        self._prepare_settings(settings, chat_history, stream_request=True, kernel=kernel, message_cache=message_cache)
+        if settings.function_choice_behavior is None or (
+            settings.function_choice_behavior and not settings.function_choice_behavior.auto_invoke_kernel_functions
+        ):
+            async for messages in self._send_chat_streaming_request(chat_history, settings):
                 yield messages
+            return
 
-            if (
-                settings.function_choice_behavior is None
-                or (
-                    settings.function_choice_behavior
-                    and not settings.function_choice_behavior.auto_invoke_kernel_functions
-                )
-                or not function_call_returned
-            ):
-                # no need to process function calls
-                # note that we don't check the FinishReason and instead check whether there are any tool calls,
-                # as the service may return a FinishReason of "stop" even if there are tool calls to be made,
-                # in particular if a required tool is specified.
-                return
-
-            # there is one response stream in the messages, combining now to create the full completion
-            # depending on the prompt, the message may contain both function call content and others
-            full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
-            function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
-            chat_history.add_message(message=full_completion)
-
-            fc_count = len(function_calls)
-            logger.info(f"processing {fc_count} tool calls in parallel.")
-
-            # this function either updates the chat history with the function call results
-            # or returns the context, with terminate set to True
-            # in which case the loop will break and the function calls are returned.
-            # Exceptions are not caught, that is up to the developer, can be done with a filter
-            results = await asyncio.gather(
-                *[
-                    self._process_function_call(
-                        function_call=function_call,
-                        chat_history=chat_history,
-                        kernel=kernel,
-                        arguments=kwargs.get("arguments", None),
-                        function_call_count=fc_count,
-                        request_index=request_index,
-                        function_call_behavior=settings.function_choice_behavior,
-                    )
-                    for function_call in function_calls
-                ],
-            )
-            if any(result.terminate for result in results if result is not None):
-                return
-
-            self._update_settings(settings, chat_history, kernel=kernel)
+        # loop for auto-invoke function calls
+        loop = self._create_auto_function_invocation_loop(
+            settings, kernel, kwargs.get("arguments", None), message_cache
+        )
+        async for messages in loop.get_streaming_chat_message_contents(chat_history):
+            yield messages
 
     # endregion
     # region internal handlers
 
-    async def _send_chat_request(self, settings: OpenAIChatPromptExecutionSettings) -> list["ChatMessageContent"]:
-        """Send the chat request."""
+    async def _send_chat_request(
+        self,
+        chat_history: ChatHistory,
+        settings: OpenAIChatPromptExecutionSettings,
+        message_cache: MessageCache | None = None,
+    ) -> list["ChatMessageContent"]:
+        """Send the chat request, the messages of the chat history are in the settings."""
         response = await self._send_request(request_settings=settings)
         assert isinstance(response, ChatCompletion)  # nosec
         response_metadata = self._get_metadata_from_chat_response(response)
         return [self._create_chat_message_content(response, choice, response_metadata) for choice in response.choices]
 
-    async def _send_chat_stream_request(
-        self, settings: OpenAIChatPromptExecutionSettings
+    async def _send_chat_streaming_request(
+        self,
+        chat_history: ChatHistory,
+        settings: OpenAIChatPromptExecutionSettings,
+        message_cache: MessageCache | None = None,
     ) -> AsyncGenerator[list["StreamingChatMessageContent"], None]:
-        """Send the chat stream request."""
+        """Send the chat stream request, the messages of the chat history are in the settings."""
         response = await self._send_request(request_settings=settings)
         if not isinstance(response, AsyncStream):
             raise ServiceInvalidResponseError("Expected an AsyncStream[ChatCompletionChunk] response.")
@@ -374,31 +308,104 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
         chat_history: ChatHistory,
         stream_request: bool = False,
         kernel: "Kernel | None" = None,
+        message_cache: MessageCache | None = None,
     ) -> None:
         """Prepare the prompt execution settings for the chat request."""
         settings.stream = stream_request
         if not settings.ai_model_id:
             settings.ai_model_id = self.ai_model_id
-        self._update_settings(settings=settings, chat_history=chat_history, kernel=kernel)
+        self._update_settings(settings=settings, chat_history=chat_history, kernel=kernel, message_cache=message_cache)
 
     def _update_settings(
         self,
         settings: OpenAIChatPromptExecutionSettings,
         chat_history: ChatHistory,
         kernel: "Kernel | None" = None,
+        message_cache: MessageCache | None = None,
     ) -> None:
-        """Update the settings with the chat history."""
-        settings.messages = self._prepare_chat_history_for_request(chat_history)
+        """Update the settings with the chat history.
+
+        With the message cache of a run of auto function invocation, only the messages that were not serialized
+        for an earlier request of the run are serialized. The tools serialized by a previous update of the same
+        settings are reused, so they are only serialized again when the available functions change.
+        """
+        settings.messages = self._prepare_messages_for_request(chat_history, message_cache)
         if settings.function_choice_behavior and kernel:
             settings.function_choice_behavior.configure(
                 kernel=kernel,
-                update_settings_callback=update_settings_from_function_call_configuration,
+                update_settings_callback=self._update_tools_from_function_call_configuration,
                 settings=settings,
             )
 
+    def _prepare_messages_for_request(
+        self, chat_history: ChatHistory, message_cache: MessageCache | None = None
+    ) -> list[dict[str, Any]]:
+        """Serialize the messages of the chat history.
+
+        The messages are serialized with `_prepare_chat_history_for_request`. With a message cache,
+        and unless a subclass overrides that method, they are serialized one at a time instead,
+        reusing the messages in the cache.
+        """
+        if (
+            message_cache is None
+            or type(self)._prepare_chat_history_for_request
+            is not ChatCompletionClientBase._prepare_chat_history_for_request
+        ):
+            return self._prepare_chat_history_for_request(chat_history)
+        return prepare_messages_with_cache(chat_history, message_cache, lambda message: message.to_dict())
+
+    @staticmethod
+    def _update_tools_from_function_call_configuration(
+        function_choice_configuration: "FunctionCallChoiceConfiguration",
+        settings: OpenAIChatPromptExecutionSettings,
+        type: str,
+    ) -> None:
+        """Update the tools of the settings, reusing the tools if the available functions did not change."""
+        functions = function_choice_configuration.available_functions or []
+        cached = settings._serialized_tools
+        if (
+            functions
+            and cached
+            and cached[0] == type
+            and len(cached[1]) == len(functions)
+            and all(cached_function is function for cached_function, function in zip(cached[1], functions))
+        ):
+            settings.tool_choice = type
+            settings.tools = cached[2]
+            return
+        update_settings_from_function_call_configuration(function_choice_configuration, settings, type)
+        if functions and settings.tools is not None:
+            settings._serialized_tools = (type, list(functions), settings.tools)
+
     # endregion
     # region function calling
 
+    def _create_auto_function_invocation_loop(
+        self,
+        settings: OpenAIChatPromptExecutionSettings,
+        kernel: "Kernel",
+        arguments: "KernelArguments | None",
+        message_cache: MessageCache | None = None,
+    ) -> AutoFunctionInvocationLoop:
+        """Create the loop that sends the requests and invokes the tool calls of auto function invocation."""
+
+        async def invoke_function_call(
+            function_call: FunctionCallContent, function_behavior: FunctionChoiceBehavior, **kwargs: Any
+        ) -> "AutoFunctionInvocationContext | None":
+            return await self._process_function_call(
+                function_call, kernel=kernel, function_call_behavior=function_behavior, **kwargs
+            )
+
+        return AutoFunctionInvocationLoop(
+            self,
+            settings,
+            kernel,
+            arguments,
+            invoke_function_call=invoke_function_call,
+            update_settings=partial(self._update_settings, settings, kernel=kernel, message_cache=message_cache),
+            message_cache=message_cache,
+        )
+
     @deprecated("Use `invoke_function_call` from the kernel instead with `FunctionChoiceBehavior`.")
     async def _process_function_call(
         self,
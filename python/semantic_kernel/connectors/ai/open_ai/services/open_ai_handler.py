@@ -2,11 +2,13 @@
 
 import logging
 from abc import ABC
+from functools import partial
 from typing import Any
 
 from openai import AsyncOpenAI, AsyncStream, BadRequestError
 from openai.types import Completion, CreateEmbeddingResponse
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from pydantic import Field
 
 from semantic_kernel.connectors.ai.open_ai.exceptions.content_filter_ai_exception import ContentFilterAIException
 from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
@@ -16,24 +18,40 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_pro
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_model_types import OpenAIModelTypes
 from semantic_kernel.exceptions import ServiceResponseException
 from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.reliability.resilience_policy import ResiliencePolicy
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 class OpenAIHandler(KernelBaseModel, ABC):
-    """Internal class for calls to OpenAI API's."""
+    """Internal class for calls to OpenAI API's.
+
+    When a resilience_policy is set, every request to the service goes through it,
+    streaming requests are retried until the response starts but not hedged.
+    """
 
     client: AsyncOpenAI
     ai_model_type: OpenAIModelTypes = OpenAIModelTypes.CHAT
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
+    resilience_policy: ResiliencePolicy | None = Field(default=None, exclude=True)
 
     async def _send_request(
         self,
         request_settings: OpenAIPromptExecutionSettings,
     ) -> ChatCompletion | Completion | AsyncStream[ChatCompletionChunk] | AsyncStream[Completion]:
         """Execute the appropriate call to OpenAI models."""
+        if self.resilience_policy is None:
+            return await self._send_single_request(request_settings)
+        return await self.resilience_policy.execute(
+            partial(self._send_single_request, request_settings), hedge=not request_settings.stream
+        )
+
+    async def _send_single_request(
+        self,
+        request_settings: OpenAIPromptExecutionSettings,
+    ) -> ChatCompletion | Completion | AsyncStream[ChatCompletionChunk] | AsyncStream[Completion]:
         try:
             if self.ai_model_type == OpenAIModelTypes.CHAT:
                 response = await self.client.chat.completions.create(**request_settings.prepare_settings_dict())
@@ -58,6 +76,11 @@ class OpenAIHandler(KernelBaseModel, ABC):
             ) from ex
 
     async def _send_embedding_request(self, settings: OpenAIEmbeddingPromptExecutionSettings) -> list[Any]:
+        if self.resilience_policy is None:
+            return await self._send_single_embedding_request(settings)
+        return await self.resilience_policy.execute(partial(self._send_single_embedding_request, settings))
+
+    async def _send_single_embedding_request(self, settings: OpenAIEmbeddingPromptExecutionSettings) -> list[Any]:
         try:
             response = await self.client.embeddings.create(**settings.prepare_settings_dict())
             self.store_usage(response)
@@ -13,6 +13,7 @@ from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_embedding_base
 from semantic_kernel.connectors.ai.open_ai.settings.open_ai_settings import OpenAISettings
 from semantic_kernel.exceptions.service_exceptions import ServiceInitializationError
 from semantic_kernel.utils.experimental_decorator import experimental_class
+from semantic_kernel.utils.rate_limiter import RateLimiter
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -33,6 +34,9 @@ class OpenAITextEmbedding(OpenAIConfigBase, OpenAITextEmbeddingBase):
         async_client: AsyncOpenAI | None = None,
         env_file_path: str | None = None,
         env_file_encoding: str | None = None,
+        binary_embeddings: bool = False,
+        max_concurrent_requests: int = 1,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         """Initializes a new instance of the OpenAITextCompletion class.
 
@@ -50,6 +54,12 @@ class OpenAITextEmbedding(OpenAIConfigBase, OpenAITextEmbeddingBase):
             env_file_path (str | None): Use the environment settings file as
                 a fallback to environment variables. (Optional)
             env_file_encoding (str | None): The encoding of the environment settings file. (Optional)
+            binary_embeddings (bool): Whether to receive the embeddings base64 encoded and decode them
+                into a float32 matrix. (Optional)
+            max_concurrent_requests (int): The maximum number of batches sent at the same time
+                when generating embeddings with a batch_size. (Optional) Defaults to 1.
+            rate_limiter (RateLimiter | None): A requests-per-minute and tokens-per-minute budget
+                the batches wait for. (Optional)
         """
         try:
             openai_settings = OpenAISettings.create(
@@ -72,6 +82,9 @@ class OpenAITextEmbedding(OpenAIConfigBase, OpenAITextEmbeddingBase):
             default_headers=default_headers,
             client=async_client,
         )
+        self.binary_embeddings = binary_embeddings
+        self.max_concurrent_requests = max_concurrent_requests
+        self.rate_limiter = rate_limiter
 
     @classmethod
     def from_dict(cls: type[T_], settings: dict[str, Any]) -> T_:
@@ -87,4 +100,7 @@ class OpenAITextEmbedding(OpenAIConfigBase, OpenAITextEmbeddingBase):
             service_id=settings.get("service_id"),
             default_headers=settings.get("default_headers", {}),
             env_file_path=settings.get("env_file_path"),
+            binary_embeddings=settings.get("binary_embeddings", False),
+            max_concurrent_requests=settings.get("max_concurrent_requests", 1),
+            rate_limiter=settings.get("rate_limiter"),
         )
@@ -1,9 +1,13 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import base64
 import sys
 from typing import TYPE_CHECKING, Any
 
-from numpy import array, ndarray
+import numpy as np
+from numpy import ndarray
+from pydantic import Field
 
 if sys.version_info >= (3, 12):
     from typing import override  # pragma: no cover
@@ -15,7 +19,9 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_pro
     OpenAIEmbeddingPromptExecutionSettings,
 )
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_handler import OpenAIHandler
+from semantic_kernel.utils.async_utils import gather_or_cancel
 from semantic_kernel.utils.experimental_decorator import experimental_class
+from semantic_kernel.utils.rate_limiter import RateLimiter
 
 if TYPE_CHECKING:
     from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
@@ -23,7 +29,22 @@ if TYPE_CHECKING:
 
 @experimental_class
 class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
-    """Base class for OpenAI text embedding services."""
+    """Base class for OpenAI text embedding services.
+
+    Args:
+        max_concurrent_requests (int): The maximum number of batches sent to the service at the same time,
+            when generating embeddings with a batch_size. Defaults to 1, which sends the batches one after another.
+        rate_limiter (RateLimiter | None): An optional requests-per-minute and tokens-per-minute budget,
+            the batches wait for it before being sent.
+        binary_embeddings (bool): Whether to receive the embeddings base64 encoded and decode them
+            into a single float32 matrix, instead of parsing a list of floats per embedding.
+            This saves most of the client CPU time for large batches of large embeddings.
+            The embeddings are then float32 instead of float64. Defaults to False.
+    """
+
+    max_concurrent_requests: int = Field(default=1, gt=0)
+    rate_limiter: RateLimiter | None = None
+    binary_embeddings: bool = False
 
     @override
     async def generate_embeddings(
@@ -34,7 +55,8 @@ class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
         **kwargs: Any,
     ) -> ndarray:
         raw_embeddings = await self.generate_raw_embeddings(texts, settings, batch_size, **kwargs)
-        return array(raw_embeddings)
+        # the binary embeddings are already a matrix, asarray does not copy it
+        return np.asarray(raw_embeddings)
 
     @override
     async def generate_raw_embeddings(
@@ -51,26 +73,60 @@ class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
             settings (PromptExecutionSettings): The settings to use for the request.
             batch_size (int): The batch size to use for the request.
             kwargs (Dict[str, Any]): Additional arguments to pass to the request.
+
+        Returns:
+            Any: A list with the embedding of each text, or a float32 matrix with a row per text
+                when binary_embeddings is enabled.
         """
         if not settings:
             settings = OpenAIEmbeddingPromptExecutionSettings(ai_model_id=self.ai_model_id)
+        elif isinstance(settings, OpenAIEmbeddingPromptExecutionSettings):
+            settings = settings.model_copy()
         else:
-            if not isinstance(settings, OpenAIEmbeddingPromptExecutionSettings):
-                settings = self.get_prompt_execution_settings_from_settings(settings)
+            settings = self.get_prompt_execution_settings_from_settings(settings)
         assert isinstance(settings, OpenAIEmbeddingPromptExecutionSettings)  # nosec
         if settings.ai_model_id is None:
             settings.ai_model_id = self.ai_model_id
         for key, value in kwargs.items():
             setattr(settings, key, value)
-        raw_embeddings = []
+        decode = self.binary_embeddings and settings.encoding_format != "float"
+        if decode:
+            settings.encoding_format = "base64"
         batch_size = batch_size or len(texts)
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            settings.input = batch
-            raw_embedding = await self._send_embedding_request(settings=settings)
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def send_batch(batch: list[str]) -> list[Any]:
+            async with semaphore:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(tokens=self._estimate_tokens(batch))
+                return await self._send_embedding_request(settings=settings.model_copy(update={"input": batch}))
+
+        raw_embeddings = []
+        # the batches that are still waiting or running are cancelled when one of them fails
+        for raw_embedding in await gather_or_cancel(*(send_batch(batch) for batch in batches)):
             raw_embeddings.extend(raw_embedding)
+        if decode:
+            return self._decode_base64_embeddings(raw_embeddings)
         return raw_embeddings
 
+    @staticmethod
+    def _decode_base64_embeddings(encoded: list[str]) -> ndarray:
+        """Decode base64 encoded little-endian float32 embeddings into the rows of one float32 matrix."""
+        if not encoded:
+            return np.empty((0, 0), dtype=np.float32)
+        first = base64.b64decode(encoded[0])
+        matrix = np.empty((len(encoded), len(first) // 4), dtype=np.float32)
+        matrix[0] = np.frombuffer(first, dtype="<f4")
+        for row, data in enumerate(encoded[1:], start=1):
+            matrix[row] = np.frombuffer(base64.b64decode(data), dtype="<f4")
+        return matrix
+
+    @staticmethod
+    def _estimate_tokens(texts: list[str]) -> int:
+        """Estimate the number of tokens of the texts, using the rule of thumb of 4 characters per token."""
+        return sum(len(text) // 4 + 1 for text in texts)
+
     def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
         """Get the request settings class."""
         return OpenAIEmbeddingPromptExecutionSettings
@@ -0,0 +1,240 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import sys
+from collections.abc import AsyncGenerator, Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import Field
+
+if sys.version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.text_completion_client_base import TextCompletionClientBase
+from semantic_kernel.reliability.resilience_policy import ResiliencePolicy
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+
+    from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+    from semantic_kernel.contents.chat_history import ChatHistory
+    from semantic_kernel.contents.chat_message_content import ChatMessageContent
+    from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+    from semantic_kernel.contents.streaming_text_content import StreamingTextContent
+    from semantic_kernel.contents.text_content import TextContent
+
+T = TypeVar("T")
+
+
+async def _stream_with_policy(
+    policy: ResiliencePolicy, open_stream: Callable[[], AsyncGenerator[T, Any]]
+) -> AsyncGenerator[T, Any]:
+    """Stream the results of a service, opening the stream is retried until the first result arrives."""
+    stream: AsyncGenerator[T, Any] | None = None
+
+    async def first_result() -> tuple[bool, T | None]:
+        nonlocal stream
+        stream = open_stream()
+        try:
+            return True, await stream.__anext__()
+        except StopAsyncIteration:
+            return False, None
+        except Exception:
+            await stream.aclose()
+            raise
+
+    has_result, result = await policy.execute(first_result, hedge=False)
+    if not has_result:
+        return
+    assert stream is not None  # nosec
+    yield result  # type: ignore[misc]
+    async for result in stream:
+        yield result
+
+
+def _auto_invokes_functions(settings: "PromptExecutionSettings") -> bool:
+    """Whether the settings let the service invoke kernel functions as part of the call."""
+    function_choice_behavior = getattr(settings, "function_choice_behavior", None)
+    return function_choice_behavior is not None and function_choice_behavior.auto_invoke_kernel_functions
+
+
+@experimental_class
+class ResilientChatCompletion(ChatCompletionClientBase):
+    """A chat completion service that calls another chat completion service through a ResiliencePolicy.
+
+    Streaming calls are retried until the first chunk arrives and are not hedged.
+    Calls that auto invoke kernel functions are passed to the service without the policy,
+    because retrying the whole call would invoke the functions again on the updated chat history.
+    To apply a policy to each request of such a call, set it as the resilience_policy of the
+    OpenAI or Azure OpenAI service instead.
+
+    The service takes over the service_id of the wrapped service, so it can be added to the kernel in its place.
+    """
+
+    service: ChatCompletionClientBase
+    policy: ResiliencePolicy = Field(default_factory=ResiliencePolicy)
+
+    def __init__(
+        self,
+        service: ChatCompletionClientBase,
+        policy: ResiliencePolicy | None = None,
+        service_id: str | None = None,
+    ) -> None:
+        """Create a resilient wrapper around a chat completion service.
+
+        Args:
+            service (ChatCompletionClientBase): The chat completion service to call.
+            policy (ResiliencePolicy | None): The policy for the calls, defaults to a ResiliencePolicy
+                with retries and a circuit breaker but without hedging.
+            service_id (str | None): The service id, defaults to the service id of the wrapped service.
+        """
+        super().__init__(
+            ai_model_id=service.ai_model_id,
+            service_id=service_id or service.service_id,
+            service=service,
+            policy=policy or ResiliencePolicy(),
+        )
+
+    @override
+    async def get_chat_message_contents(
+        self,
+        chat_history: "ChatHistory",
+        settings: "PromptExecutionSettings",
+        **kwargs: Any,
+    ) -> list["ChatMessageContent"]:
+        if _auto_invokes_functions(settings):
+            return await self.service.get_chat_message_contents(chat_history, settings, **kwargs)
+        return await self.policy.execute(
+            partial(self.service.get_chat_message_contents, chat_history, settings, **kwargs)
+        )
+
+    @override
+    async def get_streaming_chat_message_contents(
+        self,
+        chat_history: "ChatHistory",
+        settings: "PromptExecutionSettings",
+        **kwargs: Any,
+    ) -> AsyncGenerator[list["StreamingChatMessageContent"], Any]:
+        open_stream = partial(self.service.get_streaming_chat_message_contents, chat_history, settings, **kwargs)
+        stream = open_stream() if _auto_invokes_functions(settings) else _stream_with_policy(self.policy, open_stream)
+        async for messages in stream:
+            yield messages
+
+    @override
+    def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
+        return self.service.get_prompt_execution_settings_class()
+
+
+@experimental_class
+class ResilientTextCompletion(TextCompletionClientBase):
+    """A text completion service that calls another text completion service through a ResiliencePolicy.
+
+    Streaming calls are retried until the first chunk arrives and are not hedged.
+
+    The service takes over the service_id of the wrapped service, so it can be added to the kernel in its place.
+    """
+
+    service: TextCompletionClientBase
+    policy: ResiliencePolicy = Field(default_factory=ResiliencePolicy)
+
+    def __init__(
+        self,
+        service: TextCompletionClientBase,
+        policy: ResiliencePolicy | None = None,
+        service_id: str | None = None,
+    ) -> None:
+        """Create a resilient wrapper around a text completion service.
+
+        Args:
+            service (TextCompletionClientBase): The text completion service to call.
+            policy (ResiliencePolicy | None): The policy for the calls, defaults to a ResiliencePolicy
+                with retries and a circuit breaker but without hedging.
+            service_id (str | None): The service id, defaults to the service id of the wrapped service.
+        """
+        super().__init__(
+            ai_model_id=service.ai_model_id,
+            service_id=service_id or service.service_id,
+            service=service,
+            policy=policy or ResiliencePolicy(),
+        )
+
+    @override
+    async def get_text_contents(self, prompt: str, settings: "PromptExecutionSettings") -> list["TextContent"]:
+        return await self.policy.execute(partial(self.service.get_text_contents, prompt, settings))
+
+    @override
+    async def get_streaming_text_contents(
+        self, prompt: str, settings: "PromptExecutionSettings"
+    ) -> AsyncGenerator[list["StreamingTextContent"], Any]:
+        async for texts in _stream_with_policy(
+            self.policy, partial(self.service.get_streaming_text_contents, prompt, settings)
+        ):
+            yield texts
+
+    @override
+    def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
+        return self.service.get_prompt_execution_settings_class()
+
+
+@experimental_class
+class ResilientEmbeddingGenerator(EmbeddingGeneratorBase):
+    """An embedding generator that calls another embedding generator through a ResiliencePolicy.
+
+    The generator takes over the service_id of the wrapped service,
+    so it can be added to the kernel or passed to SemanticTextMemory in its place.
+    """
+
+    embedding_generator: EmbeddingGeneratorBase
+    policy: ResiliencePolicy = Field(default_factory=ResiliencePolicy)
+
+    def __init__(
+        self,
+        embedding_generator: EmbeddingGeneratorBase,
+        policy: ResiliencePolicy | None = None,
+        service_id: str | None = None,
+    ) -> None:
+        """Create a resilient wrapper around an embedding generator.
+
+        Args:
+            embedding_generator (EmbeddingGeneratorBase): The embedding generator to call.
+            policy (ResiliencePolicy | None): The policy for the calls, defaults to a ResiliencePolicy
+                with retries and a circuit breaker but without hedging.
+            service_id (str | None): The service id, defaults to the service id of the embedding generator.
+        """
+        super().__init__(
+            ai_model_id=embedding_generator.ai_model_id,
+            service_id=service_id or embedding_generator.service_id,
+            embedding_generator=embedding_generator,
+            policy=policy or ResiliencePolicy(),
+        )
+
+    @override
+    async def generate_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> "ndarray":
+        return await self.policy.execute(
+            partial(self.embedding_generator.generate_embeddings, texts, settings, **kwargs)
+        )
+
+    @override
+    async def generate_raw_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> Any:
+        return await self.policy.execute(
+            partial(self.embedding_generator.generate_raw_embeddings, texts, settings, **kwargs)
+        )
+
+    @override
+    def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
+        return self.embedding_generator.get_prompt_execution_settings_class()
@@ -0,0 +1,353 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Any
+
+from pydantic import Field
+
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+if TYPE_CHECKING:
+    from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+    from semantic_kernel.filters.auto_function_invocation.auto_function_invocation_context import (
+        AutoFunctionInvocationContext,
+    )
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@experimental_class
+class ToolCallScheduler(KernelBaseModel):
+    """Controls how the tool calls that a model returns in one response are executed.
+
+    By default all tool calls run concurrently without limits. The scheduler can limit the
+    number of calls that run at the same time, in total and per plugin, so that many calls to one
+    rate limited backend do not all start at once. It can also stop calls that take too long: the model
+    then receives an error result for that call instead of the round waiting for it. And it can return
+    as soon as a call asks to terminate, which cancels the calls that are still running or waiting,
+    these receive an error result as well.
+
+    The limits apply to the tool calls of a single response.
+
+    Attributes:
+        max_concurrency: The maximum number of tool calls that run at the same time, unlimited if None.
+        max_concurrency_per_plugin: The maximum number of tool calls per plugin that run at the same time,
+            unlimited if None.
+        plugin_concurrency: The maximum number of concurrent tool calls for specific plugins, by plugin name,
+            these take precedence over max_concurrency_per_plugin.
+        timeout: The number of seconds after which a tool call is cancelled, unlimited if None.
+        function_timeouts: The timeouts for specific functions, by fully qualified name (plugin-function),
+            these take precedence over timeout.
+        return_on_terminate: Whether to cancel the remaining tool calls as soon as one of the calls terminates
+            the auto invocation (by setting `terminate` in an auto function invocation filter).
+        dispatch_while_streaming: Whether the tool calls of a streamed response are invoked as soon as each call
+            is complete, while the rest of the response is still streaming, see StreamingToolCallTracker.
+    """
+
+    max_concurrency: int | None = Field(default=None, gt=0)
+    max_concurrency_per_plugin: int | None = Field(default=None, gt=0)
+    plugin_concurrency: dict[str, int] = Field(default_factory=dict)
+    timeout: float | None = Field(default=None, gt=0)
+    function_timeouts: dict[str, float] = Field(default_factory=dict)
+    return_on_terminate: bool = False
+    dispatch_while_streaming: bool = False
+
+    def get_timeout(self, function_call: "FunctionCallContent") -> float | None:
+        """Get the timeout for a tool call, in seconds."""
+        return self.function_timeouts.get(function_call.name or "", self.timeout)
+
+    def get_plugin_concurrency(self, plugin_name: str | None) -> int | None:
+        """Get the maximum number of concurrent tool calls for a plugin."""
+        if plugin_name is not None and plugin_name in self.plugin_concurrency:
+            return self.plugin_concurrency[plugin_name]
+        return self.max_concurrency_per_plugin
+
+    async def invoke_function_calls(
+        self,
+        function_calls: list["FunctionCallContent"],
+        invoke: Callable[["FunctionCallContent"], Awaitable["AutoFunctionInvocationContext | None"]],
+        chat_history: "ChatHistory",
+    ) -> list["AutoFunctionInvocationContext | None"]:
+        """Invoke the tool calls of a response.
+
+        Args:
+            function_calls (list[FunctionCallContent]): The tool calls.
+            invoke (Callable): Invokes a single tool call and adds its result to the chat history,
+                such as `Kernel.invoke_function_call`.
+            chat_history (ChatHistory): The chat history, the error results of timed out and cancelled calls
+                are added to it.
+
+        Returns:
+            list[AutoFunctionInvocationContext | None]: The result of each tool call, in the order of the calls,
+                None for the calls that were cancelled because another call terminated.
+        """
+        run = self._create_runner(invoke, chat_history)
+        if not self.return_on_terminate:
+            return list(await asyncio.gather(*[run(function_call) for function_call in function_calls]))
+        return await self._wait_for_calls(
+            [asyncio.ensure_future(run(function_call)) for function_call in function_calls],
+            function_calls,
+            chat_history,
+        )
+
+    def track_stream(
+        self,
+        invoke: Callable[..., Awaitable["AutoFunctionInvocationContext | None"]],
+        chat_history: "ChatHistory",
+    ) -> "StreamingToolCallTracker":
+        """Create a tracker that invokes the tool calls of a streamed response while it is streaming.
+
+        Args:
+            invoke (Callable): Invokes a single tool call and adds its result to the chat history,
+                such as `Kernel.invoke_function_call`, it is called with the tool call
+                and the keyword arguments chat_history and function_call_count.
+            chat_history (ChatHistory): The chat history, without the streamed response.
+
+        Returns:
+            StreamingToolCallTracker: The tracker.
+        """
+        return StreamingToolCallTracker(self, invoke, chat_history)
+
+    def _create_runner(
+        self,
+        invoke: Callable[["FunctionCallContent"], Awaitable["AutoFunctionInvocationContext | None"]],
+        chat_history: "ChatHistory",
+    ) -> Callable[["FunctionCallContent"], Awaitable["AutoFunctionInvocationContext | None"]]:
+        """Create a function that invokes a tool call within the limits and the timeout of the scheduler."""
+        global_semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        plugin_semaphores: dict[str | None, asyncio.Semaphore | None] = {}
+
+        def get_plugin_semaphore(plugin_name: str | None) -> asyncio.Semaphore | None:
+            if plugin_name not in plugin_semaphores:
+                limit = self.get_plugin_concurrency(plugin_name)
+                plugin_semaphores[plugin_name] = asyncio.Semaphore(limit) if limit else None
+            return plugin_semaphores[plugin_name]
+
+        async def run(function_call: "FunctionCallContent") -> "AutoFunctionInvocationContext | None":
+            async with AsyncExitStack() as stack:
+                # take the plugin slot first, so calls of a saturated plugin do not hold global slots
+                if (plugin_semaphore := get_plugin_semaphore(function_call.plugin_name)) is not None:
+                    await stack.enter_async_context(plugin_semaphore)
+                if global_semaphore is not None:
+                    await stack.enter_async_context(global_semaphore)
+                timeout = self.get_timeout(function_call)
+                try:
+                    return await asyncio.wait_for(invoke(function_call), timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"The tool call `{function_call.name}` did not complete within {timeout} seconds.")
+                    self._add_error_result(
+                        chat_history,
+                        function_call,
+                        f"The tool call `{function_call.name}` timed out after {timeout} seconds.",
+                    )
+                    return None
+
+        return run
+
+    async def _wait_for_calls(
+        self,
+        tasks: list["asyncio.Future[AutoFunctionInvocationContext | None]"],
+        function_calls: list["FunctionCallContent"],
+        chat_history: "ChatHistory",
+    ) -> list["AutoFunctionInvocationContext | None"]:
+        """Wait for the tool calls, when return_on_terminate is set only until a call terminates.
+
+        The calls that are cancelled because a call terminated are answered with an error result,
+        because the service rejects unanswered tool calls. When the caller is cancelled,
+        the calls are cancelled as well and nothing is added to the chat history.
+        """
+        if not self.return_on_terminate:
+            return list(await asyncio.gather(*tasks))
+        try:
+            pending: set[asyncio.Future[AutoFunctionInvocationContext | None]] = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(self._is_terminated(task) for task in done):
+                    logger.info("A tool call terminated the auto invocation, cancelling the remaining tool calls.")
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for function_call, task in zip(function_calls, tasks):
+            if task.cancelled():
+                self._add_error_result(
+                    chat_history, function_call, f"The tool call `{function_call.name}` was cancelled."
+                )
+        return [task.result() if not task.cancelled() else None for task in tasks]
+
+    @staticmethod
+    def _add_error_result(chat_history: "ChatHistory", function_call: "FunctionCallContent", error: str) -> None:
+        """Answer a tool call that did not complete with an error result."""
+        frc = FunctionResultContent.from_function_call_content_and_result(
+            function_call_content=function_call, result=error
+        )
+        chat_history.add_message(message=frc.to_chat_message_content())
+
+    @staticmethod
+    def _is_terminated(task: "asyncio.Future[AutoFunctionInvocationContext | None]") -> bool:
+        """Whether a finished tool call terminated the auto invocation, exceptions of the call are raised."""
+        result = task.result()
+        return result is not None and result.terminate
+
+
+class _StreamedToolCall:
+    """The fragments of one tool call of a streamed response, the argument strings are joined when needed."""
+
+    def __init__(self, first: FunctionCallContent) -> None:
+        self.id = first.id
+        self.index = first.index
+        self.name = first.name
+        self.argument_parts: list[str] = []
+        self.argument_dict: dict[str, Any] | None = None
+        self.add(first)
+
+    def add(self, item: FunctionCallContent) -> None:
+        self.id = self.id or item.id
+        self.name = self.name or item.name
+        if isinstance(item.arguments, dict):
+            self.argument_dict = {**(self.argument_dict or {}), **item.arguments}
+        elif item.arguments:
+            self.argument_parts.append(item.arguments)
+
+    def is_complete(self) -> bool:
+        """Whether the arguments are a JSON object, a call without arguments is complete as well."""
+        if self.argument_dict is not None or not self.argument_parts:
+            return True
+        try:
+            return isinstance(json.loads("".join(self.argument_parts)), dict)
+        except json.JSONDecodeError:
+            return False
+
+    def build(self) -> FunctionCallContent:
+        arguments = self.argument_dict if self.argument_dict is not None else "".join(self.argument_parts) or "{}"
+        return FunctionCallContent(id=self.id, index=self.index, name=self.name, arguments=arguments)
+
+
+@experimental_class
+class StreamingToolCallTracker:
+    """Invokes the tool calls of a streamed response while the response is still streaming.
+
+    The streamed messages are passed to `add`. A tool call is complete when a later tool call starts
+    and its arguments are a JSON object, or when the finish reason arrives, and is then invoked right away
+    through the ToolCallScheduler, so the tool calls run while the model is still generating the next ones.
+    Tool calls are told apart by their index, or by their id when the service does not send an index.
+
+    The tool calls run against a copy of the chat history, because the streamed response is not yet part
+    of the chat history. `finish` invokes the tool calls that are not complete yet, waits for all of them
+    and then adds their results to the chat history, after the streamed response.
+    An auto function invocation filter therefore sees the chat history without the streamed response
+    and a function_count of the tool calls received so far.
+
+    Call `cancel` when the response is not finished, for instance when the stream fails.
+    """
+
+    def __init__(
+        self,
+        scheduler: ToolCallScheduler,
+        invoke: Callable[..., Awaitable["AutoFunctionInvocationContext | None"]],
+        chat_history: ChatHistory,
+    ) -> None:
+        """Create a tracker for a streamed response.
+
+        Args:
+            scheduler (ToolCallScheduler): The scheduler that limits the tool calls.
+            invoke (Callable): Invokes a single tool call and adds its result to the chat history,
+                it is called with the tool call and the keyword arguments chat_history and function_call_count.
+            chat_history (ChatHistory): The chat history, without the streamed response.
+        """
+        self._scheduler = scheduler
+        self._invoke = invoke
+        self._chat_history = chat_history
+        self._history = ChatHistory(messages=list(chat_history.messages))
+        self._history_length = len(self._history.messages)
+        self._run = scheduler._create_runner(self._invoke_function_call, self._history)
+        self._calls: dict[int | str | None, _StreamedToolCall] = {}
+        self._tasks: dict[int | str | None, asyncio.Future[AutoFunctionInvocationContext | None]] = {}
+        self._function_call_count = 0
+
+    @property
+    def dispatched(self) -> int:
+        """The number of tool calls that have been invoked."""
+        return len(self._tasks)
+
+    def add(self, message: "StreamingChatMessageContent") -> None:
+        """Add a streamed message, the tool calls that are complete are invoked."""
+        for item in message.items:
+            if not isinstance(item, FunctionCallContent):
+                continue
+            key = self._get_key(item)
+            if key in self._tasks:
+                logger.warning(f"Ignoring a part of the tool call `{key}` that arrived after the call was invoked.")
+            elif key in self._calls:
+                self._calls[key].add(item)
+            else:
+                self._calls[key] = _StreamedToolCall(item)
+                # a new tool call started, so the previous calls are complete when their arguments parse
+                self._dispatch(final=False)
+        if message.finish_reason is not None:
+            self._dispatch(final=True)
+
+    async def finish(self, function_calls: list[FunctionCallContent]) -> list["AutoFunctionInvocationContext | None"]:
+        """Invoke the remaining tool calls and wait for all of them.
+
+        Add the streamed response to the chat history before calling this.
+
+        Args:
+            function_calls (list[FunctionCallContent]): The tool calls of the combined streamed response.
+
+        Returns:
+            list[AutoFunctionInvocationContext | None]: The result of each tool call, in the order of the calls,
+                None for the calls that were cancelled because another call terminated.
+        """
+        self._function_call_count = len(function_calls)
+        tasks = []
+        for function_call in function_calls:
+            key = self._get_key(function_call)
+            if key not in self._tasks:
+                self._start(key, function_call)
+            tasks.append(self._tasks[key])
+        try:
+            return await self._scheduler._wait_for_calls(tasks, function_calls, self._history)
+        except asyncio.CancelledError:
+            # the caller was cancelled, the results of the calls are not added to the chat history
+            del self._history.messages[self._history_length :]
+            raise
+        finally:
+            self.cancel()
+            for message in self._history.messages[self._history_length :]:
+                self._chat_history.add_message(message=message)
+
+    def cancel(self) -> None:
+        """Cancel the tool calls that are still running."""
+        for task in self._tasks.values():
+            task.cancel()
+
+    def _dispatch(self, final: bool) -> None:
+        """Invoke the complete tool calls, all of them when final, otherwise all but the last one."""
+        self._function_call_count = max(self._function_call_count, len(self._calls))
+        calls = list(self._calls.items())
+        for key, call in calls if final else calls[:-1]:
+            if key not in self._tasks and (final or call.is_complete()):
+                self._start(key, call.build())
+
+    def _start(self, key: int | str | None, function_call: FunctionCallContent) -> None:
+        logger.info(f"Invoking the tool call `{function_call.name}`.")
+        self._tasks[key] = asyncio.ensure_future(self._run(function_call))
+
+    async def _invoke_function_call(self, function_call: FunctionCallContent) -> "AutoFunctionInvocationContext | None":
+        return await self._invoke(
+            function_call, chat_history=self._history, function_call_count=self._function_call_count
+        )
+
+    @staticmethod
+    def _get_key(function_call: FunctionCallContent) -> int | str | None:
+        return function_call.index if function_call.index is not None else function_call.id
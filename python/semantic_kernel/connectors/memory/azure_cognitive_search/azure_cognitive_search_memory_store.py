@@ -1,12 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import contextlib
 import logging
 import uuid
 from inspect import isawaitable
+from typing import Any, Final
 
 from azure.core.credentials import AzureKeyCredential, TokenCredential
 from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import AioHttpTransport, AsyncHttpTransport
+from azure.search.documents.aio import SearchClient
 from azure.search.documents.indexes.aio import SearchIndexClient
 from azure.search.documents.indexes.models import (
     HnswAlgorithmConfiguration,
@@ -37,12 +41,40 @@ from semantic_kernel.utils.experimental_decorator import experimental_class
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# The maximum number of documents in one indexing request of Azure Cognitive Search
+MAX_DOCUMENTS_PER_REQUEST: Final[int] = 1000
+
+
+class _SharedTransport(AsyncHttpTransport):
+    """A transport shared by the clients of a memory store, closing a client does not close the transport."""
+
+    def __init__(self, transport: AsyncHttpTransport) -> None:
+        self._transport = transport
+
+    async def __aenter__(self) -> "_SharedTransport":
+        await self._transport.open()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def open(self) -> None:
+        await self._transport.open()
+
+    async def close(self) -> None:
+        pass
+
+    async def send(self, request: Any, **kwargs: Any) -> Any:
+        return await self._transport.send(request, **kwargs)
+
 
 @experimental_class
 class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
     """Azure Cognitive Search Memory Store."""
 
     _search_index_client: SearchIndexClient = None
+    _search_clients: dict[str, SearchClient] = None
+    _transport: AsyncHttpTransport = None
     _vector_size: int = None
 
     def __init__(
@@ -54,6 +86,7 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
         token_credentials: TokenCredential | None = None,
         env_file_path: str | None = None,
         env_file_encoding: str | None = None,
+        transport: AsyncHttpTransport | None = None,
     ) -> None:
         """Initializes a new instance of the AzureCognitiveSearchMemoryStore class.
 
@@ -61,6 +94,9 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
             async with AzureCognitiveSearchMemoryStore(<...>) as memory:
                 await memory.<...>
 
+        The store keeps one search client per index and all clients send their requests
+        through one transport, so the connections are pooled and reused until the store is closed.
+
         Args:
             vector_size (int): Embedding vector size.
             search_endpoint (str | None): The endpoint of the Azure Cognitive Search service
@@ -72,6 +108,8 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
             env_file_path (str | None): Use the environment settings file as a fallback
                 to environment variables
             env_file_encoding (str | None): The encoding of the environment settings file
+            transport (AsyncHttpTransport | None): The transport for the requests of all clients,
+                it is closed with the store. (default: an AioHttpTransport)
 
         """
         from semantic_kernel.connectors.memory.azure_cognitive_search.azure_ai_search_settings import (
@@ -89,17 +127,36 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
             raise MemoryConnectorInitializationError("Failed to create Azure Cognitive Search settings.") from exc
 
         self._vector_size = vector_size
+        self._transport = transport or AioHttpTransport()
+        self._search_clients = {}
         self._search_index_client = get_search_index_async_client(
             search_endpoint=str(acs_memory_settings.endpoint),
             admin_key=acs_memory_settings.api_key.get_secret_value() if acs_memory_settings.api_key else None,
             azure_credential=azure_credentials,
             token_credential=token_credentials,
+            transport=_SharedTransport(self._transport),
         )
 
     async def close(self):
         """Async close connection, invoked by MemoryStoreBase.__aexit__()."""
+        search_clients = list(self._search_clients.values())
+        self._search_clients.clear()
+        for search_client in search_clients:
+            await search_client.close()
         if self._search_index_client is not None:
             await self._search_index_client.close()
+        await self._transport.close()
+
+    def _get_search_client(self, collection_name: str) -> SearchClient:
+        """Get the cached search client of a collection, the client is created on first use."""
+        index_name = collection_name.lower()
+        search_client = self._search_clients.get(index_name)
+        if search_client is None:
+            search_client = self._search_index_client.get_search_client(
+                index_name, transport=_SharedTransport(self._transport)
+            )
+            self._search_clients[index_name] = search_client
+        return search_client
 
     async def create_collection(
         self,
@@ -192,6 +249,9 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
             None
         """
         await self._search_index_client.delete_index(index=collection_name.lower())
+        search_client = self._search_clients.pop(collection_name.lower(), None)
+        if search_client is not None:
+            await search_client.close()
 
     async def does_collection_exist(self, collection_name: str) -> bool:
         """Checks if a collection exists.
@@ -234,9 +294,7 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
         Returns:
             List[str]: The unique database keys of the records.
         """
-        # Initialize search client here
-        # Look up Search client class to see if exists or create
-        search_client = self._search_index_client.get_search_client(collection_name.lower())
+        search_client = self._get_search_client(collection_name)
 
         search_records = []
         search_ids = []
@@ -253,7 +311,6 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
             search_ids.append(record._id)
 
         result = await search_client.upload_documents(documents=search_records)
-        await search_client.close()
 
         if result[0].succeeded:
             return search_ids
@@ -270,19 +327,15 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
         Returns:
             MemoryRecord: The record.
         """
-        # Look up Search client class to see if exists or create
-        search_client = self._search_index_client.get_search_client(collection_name.lower())
+        search_client = self._get_search_client(collection_name)
 
         try:
             search_result = await search_client.get_document(
                 key=encode_id(key), selected_fields=get_field_selection(with_embedding)
             )
         except ResourceNotFoundError as exc:
-            await search_client.close()
             raise MemoryConnectorResourceNotFound("Memory record not found") from exc
 
-        await search_client.close()
-
         # Create Memory record from document
         return dict_to_memory_record(search_result, with_embedding)
 
@@ -291,29 +344,57 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
     ) -> list[MemoryRecord]:
         """Gets a batch of records.
 
+        The records are read with one filtered search per MAX_DOCUMENTS_PER_REQUEST keys
+        instead of one request per key.
+
         Args:
             collection_name (str): The name of the collection to get the records from.
             keys (List[str]): The unique database keys of the records.
             with_embeddings (bool): Whether to include the embeddings in the results. (default: {False})
 
         Returns:
-            List[MemoryRecord]: The records.
+            List[MemoryRecord]: The records, in the order of the keys.
+
+        Raises:
+            MemoryConnectorResourceNotFound: When a record is not found.
         """
-        search_results = []
+        if not keys:
+            return []
 
-        for key in keys:
-            search_result = await self.get(
-                collection_name=collection_name.lower(),
-                key=key,
-                with_embedding=with_embeddings,
+        search_client = self._get_search_client(collection_name)
+        encoded_keys = [encode_id(key) for key in keys]
+
+        async def search_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+            # Encoded keys are base64, so they contain neither commas nor quotes
+            search_results = await search_client.search(
+                search_text="*",
+                filter=f"search.in({SEARCH_FIELD_ID}, '{','.join(chunk)}', ',')",
+                select=get_field_selection(with_embeddings),
+                top=len(chunk),
             )
-            search_results.append(search_result)
+            return [search_record async for search_record in search_results]
+
+        chunks = [
+            encoded_keys[start : start + MAX_DOCUMENTS_PER_REQUEST]
+            for start in range(0, len(encoded_keys), MAX_DOCUMENTS_PER_REQUEST)
+        ]
+        documents = {
+            search_record[SEARCH_FIELD_ID]: search_record
+            for search_records in await asyncio.gather(*(search_chunk(chunk) for chunk in chunks))
+            for search_record in search_records
+        }
+
+        missing_keys = [key for key, encoded_key in zip(keys, encoded_keys) if encoded_key not in documents]
+        if missing_keys:
+            raise MemoryConnectorResourceNotFound(f"Memory records not found: {missing_keys}")
 
-        return search_results
+        return [dict_to_memory_record(documents[encoded_key], with_embeddings) for encoded_key in encoded_keys]
 
     async def remove_batch(self, collection_name: str, keys: list[str]) -> None:
         """Removes a batch of records.
 
+        The records are deleted with one request per MAX_DOCUMENTS_PER_REQUEST keys.
+
         Args:
             collection_name (str): The name of the collection to remove the records from.
             keys (List[str]): The unique database keys of the records to remove.
@@ -321,8 +402,11 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
         Returns:
             None
         """
-        for record_id in keys:
-            await self.remove(collection_name=collection_name.lower(), key=encode_id(record_id))
+        search_client = self._get_search_client(collection_name)
+        docs_to_delete = [{SEARCH_FIELD_ID: encode_id(key)} for key in keys]
+
+        for start in range(0, len(docs_to_delete), MAX_DOCUMENTS_PER_REQUEST):
+            await search_client.delete_documents(documents=docs_to_delete[start : start + MAX_DOCUMENTS_PER_REQUEST])
 
     async def remove(self, collection_name: str, key: str) -> None:
         """Removes a record.
@@ -334,12 +418,10 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
         Returns:
             None
         """
-        # Look up Search client class to see if exists or create
-        search_client = self._search_index_client.get_search_client(collection_name.lower())
+        search_client = self._get_search_client(collection_name)
         docs_to_delete = {SEARCH_FIELD_ID: encode_id(key)}
 
         await search_client.delete_documents(documents=[docs_to_delete])
-        await search_client.close()
 
     async def get_nearest_match(
         self,
@@ -391,8 +473,7 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
         Returns:
             List[Tuple[MemoryRecord, float]]: The records and their relevance scores.
         """
-        # Look up Search client class to see if exists or create
-        search_client = self._search_index_client.get_search_client(collection_name.lower())
+        search_client = self._get_search_client(collection_name)
 
         vector = VectorizedQuery(vector=embedding.flatten(), k_nearest_neighbors=limit, fields=SEARCH_FIELD_EMBEDDING)
 
@@ -403,7 +484,6 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
         )
 
         if not search_results or search_results is None:
-            await search_client.close()
             return []
 
         # Convert the results to MemoryRecords
@@ -415,5 +495,4 @@ class AzureCognitiveSearchMemoryStore(MemoryStoreBase):
             memory_record = dict_to_memory_record(search_record, with_embeddings)
             nearest_results.append((memory_record, search_record["@search.score"]))
 
-        await search_client.close()
         return nearest_results
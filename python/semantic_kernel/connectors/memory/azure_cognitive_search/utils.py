@@ -2,6 +2,7 @@
 
 import base64
 import os
+from typing import Any
 
 from azure.core.credentials import AzureKeyCredential, TokenCredential
 from azure.search.documents.indexes.aio import SearchIndexClient
@@ -26,6 +27,7 @@ def get_search_index_async_client(
     admin_key: str | None = None,
     azure_credential: AzureKeyCredential | None = None,
     token_credential: TokenCredential | None = None,
+    **kwargs: Any,
 ):
     """Return a client for Azure Cognitive Search.
 
@@ -34,6 +36,7 @@ def get_search_index_async_client(
         admin_key (str): Optional API key (default: {None}).
         azure_credential (AzureKeyCredential): Optional Azure credentials (default: {None}).
         token_credential (TokenCredential): Optional Token credential (default: {None}).
+        kwargs (Any): Additional arguments for the client, such as the transport.
     """
     ENV_VAR_ENDPOINT = "AZURE_COGNITIVE_SEARCH_ENDPOINT"
     ENV_VAR_API_KEY = "AZURE_COGNITIVE_SEARCH_ADMIN_KEY"
@@ -71,10 +74,10 @@ def get_search_index_async_client(
     sk_headers = {USER_AGENT: "Semantic-Kernel"}
 
     if azure_credential:
-        return SearchIndexClient(endpoint=service_endpoint, credential=azure_credential, headers=sk_headers)
+        return SearchIndexClient(endpoint=service_endpoint, credential=azure_credential, headers=sk_headers, **kwargs)
 
     if token_credential:
-        return SearchIndexClient(endpoint=service_endpoint, credential=token_credential, headers=sk_headers)
+        return SearchIndexClient(endpoint=service_endpoint, credential=token_credential, headers=sk_headers, **kwargs)
 
     raise ValueError("Error: unable to create Azure Cognitive Search client.")
 
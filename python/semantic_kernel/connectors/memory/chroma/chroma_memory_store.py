@@ -1,10 +1,11 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
 import sys
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Final, Optional
 
-from numpy import array, ndarray
+from numpy import array, ndarray, stack
 
 if sys.version_info >= (3, 12):
     from typing import override  # pragma: no cover
@@ -24,10 +25,17 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# used when the client does not report its maximum batch size, which older versions of chromadb do not
+DEFAULT_MAX_BATCH_SIZE: Final[int] = 1000
+
 
 @experimental_class
 class ChromaMemoryStore(MemoryStoreBase):
-    """ChromaMemoryStore provides an interface to store and retrieve data using ChromaDB."""
+    """ChromaMemoryStore provides an interface to store and retrieve data using ChromaDB.
+
+    The calls to the ChromaDB client are blocking, they are run in a thread so they do not block the event loop.
+    The collection handles are cached, collections that are deleted by another client are not noticed.
+    """
 
     _client: "chromadb.Client"
 
@@ -35,6 +43,7 @@ class ChromaMemoryStore(MemoryStoreBase):
         self,
         persist_directory: str | None = None,
         client_settings: Optional["chromadb.config.Settings"] = None,
+        max_batch_size: int | None = None,
         **kwargs: Any,
     ) -> None:
         """ChromaMemoryStore provides an interface to store and retrieve data using ChromaDB.
@@ -46,6 +55,8 @@ class ChromaMemoryStore(MemoryStoreBase):
                 Defaults to None, which means the default settings for ChromaDB will be used.
             client_settings (Optional["chromadb.config.Settings"], optional): A Settings instance to configure
                 the ChromaDB client. Defaults to None, which means the default settings for ChromaDB will be used.
+            max_batch_size (int | None): The maximum number of records sent to ChromaDB in one call,
+                defaults to the maximum batch size of the client.
             similarity_fetch_limit (int, optional): The maximum number of results to calculate cosine-similarity.
             **kwargs: Additional keyword arguments.
 
@@ -81,6 +92,8 @@ class ChromaMemoryStore(MemoryStoreBase):
         self._client = chromadb.Client(self._client_settings)
         self._persist_directory = persist_directory
         self._default_query_includes = ["embeddings", "metadatas", "documents"]
+        self._max_batch_size = max_batch_size
+        self._collections: dict[str, "Collection"] = {}
 
     async def create_collection(self, collection_name: str) -> None:
         """Creates a new collection in Chroma if it does not exist.
@@ -95,15 +108,21 @@ class ChromaMemoryStore(MemoryStoreBase):
         Returns:
             None
         """
-        self._client.create_collection(name=collection_name)
+        self._collections[collection_name] = await asyncio.to_thread(
+            self._client.create_collection, name=collection_name
+        )
 
     @override
     async def get_collection(self, collection_name: str) -> Optional["Collection"]:
+        if collection_name in self._collections:
+            return self._collections[collection_name]
         try:
             # Current version of ChromeDB rejects camel case collection names.
-            return self._client.get_collection(name=collection_name)
+            collection = await asyncio.to_thread(self._client.get_collection, name=collection_name)
         except ValueError:
             return None
+        self._collections[collection_name] = collection
+        return collection
 
     async def get_collections(self) -> list[str]:
         """Gets the list of collections.
@@ -111,7 +130,7 @@ class ChromaMemoryStore(MemoryStoreBase):
         Returns:
             List[str]: The list of collections.
         """
-        return [collection.name for collection in self._client.list_collections()]
+        return [collection.name for collection in await asyncio.to_thread(self._client.list_collections)]
 
     async def delete_collection(self, collection_name: str) -> None:
         """Deletes a collection.
@@ -122,7 +141,8 @@ class ChromaMemoryStore(MemoryStoreBase):
         Returns:
             None
         """
-        self._client.delete_collection(name=collection_name)
+        self._collections.pop(collection_name, None)
+        await asyncio.to_thread(self._client.delete_collection, name=collection_name)
 
     async def does_collection_exist(self, collection_name: str) -> bool:
         """Checks if a collection exists.
@@ -145,28 +165,7 @@ class ChromaMemoryStore(MemoryStoreBase):
         Returns:
             List[str]: The unique database key of the record.
         """
-        collection = await self.get_collection(collection_name)
-        if collection is None:
-            raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
-
-        record._key = record._id
-        metadata = {
-            "timestamp": record._timestamp or "",
-            "is_reference": str(record._is_reference),
-            "external_source_name": record._external_source_name or "",
-            "description": record._description or "",
-            "additional_metadata": record._additional_metadata or "",
-            "id": record._id or "",
-        }
-
-        collection.add(
-            metadatas=metadata,
-            # by providing embeddings, we can skip the chroma's embedding function call
-            embeddings=record.embedding.tolist(),
-            documents=record._text,
-            ids=record._key,
-        )
-        return record._key
+        return (await self.upsert_batch(collection_name, [record]))[0]
 
     async def upsert_batch(self, collection_name: str, records: list[MemoryRecord]) -> list[str]:
         """Upsert a batch of records.
@@ -175,11 +174,49 @@ class ChromaMemoryStore(MemoryStoreBase):
             collection_name (str): The name of the collection to upsert the records into.
             records (List[MemoryRecord]): The records to upsert.
 
+        The records are sent in chunks of the maximum batch size of ChromaDB, with one upsert call per chunk.
+
         Returns:
             List[str]: The unique database keys of the records. In Pinecone, these are the record IDs.
         """
-        # upsert is checking collection existence
-        return [await self.upsert(collection_name, record) for record in records]
+        collection = await self.get_collection(collection_name)
+        if collection is None:
+            raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
+
+        max_batch_size = await self._get_max_batch_size()
+        for start in range(0, len(records), max_batch_size):
+            chunk = records[start : start + max_batch_size]
+            for record in chunk:
+                record._key = record._id
+            documents = [record._text for record in chunk]
+            await asyncio.to_thread(
+                collection.upsert,
+                ids=[record._key for record in chunk],
+                # by providing embeddings, we can skip the chroma's embedding function call
+                embeddings=stack([record.embedding for record in chunk]).tolist(),
+                metadatas=[
+                    {
+                        "timestamp": record._timestamp or "",
+                        "is_reference": str(record._is_reference),
+                        "external_source_name": record._external_source_name or "",
+                        "description": record._description or "",
+                        "additional_metadata": record._additional_metadata or "",
+                        "id": record._id or "",
+                    }
+                    for record in chunk
+                ],
+                documents=None if all(text is None for text in documents) else [text or "" for text in documents],
+            )
+        return [record._key for record in records]
+
+    async def _get_max_batch_size(self) -> int:
+        """The maximum number of records in one call, as reported by the client."""
+        if self._max_batch_size is None:
+            if hasattr(self._client, "get_max_batch_size"):
+                self._max_batch_size = await asyncio.to_thread(self._client.get_max_batch_size)
+            else:
+                self._max_batch_size = getattr(self._client, "max_batch_size", None) or DEFAULT_MAX_BATCH_SIZE
+        return self._max_batch_size
 
     async def get(self, collection_name: str, key: str, with_embedding: bool) -> MemoryRecord:
         """Gets a record.
@@ -217,7 +254,7 @@ class ChromaMemoryStore(MemoryStoreBase):
 
         query_includes = ["embeddings", "metadatas", "documents"] if with_embeddings else ["metadatas", "documents"]
 
-        value = collection.get(ids=keys, include=query_includes)
+        value = await asyncio.to_thread(collection.get, ids=keys, include=query_includes)
         return query_results_to_records(value, with_embeddings)
 
     async def remove(self, collection_name: str, key: str) -> None:
@@ -244,7 +281,7 @@ class ChromaMemoryStore(MemoryStoreBase):
         """
         collection = await self.get_collection(collection_name=collection_name)
         if collection is not None:
-            collection.delete(ids=keys)
+            await asyncio.to_thread(collection.delete, ids=keys)
 
     async def get_nearest_matches(
         self,
@@ -275,7 +312,8 @@ class ChromaMemoryStore(MemoryStoreBase):
         if collection is None:
             return []
 
-        query_results = collection.query(
+        query_results = await asyncio.to_thread(
+            collection.query,
             query_embeddings=embedding.tolist(),
             n_results=limit,
             include=self._default_query_includes,
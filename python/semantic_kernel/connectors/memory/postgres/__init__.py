@@ -1,8 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from semantic_kernel.connectors.memory.postgres.async_postgres_memory_store import AsyncPostgresMemoryStore
 from semantic_kernel.connectors.memory.postgres.postgres_memory_store import (
     PostgresMemoryStore,
 )
 from semantic_kernel.connectors.memory.postgres.postgres_settings import PostgresSettings
 
-__all__ = ["PostgresMemoryStore", "PostgresSettings"]
+__all__ = ["AsyncPostgresMemoryStore", "PostgresMemoryStore", "PostgresSettings"]
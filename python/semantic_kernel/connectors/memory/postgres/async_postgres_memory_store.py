@@ -0,0 +1,508 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+from numpy import ndarray
+from psycopg import AsyncCursor
+from psycopg.sql import SQL, Identifier
+from psycopg_pool import AsyncConnectionPool
+from pydantic import ValidationError
+
+from semantic_kernel.connectors.memory.postgres.postgres_memory_store import DEFAULT_SCHEMA, MAX_DIMENSIONALITY
+from semantic_kernel.connectors.memory.postgres.postgres_settings import PostgresSettings
+from semantic_kernel.exceptions import (
+    ServiceInitializationError,
+    ServiceResourceNotFoundError,
+    ServiceResponseException,
+)
+from semantic_kernel.exceptions.memory_connector_exceptions import MemoryConnectorInitializationError
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@experimental_class
+class AsyncPostgresMemoryStore(MemoryStoreBase):
+    """A memory store that uses Postgres with pgvector as the backend, with non-blocking queries.
+
+    Unlike the PostgresMemoryStore, the queries run on a psycopg AsyncConnectionPool,
+    so they do not block the event loop and concurrent calls run on separate connections.
+    Batches of records are upserted by copying them into a temporary table with a binary COPY,
+    followed by a single INSERT ... ON CONFLICT statement.
+
+    The pool is opened on first use, close the store with `await store.close()`,
+    or use it as an async context manager.
+    """
+
+    _connection_pool: AsyncConnectionPool
+    _default_dimensionality: int
+    _schema: str
+
+    def __init__(
+        self,
+        connection_string: str,
+        default_dimensionality: int,
+        min_pool: int,
+        max_pool: int,
+        schema: str = DEFAULT_SCHEMA,
+        env_file_path: str | None = None,
+        env_file_encoding: str | None = None,
+    ) -> None:
+        """Initializes a new instance of the AsyncPostgresMemoryStore class.
+
+        Args:
+            connection_string (str): The connection string to the Postgres database.
+            default_dimensionality (int): The default dimensionality of the embeddings.
+            min_pool (int): The minimum number of connections in the connection pool.
+            max_pool (int): The maximum number of connections in the connection pool.
+            schema (str): The schema to use. (default: {"public"})
+            env_file_path (str | None): Use the environment settings file as a fallback
+                to environment variables. (Optional)
+            env_file_encoding (str | None): The encoding of the environment settings file.
+        """
+        try:
+            postgres_settings = PostgresSettings.create(
+                connection_string=connection_string,
+                env_file_path=env_file_path,
+                env_file_encoding=env_file_encoding,
+            )
+        except ValidationError as ex:
+            raise MemoryConnectorInitializationError("Failed to create Postgres settings.", ex) from ex
+
+        self._check_dimensionality(default_dimensionality)
+
+        self._default_dimensionality = default_dimensionality
+        self._connection_pool = AsyncConnectionPool(
+            postgres_settings.connection_string.get_secret_value(), min_size=min_pool, max_size=max_pool, open=False
+        )
+        self._schema = schema
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._connection_pool.close()
+
+    async def create_collection(
+        self,
+        collection_name: str,
+        dimension_num: int | None = None,
+    ) -> None:
+        r"""Creates a new collection.
+
+        Args:
+            collection_name (str): The name of the collection to create.\n
+            dimension_num (Optional[int]): The dimensionality of the embeddings. (default: {None})
+            Uses the default dimensionality when not provided
+
+        Returns:
+            None
+        """
+        if dimension_num is None:
+            dimension_num = self._default_dimensionality
+        else:
+            self._check_dimensionality(dimension_num)
+
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.cursor() as cur:
+            await cur.execute(
+                SQL(
+                    """
+                        CREATE TABLE IF NOT EXISTS {scm}.{tbl} (
+                            key TEXT PRIMARY KEY,
+                            embedding vector({dim}),
+                            metadata JSONB,
+                            timestamp TIMESTAMP
+                        )"""
+                ).format(
+                    scm=Identifier(self._schema),
+                    tbl=Identifier(collection_name),
+                    dim=dimension_num,
+                ),
+                (),
+            )
+
+    async def get_collections(self) -> list[str]:
+        """Gets the list of collections.
+
+        Returns:
+            List[str]: The list of collections.
+        """
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.cursor() as cur:
+            return await self._get_collections(cur)
+
+    async def delete_collection(self, collection_name: str) -> None:
+        """Deletes a collection.
+
+        Args:
+            collection_name (str): The name of the collection to delete.
+
+        Returns:
+            None
+        """
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.cursor() as cur:
+            await cur.execute(
+                SQL("DROP TABLE IF EXISTS {scm}.{tbl} CASCADE").format(
+                    scm=Identifier(self._schema), tbl=Identifier(collection_name)
+                ),
+            )
+
+    async def does_collection_exist(self, collection_name: str) -> bool:
+        """Checks if a collection exists.
+
+        Args:
+            collection_name (str): The name of the collection to check.
+
+        Returns:
+            bool: True if the collection exists; otherwise, False.
+        """
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.cursor() as cur:
+            return await self._does_collection_exist(cur, collection_name)
+
+    async def upsert(self, collection_name: str, record: MemoryRecord) -> str:
+        r"""Upserts a record.
+
+        Args:
+            collection_name (str): The name of the collection to upsert the record into.\n
+            record (MemoryRecord): The record to upsert.
+
+        Returns:
+            str: The unique database key of the record.
+        """
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.cursor() as cur:
+            await self._check_collection_exists(cur, collection_name)
+            await cur.execute(
+                SQL(
+                    """
+                        INSERT INTO {scm}.{tbl} (key, embedding, metadata, timestamp)
+                        VALUES (%s, %s::vector, %s, %s)
+                        ON CONFLICT (key) DO UPDATE
+                        SET embedding = EXCLUDED.embedding,
+                            metadata = EXCLUDED.metadata,
+                            timestamp = EXCLUDED.timestamp
+                        RETURNING key
+                        """
+                ).format(
+                    scm=Identifier(self._schema),
+                    tbl=Identifier(collection_name),
+                ),
+                (
+                    record._id,
+                    self._serialize_embedding(record.embedding),
+                    json.dumps(self._serialize_metadata(record)),
+                    record._timestamp,
+                ),
+            )
+            result = await cur.fetchone()
+            if result is None:
+                raise ServiceResponseException("Upsert failed")
+            return result[0]
+
+    async def upsert_batch(self, collection_name: str, records: list[MemoryRecord]) -> list[str]:
+        """Upserts a batch of records.
+
+        The records are streamed with a binary COPY into a temporary table, that is dropped at the end
+        of the transaction, and merged into the collection with a single INSERT ... ON CONFLICT.
+        When a key occurs more than once in the batch, the last record with that key is stored.
+        Timezone aware timestamps are converted to UTC, as the COPY only accepts naive timestamps.
+
+        Args:
+            collection_name (str): The name of the collection to upsert the records into.
+            records (List[MemoryRecord]): The records to upsert.
+
+        Returns:
+            List[str]: The unique database keys of the records.
+        """
+        if not records:
+            return []
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.transaction(), conn.cursor() as cur:
+            await self._check_collection_exists(cur, collection_name)
+            await cur.execute(
+                """
+                    CREATE TEMPORARY TABLE sk_upsert_staging (
+                        ord INTEGER,
+                        key TEXT,
+                        embedding TEXT,
+                        metadata JSONB,
+                        timestamp TIMESTAMP
+                    ) ON COMMIT DROP
+                    """
+            )
+            async with cur.copy(
+                "COPY sk_upsert_staging (ord, key, embedding, metadata, timestamp) FROM STDIN (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(["int4", "text", "text", "jsonb", "timestamp"])
+                for index, record in enumerate(records):
+                    await copy.write_row((
+                        index,
+                        record._id,
+                        self._serialize_embedding(record.embedding),
+                        self._serialize_metadata(record),
+                        self._serialize_timestamp(record._timestamp),
+                    ))
+            await cur.execute(
+                SQL(
+                    """
+                        INSERT INTO {scm}.{tbl} (key, embedding, metadata, timestamp)
+                        SELECT DISTINCT ON (key) key, embedding::vector, metadata, timestamp
+                        FROM sk_upsert_staging
+                        ORDER BY key, ord DESC
+                        ON CONFLICT (key) DO UPDATE
+                        SET embedding = EXCLUDED.embedding,
+                            metadata = EXCLUDED.metadata,
+                            timestamp = EXCLUDED.timestamp
+                        """
+                ).format(
+                    scm=Identifier(self._schema),
+                    tbl=Identifier(collection_name),
+                ),
+            )
+            if cur.rowcount != len({record._id for record in records}):
+                raise ServiceResponseException("Upsert failed")
+            return [record._id for record in records]
+
+    async def get(self, collection_name: str, key: str, with_embedding: bool = False) -> MemoryRecord:
+        """Gets a record.
+
+        Args:
+            collection_name (str): The name of the collection to get the record from.
+            key (str): The unique database key of the record.
+            with_embedding (bool): Whether to include the embedding in the result. (default: {False})
+
+        Returns:
+            MemoryRecord: The record.
+        """
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.cursor() as cur:
+            await self._check_collection_exists(cur, collection_name)
+            await cur.execute(
+                SQL(
+                    """
+                        SELECT key, embedding, metadata, timestamp
+                        FROM {scm}.{tbl}
+                        WHERE key = %s
+                        """
+                ).format(
+                    scm=Identifier(self._schema),
+                    tbl=Identifier(collection_name),
+                ),
+                (key,),
+            )
+            result = await cur.fetchone()
+            if result is None:
+                raise ServiceResourceNotFoundError("Key not found")
+            return self._deserialize_record(result, with_embedding)
+
+    async def get_batch(
+        self, collection_name: str, keys: list[str], with_embeddings: bool = False
+    ) -> list[MemoryRecord]:
+        """Gets a batch of records.
+
+        Args:
+            collection_name (str): The name of the collection to get the records from.
+            keys (List[str]): The unique database keys of the records.
+            with_embeddings (bool): Whether to include the embeddings in the results. (default: {False})
+
+        Returns:
+            List[MemoryRecord]: The records that were found from list of keys, can be empty.
+        """
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.cursor() as cur:
+            await self._check_collection_exists(cur, collection_name)
+            await cur.execute(
+                SQL(
+                    """
+                        SELECT key, embedding, metadata, timestamp
+                        FROM {scm}.{tbl}
+                        WHERE key = ANY(%s)
+                        """
+                ).format(
+                    scm=Identifier(self._schema),
+                    tbl=Identifier(collection_name),
+                ),
+                (list(keys),),
+            )
+            return [self._deserialize_record(result, with_embeddings) for result in await cur.fetchall()]
+
+    async def remove(self, collection_name: str, key: str) -> None:
+        """Removes a record.
+
+        Args:
+            collection_name (str): The name of the collection to remove the record from.
+            key (str): The unique database key of the record to remove.
+
+        Returns:
+            None
+        """
+        await self.remove_batch(collection_name, [key])
+
+    async def remove_batch(self, collection_name: str, keys: list[str]) -> None:
+        """Removes a batch of records.
+
+        Args:
+            collection_name (str): The name of the collection to remove the records from.
+            keys (List[str]): The unique database keys of the records to remove.
+
+        Returns:
+            None
+        """
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.cursor() as cur:
+            await self._check_collection_exists(cur, collection_name)
+            await cur.execute(
+                SQL(
+                    """
+                        DELETE FROM {scm}.{tbl}
+                        WHERE key = ANY(%s)
+                        """
+                ).format(scm=Identifier(self._schema), tbl=Identifier(collection_name)),
+                (list(keys),),
+            )
+
+    async def get_nearest_matches(
+        self,
+        collection_name: str,
+        embedding: ndarray,
+        limit: int,
+        min_relevance_score: float = 0.0,
+        with_embeddings: bool = False,
+    ) -> list[tuple[MemoryRecord, float]]:
+        """Gets the nearest matches to an embedding using cosine similarity.
+
+        Args:
+            collection_name (str): The name of the collection to get the nearest matches from.
+            embedding (ndarray): The embedding to find the nearest matches to.
+            limit (int): The maximum number of matches to return.
+            min_relevance_score (float): The minimum relevance score of the matches. (default: {0.0})
+            with_embeddings (bool): Whether to include the embeddings in the results. (default: {False})
+
+        Returns:
+            List[Tuple[MemoryRecord, float]]: The records and their relevance scores.
+        """
+        await self._connection_pool.open()
+        async with self._connection_pool.connection() as conn, conn.cursor() as cur:
+            await self._check_collection_exists(cur, collection_name)
+            await cur.execute(
+                SQL(
+                    """
+                        SELECT key,
+                            embedding,
+                            metadata,
+                            timestamp,
+                            cosine_similarity
+                        FROM (
+                            SELECT key, embedding, metadata, timestamp,
+                                1 - (embedding <=> %(embedding)s::vector) AS cosine_similarity
+                            FROM {scm}.{tbl}
+                        ) AS subquery
+                        WHERE cosine_similarity >= %(min_relevance_score)s
+                        ORDER BY cosine_similarity DESC
+                        LIMIT %(limit)s
+                        """
+                ).format(
+                    scm=Identifier(self._schema),
+                    tbl=Identifier(collection_name),
+                ),
+                {
+                    "embedding": self._serialize_embedding(embedding),
+                    "min_relevance_score": min_relevance_score,
+                    "limit": limit,
+                },
+            )
+            return [(self._deserialize_record(result, with_embeddings), result[4]) for result in await cur.fetchall()]
+
+    async def get_nearest_match(
+        self,
+        collection_name: str,
+        embedding: ndarray,
+        min_relevance_score: float = 0.0,
+        with_embedding: bool = False,
+    ) -> tuple[MemoryRecord, float]:
+        """Gets the nearest match to an embedding using cosine similarity.
+
+        Args:
+            collection_name (str): The name of the collection to get the nearest match from.
+            embedding (ndarray): The embedding to find the nearest match to.
+            min_relevance_score (float): The minimum relevance score of the match. (default: {0.0})
+            with_embedding (bool): Whether to include the embedding in the result. (default: {False})
+
+        Returns:
+            Tuple[MemoryRecord, float]: The record and the relevance score.
+        """
+        results = await self.get_nearest_matches(
+            collection_name=collection_name,
+            embedding=embedding,
+            limit=1,
+            min_relevance_score=min_relevance_score,
+            with_embeddings=with_embedding,
+        )
+        if len(results) == 0:
+            raise ServiceResourceNotFoundError("No match found")
+        return results[0]
+
+    async def _check_collection_exists(self, cur: AsyncCursor, collection_name: str) -> None:
+        if not await self._does_collection_exist(cur, collection_name):
+            raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
+
+    async def _does_collection_exist(self, cur: AsyncCursor, collection_name: str) -> bool:
+        results = await self._get_collections(cur)
+        return collection_name in results
+
+    async def _get_collections(self, cur: AsyncCursor) -> list[str]:
+        await cur.execute(
+            """
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = %s
+            """,
+            (self._schema,),
+        )
+        return [row[0] for row in await cur.fetchall()]
+
+    def _check_dimensionality(self, dimension_num):
+        if dimension_num > MAX_DIMENSIONALITY:
+            raise ServiceInitializationError(
+                f"Dimensionality of {dimension_num} exceeds " + f"the maximum allowed value of {MAX_DIMENSIONALITY}."
+            )
+        if dimension_num <= 0:
+            raise ServiceInitializationError("Dimensionality must be a positive integer. ")
+
+    @staticmethod
+    def _serialize_embedding(embedding: ndarray) -> str:
+        """Serialize an embedding to the text representation of a pgvector vector."""
+        return f"[{','.join(map(str, embedding.tolist()))}]"
+
+    @staticmethod
+    def _serialize_metadata(record: MemoryRecord) -> dict[str, Any]:
+        return {
+            "text": record._text,
+            "description": record._description,
+            "additional_metadata": record._additional_metadata,
+        }
+
+    @staticmethod
+    def _serialize_timestamp(timestamp: datetime | None) -> datetime | None:
+        """Convert a timezone aware timestamp to a naive UTC timestamp for the binary COPY."""
+        if timestamp is None or timestamp.tzinfo is None:
+            return timestamp
+        return timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def _deserialize_record(result: Any, with_embedding: bool) -> MemoryRecord:
+        return MemoryRecord.local_record(
+            id=result[0],
+            embedding=(np.fromstring(result[1].strip("[]"), dtype=float, sep=",") if with_embedding else np.array([])),
+            text=result[2]["text"],
+            description=result[2]["description"],
+            additional_metadata=result[2]["additional_metadata"],
+            timestamp=result[3],
+        )
@@ -1,10 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import asyncio
 import json
 import logging
 import sys
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import Any, ClassVar, TypeVar
 
 if sys.version_info >= (3, 12):
@@ -13,8 +12,8 @@ else:
     from typing_extensions import override  # pragma: no cover
 
 import numpy as np
-from pydantic import ValidationError
-from redis.asyncio.client import Redis
+from pydantic import Field, ValidationError
+from redis.asyncio.client import Pipeline, Redis
 from redis.commands.search.indexDefinition import IndexDefinition
 
 from semantic_kernel.connectors.memory.redis.const import INDEX_TYPE_MAP, RedisCollectionTypes
@@ -43,6 +42,8 @@ class RedisCollection(VectorStoreRecordCollection[str, TModel]):
     redis_database: Redis
     prefix_collection_name_to_key_names: bool
     collection_type: RedisCollectionTypes
+    pipeline_chunk_size: int = Field(default=1000, gt=0)
+    pipeline_transaction: bool = False
     supported_key_types: ClassVar[list[str] | None] = ["str"]
     supported_vector_types: ClassVar[list[str] | None] = ["float"]
 
@@ -57,12 +58,16 @@ class RedisCollection(VectorStoreRecordCollection[str, TModel]):
         connection_string: str | None = None,
         env_file_path: str | None = None,
         env_file_encoding: str | None = None,
+        pipeline_chunk_size: int = 1000,
+        pipeline_transaction: bool = False,
     ) -> None:
         """RedisMemoryStore is an abstracted interface to interact with a Redis node connection.
 
         See documentation about connections: https://redis-py.readthedocs.io/en/stable/connections.html
         See documentation about vector attributes: https://redis.io/docs/stack/search/reference/vectors.
 
+        Batches of records are sent in pipelines of at most `pipeline_chunk_size` commands,
+        one round trip per pipeline, set `pipeline_transaction` to run each pipeline as a MULTI/EXEC transaction.
         """
         if redis_database:
             super().__init__(
@@ -72,6 +77,8 @@ class RedisCollection(VectorStoreRecordCollection[str, TModel]):
                 redis_database=redis_database,
                 prefix_collection_name_to_key_names=prefix_collection_name_to_key_names,
                 collection_type=collection_type,
+                pipeline_chunk_size=pipeline_chunk_size,
+                pipeline_transaction=pipeline_transaction,
             )
             return
         try:
@@ -91,8 +98,28 @@ class RedisCollection(VectorStoreRecordCollection[str, TModel]):
             redis_database=RedisWrapper.from_url(redis_settings.connection_string.get_secret_value()),
             prefix_collection_name_to_key_names=prefix_collection_name_to_key_names,
             collection_type=collection_type,
+            pipeline_chunk_size=pipeline_chunk_size,
+            pipeline_transaction=pipeline_transaction,
         )
 
+    async def _execute_pipelined(self, items: Sequence[Any], add_command: Callable[[Pipeline, Any], Any]) -> list[Any]:
+        """Add a command per item to pipelines of at most `pipeline_chunk_size` commands and execute them.
+
+        Args:
+            items (Sequence[Any]): The items to create the commands for.
+            add_command (Callable[[Pipeline, Any], Any]): Adds the command for an item to the pipeline.
+
+        Returns:
+            list[Any]: The results of the commands, in the order of the items.
+        """
+        results: list[Any] = []
+        for start in range(0, len(items), self.pipeline_chunk_size):
+            async with self.redis_database.pipeline(transaction=self.pipeline_transaction) as pipeline:
+                for item in items[start : start + self.pipeline_chunk_size]:
+                    add_command(pipeline, item)
+                results.extend(await pipeline.execute())
+        return results
+
     def _get_redis_key(self, key: str) -> str:
         if self.prefix_collection_name_to_key_names:
             return f"{self.collection_name}:{key}"
@@ -182,15 +209,12 @@ class RedisHashsetCollection(RedisCollection):
 
     @override
     async def _inner_upsert(self, records: Sequence[Any], **kwargs: Any) -> Sequence[str]:
-        return await asyncio.gather(*[self._single_upsert(record) for record in records])
-
-    async def _single_upsert(self, upsert_record: Any) -> str:
-        await self.redis_database.hset(**upsert_record)
-        return self._unget_redis_key(upsert_record["name"])
+        await self._execute_pipelined(records, lambda pipeline, record: pipeline.hset(**record))
+        return [self._unget_redis_key(record["name"]) for record in records]
 
     @override
     async def _inner_get(self, keys: Sequence[str], **kwargs) -> Sequence[dict[bytes, bytes]] | None:
-        results = await asyncio.gather(*[self.redis_database.hgetall(self._get_redis_key(key)) for key in keys])
+        results = await self._execute_pipelined(keys, lambda pipeline, key: pipeline.hgetall(self._get_redis_key(key)))
         return [result for result in results if result]
 
     @override
@@ -204,15 +228,18 @@ class RedisHashsetCollection(RedisCollection):
         **kwargs: Any,
     ) -> Sequence[dict[str, Any]]:
         """Serialize the dict to a Redis store model."""
+        vectors = {
+            name: _vectors_to_bytes([record[name] for record in records])
+            for name, field in self.data_model_definition.fields.items()
+            if isinstance(field, VectorStoreRecordVectorField)
+        }
         results = []
-        for record in records:
+        for index, record in enumerate(records):
             result = {"mapping": {}}
             metadata = {}
             for name, field in self.data_model_definition.fields.items():
                 if isinstance(field, VectorStoreRecordVectorField):
-                    if not isinstance(record[name], np.ndarray):
-                        record[name] = np.array(record[name])
-                    result["mapping"][name] = record[name].tobytes()
+                    result["mapping"][name] = vectors[name][index]
                     continue
                 if isinstance(field, VectorStoreRecordKeyField):
                     result["name"] = self._get_redis_key(record[name])
@@ -279,11 +306,10 @@ class RedisJsonCollection(RedisCollection):
 
     @override
     async def _inner_upsert(self, records: Sequence[Any], **kwargs: Any) -> Sequence[str]:
-        return await asyncio.gather(*[self._single_upsert(record) for record in records])
-
-    async def _single_upsert(self, upsert_record: Any) -> str:
-        await self.redis_database.json().set(upsert_record["name"], "$", upsert_record["value"])
-        return self._unget_redis_key(upsert_record["name"])
+        await self._execute_pipelined(
+            records, lambda pipeline, record: pipeline.json().set(record["name"], "$", record["value"])
+        )
+        return [self._unget_redis_key(record["name"]) for record in records]
 
     @override
     async def _inner_get(self, keys: Sequence[str], **kwargs) -> Sequence[dict[bytes, bytes]] | None:
@@ -292,7 +318,9 @@ class RedisJsonCollection(RedisCollection):
 
     @override
     async def _inner_delete(self, keys: Sequence[str], **kwargs: Any) -> None:
-        await asyncio.gather(*[self.redis_database.json().delete(key, **kwargs) for key in keys])
+        await self._execute_pipelined(
+            keys, lambda pipeline, key: pipeline.json().delete(self._get_redis_key(key), **kwargs)
+        )
 
     @override
     def _serialize_dicts_to_store_models(
@@ -301,17 +329,21 @@ class RedisJsonCollection(RedisCollection):
         **kwargs: Any,
     ) -> Sequence[dict[str, Any]]:
         """Serialize the dict to a Redis store model."""
+        vectors = {
+            name: _vectors_to_lists([record[name] for record in records])
+            for name, field in self.data_model_definition.fields.items()
+            if isinstance(field, VectorStoreRecordVectorField)
+        }
         results = []
-        for record in records:
+        for index, record in enumerate(records):
             result = {"value": {}}
             for name, field in self.data_model_definition.fields.items():
                 if isinstance(field, VectorStoreRecordKeyField):
                     result["name"] = self._get_redis_key(record[name])
                     continue
                 if isinstance(field, VectorStoreRecordVectorField):
-                    if isinstance(record[name], np.ndarray):
-                        record[name] = record[name].tolist()
-                    result["value"][name] = record[name]
+                    result["value"][name] = vectors[name][index]
+                    continue
                 result["value"][name] = record[name]
             results.append(result)
         return results
@@ -328,3 +360,28 @@ class RedisJsonCollection(RedisCollection):
             record[self.data_model_definition.key_field_name] = self._unget_redis_key(key)
             results.append(record)
         return results
+
+
+def _vectors_to_bytes(vectors: list[Any]) -> list[bytes]:
+    """Serialize the vectors of a field to bytes, lists of equal length are converted to one array at once."""
+    if (
+        vectors
+        and all(isinstance(vector, list | tuple) for vector in vectors)
+        and len({len(vector) for vector in vectors}) == 1
+    ):
+        matrix = np.array(vectors)
+        if matrix.ndim == 2:
+            return [row.tobytes() for row in matrix]
+    return [(vector if isinstance(vector, np.ndarray) else np.array(vector)).tobytes() for vector in vectors]
+
+
+def _vectors_to_lists(vectors: list[Any]) -> list[Any]:
+    """Convert the ndarray vectors of a field to lists, arrays of equal shape and type are converted at once."""
+    if (
+        vectors
+        and all(isinstance(vector, np.ndarray) for vector in vectors)
+        and len({(vector.shape, vector.dtype) for vector in vectors}) == 1
+        and vectors[0].ndim == 1
+    ):
+        return np.stack(vectors).tolist()
+    return [vector.tolist() if isinstance(vector, np.ndarray) else vector for vector in vectors]
@@ -8,7 +8,6 @@ from enum import Enum
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 from numpy import ndarray
@@ -34,11 +33,14 @@ class _USearchCollection:
         embeddings_index (Index): The index of embeddings.
         embeddings_data_table (pa.Table): The PyArrow table holding embeddings data.
         embeddings_id_to_label (Dict[str, int]): Mapping of embeddings ID to label.
+        is_view (bool): Whether the index is a read-only memory-mapped view of its file,
+            which has not changed since it was read.
     """
 
     embeddings_index: Index
     embeddings_data_table: pa.Table
     embeddings_id_to_label: dict[str, int]
+    is_view: bool = False
 
     @staticmethod
     def create_default(embeddings_index: Index) -> "_USearchCollection":
@@ -50,14 +52,7 @@ class _USearchCollection:
         Returns:
             _USearchCollection: A default `_USearchCollection` initialized with the given embeddings index.
         """
-        return _USearchCollection(
-            embeddings_index,
-            pa.Table.from_pandas(
-                pd.DataFrame(columns=_embeddings_data_schema.names),
-                schema=_embeddings_data_schema,
-            ),
-            {},
-        )
+        return _USearchCollection(embeddings_index, _embeddings_data_schema.empty_table(), {})
 
 
 # PyArrow Schema definition for the embeddings data from `MemoryRecord`.
@@ -88,16 +83,21 @@ _collection_file_extensions: dict[_CollectionFileType, str] = {
 
 
 def memoryrecords_to_pyarrow_table(records: list[MemoryRecord]) -> pa.Table:
-    """Convert a list of `MemoryRecord` to a PyArrow Table."""
-    records_pylist = [
-        {attr: getattr(record, "_" + attr) for attr in _embeddings_data_schema.names} for record in records
-    ]
-    return pa.Table.from_pylist(records_pylist, schema=_embeddings_data_schema)
+    """Convert a list of `MemoryRecord` to a PyArrow Table, built column by column."""
+    return pa.Table.from_arrays(
+        [
+            pa.array([getattr(record, "_" + field.name) for record in records], type=field.type)
+            for field in _embeddings_data_schema
+        ],
+        schema=_embeddings_data_schema,
+    )
 
 
 def pyarrow_table_to_memoryrecords(table: pa.Table, vectors: ndarray | None = None) -> list[MemoryRecord]:
     """Convert a PyArrow Table to a list of MemoryRecords.
 
+    The columns are converted at once and the records are built from the column values.
+
     Args:
         table (pa.Table): The PyArrow Table to convert.
         vectors (Optional[ndarray], optional): An array of vectors to include as embeddings in the MemoryRecords.
@@ -106,9 +106,31 @@ def pyarrow_table_to_memoryrecords(table: pa.Table, vectors: ndarray | None = No
     Returns:
         List[MemoryRecord]: List of MemoryRecords constructed from the table.
     """
+    # to_numpy(...).tolist() creates the Python values of a column at once, much faster than to_pylist
+    columns = [table.column(name).to_numpy(zero_copy_only=False).tolist() for name in _embeddings_data_schema.names]
+    embeddings = vectors if vectors is not None else itertools.repeat(None, table.num_rows)
     return [
-        MemoryRecord(**row.to_dict(), embedding=vectors[index] if vectors is not None else None)
-        for index, row in table.to_pandas().iterrows()
+        MemoryRecord(
+            key=key,
+            timestamp=timestamp,
+            is_reference=is_reference,
+            external_source_name=external_source_name,
+            id=id,
+            description=description,
+            text=text,
+            additional_metadata=additional_metadata,
+            embedding=embedding,
+        )
+        for (
+            key,
+            timestamp,
+            is_reference,
+            external_source_name,
+            id,
+            description,
+            text,
+            additional_metadata,
+        ), embedding in zip(zip(*columns), embeddings)
     ]
 
 
@@ -119,6 +141,7 @@ class USearchMemoryStore(MemoryStoreBase):
     def __init__(
         self,
         persist_directory: os.PathLike | None = None,
+        memory_map: bool = True,
     ) -> None:
         """Create a USearchMemoryStore instance.
 
@@ -133,8 +156,12 @@ class USearchMemoryStore(MemoryStoreBase):
         Args:
             persist_directory (Optional[os.PathLike], default=None): Directory for loading and saving collections.
             If None, collections are not loaded nor saved.
+            memory_map (bool, default=True): Memory-map the files of the loaded collections instead of reading them.
+                The index of a collection is a read-only view of its file until the collection is changed,
+                then it is loaded into memory. Collections that did not change are not written again on `close`.
         """
         self._persist_directory = Path(persist_directory) if persist_directory is not None else None
+        self._memory_map = memory_map
 
         self._collections: dict[str, _USearchCollection] = {}
         if self._persist_directory:
@@ -223,7 +250,7 @@ class USearchMemoryStore(MemoryStoreBase):
         Returns:
             Tuple of embeddings table and a dictionary mapping from record ID to its label.
         """
-        embeddings_table = pq.read_table(path, schema=_embeddings_data_schema)
+        embeddings_table = pq.read_table(path, schema=_embeddings_data_schema, memory_map=self._memory_map)
         embeddings_id_to_label: dict[str, int] = {
             record_id: idx for idx, record_id in enumerate(embeddings_table.column("id").to_pylist())
         }
@@ -232,7 +259,7 @@ class USearchMemoryStore(MemoryStoreBase):
     def _read_embeddings_index(self, path: Path) -> Index:
         """Read embeddings index."""
         # str cast is temporarily fix for https://github.com/unum-cloud/usearch/issues/196
-        return Index.restore(str(path), view=False)
+        return Index.restore(str(path), view=self._memory_map)
 
     def _read_collections_from_dir(self) -> dict[str, _USearchCollection]:
         """Read all collections from directory to memory.
@@ -263,10 +290,21 @@ class USearchMemoryStore(MemoryStoreBase):
                 embeddings_index,
                 embeddings_table,
                 embeddings_id_to_label,
+                is_view=self._memory_map,
             )
 
         return collections
 
+    def _get_mutable_collection(self, collection_name: str) -> _USearchCollection:
+        """Get a collection that will be changed, loading its index into memory if it is a memory-mapped view."""
+        ucollection = self._collections[collection_name]
+        if ucollection.is_view:
+            ucollection.embeddings_index.load(
+                str(self._get_collection_path(collection_name, file_type=_CollectionFileType.USEARCH))
+            )
+            ucollection.is_view = False
+        return ucollection
+
     async def get_collections(self) -> list[str]:
         """Get list of existing collections.
 
@@ -326,7 +364,7 @@ class USearchMemoryStore(MemoryStoreBase):
         if collection_name not in self._collections:
             raise ServiceResourceNotFoundError(f"Collection {collection_name} does not exist, cannot insert.")
 
-        ucollection = self._collections[collection_name]
+        ucollection = self._get_mutable_collection(collection_name)
         all_records_id = [record._id for record in records]
 
         # Remove vectors from index
@@ -355,8 +393,7 @@ class USearchMemoryStore(MemoryStoreBase):
         ])
 
         # Update embeddings_id_to_label
-        for index, record_id in enumerate(all_records_id):
-            ucollection.embeddings_id_to_label[record_id] = insert_labels[index]
+        ucollection.embeddings_id_to_label.update(zip(all_records_id, insert_labels.tolist()))
 
         return all_records_id
 
@@ -411,7 +448,7 @@ class USearchMemoryStore(MemoryStoreBase):
         if collection_name not in self._collections:
             raise ServiceResourceNotFoundError(f"Collection {collection_name} does not exist, cannot insert.")
 
-        ucollection = self._collections[collection_name]
+        ucollection = self._get_mutable_collection(collection_name)
 
         labels = [ucollection.embeddings_id_to_label[key] for key in keys]
         ucollection.embeddings_index.remove(labels)
@@ -549,11 +586,16 @@ class USearchMemoryStore(MemoryStoreBase):
         return collection_storage_files
 
     def _dump_collections(self) -> None:
-        collection_storage_files = self._get_all_storage_files()
-        for file_path in itertools.chain.from_iterable(collection_storage_files.values()):
-            file_path.unlink()
+        for collection_name, collection_files in self._get_all_storage_files().items():
+            ucollection = self._collections.get(collection_name)
+            if ucollection is None or not ucollection.is_view:
+                for file_path in collection_files:
+                    file_path.unlink()
 
         for collection_name, ucollection in self._collections.items():
+            if ucollection.is_view:
+                # the collection did not change since it was read from its files
+                continue
             ucollection.embeddings_index.save(
                 self._get_collection_path(collection_name, file_type=_CollectionFileType.USEARCH)
             )
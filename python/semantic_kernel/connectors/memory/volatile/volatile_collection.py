@@ -1,7 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import logging
 import sys
-from collections.abc import Mapping, Sequence
+from collections.abc import Hashable, Mapping, Sequence
 from typing import Any, ClassVar, TypeVar
 
 if sys.version_info >= (3, 12):
@@ -9,22 +10,36 @@ if sys.version_info >= (3, 12):
 else:
     from typing_extensions import override  # pragma: no cover
 
-from pydantic import Field
+from numpy import ndarray
+from pydantic import Field, PrivateAttr
 
+from semantic_kernel.connectors.memory.volatile.volatile_vector_index import VolatileVectorIndex
+from semantic_kernel.data.vector_search_options import VectorSearchOptions
 from semantic_kernel.data.vector_store_model_definition import VectorStoreRecordDefinition
 from semantic_kernel.data.vector_store_record_collection import VectorStoreRecordCollection
+from semantic_kernel.data.vector_store_record_fields import VectorStoreRecordDataField, VectorStoreRecordVectorField
+from semantic_kernel.exceptions.memory_connector_exceptions import MemoryConnectorException
 from semantic_kernel.kernel_types import OneOrMany
 
 KEY_TYPES = str | int | float
 
 TModel = TypeVar("TModel")
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class VolatileCollection(VectorStoreRecordCollection[KEY_TYPES, TModel]):
-    """Volatile Collection."""
+    """Volatile Collection.
+
+    Vectorized search is served from a NumPy index per vector field,
+    using the dimensions and distance function of that field,
+    and equality filters are served from an index per filterable data field.
+    """
 
     inner_storage: dict[KEY_TYPES, dict] = Field(default_factory=dict)
     supported_key_types: ClassVar[list[str] | None] = ["str", "int", "float"]
+    _vector_indexes: dict[str, VolatileVectorIndex] = PrivateAttr(default_factory=dict)
+    _filter_indexes: dict[str, dict[Hashable, set[KEY_TYPES]]] = PrivateAttr(default_factory=dict)
 
     def __init__(
         self,
@@ -39,10 +54,24 @@ class VolatileCollection(VectorStoreRecordCollection[KEY_TYPES, TModel]):
             collection_name=collection_name,
         )
 
+    def model_post_init(self, __context: object | None = None):
+        """Validate the data model and create the vector and filter indexes from the field definitions."""
+        super().model_post_init(__context)
+        for field in self.data_model_definition.fields.values():
+            if isinstance(field, VectorStoreRecordVectorField):
+                self._vector_indexes[field.name] = VolatileVectorIndex(  # type: ignore[index]
+                    dimensions=field.dimensions, distance_function=field.distance_function
+                )
+            elif isinstance(field, VectorStoreRecordDataField) and field.is_filterable:
+                self._filter_indexes[field.name] = {}  # type: ignore[index]
+
     @override
     async def _inner_delete(self, keys: Sequence[KEY_TYPES], **kwargs: Any) -> None:
         for key in keys:
-            self.inner_storage.pop(key, None)
+            if (record := self.inner_storage.pop(key, None)) is not None:
+                for index in self._vector_indexes.values():
+                    index.remove(key)
+                self._unindex_filters(key, record)
 
     @override
     async def _inner_get(self, keys: Sequence[KEY_TYPES], **kwargs: Any) -> Any | OneOrMany[TModel] | None:
@@ -53,10 +82,81 @@ class VolatileCollection(VectorStoreRecordCollection[KEY_TYPES, TModel]):
         updated_keys = []
         for record in records:
             key = record[self._key_field_name] if isinstance(record, Mapping) else getattr(record, self._key_field_name)
+            # convert all vectors before changing anything, so a record is either stored and indexed or not at all
+            vectors = {
+                field_name: self._prepare_vector(key, index, self._get_field_value(record, field_name))
+                for field_name, index in self._vector_indexes.items()
+            }
+            for field_name, index in self._vector_indexes.items():
+                index.upsert(key, vectors[field_name])
+            if (existing := self.inner_storage.get(key)) is not None:
+                self._unindex_filters(key, existing)
             self.inner_storage[key] = record
+            self._index_filters(key, record)
             updated_keys.append(key)
         return updated_keys
 
+    @override
+    async def _inner_vectorized_search(
+        self,
+        vector: Sequence[float | int] | Any,
+        vector_field: VectorStoreRecordVectorField,
+        options: VectorSearchOptions,
+        **kwargs: Any,
+    ) -> Sequence[tuple[Any, float]]:
+        keys: set[KEY_TYPES] | None = None
+        for field_name, value in options.filter.items():
+            matching = self._filter_indexes[field_name].get(value, set())
+            keys = matching if keys is None else keys & matching
+            if not keys:
+                return []
+        matches = self._vector_indexes[vector_field.name].search(  # type: ignore[index]
+            vector, top=options.top, keys=list(keys) if keys is not None else None
+        )
+        if options.include_vectors:
+            return [(self.inner_storage[key], score) for key, score in matches]  # type: ignore[index]
+        return [(self._without_vectors(self.inner_storage[key]), score) for key, score in matches]  # type: ignore[index]
+
+    @staticmethod
+    def _prepare_vector(key: KEY_TYPES, index: VolatileVectorIndex, vector: Any) -> ndarray | None:
+        """Convert a vector for the index, None when the vector is missing or cannot be indexed.
+
+        Records with such vectors are still stored, as before the index existed, they are only not found by
+        vectorized search on that field.
+        """
+        if vector is None:
+            return None
+        try:
+            return index.prepare(vector)
+        except MemoryConnectorException as exc:
+            logger.warning(f"The vector of record `{key}` is not indexed for vectorized search: {exc}")
+            return None
+
+    def _index_filters(self, key: KEY_TYPES, record: Any) -> None:
+        for field_name, values in self._filter_indexes.items():
+            value = self._get_field_value(record, field_name)
+            if isinstance(value, Hashable):
+                values.setdefault(value, set()).add(key)
+
+    def _unindex_filters(self, key: KEY_TYPES, record: Any) -> None:
+        for field_name, values in self._filter_indexes.items():
+            value = self._get_field_value(record, field_name)
+            if isinstance(value, Hashable) and (keys := values.get(value)) is not None:
+                keys.discard(key)
+                if not keys:
+                    del values[value]
+
+    def _without_vectors(self, record: Any) -> Any:
+        if isinstance(record, Mapping):
+            return {name: None if name in self._vector_indexes else value for name, value in record.items()}
+        return record
+
+    @staticmethod
+    def _get_field_value(record: Any, field_name: str) -> Any:
+        if isinstance(record, Mapping):
+            return record.get(field_name)
+        return getattr(record, field_name, None)
+
     def _deserialize_store_models_to_dicts(self, records: Sequence[Any], **kwargs: Any) -> Sequence[dict[str, Any]]:
         return records
 
@@ -70,6 +170,10 @@ class VolatileCollection(VectorStoreRecordCollection[KEY_TYPES, TModel]):
     @override
     async def delete_collection(self, **kwargs: Any) -> None:
         self.inner_storage = {}
+        for index in self._vector_indexes.values():
+            index.clear()
+        for values in self._filter_indexes.values():
+            values.clear()
 
     @override
     async def does_collection_exist(self, **kwargs: Any) -> bool:
@@ -0,0 +1,169 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+import numpy as np
+from numpy import ndarray
+
+from semantic_kernel.data.const import DistanceFunction
+from semantic_kernel.exceptions.memory_connector_exceptions import MemoryConnectorException
+
+_INITIAL_CAPACITY = 16
+
+
+class VolatileVectorIndex:
+    """A NumPy-backed flat index for a single vector field of a volatile collection.
+
+    The vectors are stored in the first `size` rows of a contiguous float32 matrix that grows geometrically,
+    removes move the last row into the freed slot, so upserts and deletes are O(dimensions).
+    The norms are kept alongside for cosine scoring and the distance function of the field
+    selects the scoring kernel.
+    """
+
+    def __init__(self, dimensions: int | None = None, distance_function: DistanceFunction | None = None) -> None:
+        """Create an empty index.
+
+        Args:
+            dimensions (int, optional): The dimensions of the vectors, inferred from the first vector if not set.
+            distance_function (DistanceFunction, optional): The distance function, defaults to cosine.
+        """
+        self.dimensions = dimensions
+        self._configured_dimensions = dimensions
+        self.distance_function = distance_function or DistanceFunction.COSINE
+        self.keys: list[Hashable] = []
+        self.rows: dict[Hashable, int] = {}
+        self._matrix: ndarray | None = None
+        self._norms: ndarray | None = None
+
+    @property
+    def size(self) -> int:
+        """The number of vectors in the index."""
+        return len(self.keys)
+
+    def prepare(self, vector: Sequence[float | int] | ndarray) -> ndarray:
+        """Convert a vector for upsert without changing the index.
+
+        Raises:
+            MemoryConnectorException: When the vector does not have the dimensions of the index.
+        """
+        try:
+            return self._as_vector(vector)
+        except (TypeError, ValueError) as exc:
+            raise MemoryConnectorException(f"Vector cannot be converted to an array: {exc}") from exc
+
+    def upsert(self, key: Hashable, vector: Sequence[float | int] | ndarray | None) -> None:
+        """Insert or replace the vector for a key, a None vector removes the key from the index."""
+        if vector is None:
+            self.remove(key)
+            return
+        array = self.prepare(vector)
+        if self._matrix is None:
+            self.dimensions = array.shape[0]
+            self._matrix = np.zeros((_INITIAL_CAPACITY, self.dimensions), dtype=np.float32)
+            self._norms = np.zeros(_INITIAL_CAPACITY, dtype=np.float32)
+        row = self.rows.get(key)
+        if row is None:
+            row = self.size
+            if row == self._matrix.shape[0]:
+                self._grow()
+            self.rows[key] = row
+            self.keys.append(key)
+        self._matrix[row] = array
+        self._norms[row] = np.linalg.norm(array)  # type: ignore[index]
+
+    def remove(self, key: Hashable) -> None:
+        """Remove the vector for a key, if present."""
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        last = self.size - 1
+        if row != last:
+            moved_key = self.keys[last]
+            self._matrix[row] = self._matrix[last]  # type: ignore[index]
+            self._norms[row] = self._norms[last]  # type: ignore[index]
+            self.keys[row] = moved_key
+            self.rows[moved_key] = row
+        self.keys.pop()
+
+    def clear(self) -> None:
+        """Remove all vectors, keeping the configured dimensions."""
+        self.dimensions = self._configured_dimensions
+        self.keys = []
+        self.rows = {}
+        self._matrix = None
+        self._norms = None
+
+    def search(
+        self, vector: Sequence[float | int] | ndarray, top: int, keys: Sequence[Hashable] | None = None
+    ) -> list[tuple[Hashable, float]]:
+        """Find the best matches for a query vector.
+
+        Args:
+            vector (Sequence[float | int] | ndarray): The query vector.
+            top (int): The maximum number of matches.
+            keys (Sequence[Hashable], optional): Restrict the search to these keys, for instance from a filter.
+
+        Returns:
+            list[tuple[Hashable, float]]: The keys and scores of the matches, best match first.
+        """
+        query = self._as_vector(vector)
+        if self.size == 0:
+            return []
+        if keys is None:
+            rows = None
+            matrix = self._matrix[: self.size]  # type: ignore[index]
+            norms = self._norms[: self.size]  # type: ignore[index]
+        else:
+            rows = np.fromiter((self.rows[key] for key in keys if key in self.rows), dtype=np.intp)
+            if rows.shape[0] == 0:
+                return []
+            matrix = self._matrix[rows]  # type: ignore[index]
+            norms = self._norms[rows]  # type: ignore[index]
+
+        scores, ranking = self._score(query, matrix, norms)
+        candidates = np.flatnonzero(np.isfinite(ranking))
+        if top < candidates.shape[0]:
+            candidates = candidates[np.argpartition(ranking[candidates], top - 1)[:top]]
+        candidates = candidates[np.argsort(ranking[candidates], kind="stable")]
+        if rows is not None:
+            return [(self.keys[rows[index]], float(scores[index])) for index in candidates]
+        return [(self.keys[index], float(scores[index])) for index in candidates]
+
+    def _score(self, query: ndarray, matrix: ndarray, norms: ndarray) -> tuple[ndarray, ndarray]:
+        """Score the rows against the query, returns the scores and a ranking key where lower is better."""
+        match self.distance_function:
+            case DistanceFunction.COSINE:
+                query_norm = np.linalg.norm(query)
+                if query_norm == 0:
+                    raise MemoryConnectorException("Cannot compute cosine similarity for a zero query vector.")
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    scores = (matrix @ query) / (norms * query_norm)
+                scores[norms == 0] = np.nan
+                return scores, np.where(np.isnan(scores), np.inf, -scores)
+            case DistanceFunction.DOT_PROD:
+                scores = matrix @ query
+                return scores, -scores
+            case DistanceFunction.EUCLIDEAN:
+                squared = norms**2 - 2 * (matrix @ query) + query @ query
+                scores = np.sqrt(np.maximum(squared, 0))
+                return scores, scores
+            case DistanceFunction.MANHATTAN:
+                scores = np.abs(matrix - query).sum(axis=1)
+                return scores, scores
+        raise MemoryConnectorException(f"Distance function '{self.distance_function}' is not supported.")
+
+    def _as_vector(self, vector: Any) -> ndarray:
+        array = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if self.dimensions is not None and array.shape[0] != self.dimensions:
+            raise MemoryConnectorException(f"Vector has {array.shape[0]} dimensions, expected {self.dimensions}.")
+        return array
+
+    def _grow(self) -> None:
+        capacity = self._matrix.shape[0] * 2  # type: ignore[union-attr]
+        matrix = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)  # type: ignore[union-attr]
+        matrix[: self.size] = self._matrix[: self.size]  # type: ignore[index]
+        norms = np.zeros(capacity, dtype=np.float32)
+        norms[: self.size] = self._norms[: self.size]  # type: ignore[index]
+        self._matrix = matrix
+        self._norms = norms
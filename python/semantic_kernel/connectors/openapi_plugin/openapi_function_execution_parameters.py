@@ -7,6 +7,7 @@ from urllib.parse import urlparse
 import httpx
 from pydantic import Field
 
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 from semantic_kernel.utils.experimental_decorator import experimental_class
 
@@ -18,6 +19,7 @@ class OpenAPIFunctionExecutionParameters(KernelBaseModel):
     """OpenAPI function execution parameters."""
 
     http_client: httpx.AsyncClient | None = None
+    http_client_pool: HttpClientPool | None = None
     auth_callback: AuthCallbackType | None = None
     server_url_override: str | None = None
     ignore_non_compliant_errors: bool = False
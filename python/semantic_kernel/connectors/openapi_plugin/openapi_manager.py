@@ -58,6 +58,7 @@ def create_functions_from_openapi(
         parsed_openapi_document=parsed_doc,
         auth_callback=auth_callback,
         http_client=execution_settings.http_client if execution_settings else None,
+        http_client_pool=execution_settings.http_client_pool if execution_settings else None,
         enable_dynamic_payload=execution_settings.enable_dynamic_payload if execution_settings else True,
         enable_payload_namespacing=execution_settings.enable_payload_namespacing if execution_settings else False,
     )
@@ -17,6 +17,7 @@ from semantic_kernel.connectors.openapi_plugin.models.rest_api_operation_expecte
 )
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_operation_payload import RestApiOperationPayload
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_operation_run_options import RestApiOperationRunOptions
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
 from semantic_kernel.exceptions.function_exceptions import FunctionExecutionException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.utils.experimental_decorator import experimental_class
@@ -39,11 +40,17 @@ class OpenApiRunner:
         http_client: httpx.AsyncClient | None = None,
         enable_dynamic_payload: bool = True,
         enable_payload_namespacing: bool = False,
+        http_client_pool: HttpClientPool | None = None,
     ):
-        """Initialize the OpenApiRunner."""
+        """Initialize the OpenApiRunner.
+
+        Without an http_client, the requests use the pooled client for the host of the operation
+        from the http_client_pool, or a new client for each request when there is no pool.
+        """
         self.spec = Spec.from_dict(parsed_openapi_document)  # type: ignore
         self.auth_callback = auth_callback
         self.http_client = http_client
+        self.http_client_pool = http_client_pool
         self.enable_dynamic_payload = enable_dynamic_payload
         self.enable_payload_namespacing = enable_payload_namespacing
 
@@ -178,6 +185,8 @@ class OpenApiRunner:
 
             if hasattr(self, "http_client") and self.http_client is not None:
                 return await make_request(self.http_client)
+            if (pool := getattr(self, "http_client_pool", None)) is not None:
+                return await make_request(pool.get_client(url))
             async with httpx.AsyncClient() as client:
                 return await make_request(client)
 
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 from semantic_kernel.connectors.utils.document_loader import DocumentLoader
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
 
-__all__ = ["DocumentLoader"]
+__all__ = ["DocumentLoader", "HttpClientPool"]
@@ -6,6 +6,7 @@ from inspect import isawaitable
 
 from httpx import AsyncClient, HTTPStatusError, RequestError
 
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
 from semantic_kernel.exceptions import ServiceInvalidRequestError
 from semantic_kernel.utils.telemetry.user_agent import HTTP_USER_AGENT
 
@@ -18,27 +19,26 @@ class DocumentLoader:
     @staticmethod
     async def from_uri(
         url: str,
-        http_client: AsyncClient,
-        auth_callback: Callable[..., None | Awaitable[dict[str, str]]] | None,
+        http_client: AsyncClient | None = None,
+        auth_callback: Callable[..., None | Awaitable[dict[str, str]]] | None = None,
         user_agent: str | None = HTTP_USER_AGENT,
+        http_client_pool: HttpClientPool | None = None,
     ):
-        """Load the manifest from the given URL."""
+        """Load the manifest from the given URL.
+
+        If an http_client is supplied it is closed afterwards. Otherwise the pooled client for the host
+        of the url from the http_client_pool is used and kept open, unless there is an auth_callback,
+        which gets a new client because it may change the client.
+        """
         if user_agent is None:
             user_agent = HTTP_USER_AGENT
 
         headers = {"User-Agent": user_agent}
         try:
-            async with http_client as client:
-                if auth_callback:
-                    callback = auth_callback(client, url)
-                    if isawaitable(callback):
-                        await callback
-
-                logger.info(f"Importing document from {url}")
-
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                return response.text
+            if http_client is None and http_client_pool is not None and auth_callback is None:
+                return await DocumentLoader._get(http_client_pool.get_client(url), url, auth_callback, headers)
+            async with http_client or AsyncClient() as client:
+                return await DocumentLoader._get(client, url, auth_callback, headers)
         except HTTPStatusError as ex:
             logger.error(f"Failed to get document: {ex}")
             raise ServiceInvalidRequestError("Failed to get document.") from ex
@@ -48,3 +48,21 @@ class DocumentLoader:
         except Exception as ex:
             logger.error(f"An unexpected error occurred: {ex}")
             raise ServiceInvalidRequestError("An unexpected error occurred while getting the document.") from ex
+
+    @staticmethod
+    async def _get(
+        client: AsyncClient,
+        url: str,
+        auth_callback: Callable[..., None | Awaitable[dict[str, str]]] | None,
+        headers: dict[str, str],
+    ) -> str:
+        if auth_callback:
+            callback = auth_callback(client, url)
+            if isawaitable(callback):
+                await callback
+
+        logger.info(f"Importing document from {url}")
+
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+        return response.text
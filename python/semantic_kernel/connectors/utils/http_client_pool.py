@@ -0,0 +1,103 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class _NoResponseCookiesPolicy(DefaultCookiePolicy):
+    """A cookie policy that never stores the cookies set by responses."""
+
+    def set_ok(self, cookie: Any, request: Any) -> bool:
+        """Refuse every cookie of a response."""
+        return False
+
+
+@experimental_class
+class HttpClientPool:
+    """A pool of shared httpx clients, one per host, that keep their connections alive between requests.
+
+    The clients are created on first use for a host and reused for every following request to that host,
+    so the TCP and TLS setup is only paid once per connection. HTTP/2 is used when the `h2` package is installed.
+    Because connections are bound to an event loop, the clients are kept per event loop.
+
+    The clients are shared by every caller of the pool, so they do not store the cookies set by responses,
+    only the cookies passed to the pool are sent.
+
+    Close the pool with `await pool.close()`, or use it as an async context manager, to close the connections.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 30.0,
+        timeout: float | None = 30.0,
+        http2: bool | None = None,
+        **client_kwargs: Any,
+    ) -> None:
+        """Create a pool of http clients.
+
+        Args:
+            max_connections (int | None): The maximum number of connections per host, unlimited if None.
+            max_keepalive_connections (int | None): The maximum number of idle connections kept alive per host.
+            keepalive_expiry (float | None): The seconds an idle connection is kept alive.
+            timeout (float | None): The timeout of the requests in seconds, no timeout if None.
+            http2 (bool | None): Use HTTP/2, defaults to True if the `h2` package is installed.
+            client_kwargs (Any): Other keyword arguments for the httpx.AsyncClient, such as headers, cookies or verify.
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self.http2 = http2 if http2 is not None else importlib.util.find_spec("h2") is not None
+        self.client_kwargs = client_kwargs
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """Get the shared client for the host of the url, the client should not be closed by the caller.
+
+        Args:
+            url (str): The url that will be requested.
+
+        Returns:
+            httpx.AsyncClient: The client for the host.
+        """
+        parsed_url = urlparse(url)
+        key = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            logger.debug(f"Creating a pooled http client for {key}")
+            client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=self.http2, **self.client_kwargs)
+            client.cookies.jar.set_policy(_NoResponseCookiesPolicy())
+            clients[key] = client
+        return client
+
+    async def close(self) -> None:
+        """Close the clients of the running event loop and forget the clients of other event loops."""
+        clients = self._clients.get(asyncio.get_running_loop(), {})
+        self._clients = weakref.WeakKeyDictionary()
+        await asyncio.gather(*(client.aclose() for client in clients.values()))
+
+    async def __aenter__(self) -> "HttpClientPool":
+        """Enter the context, the clients are closed on exit."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Close the clients."""
+        await self.close()
@@ -0,0 +1,229 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from collections.abc import Iterable
+from typing import Any
+
+from semantic_kernel.contents.function_call_content import EMPTY_VALUES, FunctionCallContent
+from semantic_kernel.contents.streaming_chat_message_content import ITEM_TYPES, StreamingChatMessageContent
+from semantic_kernel.contents.streaming_content_mixin import StreamingContentMixin
+from semantic_kernel.contents.streaming_text_content import StreamingTextContent
+from semantic_kernel.exceptions import ContentAdditionException
+
+
+class _TextSlot:
+    """The text fragments of one StreamingTextContent item, joined once when building."""
+
+    def __init__(self, first: StreamingTextContent) -> None:
+        self.first = first
+        self.parts: list[str] = [first.text] if first.text else []
+        self.count = 1
+
+    def accepts(self, item: StreamingTextContent) -> bool:
+        return (
+            item.choice_index == self.first.choice_index
+            and item.ai_model_id == self.first.ai_model_id
+            and item.encoding == self.first.encoding
+        )
+
+    def add(self, item: StreamingTextContent) -> None:
+        if item.text:
+            self.parts.append(item.text)
+        self.count += 1
+
+    def build(self) -> StreamingTextContent:
+        if self.count == 1:
+            return self.first
+        return StreamingTextContent(
+            choice_index=self.first.choice_index,
+            inner_content=self.first.inner_content,
+            ai_model_id=self.first.ai_model_id,
+            metadata=self.first.metadata,
+            text="".join(self.parts),
+            encoding=self.first.encoding,
+        )
+
+
+class _FunctionCallSlot:
+    """The fragments of one function call, merged by index, the argument strings are joined once when building."""
+
+    def __init__(self, first: FunctionCallContent) -> None:
+        self.first = first
+        self.id = first.id
+        self.index = first.index
+        self.name = first.name
+        self.argument_parts: list[str] = []
+        self.argument_dict: dict[str, Any] | None = None
+        self._add_arguments(first.arguments)
+        self.count = 1
+
+    def accepts(self, item: FunctionCallContent) -> bool:
+        if item.index != self.index or (self.id and item.id and self.id != item.id):
+            return False
+        # a dict cannot be combined with a string
+        if isinstance(item.arguments, dict):
+            return self.argument_dict is not None or not self.argument_parts
+        return self.argument_dict is None or item.arguments in EMPTY_VALUES
+
+    def add(self, item: FunctionCallContent) -> None:
+        self.id = self.id or item.id
+        self.name = self.name or item.name
+        self._add_arguments(item.arguments)
+        self.count += 1
+
+    def build(self) -> FunctionCallContent:
+        if self.count == 1:
+            return self.first
+        arguments: str | dict[str, Any] = (
+            self.argument_dict if self.argument_dict is not None else "".join(self.argument_parts) or "{}"
+        )
+        return FunctionCallContent(id=self.id, index=self.index, name=self.name, arguments=arguments)
+
+    def _add_arguments(self, arguments: str | dict[str, Any] | None) -> None:
+        if isinstance(arguments, dict):
+            self.argument_dict = {**(self.argument_dict or {}), **arguments}
+        elif arguments not in EMPTY_VALUES:
+            self.argument_parts.append(arguments)  # type: ignore[arg-type]
+
+
+class StreamingContentAccumulator:
+    """Combines streaming chunks into a single content, in time linear in the number of chunks.
+
+    Adding StreamingChatMessageContent (or StreamingTextContent) chunks one by one with `+`
+    re-merges all items and creates a new model for every chunk,
+    this accumulator instead appends the text and function call argument fragments to lists,
+    keyed by function call index, and creates the combined content once in `build`.
+    The result is the same as combining the chunks with `+`.
+
+    All chunks added to one accumulator should belong to the same choice.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty accumulator."""
+        self._first: StreamingContentMixin | None = None
+        self._count = 0
+        self._fallback: StreamingContentMixin | None = None
+        self._finish_reason: Any = None
+        self._inner_content: list[Any] = []
+        self._slots: list[_TextSlot | _FunctionCallSlot | Any] = []
+        self._text_slots: list[_TextSlot] = []
+        self._function_call_slots: dict[int | None, list[_FunctionCallSlot]] = {}
+
+    @classmethod
+    def combine(cls, contents: Iterable[StreamingContentMixin]) -> StreamingContentMixin | None:
+        """Combine the chunks of a single choice into one content, None if there are no chunks."""
+        accumulator = cls()
+        for content in contents:
+            accumulator.add(content)
+        return accumulator.build()
+
+    def add(self, content: StreamingContentMixin) -> None:
+        """Add a chunk.
+
+        Raises:
+            ContentAdditionException: If the chunk cannot be combined with the previous chunks.
+        """
+        self._count += 1
+        if self._first is None:
+            self._first = content
+            if isinstance(content, StreamingChatMessageContent):
+                self._finish_reason = content.finish_reason
+                self._add_inner_content(content.inner_content)
+                self._add_items(content.items)
+            elif isinstance(content, StreamingTextContent):
+                self._add_items([content])
+            else:
+                self._fallback = content
+            return
+
+        if self._fallback is not None:
+            self._fallback = self._fallback + content
+            return
+        if isinstance(self._first, StreamingTextContent):
+            self._validate_text(content)
+            self._add_items([content])  # type: ignore[list-item]
+            return
+
+        self._validate_message(content)
+        assert isinstance(content, StreamingChatMessageContent)  # nosec
+        self._finish_reason = self._finish_reason or content.finish_reason
+        self._add_inner_content(content.inner_content)
+        self._add_items(content.items)
+
+    def build(self) -> StreamingContentMixin | None:
+        """Create the combined content."""
+        if self._first is None or self._count == 1:
+            return self._first
+        if self._fallback is not None:
+            return self._fallback
+        items = [slot.build() if isinstance(slot, _TextSlot | _FunctionCallSlot) else slot for slot in self._slots]
+        if isinstance(self._first, StreamingTextContent):
+            return items[0]
+        first = self._first
+        assert isinstance(first, StreamingChatMessageContent)  # nosec
+        return StreamingChatMessageContent(
+            role=first.role,
+            items=items,
+            choice_index=first.choice_index,
+            inner_content=self._inner_content,
+            name=first.name,
+            ai_model_id=first.ai_model_id,
+            metadata=first.metadata,
+            encoding=first.encoding,
+            finish_reason=self._finish_reason,
+        )
+
+    def _add_items(self, items: Iterable[ITEM_TYPES]) -> None:
+        for item in items:
+            if isinstance(item, StreamingTextContent):
+                slot = next((slot for slot in self._text_slots if slot.accepts(item)), None)
+                if slot:
+                    slot.add(item)
+                    continue
+                new_slot = _TextSlot(item)
+                self._text_slots.append(new_slot)
+                self._slots.append(new_slot)
+            elif isinstance(item, FunctionCallContent):
+                candidates = self._function_call_slots.setdefault(item.index, [])
+                function_call_slot = next((slot for slot in candidates if slot.accepts(item)), None)
+                if function_call_slot:
+                    function_call_slot.add(item)
+                    continue
+                new_function_call_slot = _FunctionCallSlot(item)
+                candidates.append(new_function_call_slot)
+                self._slots.append(new_function_call_slot)
+            else:
+                self._slots.append(item)
+
+    def _add_inner_content(self, inner_content: Any) -> None:
+        if isinstance(inner_content, list):
+            self._inner_content.extend(inner_content)
+        elif inner_content:
+            self._inner_content.append(inner_content)
+
+    def _validate_text(self, content: StreamingContentMixin) -> None:
+        first = self._first
+        assert isinstance(first, StreamingTextContent)  # nosec
+        if not isinstance(content, StreamingTextContent):
+            raise ContentAdditionException(f"Cannot add {type(content)} to StreamingTextContent")
+        if first.choice_index != content.choice_index:
+            raise ContentAdditionException("Cannot add StreamingTextContent with different choice_index")
+        if first.ai_model_id != content.ai_model_id:
+            raise ContentAdditionException("Cannot add StreamingTextContent from different ai_model_id")
+        if first.encoding != content.encoding:
+            raise ContentAdditionException("Cannot add StreamingTextContent with different encoding")
+
+    def _validate_message(self, content: StreamingContentMixin) -> None:
+        first = self._first
+        assert isinstance(first, StreamingChatMessageContent)  # nosec
+        if not isinstance(content, StreamingChatMessageContent):
+            raise ContentAdditionException(
+                f"Cannot add other type to StreamingChatMessageContent, type supplied: {type(content)}"
+            )
+        if first.choice_index != content.choice_index:
+            raise ContentAdditionException("Cannot add StreamingChatMessageContent with different choice_index")
+        if first.ai_model_id != content.ai_model_id:
+            raise ContentAdditionException("Cannot add StreamingChatMessageContent from different ai_model_id")
+        if first.encoding != content.encoding:
+            raise ContentAdditionException("Cannot add StreamingChatMessageContent with different encoding")
+        if first.role and content.role and first.role != content.role:
+            raise ContentAdditionException("Cannot add StreamingChatMessageContent with different role")
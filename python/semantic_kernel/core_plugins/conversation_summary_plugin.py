@@ -31,7 +31,12 @@ class ConversationSummaryPlugin:
     )
 
     def __init__(
-        self, prompt_template_config: "PromptTemplateConfig", return_key: str = "summary", **kwargs: Any
+        self,
+        prompt_template_config: "PromptTemplateConfig",
+        return_key: str = "summary",
+        max_concurrency: int | None = 4,
+        reduce_batch_size: int | None = None,
+        **kwargs: Any,
     ) -> None:
         """Initializes a new instance of the ConversationSummaryPlugin.
 
@@ -40,6 +45,10 @@ class ConversationSummaryPlugin:
         Args:
             prompt_template_config (PromptTemplateConfig): The prompt template configuration.
             return_key (str): The key to use for the return value.
+            max_concurrency (int | None): The maximum number of chunks of the transcript that are summarized
+                at the same time, unlimited if None. (default: 4)
+            reduce_batch_size (int | None): When set, the summaries of the chunks are summarized again in groups
+                of this size until a single summary remains, otherwise they are joined. (default: None)
             **kwargs: Additional keyword arguments, not used only for compatibility.
 
         """
@@ -51,6 +60,8 @@ class ConversationSummaryPlugin:
             )
 
         self.return_key = return_key
+        self.max_concurrency = max_concurrency
+        self.reduce_batch_size = reduce_batch_size
         prompt_template_config.template = ConversationSummaryPlugin._summarize_conversation_prompt_template
         prompt_template_config.template_format = "semantic-kernel"
         self._summarizeConversationFunction = KernelFunctionFromPrompt(
@@ -88,6 +99,11 @@ class ConversationSummaryPlugin:
         paragraphs = text_chunker._split_text_paragraph(lines, ConversationSummaryPlugin._max_tokens)
 
         arguments[self.return_key] = await aggregate_chunked_results(
-            self._summarizeConversationFunction, paragraphs, kernel, arguments
+            self._summarizeConversationFunction,
+            paragraphs,
+            kernel,
+            arguments,
+            max_concurrency=self.max_concurrency,
+            reduce_batch_size=self.reduce_batch_size,
         )
         return arguments
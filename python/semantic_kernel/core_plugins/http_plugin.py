@@ -1,14 +1,19 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import json
-from typing import Annotated, Any
+from typing import Annotated, Any, Final
 
-import aiohttp
+import httpx
 
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
 from semantic_kernel.exceptions import FunctionExecutionException
 from semantic_kernel.functions.kernel_function_decorator import kernel_function
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 
+# the defaults of the aiohttp sessions the plugin used before the pooled clients
+DEFAULT_TIMEOUT: Final[float] = 300.0
+CONNECT_TIMEOUT: Final[float] = 30.0
+
 
 class HttpPlugin(KernelBaseModel):
     """A plugin that provides HTTP functionality.
@@ -21,8 +26,17 @@ class HttpPlugin(KernelBaseModel):
         {{http.postAsync $url}}
         {{http.putAsync $url}}
         {{http.deleteAsync $url}}
+
+    With an http_client_pool, for instance the pool of the kernel, the requests use the pooled client
+    for the host of the url, so connections are kept alive between calls,
+    otherwise a new client is created for each request.
+    Redirects are followed and the requests time out after timeout seconds (5 minutes by default,
+    30 seconds to connect), regardless of the settings of the pool.
     """
 
+    http_client_pool: HttpClientPool | None = None
+    timeout: float | None = DEFAULT_TIMEOUT
+
     @kernel_function(description="Makes a GET request to a url", name="getAsync")
     async def get(self, url: Annotated[str, "The URL to send the request to."]) -> str:
         """Sends an HTTP GET request to the specified URI and returns the response body as a string.
@@ -36,8 +50,7 @@ class HttpPlugin(KernelBaseModel):
         if not url:
             raise FunctionExecutionException("url cannot be `None` or empty")
 
-        async with aiohttp.ClientSession() as session, session.get(url, raise_for_status=True) as response:
-            return await response.text()
+        return await self._send_request("GET", url)
 
     @kernel_function(description="Makes a POST request to a uri", name="postAsync")
     async def post(
@@ -56,13 +69,7 @@ class HttpPlugin(KernelBaseModel):
         if not url:
             raise FunctionExecutionException("url cannot be `None` or empty")
 
-        headers = {"Content-Type": "application/json"}
-        data = json.dumps(body)
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(url, headers=headers, data=data, raise_for_status=True) as response,
-        ):
-            return await response.text()
+        return await self._send_request("POST", url, body)
 
     @kernel_function(description="Makes a PUT request to a uri", name="putAsync")
     async def put(
@@ -82,13 +89,7 @@ class HttpPlugin(KernelBaseModel):
         if not url:
             raise FunctionExecutionException("url cannot be `None` or empty")
 
-        headers = {"Content-Type": "application/json"}
-        data = json.dumps(body)
-        async with (
-            aiohttp.ClientSession() as session,
-            session.put(url, headers=headers, data=data, raise_for_status=True) as response,
-        ):
-            return await response.text()
+        return await self._send_request("PUT", url, body)
 
     @kernel_function(description="Makes a DELETE request to a uri", name="deleteAsync")
     async def delete(self, url: Annotated[str, "The URI to send the request to."]) -> str:
@@ -102,5 +103,27 @@ class HttpPlugin(KernelBaseModel):
         """
         if not url:
             raise FunctionExecutionException("url cannot be `None` or empty")
-        async with aiohttp.ClientSession() as session, session.delete(url, raise_for_status=True) as response:
-            return await response.text()
+        return await self._send_request("DELETE", url)
+
+    async def _send_request(self, method: str, url: str, body: dict[str, Any] | None = None) -> str:
+        """Send the request with the pooled client for the host, or a new client, and return the response body."""
+        if self.http_client_pool is not None:
+            return await self._send(self.http_client_pool.get_client(url), method, url, body)
+        async with httpx.AsyncClient() as client:
+            return await self._send(client, method, url, body)
+
+    async def _send(self, client: httpx.AsyncClient, method: str, url: str, body: dict[str, Any] | None) -> str:
+        timeout = httpx.Timeout(self.timeout, connect=min(self.timeout, CONNECT_TIMEOUT) if self.timeout else None)
+        if method in ("POST", "PUT"):
+            response = await client.request(
+                method,
+                url,
+                headers={"Content-Type": "application/json"},
+                content=json.dumps(body),
+                follow_redirects=True,
+                timeout=timeout,
+            )
+        else:
+            response = await client.request(method, url, follow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+        return response.text
@@ -3,10 +3,12 @@ import json
 import logging
 from typing import Annotated, Any, Final
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter, ValidationError
 
+from semantic_kernel.exceptions import FunctionExecutionException
 from semantic_kernel.functions.kernel_function_decorator import kernel_function
 from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.memory.memory_ingestion import MemoryInformation
 from semantic_kernel.memory.semantic_text_memory_base import SemanticTextMemoryBase
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -18,6 +20,16 @@ RELEVANCE_PARAM: Final[str] = "relevance"
 DEFAULT_LIMIT: Final[int] = 1
 
 
+class _MemoryItem(KernelBaseModel):
+    """A piece of information passed to save_batch."""
+
+    key: str
+    text: str
+
+
+_MEMORY_ITEMS: Final[TypeAdapter[list[_MemoryItem]]] = TypeAdapter(list[_MemoryItem])
+
+
 class TextMemoryPlugin(KernelBaseModel):
     """A plugin to interact with a Semantic Text Memory."""
 
@@ -94,3 +106,40 @@ class TextMemoryPlugin(KernelBaseModel):
         await self.memory.save_information(
             collection=collection, text=text, id=key, embeddings_kwargs=self.embeddings_kwargs
         )
+
+    @kernel_function(
+        description="Save many pieces of information to semantic memory at once",
+        name="save_batch",
+    )
+    async def save_batch(
+        self,
+        items: Annotated[str, "A JSON array of objects with the `key` and the `text` of each piece of information."],
+        collection: Annotated[str, "The collection to save the information."] = DEFAULT_COLLECTION,
+    ) -> str:
+        """Save many facts to the long term memory, the texts are embedded and saved in batches.
+
+        Example:
+            {{memory.save_batch '[{"key": "1", "text": "Paris"}]'}} => "1"
+
+        Args:
+            items: A JSON array of objects with the key and the text of each fact
+            collection: The collection to save the information
+
+        Returns:
+            The number of facts that were saved.
+
+        Raises:
+            FunctionExecutionException: If the items are not a JSON array of objects with a key and a text.
+        """
+        try:
+            memory_items = _MEMORY_ITEMS.validate_json(items)
+        except ValidationError as exc:
+            raise FunctionExecutionException(
+                f"items must be a JSON array of objects with a `key` and a `text`: {exc}"
+            ) from exc
+        stats = await self.memory.save_information_batch(
+            collection=collection,
+            items=[MemoryInformation(id=item.key, text=item.text) for item in memory_items],
+            embeddings_kwargs=self.embeddings_kwargs,
+        )
+        return str(stats.items)
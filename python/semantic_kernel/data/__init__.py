@@ -1,5 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from semantic_kernel.data.vector_search_options import VectorSearchOptions
+from semantic_kernel.data.vector_search_result import VectorSearchResult
 from semantic_kernel.data.vector_store import VectorStore
 from semantic_kernel.data.vector_store_model_decorator import vectorstoremodel
 from semantic_kernel.data.vector_store_model_definition import (
@@ -13,6 +15,8 @@ from semantic_kernel.data.vector_store_record_fields import (
 )
 
 __all__ = [
+    "VectorSearchOptions",
+    "VectorSearchResult",
     "VectorStore",
     "VectorStoreRecordCollection",
     "VectorStoreRecordDataField",
@@ -0,0 +1,27 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import Any
+
+from pydantic import Field
+
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+
+@experimental_class
+class VectorSearchOptions(KernelBaseModel):
+    """Options for a vectorized search.
+
+    Args:
+        vector_field_name (str, optional): The name of the vector field to search,
+            defaults to the first vector field of the data model definition.
+        top (int): The maximum number of results to return. Defaults to 3.
+        filter (dict[str, Any]): Equality filters on data fields, the fields need to be marked `is_filterable`.
+            A record matches when all the supplied fields are equal to the supplied values.
+        include_vectors (bool): Whether to return the vectors of the records. Defaults to False.
+    """
+
+    vector_field_name: str | None = None
+    top: int = Field(default=3, gt=0)
+    filter: dict[str, Any] = Field(default_factory=dict)
+    include_vectors: bool = False
@@ -0,0 +1,23 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+TModel = TypeVar("TModel")
+
+
+@experimental_class
+@dataclass
+class VectorSearchResult(Generic[TModel]):
+    """A single result of a vectorized search.
+
+    Args:
+        record (TModel): The record that matched.
+        score (float): The score of the match, its meaning depends on the distance function of the vector field,
+            for cosine and dot product higher is better, for euclidean and manhattan distances lower is better.
+    """
+
+    record: TModel
+    score: float
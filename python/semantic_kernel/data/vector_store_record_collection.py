@@ -9,6 +9,8 @@ from typing import Any, ClassVar, Generic, TypeVar
 
 from pydantic import model_validator
 
+from semantic_kernel.data.vector_search_options import VectorSearchOptions
+from semantic_kernel.data.vector_search_result import VectorSearchResult
 from semantic_kernel.data.vector_store_model_definition import (
     VectorStoreRecordDefinition,
 )
@@ -17,6 +19,7 @@ from semantic_kernel.data.vector_store_model_protocols import (
     VectorStoreModelPydanticProtocol,
     VectorStoreModelToDictFromDictProtocol,
 )
+from semantic_kernel.data.vector_store_record_fields import VectorStoreRecordDataField, VectorStoreRecordVectorField
 from semantic_kernel.exceptions.memory_connector_exceptions import (
     MemoryConnectorException,
     VectorStoreModelDeserializationException,
@@ -111,6 +114,26 @@ class VectorStoreRecordCollection(KernelBaseModel, Generic[TKey, TModel]):
         """
         ...  # pragma: no cover
 
+    async def _inner_vectorized_search(
+        self,
+        vector: Sequence[float | int] | Any,
+        vector_field: VectorStoreRecordVectorField,
+        options: VectorSearchOptions,
+        **kwargs: Any,
+    ) -> Sequence[tuple[Any, float]]:
+        """Search the collection with a vector, this should be overridden by child classes that support search.
+
+        Args:
+            vector (Sequence[float | int] | Any): The query vector.
+            vector_field (VectorStoreRecordVectorField): The vector field to search.
+            options (VectorSearchOptions): The search options, the filter is already validated.
+            **kwargs (Any): Additional arguments.
+
+        Returns:
+            The matching records from the store, not deserialized, with their scores, best match first.
+        """
+        raise NotImplementedError(f"Vectorized search is not supported by {self.__class__.__name__}.")
+
     def _validate_data_model(self):
         """Internal function that can be overloaded by child classes to validate datatypes, etc.
 
@@ -346,6 +369,58 @@ class VectorStoreRecordCollection(KernelBaseModel, Generic[TKey, TModel]):
         except Exception as exc:
             raise MemoryConnectorException(f"Error deleting records: {exc}") from exc
 
+    async def vectorized_search(
+        self,
+        vector: Sequence[float | int] | Any,
+        options: VectorSearchOptions | None = None,
+        **kwargs: Any,
+    ) -> Sequence[VectorSearchResult[TModel]]:
+        """Search the collection for the records nearest to a vector.
+
+        Args:
+            vector (Sequence[float | int] | Any): The query vector, a list of numbers or a numpy array.
+            options (VectorSearchOptions, optional): The search options, such as the vector field to search,
+                the number of results, the filters and whether to include the vectors.
+            **kwargs (Any): Additional arguments, to be passed to the store.
+
+        Returns:
+            Sequence[VectorSearchResult[TModel]]: The matching records and their scores, best match first.
+
+        Raises:
+            MemoryConnectorException: If the vector field or filters are invalid, or if the search fails.
+            NotImplementedError: If the collection does not support vectorized search.
+        """
+        options = options or VectorSearchOptions()
+        vector_field = self._get_vector_field(options.vector_field_name)
+        for field_name in options.filter:
+            field = self.data_model_definition.fields.get(field_name)
+            if not isinstance(field, VectorStoreRecordDataField) or not field.is_filterable:
+                raise MemoryConnectorException(f"Field '{field_name}' is not a filterable data field.")
+
+        try:
+            results = await self._inner_vectorized_search(vector, vector_field, options, **kwargs)
+        except NotImplementedError:
+            raise
+        except Exception as exc:
+            raise MemoryConnectorException(f"Error searching records: {exc}") from exc
+
+        try:
+            return [VectorSearchResult(record=self.deserialize(record), score=score) for record, score in results]
+        except Exception as exc:
+            raise MemoryConnectorException(f"Error deserializing record: {exc}") from exc
+
+    def _get_vector_field(self, field_name: str | None) -> VectorStoreRecordVectorField:
+        """Get the vector field to search, defaults to the first vector field."""
+        vector_fields = self.data_model_definition.vector_fields
+        if not vector_fields:
+            raise MemoryConnectorException("The data model definition has no vector fields to search.")
+        if field_name is None:
+            return vector_fields[0]
+        for field in vector_fields:
+            if field.name == field_name:
+                return field
+        raise MemoryConnectorException(f"Field '{field_name}' is not a vector field.")
+
     # region Internal Serialization methods
 
     def serialize(self, records: OneOrMany[TModel], **kwargs: Any) -> OneOrMany[Any]:
@@ -533,7 +608,10 @@ class VectorStoreRecordCollection(KernelBaseModel, Generic[TKey, TModel]):
         for field_name in self.data_model_definition.fields:  # type: ignore
             try:
                 value = record[field_name]
-                if func := getattr(self.data_model_definition.fields[field_name], "deserialize_function", None):
+                # an empty value, such as a vector that was not stored, is kept as None for every connector
+                if value is not None and (
+                    func := getattr(self.data_model_definition.fields[field_name], "deserialize_function", None)
+                ):
                     value = func(value)
                 data_model_dict[field_name] = value
             except KeyError as exc:
@@ -58,6 +58,12 @@ class ServiceContentFilterException(ServiceResponseException):
     pass
 
 
+class ServiceUnavailableError(ServiceResponseException):
+    """The service was not called because it is considered unavailable, for instance by an open circuit breaker."""
+
+    pass
+
+
 class ServiceResourceNotFoundError(ServiceException):
     """The request service could not be found."""
 
@@ -75,4 +81,5 @@ __all__ = [
     "ServiceInvalidTypeError",
     "ServiceResourceNotFoundError",
     "ServiceResponseException",
+    "ServiceUnavailableError",
 ]
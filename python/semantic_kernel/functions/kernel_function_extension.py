@@ -3,11 +3,12 @@
 import logging
 from abc import ABC
 from functools import singledispatchmethod
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 from pydantic import Field, field_validator
 
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
 from semantic_kernel.exceptions import KernelFunctionNotFoundError, KernelPluginNotFoundError
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
 from semantic_kernel.functions.kernel_plugin import KernelPlugin
@@ -27,6 +28,8 @@ if TYPE_CHECKING:
     from semantic_kernel.functions.types import KERNEL_FUNCTION_TYPE
 
 
+_T = TypeVar("_T", bound="OpenAPIFunctionExecutionParameters")
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -34,6 +37,7 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
     """Kernel function extension."""
 
     plugins: dict[str, KernelPlugin] = Field(default_factory=dict)
+    http_client_pool: HttpClientPool = Field(default_factory=HttpClientPool, exclude=True)
 
     @field_validator("plugins", mode="before")
     @classmethod
@@ -212,6 +216,9 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
     ) -> KernelPlugin:
         """Add a plugin from the OpenAPI manifest.
 
+        The requests of the plugin use the http_client_pool of the kernel,
+        unless the execution settings have an http_client or an http_client_pool.
+
         Args:
             plugin_name (str): The name of the plugin
             openapi_document_path (str): The path to the OpenAPI document
@@ -224,11 +231,17 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
         Raises:
             PluginInitializationError: if the plugin URL or plugin JSON/YAML is not provided
         """
+        from semantic_kernel.connectors.openapi_plugin.openapi_function_execution_parameters import (
+            OpenAPIFunctionExecutionParameters,
+        )
+
         return self.add_plugin(
             KernelPlugin.from_openapi(
                 plugin_name=plugin_name,
                 openapi_document_path=openapi_document_path,
-                execution_settings=execution_settings,
+                execution_settings=self._with_http_client_pool(
+                    execution_settings or OpenAPIFunctionExecutionParameters()
+                ),
                 description=description,
             )
         )
@@ -243,6 +256,9 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
     ) -> KernelPlugin:
         """Add a plugin from an OpenAPI document.
 
+        The manifest is loaded and the requests of the plugin are sent with the http_client_pool of the kernel,
+        unless the execution parameters have an http_client or an http_client_pool.
+
         Args:
             plugin_name (str): The name of the plugin
             plugin_url (str | None): The URL of the plugin
@@ -256,16 +272,28 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
         Raises:
             PluginInitializationError: if the plugin URL or plugin JSON/YAML is not provided
         """
+        from semantic_kernel.connectors.openai_plugin.openai_function_execution_parameters import (
+            OpenAIFunctionExecutionParameters,
+        )
+
         return self.add_plugin(
             await KernelPlugin.from_openai(
                 plugin_name=plugin_name,
                 plugin_url=plugin_url,
                 plugin_str=plugin_str,
-                execution_parameters=execution_parameters,
+                execution_parameters=self._with_http_client_pool(
+                    execution_parameters or OpenAIFunctionExecutionParameters()
+                ),
                 description=description,
             )
         )
 
+    def _with_http_client_pool(self, execution_parameters: "_T") -> "_T":
+        """Return a copy of the execution parameters with the http_client_pool of the kernel, if they have none."""
+        if execution_parameters.http_client is not None or execution_parameters.http_client_pool is not None:
+            return execution_parameters
+        return execution_parameters.model_copy(update={"http_client_pool": self.http_client_pool})
+
     def get_plugin(self, plugin_name: str) -> "KernelPlugin":
         """Get a plugin by name.
 
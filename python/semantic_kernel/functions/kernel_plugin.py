@@ -11,7 +11,6 @@ from glob import glob
 from types import MethodType
 from typing import TYPE_CHECKING, Annotated, Any
 
-import httpx
 from pydantic import Field, StringConstraints
 
 from semantic_kernel.connectors.openai_plugin.openai_authentication_config import OpenAIAuthenticationConfig
@@ -424,9 +423,12 @@ class KernelPlugin(KernelBaseModel):
             openai_manifest = plugin_str
         elif plugin_url is not None:
             # Load plugin from the URL
-            http_client = execution_parameters.http_client if execution_parameters.http_client else httpx.AsyncClient()
             openai_manifest = await DocumentLoader.from_uri(
-                url=plugin_url, http_client=http_client, auth_callback=None, user_agent=execution_parameters.user_agent
+                url=plugin_url,
+                http_client=execution_parameters.http_client,
+                auth_callback=None,
+                user_agent=execution_parameters.user_agent,
+                http_client_pool=execution_parameters.http_client_pool,
             )
         else:
             raise PluginInitializationError("Either plugin_url or plugin_json must be provided.")
@@ -521,12 +523,10 @@ class KernelPlugin(KernelBaseModel):
                     function = KernelPlugin._parse_or_copy(function=function, plugin_name=plugin_name)
                     functions_dict[function.name] = function
                 elif isinstance(function, KernelPlugin):  # type: ignore
-                    functions_dict.update(
-                        {
-                            name: KernelPlugin._parse_or_copy(function=function, plugin_name=plugin_name)
-                            for name, function in function.functions.items()
-                        }
-                    )
+                    functions_dict.update({
+                        name: KernelPlugin._parse_or_copy(function=function, plugin_name=plugin_name)
+                        for name, function in function.functions.items()
+                    })
                 else:
                     raise ValueError(f"Invalid type for functions in list: {function} (type: {type(function)})")
             return functions_dict
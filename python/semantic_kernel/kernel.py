@@ -3,6 +3,7 @@
 import logging
 from collections.abc import AsyncGenerator, AsyncIterable, Callable
 from copy import copy
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
@@ -10,6 +11,7 @@ from semantic_kernel.const import METADATA_EXCEPTION_KEY
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.streaming_content_accumulator import StreamingContentAccumulator
 from semantic_kernel.contents.streaming_content_mixin import StreamingContentMixin
 from semantic_kernel.exceptions import (
     FunctionCallInvalidArgumentsException,
@@ -67,6 +69,8 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
         plugins: A dict with the plugins registered with the Kernel, from KernelFunctionExtension.
         services: A dict with the services registered with the Kernel, from KernelServicesExtension.
         ai_service_selector: The AI service selector to be used by the kernel, from KernelServicesExtension.
+        http_client_pool: The pool of http clients used by the OpenAPI plugins of the kernel,
+            from KernelFunctionExtension, close it with `await kernel.close()` or `async with kernel`.
         retry_mechanism: The retry mechanism to be used by the kernel, from KernelReliabilityExtension.
 
     """
@@ -102,6 +106,18 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
             args["ai_service_selector"] = ai_service_selector
         super().__init__(**args)
 
+    async def close(self) -> None:
+        """Close the connections of the http client pool of the kernel."""
+        await self.http_client_pool.close()
+
+    async def __aenter__(self) -> "Kernel":
+        """Enter the context, the connections of the kernel are closed on exit."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Close the connections of the kernel."""
+        await self.close()
+
     async def invoke_stream(
         self,
         function: "KernelFunction | None" = None,
@@ -154,15 +170,13 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
             yield stream_message
 
         if return_function_results:
-            output_function_result: list["StreamingContentMixin"] = []
+            accumulators: dict[int, StreamingContentAccumulator] = {}
             for result in function_result:
                 for choice in result:
                     if not isinstance(choice, StreamingContentMixin):
                         continue
-                    if len(output_function_result) <= choice.choice_index:
-                        output_function_result.append(copy(choice))
-                    else:
-                        output_function_result[choice.choice_index] += choice
+                    accumulators.setdefault(choice.choice_index, StreamingContentAccumulator()).add(choice)
+            output_function_result = [accumulators[index].build() for index in sorted(accumulators)]
             yield FunctionResult(function=function.metadata, value=output_function_result)
 
     async def invoke(
@@ -307,15 +321,13 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
             yield stream_message
 
         if return_function_results:
-            output_function_result: list["StreamingContentMixin"] = []
+            accumulators: dict[int, StreamingContentAccumulator] = {}
             for result in function_result:
                 for choice in result:
                     if not isinstance(choice, StreamingContentMixin):
                         continue
-                    if len(output_function_result) <= choice.choice_index:
-                        output_function_result.append(copy(choice))
-                    else:
-                        output_function_result[choice.choice_index] += choice
+                    accumulators.setdefault(choice.choice_index, StreamingContentAccumulator()).add(choice)
+            output_function_result = [accumulators[index].build() for index in sorted(accumulators)]
             yield FunctionResult(function=function.metadata, value=output_function_result)
 
     async def invoke_function_call(
@@ -460,7 +472,9 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
         for service_id, settings in execution_settings.items():
             service = self.get_service(service_id, type=EmbeddingGeneratorBase)  # type: ignore
             if service:
-                vectors = await service.generate_raw_embeddings(texts=contents, settings=settings, **kwargs)  # type: ignore
+                vectors = await self.retry_mechanism.execute_with_retry(
+                    partial(service.generate_raw_embeddings, texts=contents, settings=settings, **kwargs)  # type: ignore
+                )
                 break
         if not service:
             raise KernelServiceNotFoundError("No service found to generate embeddings.")
@@ -1,5 +1,12 @@
 # Copyright (c) Microsoft. All rights reserved.
+from semantic_kernel.memory.memory_ingestion import MemoryInformation, MemoryIngestionStats, MemoryReference
 from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
 from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
 
-__all__ = ["SemanticTextMemory", "VolatileMemoryStore"]
+__all__ = [
+    "MemoryInformation",
+    "MemoryIngestionStats",
+    "MemoryReference",
+    "SemanticTextMemory",
+    "VolatileMemoryStore",
+]
@@ -0,0 +1,90 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Final, TypeVar
+
+from pydantic import Field
+
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE: Final[int] = 100
+
+
+@experimental_class
+class MemoryInformation(KernelBaseModel):
+    """A text to save to the memory with SemanticTextMemory.save_information_batch.
+
+    Args:
+        id (str): The id of the information.
+        text (str): The text to save.
+        description (str | None): The description of the information.
+        additional_metadata (str | None): Additional metadata of the information.
+    """
+
+    id: str
+    text: str
+    description: str | None = None
+    additional_metadata: str | None = None
+
+
+@experimental_class
+class MemoryReference(KernelBaseModel):
+    """A reference to save to the memory with SemanticTextMemory.save_references_batch.
+
+    Args:
+        external_id (str): The external id of the reference.
+        external_source_name (str): The external source name of the reference.
+        text (str): The text to embed.
+        description (str | None): The description of the reference.
+        additional_metadata (str | None): Additional metadata of the reference.
+    """
+
+    external_id: str
+    external_source_name: str
+    text: str
+    description: str | None = None
+    additional_metadata: str | None = None
+
+
+@experimental_class
+class MemoryIngestionStats(KernelBaseModel):
+    """The statistics of a bulk save to the memory.
+
+    Args:
+        items (int): The number of items that were saved.
+        batches (int): The number of batches the items were embedded and upserted in.
+        seconds (float): The number of seconds the save took.
+    """
+
+    items: int = 0
+    batches: int = 0
+    seconds: float = Field(default=0.0, ge=0)
+
+    @property
+    def items_per_second(self) -> float:
+        """The number of items saved per second."""
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+async def iterate_batches(items: Iterable[T] | AsyncIterable[T], batch_size: int) -> AsyncIterator[list[T]]:
+    """Iterate over an iterable or async iterable in lists of at most batch_size items."""
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0.")
+    batch: list[T] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+    else:
+        for item in items:
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
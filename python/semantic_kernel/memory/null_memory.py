@@ -1,5 +1,14 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from collections.abc import AsyncIterable, Iterable
+from typing import Any
+
+from semantic_kernel.memory.memory_ingestion import (
+    DEFAULT_BATCH_SIZE,
+    MemoryInformation,
+    MemoryIngestionStats,
+    MemoryReference,
+)
 from semantic_kernel.memory.memory_query_result import MemoryQueryResult
 from semantic_kernel.memory.semantic_text_memory_base import SemanticTextMemoryBase
 from semantic_kernel.utils.experimental_decorator import experimental_class
@@ -32,6 +41,26 @@ class NullMemory(SemanticTextMemoryBase):
         """Nullifies behavior of SemanticTextMemoryBase save_reference."""
         return
 
+    async def save_information_batch(
+        self,
+        collection: str,
+        items: Iterable[MemoryInformation] | AsyncIterable[MemoryInformation],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        embeddings_kwargs: dict[str, Any] | None = None,
+    ) -> MemoryIngestionStats:
+        """Nullifies behavior of SemanticTextMemoryBase save_information_batch."""
+        return MemoryIngestionStats()
+
+    async def save_references_batch(
+        self,
+        collection: str,
+        items: Iterable[MemoryReference] | AsyncIterable[MemoryReference],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        embeddings_kwargs: dict[str, Any] | None = None,
+    ) -> MemoryIngestionStats:
+        """Nullifies behavior of SemanticTextMemoryBase save_references_batch."""
+        return MemoryIngestionStats()
+
     async def get(self, collection: str, query: str) -> MemoryQueryResult | None:
         """Nullifies behavior of SemanticTextMemoryBase get."""
         return None
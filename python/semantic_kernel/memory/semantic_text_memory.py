@@ -1,23 +1,47 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from typing import Any
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from typing import Any, TypeVar
 
+from numpy import ndarray
 from pydantic import PrivateAttr
 
 from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.exceptions import ServiceResourceNotFoundError
+from semantic_kernel.memory.memory_ingestion import (
+    DEFAULT_BATCH_SIZE,
+    MemoryInformation,
+    MemoryIngestionStats,
+    MemoryReference,
+    iterate_batches,
+)
 from semantic_kernel.memory.memory_query_result import MemoryQueryResult
 from semantic_kernel.memory.memory_record import MemoryRecord
 from semantic_kernel.memory.memory_store_base import MemoryStoreBase
 from semantic_kernel.memory.semantic_text_memory_base import SemanticTextMemoryBase
 from semantic_kernel.utils.experimental_decorator import experimental_class
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT", MemoryInformation, MemoryReference)
+T = TypeVar("T")
+
 
 @experimental_class
 class SemanticTextMemory(SemanticTextMemoryBase):
-    """Class for semantic text memory."""
+    """Class for semantic text memory.
+
+    The collections that were found or created are remembered, so they are only checked once.
+    When a remembered collection is not found while saving, because it was deleted in the meantime,
+    it is created again and the save is retried.
+    """
 
     _storage: MemoryStoreBase = PrivateAttr()
     _embeddings_generator: EmbeddingGeneratorBase = PrivateAttr()
+    _known_collections: set[str] = PrivateAttr(default_factory=set)
 
     def __init__(self, storage: MemoryStoreBase, embeddings_generator: EmbeddingGeneratorBase) -> None:
         """Initialize a new instance of SemanticTextMemory.
@@ -50,8 +74,7 @@ class SemanticTextMemory(SemanticTextMemoryBase):
             additional_metadata (Optional[str]): Additional metadata of the information.
             embeddings_kwargs (Optional[Dict[str, Any]]): The embeddings kwargs of the information.
         """
-        if not await self._storage.does_collection_exist(collection_name=collection):
-            await self._storage.create_collection(collection_name=collection)
+        await self._ensure_collection(collection)
 
         embedding = (await self._embeddings_generator.generate_embeddings([text], **embeddings_kwargs))[0]
         data = MemoryRecord.local_record(
@@ -62,7 +85,7 @@ class SemanticTextMemory(SemanticTextMemoryBase):
             embedding=embedding,
         )
 
-        await self._storage.upsert(collection_name=collection, record=data)
+        await self._upsert(collection, lambda: self._storage.upsert(collection_name=collection, record=data))
 
     async def save_reference(
         self,
@@ -85,8 +108,7 @@ class SemanticTextMemory(SemanticTextMemoryBase):
             additional_metadata (Optional[str]): Additional metadata of the reference.
             embeddings_kwargs (Optional[Dict[str, Any]]): The embeddings kwargs of the reference.
         """
-        if not await self._storage.does_collection_exist(collection_name=collection):
-            await self._storage.create_collection(collection_name=collection)
+        await self._ensure_collection(collection)
 
         embedding = (await self._embeddings_generator.generate_embeddings([text], **embeddings_kwargs))[0]
         data = MemoryRecord.reference_record(
@@ -97,7 +119,138 @@ class SemanticTextMemory(SemanticTextMemoryBase):
             embedding=embedding,
         )
 
-        await self._storage.upsert(collection_name=collection, record=data)
+        await self._upsert(collection, lambda: self._storage.upsert(collection_name=collection, record=data))
+
+    async def save_information_batch(
+        self,
+        collection: str,
+        items: Iterable[MemoryInformation] | AsyncIterable[MemoryInformation],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        embeddings_kwargs: dict[str, Any] | None = None,
+    ) -> MemoryIngestionStats:
+        """Save many texts to the memory (calls the memory store's upsert_batch method).
+
+        The texts of each batch are embedded with a single call, and each batch is upserted
+        while the next batch is embedded.
+
+        Args:
+            collection (str): The collection to save the information to.
+            items (Iterable[MemoryInformation] | AsyncIterable[MemoryInformation]): The information to save.
+            batch_size (int): The maximum number of items per batch, at most the number of texts
+                the embedding model accepts in one call. (default: 100)
+            embeddings_kwargs (Optional[Dict[str, Any]]): The embeddings kwargs of the information.
+
+        Returns:
+            MemoryIngestionStats: The number of items and batches that were saved and the seconds it took.
+        """
+        return await self._save_batch(
+            collection,
+            items,
+            lambda item, embedding: MemoryRecord.local_record(
+                id=item.id,
+                text=item.text,
+                description=item.description,
+                additional_metadata=item.additional_metadata,
+                embedding=embedding,
+            ),
+            batch_size,
+            embeddings_kwargs,
+        )
+
+    async def save_references_batch(
+        self,
+        collection: str,
+        items: Iterable[MemoryReference] | AsyncIterable[MemoryReference],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        embeddings_kwargs: dict[str, Any] | None = None,
+    ) -> MemoryIngestionStats:
+        """Save many references to the memory (calls the memory store's upsert_batch method).
+
+        The texts of each batch are embedded with a single call, and each batch is upserted
+        while the next batch is embedded.
+
+        Args:
+            collection (str): The collection to save the references to.
+            items (Iterable[MemoryReference] | AsyncIterable[MemoryReference]): The references to save.
+            batch_size (int): The maximum number of items per batch, at most the number of texts
+                the embedding model accepts in one call. (default: 100)
+            embeddings_kwargs (Optional[Dict[str, Any]]): The embeddings kwargs of the references.
+
+        Returns:
+            MemoryIngestionStats: The number of items and batches that were saved and the seconds it took.
+        """
+        return await self._save_batch(
+            collection,
+            items,
+            lambda item, embedding: MemoryRecord.reference_record(
+                external_id=item.external_id,
+                source_name=item.external_source_name,
+                description=item.description,
+                additional_metadata=item.additional_metadata,
+                embedding=embedding,
+            ),
+            batch_size,
+            embeddings_kwargs,
+        )
+
+    async def _save_batch(
+        self,
+        collection: str,
+        items: Iterable[ItemT] | AsyncIterable[ItemT],
+        to_record: Callable[[ItemT, ndarray], MemoryRecord],
+        batch_size: int,
+        embeddings_kwargs: dict[str, Any] | None,
+    ) -> MemoryIngestionStats:
+        """Embed and upsert the items in batches, overlapping the upsert of a batch with the next embedding call."""
+        start = time.perf_counter()
+        stats = MemoryIngestionStats()
+        await self._ensure_collection(collection)
+        upsert: asyncio.Future[list[str]] | None = None
+        try:
+            async for batch in iterate_batches(items, batch_size):
+                embeddings = await self._embeddings_generator.generate_embeddings(
+                    [item.text for item in batch], **(embeddings_kwargs or {})
+                )
+                records = [to_record(item, embedding) for item, embedding in zip(batch, embeddings)]
+                if upsert is not None:
+                    await upsert
+                upsert = asyncio.ensure_future(
+                    self._upsert(
+                        collection,
+                        lambda records=records: self._storage.upsert_batch(collection_name=collection, records=records),
+                    )
+                )
+                stats.items += len(records)
+                stats.batches += 1
+            if upsert is not None:
+                await upsert
+        finally:
+            if upsert is not None and not upsert.done():
+                upsert.cancel()
+        stats.seconds = time.perf_counter() - start
+        logger.info(
+            f"Saved {stats.items} items in {stats.batches} batches to collection `{collection}` "
+            f"in {stats.seconds:.2f} seconds ({stats.items_per_second:.1f} items per second)."
+        )
+        return stats
+
+    async def _ensure_collection(self, collection: str) -> None:
+        """Create the collection if it does not exist, the collections that exist are remembered."""
+        if collection in self._known_collections:
+            return
+        if not await self._storage.does_collection_exist(collection_name=collection):
+            await self._storage.create_collection(collection_name=collection)
+        self._known_collections.add(collection)
+
+    async def _upsert(self, collection: str, upsert: Callable[[], Awaitable[T]]) -> T:
+        """Run the upsert, the collection is created again and the upsert retried if it is not found."""
+        try:
+            return await upsert()
+        except ServiceResourceNotFoundError:
+            logger.info(f"Collection `{collection}` was not found, creating it again.")
+            self._known_collections.discard(collection)
+            await self._ensure_collection(collection)
+            return await upsert()
 
     async def get(
         self,
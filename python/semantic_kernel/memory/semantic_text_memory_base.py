@@ -1,9 +1,18 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import time
 from abc import abstractmethod
+from collections.abc import AsyncIterable, Iterable
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.memory.memory_ingestion import (
+    DEFAULT_BATCH_SIZE,
+    MemoryInformation,
+    MemoryIngestionStats,
+    MemoryReference,
+    iterate_batches,
+)
 from semantic_kernel.utils.experimental_decorator import experimental_class
 
 if TYPE_CHECKING:
@@ -62,6 +71,82 @@ class SemanticTextMemoryBase(KernelBaseModel):
         """
         pass
 
+    async def save_information_batch(
+        self,
+        collection: str,
+        items: Iterable[MemoryInformation] | AsyncIterable[MemoryInformation],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        embeddings_kwargs: dict[str, Any] | None = None,
+    ) -> MemoryIngestionStats:
+        """Save many texts to the memory.
+
+        The default implementation saves the items one by one with save_information,
+        implementations override it to embed and upsert the items in batches.
+
+        Args:
+            collection (str): The collection to save the information to.
+            items (Iterable[MemoryInformation] | AsyncIterable[MemoryInformation]): The information to save.
+            batch_size (int): The maximum number of items per batch. (default: 100)
+            embeddings_kwargs (Optional[Dict[str, Any]]): The embeddings kwargs of the information.
+
+        Returns:
+            MemoryIngestionStats: The number of items and batches that were saved and the seconds it took.
+        """
+        start = time.perf_counter()
+        stats = MemoryIngestionStats()
+        async for batch in iterate_batches(items, batch_size):
+            for item in batch:
+                await self.save_information(
+                    collection=collection,
+                    text=item.text,
+                    id=item.id,
+                    description=item.description,
+                    additional_metadata=item.additional_metadata,
+                    embeddings_kwargs=embeddings_kwargs,
+                )
+            stats.items += len(batch)
+            stats.batches += 1
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    async def save_references_batch(
+        self,
+        collection: str,
+        items: Iterable[MemoryReference] | AsyncIterable[MemoryReference],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        embeddings_kwargs: dict[str, Any] | None = None,
+    ) -> MemoryIngestionStats:
+        """Save many references to the memory.
+
+        The default implementation saves the items one by one with save_reference,
+        implementations override it to embed and upsert the items in batches.
+
+        Args:
+            collection (str): The collection to save the references to.
+            items (Iterable[MemoryReference] | AsyncIterable[MemoryReference]): The references to save.
+            batch_size (int): The maximum number of items per batch. (default: 100)
+            embeddings_kwargs (Optional[Dict[str, Any]]): The embeddings kwargs of the references.
+
+        Returns:
+            MemoryIngestionStats: The number of items and batches that were saved and the seconds it took.
+        """
+        start = time.perf_counter()
+        stats = MemoryIngestionStats()
+        async for batch in iterate_batches(items, batch_size):
+            for item in batch:
+                await self.save_reference(
+                    collection=collection,
+                    text=item.text,
+                    external_id=item.external_id,
+                    external_source_name=item.external_source_name,
+                    description=item.description,
+                    additional_metadata=item.additional_metadata,
+                )
+            stats.items += len(batch)
+            stats.batches += 1
+        stats.seconds = time.perf_counter() - start
+        return stats
+
     @abstractmethod
     async def get(
         self,
@@ -1,27 +1,132 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
-from copy import deepcopy
+from copy import copy, deepcopy
 
+import numpy as np
 from numpy import array, linalg, ndarray
 
-from semantic_kernel.exceptions import ServiceResourceNotFoundError
+from semantic_kernel.exceptions import ServiceInvalidRequestError, ServiceResourceNotFoundError
 from semantic_kernel.memory.memory_record import MemoryRecord
 from semantic_kernel.memory.memory_store_base import MemoryStoreBase
 from semantic_kernel.utils.experimental_decorator import experimental_class
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_INITIAL_CAPACITY = 16
+
+
+class _EmbeddingIndex:
+    """A contiguous, pre-normalized float32 embedding matrix for a single collection.
+
+    Rows are kept in the first `size` rows of `matrix`, the matrix grows geometrically on insert
+    and removals move the last row into the freed slot, so upserts and removes are O(dimensions).
+    Zero vectors are stored as zero rows and flagged in `valid`, they are scored -1.
+    """
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.rows: dict[str, int] = {}
+        self.matrix: ndarray | None = None
+        self.valid: ndarray | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.keys)
+
+    def upsert(self, key: str, embedding: ndarray | None) -> None:
+        if embedding is None:
+            self.remove(key)
+            return
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if self.matrix is None:
+            self.matrix = np.zeros((_INITIAL_CAPACITY, vector.shape[0]), dtype=np.float32)
+            self.valid = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        elif vector.shape[0] != self.matrix.shape[1]:
+            raise ServiceInvalidRequestError(
+                f"Embedding of record '{key}' has dimension {vector.shape[0]}, "
+                f"expected {self.matrix.shape[1]} for this collection"
+            )
+        row = self.rows.get(key)
+        if row is None:
+            row = self.size
+            if row == self.matrix.shape[0]:
+                self._grow()
+            self.rows[key] = row
+            self.keys.append(key)
+        norm = linalg.norm(vector)
+        if norm == 0:
+            self.matrix[row] = 0.0
+            self.valid[row] = False
+        else:
+            self.matrix[row] = vector / norm
+            self.valid[row] = True
+
+    def remove(self, key: str) -> None:
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        last = self.size - 1
+        if row != last:
+            moved_key = self.keys[last]
+            self.matrix[row] = self.matrix[last]
+            self.valid[row] = self.valid[last]
+            self.keys[row] = moved_key
+            self.rows[moved_key] = row
+        self.keys.pop()
+        self.valid[last] = False
+
+    def scores(self, queries: ndarray) -> ndarray:
+        """Computes the cosine similarity of each (row) query against all rows, shape (queries, size)."""
+        matrix = self.matrix[: self.size]
+        valid = self.valid[: self.size]
+        if not valid.any():
+            raise ValueError("Invalid vectors, cannot compute cosine similarity scores for zero vectors")
+        if not valid.all():
+            logger.warning(
+                "Some vectors in the embedding collection are zero vectors."
+                "Ignoring cosine similarity score computation for those vectors."
+            )
+        if queries.shape[1] != matrix.shape[1]:
+            raise ServiceInvalidRequestError(
+                f"Query embedding has dimension {queries.shape[1]}, expected {matrix.shape[1]} for this collection"
+            )
+        query_norms = linalg.norm(queries, axis=1, keepdims=True)
+        if (query_norms == 0).any():
+            raise ValueError("Invalid vectors, cannot compute cosine similarity scores for zero query vectors")
+        scores = (queries / query_norms) @ matrix.T
+        scores[:, ~valid] = -1.0
+        return scores
+
+    def _grow(self) -> None:
+        capacity = self.matrix.shape[0] * 2
+        matrix = np.zeros((capacity, self.matrix.shape[1]), dtype=np.float32)
+        matrix[: self.size] = self.matrix[: self.size]
+        valid = np.zeros(capacity, dtype=bool)
+        valid[: self.size] = self.valid[: self.size]
+        self.matrix = matrix
+        self.valid = valid
+
+    @staticmethod
+    def top_k(scores: ndarray, limit: int, min_relevance_score: float) -> ndarray:
+        """Returns the indices of the (at most) `limit` best scores above the threshold, best first."""
+        candidates = np.flatnonzero(scores >= min_relevance_score)
+        if limit < candidates.shape[0]:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+
 
 @experimental_class
 class VolatileMemoryStore(MemoryStoreBase):
     """A volatile memory store that stores data in memory."""
 
     _store: dict[str, dict[str, MemoryRecord]]
+    _indexes: dict[str, _EmbeddingIndex]
 
     def __init__(self) -> None:
         """Initializes a new instance of the VolatileMemoryStore class."""
         self._store = {}
+        self._indexes = {}
 
     async def create_collection(self, collection_name: str) -> None:
         """Creates a new collection if it does not exist.
@@ -36,6 +141,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             pass
         else:
             self._store[collection_name] = {}
+            self._indexes[collection_name] = _EmbeddingIndex()
 
     async def get_collections(
         self,
@@ -58,6 +164,7 @@ class VolatileMemoryStore(MemoryStoreBase):
         """
         if collection_name in self._store:
             del self._store[collection_name]
+            del self._indexes[collection_name]
 
     async def does_collection_exist(self, collection_name: str) -> bool:
         """Checks if a collection exists.
@@ -84,6 +191,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
 
         record._key = record._id
+        self._indexes[collection_name].upsert(record._key, record._embedding)
         self._store[collection_name][record._key] = record
         return record._key
 
@@ -100,8 +208,10 @@ class VolatileMemoryStore(MemoryStoreBase):
         if collection_name not in self._store:
             raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
 
+        index = self._indexes[collection_name]
         for record in records:
             record._key = record._id
+            index.upsert(record._key, record._embedding)
             self._store[collection_name][record._key] = record
         return [record._key for record in records]
 
@@ -172,6 +282,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             raise ServiceResourceNotFoundError(f"Key '{key}' not found in collection '{collection_name}'")
 
         del self._store[collection_name][key]
+        self._indexes[collection_name].remove(key)
 
     async def remove_batch(self, collection_name: str, keys: list[str]) -> None:
         """Removes a batch of records.
@@ -186,9 +297,11 @@ class VolatileMemoryStore(MemoryStoreBase):
         if collection_name not in self._store:
             raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
 
+        index = self._indexes[collection_name]
         for key in keys:
             if key in self._store[collection_name]:
                 del self._store[collection_name][key]
+                index.remove(key)
 
     async def get_nearest_match(
         self,
@@ -208,13 +321,14 @@ class VolatileMemoryStore(MemoryStoreBase):
         Returns:
             Tuple[MemoryRecord, float]: The record and the relevance score.
         """
-        return self.get_nearest_matches(
+        results = await self.get_nearest_matches(
             collection_name=collection_name,
             embedding=embedding,
             limit=1,
             min_relevance_score=min_relevance_score,
             with_embeddings=with_embedding,
         )
+        return results[0] if results else None
 
     async def get_nearest_matches(
         self,
@@ -243,43 +357,67 @@ class VolatileMemoryStore(MemoryStoreBase):
             )
             return []
 
-        # Get all the records in the collection
-        memory_records = list(self._store[collection_name].values())
-
-        # Convert the collection of embeddings into a numpy array (stacked)
-        embeddings = array([x._embedding for x in memory_records], dtype=float)
-        embeddings = embeddings.reshape(embeddings.shape[0], -1)
-
-        # If the query embedding has shape (1, embedding_size),
-        # reshape it to (embedding_size,)
-        if len(embedding.shape) == 2:
-            embedding = embedding.reshape(
-                embedding.shape[1],
+        # The query is scored against the collection's pre-normalized embedding matrix
+        return (
+            await self.get_nearest_matches_batch(
+                collection_name=collection_name,
+                embeddings=embedding.reshape(1, -1),
+                limit=limit,
+                min_relevance_score=min_relevance_score,
+                with_embeddings=with_embeddings,
             )
+        )[0]
 
-        # Use numpy to get the cosine similarity between the query
-        # embedding and all the embeddings in the collection
-        similarity_scores = self.compute_similarity_scores(embedding, embeddings)
-
-        # Then, sort the results by the similarity score
-        sorted_results = sorted(
-            zip(memory_records, similarity_scores),
-            key=lambda x: x[1],
-            reverse=True,
-        )
+    async def get_nearest_matches_batch(
+        self,
+        collection_name: str,
+        embeddings: ndarray,
+        limit: int,
+        min_relevance_score: float = 0.0,
+        with_embeddings: bool = False,
+    ) -> list[list[tuple[MemoryRecord, float]]]:
+        """Gets the nearest matches for several query embeddings at once using cosine similarity.
 
-        # Then, filter out the results that are below the minimum relevance score
-        filtered_results = [x for x in sorted_results if x[1] >= min_relevance_score]
+        All queries are scored with a single matrix multiplication against the collection.
 
-        # Then, take the top N results
-        top_results = filtered_results[:limit]
+        Args:
+            collection_name (str): The name of the collection to get the nearest matches from.
+            embeddings (ndarray): The query embeddings, one per row, shape (queries, embedding_size).
+            limit (int): The maximum number of matches to return per query.
+            min_relevance_score (float): The minimum relevance score of the matches. (default: {0.0})
+            with_embeddings (bool): Whether to include the embeddings in the results. (default: {False})
 
-        if not with_embeddings:
-            # create copy of results without embeddings
-            for result in top_results:
-                result = deepcopy(result)
-                result[0]._embedding = None
-        return top_results
+        Returns:
+            List[List[Tuple[MemoryRecord, float]]]: For each query, the records and their relevance scores.
+        """
+        queries = np.asarray(embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries.reshape(1, -1)
+        if collection_name not in self._store:
+            logger.warning(
+                f"Collection '{collection_name}' does not exist in collections: "
+                f"{', '.join([collection for collection in await self.get_collections()])}"
+            )
+            return [[] for _ in range(queries.shape[0])]
+
+        index = self._indexes[collection_name]
+        if index.size == 0 or limit <= 0:
+            return [[] for _ in range(queries.shape[0])]
+
+        scores = index.scores(queries)
+        records = self._store[collection_name]
+        results: list[list[tuple[MemoryRecord, float]]] = []
+        for query_scores in scores:
+            matches = []
+            for row in _EmbeddingIndex.top_k(query_scores, limit, min_relevance_score):
+                record = records[index.keys[row]]
+                if not with_embeddings:
+                    # create copy of result without embedding
+                    record = copy(record)
+                    record._embedding = None
+                matches.append((record, float(query_scores[row])))
+            results.append(matches)
+        return results
 
     def compute_similarity_scores(self, embedding: ndarray, embedding_array: ndarray) -> ndarray:
         """Computes the cosine similarity scores between a query embedding and a group of embeddings.
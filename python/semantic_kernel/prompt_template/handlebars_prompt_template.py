@@ -2,7 +2,8 @@
 
 import logging
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, Optional
+from copy import copy
+from typing import TYPE_CHECKING, Any, Final, Optional
 
 from pybars import Compiler, PybarsError
 from pydantic import PrivateAttr, field_validator
@@ -11,7 +12,11 @@ from semantic_kernel.exceptions import HandlebarsTemplateRenderException, Handle
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.prompt_template.const import HANDLEBARS_TEMPLATE_FORMAT_NAME
 from semantic_kernel.prompt_template.prompt_template_base import PromptTemplateBase
-from semantic_kernel.prompt_template.utils import HANDLEBAR_SYSTEM_HELPERS, create_template_helper_from_function
+from semantic_kernel.prompt_template.utils import (
+    HANDLEBAR_SYSTEM_HELPERS,
+    TemplateFunctionCallResolver,
+    create_template_helper_from_function,
+)
 
 if TYPE_CHECKING:
     from semantic_kernel.kernel import Kernel
@@ -19,6 +24,24 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# the helpers that pybars adds to every render and that are guarded against unresolved function calls
+PYBARS_BUILTIN_HELPER_NAMES: Final[tuple[str, ...]] = ("if", "unless", "each", "with", "lookup")
+
+
+def _get_pybars_builtin_helpers() -> dict[str, Callable[..., Any]]:
+    """Get the built-in helpers of pybars, from the helpers that a render passes to a block helper."""
+    helpers: dict[str, Callable[..., Any]] = {}
+
+    def capture(this: Any, options: dict[str, Any]) -> str:
+        helpers.update(options["helpers"])
+        return ""
+
+    Compiler().compile("{{#capture}}{{/capture}}")({}, helpers={"capture": capture})
+    return {name: helpers[name] for name in PYBARS_BUILTIN_HELPER_NAMES if name in helpers}
+
+
+PYBARS_BUILTIN_HELPERS: dict[str, Callable[..., Any]] = _get_pybars_builtin_helpers()
+
 
 class HandlebarsPromptTemplate(PromptTemplateBase):
     """Create a Handlebars prompt template.
@@ -34,12 +57,16 @@ class HandlebarsPromptTemplate(PromptTemplateBase):
         allow_dangerously_set_content (bool = False): Allow content without encoding throughout, this overrides
             the same settings in the prompt template config and input variables.
             This reverts the behavior to unencoded input.
+        enable_async (bool = False): Resolve the kernel function calls in the template concurrently with await,
+            before the final render, instead of running each call to completion inside the helper,
+            which blocks the event loop. See TemplateFunctionCallResolver for the details.
 
     Raises:
         ValueError: If the template format is not 'handlebars'
         HandlebarsTemplateSyntaxError: If the handlebars template has a syntax error
     """
 
+    enable_async: bool = False
     _template_compiler: Any = PrivateAttr()
 
     @field_validator("prompt_template_config")
@@ -84,22 +111,50 @@ class HandlebarsPromptTemplate(PromptTemplateBase):
 
         arguments = self._get_trusted_arguments(arguments)
         allow_unsafe_function_output = self._get_allow_dangerously_set_function_output()
+        if self.enable_async:
+            return await self._render_with_resolved_functions(kernel, arguments, allow_unsafe_function_output)
         helpers: dict[str, Callable[..., Any]] = {}
         for plugin in kernel.plugins.values():
-            helpers.update(
-                {
-                    function.fully_qualified_name: create_template_helper_from_function(
-                        function,
-                        kernel,
-                        arguments,
-                        self.prompt_template_config.template_format,
-                        allow_unsafe_function_output,
-                    )
-                    for function in plugin
-                }
-            )
+            helpers.update({
+                function.fully_qualified_name: create_template_helper_from_function(
+                    function,
+                    kernel,
+                    arguments,
+                    self.prompt_template_config.template_format,
+                    allow_unsafe_function_output,
+                )
+                for function in plugin
+            })
         helpers.update(HANDLEBAR_SYSTEM_HELPERS)
+        return self._render_compiled(arguments, helpers)
 
+    async def _render_with_resolved_functions(
+        self, kernel: "Kernel", arguments: "KernelArguments", allow_unsafe_function_output: bool
+    ) -> str:
+        """Render the template after resolving its function calls concurrently, without blocking the loop.
+
+        Every render works on a copy of the arguments, so values set by a render
+        with unresolved function calls do not leak into the next one.
+        """
+        resolver = TemplateFunctionCallResolver(kernel, arguments, allow_unsafe_function_output)
+        helpers: dict[str, Callable[..., Any]] = {
+            function.fully_qualified_name: resolver.create_helper(function)
+            for plugin in kernel.plugins.values()
+            for function in plugin
+        }
+        # the built-in block helpers and the system helpers must not run on the placeholder of an unresolved call,
+        # set is left as is so a variable set to a placeholder stays a placeholder
+        helpers.update({
+            name: helper if name == "set" else resolver.create_guarded_helper(helper)
+            for name, helper in {**PYBARS_BUILTIN_HELPERS, **HANDLEBAR_SYSTEM_HELPERS}.items()
+        })
+        while True:
+            rendered = self._render_compiled(copy(arguments), helpers)
+            if not resolver.has_pending_calls:
+                return rendered
+            await resolver.resolve()
+
+    def _render_compiled(self, arguments: "KernelArguments", helpers: dict[str, Callable[..., Any]]) -> str:
         try:
             return self._template_compiler(
                 arguments,
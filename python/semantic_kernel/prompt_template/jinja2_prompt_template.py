@@ -4,7 +4,7 @@ import logging
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Optional
 
-from jinja2 import BaseLoader, TemplateError
+from jinja2 import BaseLoader, Template, TemplateError
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from pydantic import PrivateAttr, field_validator
 
@@ -14,7 +14,10 @@ from semantic_kernel.prompt_template.const import JINJA2_TEMPLATE_FORMAT_NAME
 from semantic_kernel.prompt_template.prompt_template_base import PromptTemplateBase
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
 from semantic_kernel.prompt_template.utils import JINJA2_SYSTEM_HELPERS
-from semantic_kernel.prompt_template.utils.template_function_helpers import create_template_helper_from_function
+from semantic_kernel.prompt_template.utils.template_function_helpers import (
+    bind_template_arguments,
+    create_template_helper_from_function,
+)
 
 if TYPE_CHECKING:
     from semantic_kernel.kernel import Kernel
@@ -49,6 +52,10 @@ class Jinja2PromptTemplate(PromptTemplateBase):
     """
 
     _env: ImmutableSandboxedEnvironment | None = PrivateAttr()
+    _template: Template | None = PrivateAttr(default=None)
+    _template_source: str | None = PrivateAttr(default=None)
+    _template_error: TemplateError | None = PrivateAttr(default=None)
+    _helpers: tuple[tuple[Any, ...], dict[str, Callable[..., Any]]] | None = PrivateAttr(default=None)
 
     @field_validator("prompt_template_config")
     @classmethod
@@ -64,6 +71,43 @@ class Jinja2PromptTemplate(PromptTemplateBase):
             self._env = None
             return
         self._env = ImmutableSandboxedEnvironment(loader=BaseLoader(), enable_async=True)
+        self._compile(self.prompt_template_config.template)
+
+    def _compile(self, source: str) -> None:
+        """Compile the template source once, a syntax error is raised when rendering."""
+        self._template_source = source
+        try:
+            self._template = self._env.from_string(source)  # type: ignore[union-attr]
+            self._template_error = None
+        except TemplateError as exc:
+            self._template = None
+            self._template_error = exc
+
+    def _get_helpers(self, kernel: "Kernel", allow_unsafe_function_output: bool) -> dict[str, Callable[..., Any]]:
+        """Get the helpers for the functions of the kernel, reused while the functions do not change.
+
+        The helpers are created without a kernel and base arguments, the kernel and the arguments of a render
+        are bound with `bind_template_arguments`, so the cached helpers do not keep the kernel alive.
+        """
+        functions = [function for plugin in kernel.plugins.values() for function in plugin]
+        signature = (allow_unsafe_function_output, *map(id, functions))
+        if self._helpers and self._helpers[0] == signature:
+            return self._helpers[1]
+        helpers: dict[str, Callable[..., Any]] = {}
+        helpers.update(JINJA2_SYSTEM_HELPERS)
+        helpers.update({
+            function.fully_qualified_name.replace("-", "_"): create_template_helper_from_function(
+                function,
+                None,
+                None,
+                self.prompt_template_config.template_format,
+                allow_unsafe_function_output,
+                enable_async=True,
+            )
+            for function in functions
+        })
+        self._helpers = (signature, helpers)
+        return helpers
 
     async def render(self, kernel: "Kernel", arguments: Optional["KernelArguments"] = None) -> str:
         """Render the prompt template.
@@ -86,27 +130,16 @@ class Jinja2PromptTemplate(PromptTemplateBase):
 
         arguments = self._get_trusted_arguments(arguments)
         allow_unsafe_function_output = self._get_allow_dangerously_set_function_output()
-        helpers: dict[str, Callable[..., Any]] = {}
-        helpers.update(JINJA2_SYSTEM_HELPERS)
-        for plugin in kernel.plugins.values():
-            helpers.update(
-                {
-                    function.fully_qualified_name.replace("-", "_"): create_template_helper_from_function(
-                        function,
-                        kernel,
-                        arguments,
-                        self.prompt_template_config.template_format,
-                        allow_unsafe_function_output,
-                        enable_async=True,
-                    )
-                    for function in plugin
-                }
-            )
         if self.prompt_template_config.template is None:
             raise Jinja2TemplateRenderException("Error rendering template, template is None")
+        if self.prompt_template_config.template != self._template_source:
+            self._compile(self.prompt_template_config.template)
+        helpers = self._get_helpers(kernel, allow_unsafe_function_output)
         try:
-            template = self._env.from_string(self.prompt_template_config.template, globals=helpers)
-            return await template.render_async(**arguments)
+            if self._template_error is not None:
+                raise self._template_error
+            with bind_template_arguments(arguments, kernel):
+                return await self._template.render_async({**helpers, **arguments})  # type: ignore[union-attr]
         except TemplateError as exc:
             logger.error(
                 f"Error rendering prompt template: {self.prompt_template_config.template} with arguments: {arguments}"
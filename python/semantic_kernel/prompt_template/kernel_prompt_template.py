@@ -1,10 +1,12 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
+from contextlib import nullcontext
 from html import escape
 from typing import TYPE_CHECKING, Any
 
-from pydantic import PrivateAttr, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
 from semantic_kernel.exceptions import TemplateRenderException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
@@ -16,6 +18,7 @@ from semantic_kernel.template_engine.blocks.code_block import CodeBlock
 from semantic_kernel.template_engine.blocks.named_arg_block import NamedArgBlock
 from semantic_kernel.template_engine.blocks.var_block import VarBlock
 from semantic_kernel.template_engine.template_tokenizer import TemplateTokenizer
+from semantic_kernel.utils.async_utils import gather_or_cancel
 
 if TYPE_CHECKING:
     from semantic_kernel.kernel import Kernel
@@ -25,8 +28,21 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 class KernelPromptTemplate(PromptTemplateBase):
-    """Create a Kernel prompt template."""
-
+    """Create a Kernel prompt template.
+
+    Args:
+        prompt_template_config (PromptTemplateConfig): The prompt template configuration.
+        allow_dangerously_set_content (bool = False): Allow content without encoding throughout, this overrides
+            the same settings in the prompt template config and input variables.
+        enable_concurrent_rendering (bool = False): Render the code blocks (function calls) of the template
+            concurrently instead of one after the other, the results are joined in template order.
+            Only use this when the functions in the template do not depend on each other's side effects.
+        max_concurrent_blocks (int | None): The maximum number of code blocks rendered at the same time
+            when concurrent rendering is enabled, unlimited if None.
+    """
+
+    enable_concurrent_rendering: bool = False
+    max_concurrent_blocks: int | None = Field(default=None, gt=0)
     _blocks: list[Block] = PrivateAttr(default_factory=list)
 
     @field_validator("prompt_template_config")
@@ -111,20 +127,36 @@ class KernelPromptTemplate(PromptTemplateBase):
         from semantic_kernel.template_engine.protocols.text_renderer import TextRenderer
 
         logger.debug(f"Rendering list of {len(blocks)} blocks")
-        rendered_blocks: list[str] = []
         arguments = self._get_trusted_arguments(arguments or KernelArguments())
         allow_unsafe_function_output = self._get_allow_dangerously_set_function_output()
+        semaphore = asyncio.Semaphore(self.max_concurrent_blocks) if self.max_concurrent_blocks else None
+
+        async def render_code(block: CodeRenderer) -> str:
+            try:
+                async with semaphore or nullcontext():
+                    rendered = await block.render_code(kernel, arguments)
+            except Exception as exc:
+                logger.error(f"Error rendering code block: {exc}")
+                raise TemplateRenderException(f"Error rendering code block: {exc}") from exc
+            return rendered if allow_unsafe_function_output else escape(rendered)
+
+        rendered_blocks: list[str] = []
+        code_blocks: dict[int, CodeRenderer] = {}
         for block in blocks:
             if isinstance(block, TextRenderer):
                 rendered_blocks.append(block.render(kernel, arguments))
                 continue
             if isinstance(block, CodeRenderer):
-                try:
-                    rendered = await block.render_code(kernel, arguments)
-                except Exception as exc:
-                    logger.error(f"Error rendering code block: {exc}")
-                    raise TemplateRenderException(f"Error rendering code block: {exc}") from exc
-                rendered_blocks.append(rendered if allow_unsafe_function_output else escape(rendered))
+                if self.enable_concurrent_rendering:
+                    code_blocks[len(rendered_blocks)] = block
+                    rendered_blocks.append("")
+                    continue
+                rendered_blocks.append(await render_code(block))
+        if code_blocks:
+            # the other code blocks are cancelled as soon as one of them fails
+            results = await gather_or_cancel(*(render_code(block) for block in code_blocks.values()))
+            for index, rendered in zip(code_blocks, results):
+                rendered_blocks[index] = rendered
         prompt = "".join(rendered_blocks)
         logger.debug(f"Rendered prompt: {prompt}")
         return prompt
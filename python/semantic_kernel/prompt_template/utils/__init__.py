@@ -2,10 +2,16 @@
 
 from semantic_kernel.prompt_template.utils.handlebars_system_helpers import HANDLEBAR_SYSTEM_HELPERS
 from semantic_kernel.prompt_template.utils.jinja2_system_helpers import JINJA2_SYSTEM_HELPERS
-from semantic_kernel.prompt_template.utils.template_function_helpers import create_template_helper_from_function
+from semantic_kernel.prompt_template.utils.template_function_helpers import (
+    TemplateFunctionCallResolver,
+    bind_template_arguments,
+    create_template_helper_from_function,
+)
 
 __all__ = [
     "HANDLEBAR_SYSTEM_HELPERS",
     "JINJA2_SYSTEM_HELPERS",
+    "TemplateFunctionCallResolver",
+    "bind_template_arguments",
     "create_template_helper_from_function",
 ]
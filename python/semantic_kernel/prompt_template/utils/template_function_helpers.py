@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from html import escape
 from typing import TYPE_CHECKING, Any
 
@@ -22,11 +24,56 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_bound_arguments: ContextVar["KernelArguments | None"] = ContextVar("template_arguments", default=None)
+_bound_kernel: ContextVar["Kernel | None"] = ContextVar("template_kernel", default=None)
+
+
+@contextmanager
+def bind_template_arguments(arguments: "KernelArguments", kernel: "Kernel | None" = None) -> Iterator[None]:
+    """Bind the arguments and the kernel used by helpers that were created without them.
+
+    This allows the helpers to be created once and reused across renders and kernels,
+    the arguments and the kernel of the current render are bound for the duration of the with block.
+
+    Args:
+        arguments (KernelArguments): The arguments of the current render.
+        kernel (Kernel | None): The kernel of the current render.
+    """
+    arguments_token = _bound_arguments.set(arguments)
+    kernel_token = _bound_kernel.set(kernel)
+    try:
+        yield
+    finally:
+        _bound_kernel.reset(kernel_token)
+        _bound_arguments.reset(arguments_token)
+
+
+def _get_kernel(kernel: "Kernel | None") -> "Kernel":
+    """Get the kernel of a helper, or the bound kernel if the helper was created without one."""
+    if kernel is None:
+        kernel = _bound_kernel.get()
+    if kernel is None:
+        raise ValueError("The helper was created without a kernel and no kernel is bound.")
+    return kernel
+
+
+def _create_function_arguments(base_arguments: "KernelArguments | None", kwargs: dict[str, Any]) -> KernelArguments:
+    """Create the arguments for a helper call from the base (or bound) arguments and the keyword arguments."""
+    if base_arguments is None:
+        base_arguments = _bound_arguments.get()
+    arguments = KernelArguments()
+    if base_arguments and base_arguments.execution_settings:
+        arguments.execution_settings = base_arguments.execution_settings  # pragma: no cover
+    if base_arguments:
+        arguments.update(base_arguments)
+    arguments.update(kwargs)
+    return arguments
+
 
 def create_template_helper_from_function(
     function: "KernelFunction",
-    kernel: "Kernel",
-    base_arguments: "KernelArguments",
+    kernel: "Kernel | None",
+    base_arguments: "KernelArguments | None",
     template_format: TEMPLATE_FORMAT_TYPES,
     allow_dangerously_set_content: bool = False,
     enable_async: bool = False,
@@ -35,8 +82,10 @@ def create_template_helper_from_function(
 
     Args:
         function (KernelFunction): The kernel function to create a helper for.
-        kernel (Kernel): The kernel to use for invoking the function.
-        base_arguments (KernelArguments): The base arguments to use when invoking the function.
+        kernel (Kernel | None): The kernel to use for invoking the function,
+            if None the kernel bound with `bind_template_arguments` at the time of the call is used.
+        base_arguments (KernelArguments | None): The base arguments to use when invoking the function,
+            if None the arguments bound with `bind_template_arguments` at the time of the call are used.
         template_format (TEMPLATE_FORMAT_TYPES): The template format to create the helper for.
         allow_dangerously_set_content (bool, optional): Return the content of the function result
             without encoding it or not.
@@ -69,8 +118,8 @@ def create_template_helper_from_function(
 
 def _create_sync_template_helper_from_function(
     function: "KernelFunction",
-    kernel: "Kernel",
-    base_arguments: "KernelArguments",
+    kernel: "Kernel | None",
+    base_arguments: "KernelArguments | None",
     template_format: TEMPLATE_FORMAT_TYPES,
     allow_dangerously_set_content: bool = False,
 ) -> Callable[..., Any]:
@@ -82,11 +131,7 @@ def _create_sync_template_helper_from_function(
         nest_asyncio.apply()
 
     def func(*args, **kwargs):
-        arguments = KernelArguments()
-        if base_arguments and base_arguments.execution_settings:
-            arguments.execution_settings = base_arguments.execution_settings  # pragma: no cover
-        arguments.update(base_arguments)
-        arguments.update(kwargs)
+        arguments = _create_function_arguments(base_arguments, kwargs)
 
         if len(args) > 0 and template_format == HANDLEBARS_TEMPLATE_FORMAT_NAME:
             this = args[0]
@@ -105,7 +150,7 @@ def _create_sync_template_helper_from_function(
             f"with args: {actual_args} and kwargs: {kwargs} and this: {this}."
         )
 
-        result = asyncio.run(function.invoke(kernel=kernel, arguments=arguments))
+        result = asyncio.run(function.invoke(kernel=_get_kernel(kernel), arguments=arguments))
         if allow_dangerously_set_content:
             return result
         return escape(str(result))
@@ -115,8 +160,8 @@ def _create_sync_template_helper_from_function(
 
 def _create_async_template_helper_from_function(
     function: "KernelFunction",
-    kernel: "Kernel",
-    base_arguments: "KernelArguments",
+    kernel: "Kernel | None",
+    base_arguments: "KernelArguments | None",
     template_format: TEMPLATE_FORMAT_TYPES,
     allow_dangerously_set_content: bool = False,
 ) -> Callable[..., Any]:
@@ -125,18 +170,111 @@ def _create_async_template_helper_from_function(
         raise ValueError(f"Invalid template format: {template_format}")
 
     async def func(*args, **kwargs):
-        arguments = KernelArguments()
-        if base_arguments and base_arguments.execution_settings:
-            arguments.execution_settings = base_arguments.execution_settings  # pragma: no cover
-        arguments.update(base_arguments)
-        arguments.update(kwargs)
+        arguments = _create_function_arguments(base_arguments, kwargs)
         logger.debug(
             f"Invoking function {function.metadata.fully_qualified_name} "
             f"with args: {arguments} and kwargs: {kwargs}."
         )
-        result = await function.invoke(kernel=kernel, arguments=arguments)
+        result = await function.invoke(kernel=_get_kernel(kernel), arguments=arguments)
         if allow_dangerously_set_content:
             return result
         return escape(str(result))
 
     return func
+
+
+class _PendingResult:
+    """Stands in for the result of a function call that has not been resolved yet."""
+
+    def __str__(self) -> str:
+        return ""
+
+    def __repr__(self) -> str:
+        return "<pending>"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+_PENDING = _PendingResult()
+
+
+class TemplateFunctionCallResolver:
+    """Resolves the kernel function calls of a synchronous template with await, before the final render.
+
+    The helpers created by the resolver do not invoke the function, instead they record the call
+    and return a placeholder, or the result if the call was resolved before. The template is rendered
+    once to discover the calls, these are invoked concurrently with `resolve`, and the template is rendered
+    again, until a render does not discover new calls, that render is the result.
+    Calls with the same function and keyword arguments are invoked once per render,
+    calls that take the result of another call as argument are only recorded after that call is resolved.
+    Other helpers are wrapped with `create_guarded_helper`, so a helper that gets a placeholder returns one
+    instead of running, and a block helper whose argument is a placeholder renders neither of its branches.
+    The calls inside such a block are only recorded in a later render, once the condition is known,
+    so functions in a branch that should not run are never invoked.
+
+    Args:
+        kernel (Kernel): The kernel to use for invoking the functions.
+        base_arguments (KernelArguments): The base arguments to use when invoking the functions.
+        allow_dangerously_set_content (bool, optional): Return the content of the function results
+            without encoding it or not.
+    """
+
+    def __init__(
+        self,
+        kernel: "Kernel",
+        base_arguments: "KernelArguments",
+        allow_dangerously_set_content: bool = False,
+    ) -> None:
+        """Create a resolver for a single render."""
+        self.kernel = kernel
+        self.base_arguments = base_arguments
+        self.allow_dangerously_set_content = allow_dangerously_set_content
+        self._results: dict[tuple[str, str], Any] = {}
+        self._pending: dict[tuple[str, str], tuple["KernelFunction", dict[str, Any]]] = {}
+
+    @property
+    def has_pending_calls(self) -> bool:
+        """Whether the last render recorded calls that are not resolved yet."""
+        return bool(self._pending)
+
+    def create_helper(self, function: "KernelFunction") -> Callable[..., Any]:
+        """Create a recording helper for a kernel function, the first positional argument is `this`."""
+
+        def func(this: Any, *args: Any, **kwargs: Any) -> Any:
+            key = (function.fully_qualified_name, repr(sorted(kwargs.items())))
+            if key in self._results:
+                return self._results[key]
+            if not any(isinstance(value, _PendingResult) for value in kwargs.values()):
+                self._pending.setdefault(key, (function, kwargs))
+            return _PENDING
+
+        return func
+
+    def create_guarded_helper(self, helper: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a system or block helper so it does not run on the placeholder of an unresolved call.
+
+        The wrapped helper returns the placeholder when any of its arguments is a placeholder,
+        which also keeps block helpers, such as `if` and `each`, from rendering either branch.
+        """
+
+        def func(this: Any, *args: Any, **kwargs: Any) -> Any:
+            if any(isinstance(value, _PendingResult) for value in (*args, *kwargs.values())):
+                return _PENDING
+            return helper(this, *args, **kwargs)
+
+        return func
+
+    async def resolve(self) -> None:
+        """Invoke the recorded calls concurrently and store their results."""
+        calls, self._pending = self._pending, {}
+        results = await asyncio.gather(*(self._invoke(function, kwargs) for function, kwargs in calls.values()))
+        self._results.update(zip(calls, results))
+
+    async def _invoke(self, function: "KernelFunction", kwargs: dict[str, Any]) -> Any:
+        arguments = _create_function_arguments(self.base_arguments, kwargs)
+        logger.debug(f"Invoking function {function.metadata.fully_qualified_name} with kwargs: {kwargs}.")
+        result = await function.invoke(kernel=self.kernel, arguments=arguments)
+        if self.allow_dangerously_set_content:
+            return result
+        return escape(str(result))
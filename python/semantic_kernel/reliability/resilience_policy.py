@@ -0,0 +1,320 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Any, TypeVar
+
+from openai import APIConnectionError
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.exceptions.service_exceptions import ServiceUnavailableError
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.reliability.retry_mechanism_base import RetryMechanismBase
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({408, 409, 429})
+
+
+class CircuitState(str, Enum):
+    """The state of the circuit breaker of a ResiliencePolicy."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@experimental_class
+class ResilienceMetrics(KernelBaseModel):
+    """The counters of a ResiliencePolicy.
+
+    Args:
+        calls (int): The number of calls to the policy.
+        attempts (int): The number of requests that were sent, including retries and hedged requests.
+        retries (int): The number of retries after a failed attempt.
+        failures (int): The number of calls that failed after all retries.
+        hedges (int): The number of hedged requests that were sent.
+        hedge_wins (int): The number of hedged requests that returned before the original request.
+        circuit_opened (int): The number of times the circuit breaker opened.
+        rejected (int): The number of calls that failed because the circuit breaker was open.
+    """
+
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    circuit_opened: int = 0
+    rejected: int = 0
+
+
+@experimental_class
+class ResiliencePolicy(RetryMechanismBase, KernelBaseModel):
+    """Retries, a circuit breaker and request hedging for calls to AI services.
+
+    Retries: a failed call is retried up to max_retries times when the error is transient:
+    a status code of 408, 409, 429 or 5xx, a timeout or a connection error.
+    The delay before a retry is random between 0 and the exponential backoff (full jitter),
+    or the Retry-After (or retry-after-ms) header of the response when the service sends one.
+
+    Circuit breaker: after failure_threshold consecutive transient failures the circuit opens
+    and calls fail immediately with a ServiceUnavailableError. After recovery_time seconds a single call
+    is let through, when it succeeds the circuit closes again, otherwise it stays open for another recovery_time.
+
+    Hedging: when a request takes longer than hedge_after seconds, or longer than the hedge_percentile
+    of the recent latencies, a second identical request is sent and the first response wins,
+    the other request is cancelled. This cuts the tail latency at the cost of a few extra requests,
+    only use it for requests without side effects.
+
+    The policy can be used as the retry_mechanism of the kernel, as the resilience_policy of the OpenAI and
+    Azure OpenAI services, or through the ResilientChatCompletion, ResilientTextCompletion and
+    ResilientEmbeddingGenerator wrappers. When used with the OpenAI services,
+    consider creating the client with max_retries=0, so requests are not retried twice.
+
+    The counters are kept in the metrics field.
+    """
+
+    max_retries: int = Field(default=3, ge=0)
+    initial_backoff: float = Field(default=0.5, ge=0)
+    max_backoff: float = Field(default=30.0, ge=0)
+    backoff_multiplier: float = Field(default=2.0, ge=1)
+    max_retry_after: float = Field(default=60.0, ge=0)
+    is_retryable: Callable[[Exception], bool] | None = Field(default=None, exclude=True)
+    failure_threshold: int | None = Field(default=5, gt=0)
+    recovery_time: float = Field(default=30.0, gt=0)
+    hedge_after: float | None = Field(default=None, gt=0)
+    hedge_percentile: float | None = Field(default=None, gt=0, lt=100)
+    hedge_min_samples: int = Field(default=20, gt=0)
+    latency_window: int = Field(default=200, gt=0)
+    metrics: ResilienceMetrics = Field(default_factory=ResilienceMetrics, exclude=True)
+
+    _latencies: deque[float] = PrivateAttr()
+    _state: CircuitState = PrivateAttr(default=CircuitState.CLOSED)
+    _consecutive_failures: int = PrivateAttr(default=0)
+    _opened_at: float = PrivateAttr(default=0.0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Create the latency window."""
+        self._latencies = deque(maxlen=self.latency_window)
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """The state of the circuit breaker."""
+        return self._state
+
+    async def execute_with_retry(self, action: Callable[[], Awaitable[T]]) -> T:
+        """Executes the given action with retries, the circuit breaker and hedging.
+
+        Args:
+            action (Callable[[], Awaitable[T]]): The action, it is called again for each attempt.
+
+        Returns:
+            T: The result of the action.
+        """
+        return await self.execute(action)
+
+    async def execute(self, action: Callable[[], Awaitable[T]], hedge: bool = True) -> T:
+        """Executes the given action with retries, the circuit breaker and optionally hedging.
+
+        Args:
+            action (Callable[[], Awaitable[T]]): The action, it is called again for each attempt.
+            hedge (bool): Whether the action may be hedged, disable it for actions with side effects
+                or results that have to be closed, such as streams. (default: True)
+
+        Returns:
+            T: The result of the action.
+
+        Raises:
+            ServiceUnavailableError: When the circuit breaker is open.
+        """
+        self.metrics.calls += 1
+        retries = 0
+        while True:
+            probe = self._before_attempt()
+            try:
+                hedge_delay = self._get_hedge_delay() if hedge else None
+                if hedge_delay is None:
+                    result = await self._attempt(action)
+                else:
+                    result = await self._hedged_attempt(action, hedge_delay)
+            except asyncio.CancelledError:
+                if probe:
+                    # let the next call probe the service instead of keeping the circuit half open
+                    self._state = CircuitState.OPEN
+                raise
+            except Exception as exc:
+                if not self._is_retryable(exc):
+                    self._record_success()
+                    self.metrics.failures += 1
+                    raise
+                self._record_failure()
+                if retries >= self.max_retries:
+                    self.metrics.failures += 1
+                    raise
+                delay = self._get_delay(exc, retries)
+                retries += 1
+                self.metrics.retries += 1
+                logger.info(f"Attempt {retries} failed with {type(exc).__name__}, retrying in {delay:.2f} seconds.")
+                await asyncio.sleep(delay)
+                continue
+            self._record_success()
+            return result
+
+    async def _attempt(self, action: Callable[[], Awaitable[T]]) -> T:
+        """Run the action once and record its latency when it succeeds."""
+        self.metrics.attempts += 1
+        start = time.perf_counter()
+        result = await action()
+        self._latencies.append(time.perf_counter() - start)
+        return result
+
+    async def _hedged_attempt(self, action: Callable[[], Awaitable[T]], hedge_delay: float) -> T:
+        """Run the action, and a second time when the first run takes longer than hedge_delay seconds."""
+        first = asyncio.ensure_future(self._attempt(action))
+        tasks = [first]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done:
+                logger.debug(
+                    f"The request did not complete within {hedge_delay:.2f} seconds, sending a hedged request."
+                )
+                self.metrics.hedges += 1
+                tasks.append(asyncio.ensure_future(self._attempt(action)))
+            pending: set[asyncio.Future[T]] = set(tasks)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # retrieve all exceptions, so none of them is reported as never retrieved
+                errors = {task: task.exception() for task in done}
+                for task, task_error in errors.items():
+                    if task_error is None:
+                        if task is not first:
+                            self.metrics.hedge_wins += 1
+                        return task.result()
+                    error = task_error
+            assert error is not None  # nosec
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _get_hedge_delay(self) -> float | None:
+        """The seconds after which a hedged request is sent, None when requests are not hedged."""
+        if self.hedge_after is not None:
+            return self.hedge_after
+        if self.hedge_percentile is None or len(self._latencies) < self.hedge_min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * self.hedge_percentile / 100))]
+
+    def _before_attempt(self) -> bool:
+        """Check the circuit breaker before an attempt, returns whether the attempt probes a half open circuit."""
+        if self._state == CircuitState.CLOSED:
+            return False
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_time:
+            logger.info("The circuit breaker is half open, probing the service.")
+            self._state = CircuitState.HALF_OPEN
+            return True
+        self.metrics.rejected += 1
+        raise ServiceUnavailableError("The circuit breaker is open, the service is not called.")
+
+    def _record_success(self) -> None:
+        if self._state != CircuitState.CLOSED:
+            logger.info("The circuit breaker is closed.")
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+
+    def _record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self.failure_threshold is None:
+            return
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold
+        ):
+            logger.warning(f"The circuit breaker is open for {self.recovery_time} seconds.")
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self.metrics.circuit_opened += 1
+
+    def _is_retryable(self, exc: Exception) -> bool:
+        if isinstance(exc, ServiceUnavailableError):
+            return False
+        if self.is_retryable is not None:
+            return self.is_retryable(exc)
+        for error in _exception_chain(exc):
+            status_code = _get_status_code(error)
+            if status_code is not None:
+                return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+            if isinstance(error, (TimeoutError, ConnectionError, APIConnectionError)):
+                return True
+        return False
+
+    def _get_delay(self, exc: Exception, retries: int) -> float:
+        """The seconds to wait before the next attempt: the Retry-After of the service or a jittered backoff."""
+        for error in _exception_chain(exc):
+            retry_after = _get_retry_after(error)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        backoff = min(self.max_backoff, self.initial_backoff * self.backoff_multiplier**retries)
+        return random.uniform(0, backoff)  # nosec
+
+
+def _exception_chain(exc: BaseException) -> Iterator[BaseException]:
+    """The exception, its causes and the exceptions it wraps, such as the service errors in a KernelException."""
+    seen: set[int] = set()
+    stack: list[BaseException] = [exc]
+    while stack:
+        error = stack.pop(0)
+        if id(error) in seen:
+            continue
+        seen.add(id(error))
+        yield error
+        stack.extend(arg for arg in error.args if isinstance(arg, BaseException))
+        if error.__cause__ is not None:
+            stack.append(error.__cause__)
+        if error.__context__ is not None:
+            stack.append(error.__context__)
+
+
+def _get_status_code(error: BaseException) -> int | None:
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if status_code is None:
+        status_code = getattr(error, "status", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def _get_retry_after(error: BaseException) -> float | None:
+    """The seconds in the retry-after-ms or Retry-After header of the response of an error, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or getattr(error, "headers", None)
+    if not headers or not hasattr(headers, "get"):
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -14,13 +14,13 @@ class RetryMechanismBase(ABC):
     """Base class for retry mechanisms."""
 
     @abstractmethod
-    async def execute_with_retry(self, action: Callable[[], Awaitable[T]]) -> Awaitable[T]:
+    async def execute_with_retry(self, action: Callable[[], Awaitable[T]]) -> T:
         """Executes the given action with retry logic.
 
         Args:
             action (Callable[[], Awaitable[T]]): The action to retry on exception.
 
         Returns:
-            Awaitable[T]: An awaitable that will return the result of the action.
+            T: The result of the action.
         """
         pass
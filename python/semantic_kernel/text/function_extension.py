@@ -1,20 +1,66 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+from typing import Final
 
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.functions.kernel_function import KernelFunction
 from semantic_kernel.kernel import Kernel
 
+DEFAULT_MAX_CONCURRENCY: Final[int] = 4
+
 
 async def aggregate_chunked_results(
-    func: KernelFunction, chunked_results: list[str], kernel: Kernel, arguments: KernelArguments
+    func: KernelFunction,
+    chunked_results: list[str],
+    kernel: Kernel,
+    arguments: KernelArguments,
+    max_concurrency: int | None = DEFAULT_MAX_CONCURRENCY,
+    reduce_function: KernelFunction | None = None,
+    reduce_batch_size: int | None = None,
 ) -> str:
-    """Aggregate the results from the chunked results."""
-    results = []
-    for chunk in chunked_results:
-        arguments["input"] = chunk
-        result = await func.invoke(kernel, arguments)
+    """Aggregate the results from the chunked results.
+
+    The function is invoked for all chunks concurrently, with a copy of the arguments per chunk
+    that has the chunk as `input`, and the results are joined with newlines in the order of the chunks.
+
+    When a reduce_batch_size is given, the results are then combined hierarchically: the joined results
+    of every reduce_batch_size chunks are passed to the reduce function (func if not given) as `input`,
+    and this is repeated on the combined results until a single result remains.
+    That takes one round of concurrent calls per level of the tree instead of one call per chunk.
+
+    Args:
+        func (KernelFunction): The function to invoke for each chunk.
+        chunked_results (list[str]): The chunks.
+        kernel (Kernel): The kernel.
+        arguments (KernelArguments): The arguments, they are copied and not changed.
+        max_concurrency (int | None): The maximum number of concurrent invocations, unlimited if None. (default: 4)
+        reduce_function (KernelFunction | None): The function that combines results, defaults to func.
+        reduce_batch_size (int | None): The number of results combined per invocation of the reduce function,
+            the results are only joined when None. (default: None)
+
+    Returns:
+        str: The aggregated result.
+    """
+    if max_concurrency is not None and max_concurrency <= 0:
+        raise ValueError("max_concurrency must be greater than 0.")
+    if reduce_batch_size is not None and reduce_batch_size < 2:
+        raise ValueError("reduce_batch_size must be at least 2.")
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def invoke(function: KernelFunction, chunk: str) -> str:
+        chunk_arguments = KernelArguments(settings=arguments.execution_settings, **arguments)
+        chunk_arguments["input"] = chunk
+        if semaphore is None:
+            return str(await function.invoke(kernel, chunk_arguments))
+        async with semaphore:
+            return str(await function.invoke(kernel, chunk_arguments))
 
-        results.append(str(result))
+    results = list(await asyncio.gather(*(invoke(func, chunk) for chunk in chunked_results)))
+    if reduce_batch_size is None:
+        return "\n".join(results)
 
-    return "\n".join(results)
+    while len(results) > 1:
+        groups = ["\n".join(results[i : i + reduce_batch_size]) for i in range(0, len(results), reduce_batch_size)]
+        results = list(await asyncio.gather(*(invoke(reduce_function or func, group) for group in groups)))
+    return results[0] if results else ""
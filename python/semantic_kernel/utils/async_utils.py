@@ -0,0 +1,47 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_or_cancel(*awaitables: Awaitable[T]) -> list[T]:
+    """Run the awaitables concurrently and return their results in order, like `asyncio.gather`.
+
+    Unlike `asyncio.gather`, the other awaitables are cancelled as soon as one of them fails,
+    or when the caller is cancelled, and the error is raised once they have stopped.
+    This is the behavior of `asyncio.TaskGroup`, without wrapping the error in an ExceptionGroup.
+
+    Args:
+        awaitables (Awaitable[T]): The awaitables to run.
+
+    Returns:
+        list[T]: The results of the awaitables.
+    """
+    tasks: list[asyncio.Task[T]] = []
+
+    async def run(awaitable: Awaitable[T]) -> T:
+        try:
+            return await awaitable
+        except Exception:
+            # cancel the others right away, so an awaitable that was about to resume does not get to run
+            for task in tasks:
+                if task is not asyncio.current_task():
+                    task.cancel()
+            raise
+
+    tasks.extend(asyncio.ensure_future(run(awaitable)) for awaitable in awaitables)
+    if not tasks:
+        return []
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()  # type: ignore[misc]
+    return [task.result() for task in tasks]
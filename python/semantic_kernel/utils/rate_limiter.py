@@ -0,0 +1,76 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+
+@experimental_class
+class RateLimiter:
+    """An async limiter for a requests-per-minute and tokens-per-minute budget.
+
+    Both budgets are token buckets that refill continuously, waiters are served in arrival order.
+    A single request that asks for more tokens than the whole per-minute budget waits for a full bucket.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        """Create a rate limiter.
+
+        Args:
+            requests_per_minute (int | None): The maximum number of requests per minute, unlimited if None.
+            tokens_per_minute (int | None): The maximum number of tokens per minute, unlimited if None.
+        """
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be greater than 0.")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be greater than 0.")
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute or 0)
+        self._available_tokens = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request using the given number of tokens fits in the budget and reserve it.
+
+        Args:
+            tokens (int): The (estimated) number of tokens the request will use.
+        """
+        async with self._lock:
+            while (wait := self._reserve(tokens)) > 0:
+                await asyncio.sleep(wait)
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve the budget if available and return 0, otherwise return the seconds to wait."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        wait = 0.0
+        if self.requests_per_minute:
+            self._available_requests = min(
+                float(self.requests_per_minute),
+                self._available_requests + elapsed * self.requests_per_minute / 60,
+            )
+            if self._available_requests < 1:
+                wait = (1 - self._available_requests) * 60 / self.requests_per_minute
+        if self.tokens_per_minute:
+            needed = min(tokens, self.tokens_per_minute)
+            self._available_tokens = min(
+                float(self.tokens_per_minute),
+                self._available_tokens + elapsed * self.tokens_per_minute / 60,
+            )
+            if self._available_tokens < needed:
+                wait = max(wait, (needed - self._available_tokens) * 60 / self.tokens_per_minute)
+        if wait > 0:
+            return wait
+        if self.requests_per_minute:
+            self._available_requests -= 1
+        if self.tokens_per_minute:
+            self._available_tokens -= min(tokens, self.tokens_per_minute)
+        return 0.0
@@ -0,0 +1,100 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from semantic_kernel.utils.experimental_decorator import experimental_class
+
+KT = TypeVar("KT")
+VT = TypeVar("VT")
+
+
+@experimental_class
+class TTLCache(Generic[KT, VT]):
+    """An in-memory cache whose entries expire a fixed number of seconds after they were added.
+
+    When the cache is full the least recently used entry is evicted. Concurrent `get_or_add` calls
+    for a missing key share a single call of the factory, so the value is only fetched once.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_size: int = 1024) -> None:
+        """Create a cache.
+
+        Args:
+            ttl (float): The number of seconds an entry is kept. (default: 300)
+            max_size (int): The maximum number of entries. (default: 1024)
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0.")
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0.")
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[KT, tuple[float, VT]] = OrderedDict()
+        self._pending: dict[KT, asyncio.Future[VT]] = {}
+
+    def __len__(self) -> int:
+        """The number of entries, including the expired entries that were not removed yet."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether the cache has an entry for the key that has not expired."""
+        entry = self._entries.get(key)  # type: ignore[call-overload]
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key: KT) -> VT | None:
+        """Get the value for a key, None if the key is missing or the entry has expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: KT, value: VT) -> None:
+        """Add or replace the value for a key."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: KT) -> None:
+        """Remove the entry for a key, if any."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    async def get_or_add(self, key: KT, factory: Callable[[], Awaitable[VT]]) -> VT:
+        """Get the value for a key, or add the value returned by the factory when it is missing or expired.
+
+        Args:
+            key (KT): The key.
+            factory (Callable[[], Awaitable[VT]]): Creates the value, for instance by retrieving it from a service.
+                Exceptions of the factory are raised to all callers waiting for the key and nothing is cached.
+
+        Returns:
+            VT: The cached or created value.
+        """
+        if key in self:
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+        future = self._pending.get(key)
+        if future is None:
+            future = self._pending[key] = asyncio.ensure_future(factory())
+
+            def add(future: asyncio.Future[VT]) -> None:
+                if self._pending.get(key) is future:
+                    del self._pending[key]
+                if not future.cancelled() and future.exception() is None:
+                    self.set(key, future.result())
+
+            future.add_done_callback(add)
+        # shield the call, so a cancelled caller does not cancel it for the other callers
+        return await asyncio.shield(future)
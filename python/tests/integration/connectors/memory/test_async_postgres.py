@@ -0,0 +1,88 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import pytest
+from pydantic import ValidationError
+
+from semantic_kernel.connectors.memory.postgres import AsyncPostgresMemoryStore
+from semantic_kernel.connectors.memory.postgres.postgres_settings import PostgresSettings
+from semantic_kernel.exceptions import ServiceResourceNotFoundError
+
+try:
+    import psycopg  # noqa: F401
+    import psycopg_pool  # noqa: F401
+
+    psycopg_installed = True
+except ImportError:
+    psycopg_installed = False
+
+pytestmark = pytest.mark.skipif(not psycopg_installed, reason="psycopg or psycopg_pool is not installed")
+
+
+@pytest.fixture(scope="session")
+def connection_string():
+    try:
+        postgres_settings = PostgresSettings.create()
+        return postgres_settings.connection_string.get_secret_value()
+    except ValidationError:
+        pytest.skip("Postgres Connection string not found in env vars.")
+
+
+@pytest.mark.asyncio
+async def test_create_and_delete_collection(connection_string):
+    async with AsyncPostgresMemoryStore(connection_string, 2, 1, 5) as memory:
+        await memory.create_collection("test_async_collection")
+        assert await memory.does_collection_exist("test_async_collection")
+
+        await memory.delete_collection("test_async_collection")
+        assert "test_async_collection" not in await memory.get_collections()
+
+
+@pytest.mark.asyncio
+async def test_upsert_and_get(connection_string, memory_record1):
+    async with AsyncPostgresMemoryStore(connection_string, 2, 1, 5) as memory:
+        await memory.create_collection("test_async_collection")
+        await memory.upsert("test_async_collection", memory_record1)
+        result = await memory.get("test_async_collection", memory_record1._id, with_embedding=True)
+        assert result._id == memory_record1._id
+        assert result._text == memory_record1._text
+        assert result._timestamp == memory_record1._timestamp
+        assert list(result._embedding) == list(memory_record1._embedding)
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_and_get_batch(connection_string, memory_record1, memory_record2):
+    async with AsyncPostgresMemoryStore(connection_string, 2, 1, 5) as memory:
+        await memory.create_collection("test_async_collection")
+        keys = await memory.upsert_batch("test_async_collection", [memory_record1, memory_record2, memory_record1])
+        assert keys == [memory_record1._id, memory_record2._id, memory_record1._id]
+
+        results = await memory.get_batch(
+            "test_async_collection", [memory_record1._id, memory_record2._id], with_embeddings=True
+        )
+        assert {result._id for result in results} == {memory_record1._id, memory_record2._id}
+
+
+@pytest.mark.asyncio
+async def test_remove_batch(connection_string, memory_record1, memory_record2):
+    async with AsyncPostgresMemoryStore(connection_string, 2, 1, 5) as memory:
+        await memory.create_collection("test_async_collection")
+        await memory.upsert_batch("test_async_collection", [memory_record1, memory_record2])
+        await memory.remove_batch("test_async_collection", [memory_record1._id, memory_record2._id])
+        with pytest.raises(ServiceResourceNotFoundError):
+            await memory.get("test_async_collection", memory_record1._id)
+
+
+@pytest.mark.asyncio
+async def test_get_nearest_matches(connection_string, memory_record1, memory_record2, memory_record3):
+    async with AsyncPostgresMemoryStore(connection_string, 2, 1, 5) as memory:
+        await memory.create_collection("test_async_collection")
+        await memory.upsert_batch("test_async_collection", [memory_record1, memory_record2, memory_record3])
+        test_embedding = memory_record2.embedding.copy()
+        test_embedding[0] = test_embedding[0] + 0.025
+
+        result = await memory.get_nearest_matches(
+            "test_async_collection", test_embedding, limit=2, min_relevance_score=0.0, with_embeddings=True
+        )
+        assert len(result) == 2
+        assert result[0][0]._id in [memory_record3._id, memory_record2._id]
+        assert result[1][0]._id in [memory_record3._id, memory_record2._id]
@@ -213,3 +213,18 @@ async def test_get_nearest_match(setup_chroma, memory_record1, memory_record2):
     assert len(result) == 2
     assert isinstance(result[0], MemoryRecord)
     assert result[1] == pytest.approx(1, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_in_chunks_updates_records(setup_chroma, memory_record1, memory_record2):
+    memory = ChromaMemoryStore(persist_directory="chroma/TEMP/", max_batch_size=1)
+    await memory.create_collection("test_collection")
+
+    await memory.upsert_batch("test_collection", [memory_record1, memory_record2])
+    memory_record1._text = "updated text1"
+    keys = await memory.upsert_batch("test_collection", [memory_record1, memory_record2])
+
+    assert keys == ["test_id1", "test_id2"]
+    result = await memory.get_batch("test_collection", ["test_id1", "test_id2"], True)
+    assert len(result) == 2
+    assert {record._text for record in result} == {"updated text1", "sample text2"}
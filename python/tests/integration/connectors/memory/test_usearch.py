@@ -336,3 +336,34 @@ async def test_remove_get(memory_record1: MemoryRecord, memory_record2: MemoryRe
     result = await memory.get_batch("test_collection", ["test_id1", "test_id2"], True)
     assert len(result) == 1
     compare_memory_records(result[0], memory_record2, True)
+
+
+@pytest.mark.asyncio
+async def test_memory_mapped_collection_is_not_rewritten(tmpdir, memory_record1, memory_record2):
+    memory = USearchMemoryStore(tmpdir)
+    await memory.create_collection("test_collection", ndim=2)
+    await memory.upsert_batch("test_collection", [memory_record1, memory_record2])
+    await memory.close()
+    modified = (tmpdir / "test_collection.usearch").mtime()
+
+    memory = USearchMemoryStore(tmpdir)
+    assert memory._collections["test_collection"].is_view
+    result = await memory.get("test_collection", "test_id1", True)
+    compare_memory_records(result, memory_record1, True)
+    assert len(await memory.get_nearest_matches("test_collection", memory_record1.embedding, limit=2)) == 2
+    await memory.close()
+    assert (tmpdir / "test_collection.usearch").mtime() == modified
+
+    memory = USearchMemoryStore(tmpdir)
+    await memory.remove("test_collection", "test_id1")
+    assert not memory._collections["test_collection"].is_view
+    result = await memory.get_batch("test_collection", ["test_id1", "test_id2"], True)
+    assert len(result) == 1
+    compare_memory_records(result[0], memory_record2, True)
+    await memory.close()
+    assert (tmpdir / "test_collection.usearch").exists()
+
+    memory = USearchMemoryStore(tmpdir, memory_map=False)
+    assert not memory._collections["test_collection"].is_view
+    result = await memory.get("test_collection", "test_id2", True)
+    compare_memory_records(result, memory_record2, True)
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, mock_open, patch
@@ -9,12 +10,25 @@ from openai import AsyncAzureOpenAI, AsyncOpenAI
 from openai.resources.beta.threads.runs.runs import Run
 from openai.types.beta.assistant import Assistant, ToolResources, ToolResourcesCodeInterpreter, ToolResourcesFileSearch
 from openai.types.beta.assistant_response_format import AssistantResponseFormat
+from openai.types.beta.assistant_stream_event import (
+    ErrorEvent,
+    ThreadMessageCompleted,
+    ThreadMessageDelta,
+    ThreadRunCompleted,
+    ThreadRunFailed,
+    ThreadRunRequiresAction,
+    ThreadRunStepCompleted,
+    ThreadRunStepDelta,
+)
 from openai.types.beta.assistant_tool import CodeInterpreterTool, FileSearchTool
 from openai.types.beta.threads.annotation import FileCitationAnnotation, FilePathAnnotation
 from openai.types.beta.threads.file_citation_annotation import FileCitation
 from openai.types.beta.threads.file_path_annotation import FilePath
 from openai.types.beta.threads.image_file import ImageFile
 from openai.types.beta.threads.image_file_content_block import ImageFileContentBlock
+from openai.types.beta.threads.message import Message
+from openai.types.beta.threads.message_delta import MessageDelta
+from openai.types.beta.threads.message_delta_event import MessageDeltaEvent
 from openai.types.beta.threads.required_action_function_tool_call import Function
 from openai.types.beta.threads.required_action_function_tool_call import Function as RequiredActionFunction
 from openai.types.beta.threads.run import (
@@ -22,17 +36,24 @@ from openai.types.beta.threads.run import (
     RequiredActionFunctionToolCall,
     RequiredActionSubmitToolOutputs,
 )
-from openai.types.beta.threads.runs import RunStep
+from openai.types.beta.threads.runs import RunStep, RunStepDelta, RunStepDeltaEvent, ToolCallDeltaObject
 from openai.types.beta.threads.runs.code_interpreter_tool_call import (
     CodeInterpreter,
     CodeInterpreterToolCall,
 )
+from openai.types.beta.threads.runs.code_interpreter_tool_call_delta import (
+    CodeInterpreter as CodeInterpreterDelta,
+)
+from openai.types.beta.threads.runs.code_interpreter_tool_call_delta import CodeInterpreterToolCallDelta
 from openai.types.beta.threads.runs.function_tool_call import Function as RunsFunction
 from openai.types.beta.threads.runs.function_tool_call import FunctionToolCall
 from openai.types.beta.threads.runs.message_creation_step_details import MessageCreation, MessageCreationStepDetails
 from openai.types.beta.threads.runs.tool_calls_step_details import ToolCallsStepDetails
 from openai.types.beta.threads.text import Text
 from openai.types.beta.threads.text_content_block import TextContentBlock
+from openai.types.beta.threads.text_delta import TextDelta
+from openai.types.beta.threads.text_delta_block import TextDeltaBlock
+from openai.types.shared.error_object import ErrorObject
 
 from semantic_kernel.agents.open_ai.azure_assistant_agent import AzureAssistantAgent
 from semantic_kernel.contents.annotation_content import AnnotationContent
@@ -42,6 +63,7 @@ from semantic_kernel.contents.file_reference_content import FileReferenceContent
 from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.function_result_content import FunctionResultContent
 from semantic_kernel.contents.image_content import ImageContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
 from semantic_kernel.contents.text_content import TextContent
 from semantic_kernel.contents.utils.author_role import AuthorRole
 from semantic_kernel.exceptions.agent_exceptions import (
@@ -332,6 +354,49 @@ def mock_run_step_message_creation():
     )
 
 
+class MockEventStream:
+    def __init__(self, events):
+        self.events = events
+
+    async def __aiter__(self):
+        for event in self.events:
+            yield event
+
+
+def message_delta_event(text: str) -> ThreadMessageDelta:
+    return ThreadMessageDelta(
+        event="thread.message.delta",
+        data=MessageDeltaEvent(
+            id="message_id",
+            object="thread.message.delta",
+            delta=MessageDelta(
+                role="assistant", content=[TextDeltaBlock(index=0, type="text", text=TextDelta(value=text))]
+            ),
+        ),
+    )
+
+
+@pytest.fixture
+def mock_stream_message_completed():
+    return ThreadMessageCompleted(
+        event="thread.message.completed",
+        data=Message(
+            id="message_id",
+            object="thread.message",
+            created_at=123456789,
+            thread_id="thread_id",
+            role="assistant",
+            status="completed",
+            content=[TextContentBlock(type="text", text=Text(value="Hello world", annotations=[]))],
+        ),
+    )
+
+
+@pytest.fixture
+def mock_stream_run_completed(mock_run_completed):
+    return ThreadRunCompleted(event="thread.run.completed", data=mock_run_completed)
+
+
 # endregion
 
 # region Tests
@@ -640,6 +705,85 @@ async def test_get_thread_messages(
         assert str(messages[1].items[0].file_id) == "test_file_id"
 
 
+@pytest.mark.asyncio
+async def test_get_thread_messages_pages_and_caches_assistants(
+    azure_openai_assistant_agent, mock_assistant, openai_unit_test_env
+):
+    def message(id: str, assistant_id: str | None) -> Message:
+        return Message(
+            id=id,
+            object="thread.message",
+            created_at=123456789,
+            thread_id="test_thread_id",
+            role="assistant" if assistant_id else "user",
+            status="completed",
+            assistant_id=assistant_id,
+            content=[TextContentBlock(type="text", text=Text(value=id, annotations=[]))],
+        )
+
+    pages = {
+        None: MagicMock(data=[message("m4", "other"), message("m3", None)], has_more=True),
+        "m3": MagicMock(data=[message("m2", "other"), message("m1", "test_id")], has_more=False),
+    }
+
+    async def mock_list_messages(*args, after=None, **kwargs) -> Any:
+        return pages[after]
+
+    async def mock_retrieve_assistant(assistant_id, **kwargs) -> Any:
+        return mock_assistant.model_copy(update={"id": assistant_id, "name": f"{assistant_id}_name"})
+
+    with patch.object(azure_openai_assistant_agent, "client", spec=AsyncAzureOpenAI) as mock_client:
+        mock_client.beta = MagicMock()
+        mock_client.beta.threads.messages.list = AsyncMock(side_effect=mock_list_messages)
+        mock_client.beta.assistants.retrieve = AsyncMock(side_effect=mock_retrieve_assistant)
+        azure_openai_assistant_agent.assistant = mock_assistant
+
+        messages = [
+            message async for message in azure_openai_assistant_agent.get_thread_messages("test_thread_id", page_size=2)
+        ]
+
+        assert [message.content for message in messages] == ["m4", "m3", "m2", "m1"]
+        assert [message.name for message in messages] == ["other_name", "None", "other_name", "test_name"]
+        assert mock_client.beta.threads.messages.list.await_count == 2
+        assert mock_client.beta.threads.messages.list.call_args.kwargs["after"] == "m3"
+        mock_client.beta.assistants.retrieve.assert_awaited_once_with("other")
+
+        _ = [message async for message in azure_openai_assistant_agent.get_thread_messages("test_thread_id")]
+        mock_client.beta.assistants.retrieve.assert_awaited_once_with("other")
+
+
+@pytest.mark.asyncio
+async def test_get_thread_messages_prefetch_is_cancelled_when_closed(
+    azure_openai_assistant_agent, mock_thread_messages, openai_unit_test_env
+):
+    next_page_requested = asyncio.Event()
+    next_page_cancelled = asyncio.Event()
+
+    async def mock_list_messages(*args, after=None, **kwargs) -> Any:
+        if after is None:
+            return MagicMock(data=[MagicMock(id="m1", assistant_id=None, role="user", content=[])] * 2, has_more=True)
+        next_page_requested.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            next_page_cancelled.set()
+            raise
+
+    with patch.object(azure_openai_assistant_agent, "client", spec=AsyncAzureOpenAI) as mock_client:
+        mock_client.beta = MagicMock()
+        mock_client.beta.threads.messages.list = AsyncMock(side_effect=mock_list_messages)
+        azure_openai_assistant_agent._generate_message_content = MagicMock(
+            return_value=ChatMessageContent(role=AuthorRole.USER, content="content")
+        )
+
+        messages = azure_openai_assistant_agent.get_thread_messages("test_thread_id")
+        assert (await messages.__anext__()).content == "content"
+        await next_page_requested.wait()
+        await messages.aclose()
+
+        await asyncio.wait_for(next_page_cancelled.wait(), timeout=1)
+
+
 @pytest.mark.asyncio
 async def test_invoke(
     azure_openai_assistant_agent,
@@ -694,6 +838,165 @@ async def test_invoke(
         assert messages[1].content == "test code"
 
 
+@pytest.mark.asyncio
+async def test_invoke_stream(
+    azure_openai_assistant_agent,
+    mock_assistant,
+    mock_stream_message_completed,
+    mock_stream_run_completed,
+    openai_unit_test_env,
+):
+    code_delta = ThreadRunStepDelta(
+        event="thread.run.step.delta",
+        data=RunStepDeltaEvent(
+            id="step_id",
+            object="thread.run.step.delta",
+            delta=RunStepDelta(
+                step_details=ToolCallDeltaObject(
+                    type="tool_calls",
+                    tool_calls=[
+                        CodeInterpreterToolCallDelta(
+                            index=0, type="code_interpreter", code_interpreter=CodeInterpreterDelta(input="print(1)")
+                        )
+                    ],
+                )
+            ),
+        ),
+    )
+    events = [
+        code_delta,
+        message_delta_event("Hello"),
+        message_delta_event(" world"),
+        mock_stream_message_completed,
+        mock_stream_run_completed,
+    ]
+
+    with patch.object(azure_openai_assistant_agent, "client", spec=AsyncAzureOpenAI) as mock_client:
+        mock_client.beta = MagicMock()
+        mock_client.beta.assistants.create = AsyncMock(return_value=mock_assistant)
+        mock_client.beta.threads.runs.create = AsyncMock(return_value=MockEventStream(events))
+        mock_client.beta.threads.runs.retrieve = AsyncMock()
+
+        azure_openai_assistant_agent.assistant = await azure_openai_assistant_agent.create_assistant()
+        azure_openai_assistant_agent._get_tools = MagicMock(return_value=["tool"])
+
+        messages: list[ChatMessageContent] = []
+        chunks = [chunk async for chunk in azure_openai_assistant_agent.invoke_stream("thread_id", messages=messages)]
+
+        assert all(isinstance(chunk, StreamingChatMessageContent) for chunk in chunks)
+        assert [chunk.content for chunk in chunks] == ["print(1)", "Hello", " world"]
+        assert chunks[0].metadata == {"code": True}
+        assert all(chunk.name == "test_name" for chunk in chunks)
+        assert (chunks[1] + chunks[2]).content == "Hello world"
+        assert len(messages) == 1
+        assert messages[0].content == "Hello world"
+        assert mock_client.beta.threads.runs.create.call_args.kwargs["stream"] is True
+        mock_client.beta.threads.runs.retrieve.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invoke_stream_submits_tool_outputs(
+    azure_openai_assistant_agent,
+    mock_assistant,
+    mock_run_required_action,
+    mock_stream_message_completed,
+    mock_stream_run_completed,
+    openai_unit_test_env,
+):
+    tool_step = ThreadRunStepCompleted(
+        event="thread.run.step.completed",
+        data=RunStep(
+            id="step_id",
+            type="tool_calls",
+            completed_at=123456789,
+            created_at=123456789,
+            step_details=ToolCallsStepDetails(
+                type="tool_calls",
+                tool_calls=[
+                    FunctionToolCall(
+                        type="function",
+                        id="tool_call_id",
+                        function=RunsFunction(arguments="{}", name="function_name", output="test output"),
+                    )
+                ],
+            ),
+            assistant_id="assistant_id",
+            object="thread.run.step",
+            run_id="run_id",
+            status="completed",
+            thread_id="thread_id",
+        ),
+    )
+    first_stream = MockEventStream([
+        ThreadRunRequiresAction(event="thread.run.requires_action", data=mock_run_required_action)
+    ])
+    second_stream = MockEventStream([
+        tool_step,
+        message_delta_event("Hello world"),
+        mock_stream_message_completed,
+        mock_stream_run_completed,
+    ])
+
+    with patch.object(azure_openai_assistant_agent, "client", spec=AsyncAzureOpenAI) as mock_client:
+        mock_client.beta = MagicMock()
+        mock_client.beta.assistants.create = AsyncMock(return_value=mock_assistant)
+        mock_client.beta.threads.runs.create = AsyncMock(return_value=first_stream)
+        mock_client.beta.threads.runs.submit_tool_outputs = AsyncMock(return_value=second_stream)
+
+        azure_openai_assistant_agent.assistant = await azure_openai_assistant_agent.create_assistant()
+        azure_openai_assistant_agent._get_tools = MagicMock(return_value=["tool"])
+        azure_openai_assistant_agent._invoke_function_calls = AsyncMock()
+        azure_openai_assistant_agent._format_tool_outputs = MagicMock(
+            return_value=[{"tool_call_id": "tool_call_id", "output": "test output"}]
+        )
+
+        messages: list[ChatMessageContent] = []
+        chunks = [chunk async for chunk in azure_openai_assistant_agent.invoke_stream("thread_id", messages=messages)]
+
+        assert [chunk.content for chunk in chunks] == ["Hello world"]
+        mock_client.beta.threads.runs.submit_tool_outputs.assert_awaited_once_with(
+            run_id="run_id",
+            thread_id="thread_id",
+            tool_outputs=[{"tool_call_id": "tool_call_id", "output": "test output"}],
+            stream=True,
+        )
+        assert len(messages) == 3
+        assert isinstance(messages[0].items[0], FunctionCallContent)
+        assert isinstance(messages[1].items[0], FunctionResultContent)
+        assert messages[1].items[0].result == "test output"
+        assert messages[2].content == "Hello world"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", ["failed", "error"])
+async def test_invoke_stream_raises_error(
+    azure_openai_assistant_agent, mock_assistant, mock_run_failed, openai_unit_test_env, error
+):
+    if error == "failed":
+        event = ThreadRunFailed(event="thread.run.failed", data=mock_run_failed)
+        match = "Run failed with status: `failed` for agent `test_name` and thread `thread_id`"
+    else:
+        event = ErrorEvent(event="error", data=ErrorObject(message="server error", type="server_error"))
+        match = "Run failed with error: `server error` for agent `test_name` and thread `thread_id`"
+
+    with patch.object(azure_openai_assistant_agent, "client", spec=AsyncAzureOpenAI) as mock_client:
+        mock_client.beta = MagicMock()
+        mock_client.beta.assistants.create = AsyncMock(return_value=mock_assistant)
+        mock_client.beta.threads.runs.create = AsyncMock(return_value=MockEventStream([event]))
+
+        azure_openai_assistant_agent.assistant = await azure_openai_assistant_agent.create_assistant()
+        azure_openai_assistant_agent._get_tools = MagicMock(return_value=["tool"])
+
+        with pytest.raises(AgentInvokeError, match=match):
+            _ = [chunk async for chunk in azure_openai_assistant_agent.invoke_stream("thread_id")]
+
+
+@pytest.mark.asyncio
+async def test_invoke_stream_assistant_not_initialized_throws(azure_openai_assistant_agent, openai_unit_test_env):
+    with pytest.raises(AgentInitializationError, match="The assistant has not been created."):
+        _ = [chunk async for chunk in azure_openai_assistant_agent.invoke_stream("thread_id")]
+
+
 @pytest.mark.asyncio
 async def test_invoke_assistant_not_initialized_throws(azure_openai_assistant_agent, openai_unit_test_env):
     with pytest.raises(AgentInitializationError, match="The assistant has not been created."):
@@ -763,6 +1066,17 @@ def test_format_tool_outputs(azure_openai_assistant_agent, openai_unit_test_env)
     assert tool_outputs[0] == {"tool_call_id": "test", "output": 123}
 
 
+def test_format_tool_outputs_of_parallel_calls(azure_openai_assistant_agent, openai_unit_test_env):
+    chat_history = ChatHistory()
+    for index in range(2):
+        fcc = FunctionCallContent(id=f"test{index}", name="test-function", arguments="{}")
+        frc = FunctionResultContent.from_function_call_content_and_result(fcc, index)
+        chat_history.add_message(message=frc.to_chat_message_content())
+
+    tool_outputs = azure_openai_assistant_agent._format_tool_outputs(chat_history)
+    assert tool_outputs == [{"tool_call_id": "test0", "output": 0}, {"tool_call_id": "test1", "output": 1}]
+
+
 @pytest.mark.asyncio
 async def test_invoke_function_calls(azure_openai_assistant_agent, openai_unit_test_env):
     chat_history = ChatHistory()
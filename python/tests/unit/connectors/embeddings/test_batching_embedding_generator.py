@@ -0,0 +1,153 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+
+import numpy as np
+from pytest import fixture, mark, raises
+
+from semantic_kernel.connectors.ai.embeddings.batching_embedding_generator import (
+    BatchingEmbeddingGenerator,
+    EmbeddingBatchMetrics,
+)
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.exceptions import ServiceResponseException
+
+
+class CountingEmbeddings(EmbeddingGeneratorBase):
+    calls: list[list[str]] = []
+    delay: float = 0.0
+
+    async def generate_embeddings(self, texts, settings=None, **kwargs):
+        self.calls.append(list(texts))
+        await asyncio.sleep(self.delay)
+        if "fail" in texts:
+            raise ServiceResponseException("failed")
+        dimensions = kwargs.get("dimensions", 2)
+        return np.array([[float(len(text))] * dimensions for text in texts])
+
+
+@fixture
+def inner() -> CountingEmbeddings:
+    return CountingEmbeddings(service_id="embed", ai_model_id="model", calls=[])
+
+
+@mark.asyncio
+async def test_concurrent_calls_are_batched(inner):
+    batches: list[EmbeddingBatchMetrics] = []
+    generator = BatchingEmbeddingGenerator(inner, max_wait_time=0.01, on_batch=batches.append)
+    assert generator.service_id == "embed"
+    assert generator.ai_model_id == "model"
+
+    results = await asyncio.gather(
+        generator.generate_embeddings(["a"]),
+        generator.generate_embeddings(["bb", "ccc"]),
+        generator.generate_embeddings(["dddd"]),
+    )
+
+    assert inner.calls == [["a", "bb", "ccc", "dddd"]]
+    np.testing.assert_array_equal(results[0], [[1.0, 1.0]])
+    np.testing.assert_array_equal(results[1], [[2.0, 2.0], [3.0, 3.0]])
+    np.testing.assert_array_equal(results[2], [[4.0, 4.0]])
+    assert len(batches) == 1
+    assert batches[0].size == 4
+    assert batches[0].requests == 3
+    assert batches[0].wait_time >= 0.0
+    assert generator.batches == 1
+    assert generator.average_batch_size == 4.0
+    assert generator.batched_requests == 3
+
+
+@mark.asyncio
+async def test_full_batch_is_started_without_waiting(inner):
+    generator = BatchingEmbeddingGenerator(inner, max_batch_size=2, max_wait_time=10)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(generator.generate_embeddings([text]) for text in ["a", "bb", "ccc", "dddd"])), timeout=1
+    )
+
+    assert inner.calls == [["a", "bb"], ["ccc", "dddd"]]
+    assert [result[0][0] for result in results] == [1.0, 2.0, 3.0, 4.0]
+
+
+@mark.asyncio
+async def test_call_that_does_not_fit_starts_the_pending_batch(inner):
+    generator = BatchingEmbeddingGenerator(inner, max_batch_size=4, max_wait_time=10)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            generator.generate_embeddings(["a", "b"]),
+            generator.generate_embeddings(["c", "d", "e"]),
+            generator.generate_embeddings(["f"]),
+        ),
+        timeout=1,
+    )
+
+    assert inner.calls == [["a", "b"], ["c", "d", "e", "f"]]
+    assert [len(result) for result in results] == [2, 3, 1]
+
+
+@mark.asyncio
+async def test_different_settings_are_not_combined(inner):
+    generator = BatchingEmbeddingGenerator(inner, max_wait_time=0.01)
+
+    first, second, third = await asyncio.gather(
+        generator.generate_embeddings(["a"]),
+        generator.generate_embeddings(["b"], dimensions=3),
+        generator.generate_embeddings(["c"], settings=PromptExecutionSettings(service_id="other")),
+    )
+
+    assert sorted(inner.calls) == [["a"], ["b"], ["c"]]
+    assert first.shape == (1, 2)
+    assert second.shape == (1, 3)
+    assert third.shape == (1, 2)
+
+
+@mark.asyncio
+async def test_raw_embeddings(inner):
+    generator = BatchingEmbeddingGenerator(inner, max_wait_time=0.01)
+
+    first, second = await asyncio.gather(
+        generator.generate_raw_embeddings(["a"]), generator.generate_raw_embeddings(["bb"])
+    )
+
+    assert inner.calls == [["a", "bb"]]
+    np.testing.assert_array_equal(first, [[1.0, 1.0]])
+    np.testing.assert_array_equal(second, [[2.0, 2.0]])
+
+
+@mark.asyncio
+async def test_large_call_is_not_batched(inner):
+    generator = BatchingEmbeddingGenerator(inner, max_batch_size=2, max_wait_time=10)
+
+    result = await generator.generate_embeddings(["a", "bb", "ccc"])
+
+    assert inner.calls == [["a", "bb", "ccc"]]
+    assert result.shape == (3, 2)
+    assert generator.batches == 1
+
+
+@mark.asyncio
+async def test_exception_is_raised_for_every_caller(inner):
+    generator = BatchingEmbeddingGenerator(inner, max_wait_time=0.01)
+
+    results = await asyncio.gather(
+        generator.generate_embeddings(["a"]), generator.generate_embeddings(["fail"]), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ServiceResponseException) for result in results)
+
+
+@mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_batch(inner):
+    inner.delay = 0.05
+    generator = BatchingEmbeddingGenerator(inner, max_wait_time=0.01)
+
+    cancelled = asyncio.create_task(generator.generate_embeddings(["a"]))
+    other = asyncio.create_task(generator.generate_embeddings(["bb"]))
+    await asyncio.sleep(0.02)
+    cancelled.cancel()
+
+    np.testing.assert_array_equal(await other, [[2.0, 2.0]])
+    with raises(asyncio.CancelledError):
+        await cancelled
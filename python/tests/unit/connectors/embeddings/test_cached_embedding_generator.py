@@ -0,0 +1,103 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import numpy as np
+from pytest import fixture, mark, raises
+
+from semantic_kernel import Kernel
+from semantic_kernel.connectors.ai.embeddings.cached_embedding_generator import CachedEmbeddingGenerator
+from semantic_kernel.connectors.ai.embeddings.embedding_cache import InMemoryEmbeddingCache, SqliteEmbeddingCache
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+
+
+class CountingEmbeddings(EmbeddingGeneratorBase):
+    calls: list[list[str]] = []
+
+    async def generate_embeddings(self, texts, settings=None, **kwargs):
+        self.calls.append(list(texts))
+        dimensions = kwargs.get("dimensions", 2)
+        return np.array([[float(len(text))] * dimensions for text in texts])
+
+
+@fixture
+def inner() -> CountingEmbeddings:
+    return CountingEmbeddings(service_id="embed", ai_model_id="model", calls=[])
+
+
+@mark.asyncio
+async def test_cache_hits_and_dedup(inner):
+    generator = CachedEmbeddingGenerator(inner)
+    assert generator.service_id == "embed"
+    assert generator.ai_model_id == "model"
+
+    first = await generator.generate_embeddings(["a", "bb", "a"])
+    second = await generator.generate_embeddings(["bb", "ccc"])
+
+    assert inner.calls == [["a", "bb"], ["ccc"]]
+    np.testing.assert_array_equal(first, [[1.0, 1.0], [2.0, 2.0], [1.0, 1.0]])
+    np.testing.assert_array_equal(second, [[2.0, 2.0], [3.0, 3.0]])
+    assert generator.hits == 2
+    assert generator.misses == 3
+
+
+@mark.asyncio
+async def test_raw_embeddings_and_full_hit(inner):
+    generator = CachedEmbeddingGenerator(inner)
+
+    assert await generator.generate_raw_embeddings(["a"]) == [[1.0, 1.0]]
+    assert await generator.generate_raw_embeddings(["a"]) == [[1.0, 1.0]]
+    assert inner.calls == [["a"]]
+
+
+@mark.asyncio
+async def test_dimensions_are_part_of_the_key(inner):
+    generator = CachedEmbeddingGenerator(inner)
+
+    await generator.generate_embeddings(["a"], dimensions=2)
+    result = await generator.generate_embeddings(["a"], dimensions=3)
+    await generator.generate_embeddings(["a"], settings=PromptExecutionSettings(dimensions=3))
+
+    assert result.shape == (1, 3)
+    assert inner.calls == [["a"], ["a"]]
+
+
+@mark.asyncio
+async def test_in_memory_cache_lru():
+    cache = InMemoryEmbeddingCache(max_size=2)
+    await cache.set_many({"a": np.array([1.0]), "b": np.array([2.0])})
+    await cache.get_many(["a"])
+    await cache.set_many({"c": np.array([3.0])})
+
+    assert len(cache) == 2
+    assert [value is not None for value in await cache.get_many(["a", "b", "c"])] == [True, False, True]
+    with raises(ValueError):
+        InMemoryEmbeddingCache(max_size=0)
+
+
+@mark.asyncio
+async def test_sqlite_cache_persists(tmp_path, inner):
+    path = str(tmp_path / "embeddings.db")
+    cache = SqliteEmbeddingCache(path)
+    await CachedEmbeddingGenerator(inner, cache=cache).generate_embeddings(["a", "bb"])
+    await cache.close()
+
+    cache = SqliteEmbeddingCache(path)
+    result = await CachedEmbeddingGenerator(inner, cache=cache).generate_embeddings(["bb", "a"])
+    await cache.close()
+
+    assert inner.calls == [["a", "bb"]]
+    np.testing.assert_array_equal(result, [[2.0, 2.0], [1.0, 1.0]])
+
+
+@mark.asyncio
+async def test_kernel_add_embedding_to_object_uses_cache(inner):
+    kernel = Kernel()
+    kernel.add_service(CachedEmbeddingGenerator(inner))
+    records = [{"content": "a", "vector": None}, {"content": "a", "vector": None}]
+
+    await kernel.add_embedding_to_object(
+        records, "content", "vector", execution_settings={"embed": PromptExecutionSettings()}
+    )
+
+    assert inner.calls == [["a"]]
+    assert records[1]["vector"] == [1.0, 1.0]
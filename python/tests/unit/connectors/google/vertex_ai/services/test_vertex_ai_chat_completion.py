@@ -356,3 +356,23 @@ def test_vertex_ai_chat_completion_parse_chat_history_correctly(vertex_ai_unit_t
     assert parsed_chat_history[0].parts[0].text == "test_user_message"
     assert parsed_chat_history[1].role == "model"
     assert parsed_chat_history[1].parts[0].text == "test_assistant_message"
+
+
+def test_vertex_ai_chat_completion_prepare_messages_for_request(vertex_ai_unit_test_env) -> None:
+    """Test that the message cache is used unless _prepare_chat_history_for_request is overridden"""
+
+    class CustomVertexAIChatCompletion(VertexAIChatCompletion):
+        def _prepare_chat_history_for_request(self, chat_history, role_key="role", content_key="content"):
+            return ["custom"]
+
+    chat_history = ChatHistory()
+    chat_history.add_system_message("test_system_message")
+    chat_history.add_user_message("test_user_message")
+    vertex_ai_chat_completion = VertexAIChatCompletion()
+    message_cache: dict = {}
+
+    contents = vertex_ai_chat_completion._prepare_messages_for_request(chat_history, message_cache)
+
+    assert contents == vertex_ai_chat_completion._prepare_chat_history_for_request(chat_history)
+    assert len(message_cache) == 2
+    assert CustomVertexAIChatCompletion()._prepare_messages_for_request(chat_history, message_cache) == ["custom"]
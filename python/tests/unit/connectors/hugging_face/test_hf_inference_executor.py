@@ -0,0 +1,98 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from semantic_kernel.connectors.ai.hugging_face.hf_inference_executor import HuggingFaceInferenceExecutor
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result_from_worker_thread():
+    executor = HuggingFaceInferenceExecutor()
+
+    result = await executor.run(lambda a, b=0: (a + b, threading.current_thread().name), 1, b=2)
+
+    assert result[0] == 3
+    assert result[1].startswith("sk-hf-inference")
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_raises_exception():
+    executor = HuggingFaceInferenceExecutor()
+
+    def fail():
+        raise ValueError("inference failed")
+
+    with pytest.raises(ValueError, match="inference failed"):
+        await executor.run(fail)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_bounds_concurrent_calls():
+    executor = HuggingFaceInferenceExecutor(max_workers=2, max_queue_size=1)
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def infer():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*(executor.run(infer) for _ in range(6)))
+
+    assert max_running == 2
+    assert executor._executor._work_queue.qsize() == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_block_the_event_loop():
+    executor = HuggingFaceInferenceExecutor()
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    await executor.run(time.sleep, 0.2)
+    ticker.cancel()
+
+    assert ticks > 5
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_waiting_call_can_be_cancelled():
+    executor = HuggingFaceInferenceExecutor()
+    calls = []
+
+    first = asyncio.create_task(executor.run(time.sleep, 0.1))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(executor.run(calls.append, "second"))
+    await asyncio.sleep(0)
+    second.cancel()
+    await first
+
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert calls == []
+    executor.shutdown()
+
+
+@pytest.mark.parametrize(("max_workers", "max_queue_size"), [(0, 0), (1, -1)])
+def test_invalid_arguments(max_workers, max_queue_size):
+    with pytest.raises(ValueError):
+        HuggingFaceInferenceExecutor(max_workers=max_workers, max_queue_size=max_queue_size)
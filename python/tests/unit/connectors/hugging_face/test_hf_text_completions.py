@@ -1,10 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from threading import Thread
-from unittest.mock import MagicMock, Mock, patch
+import asyncio
+import time
+from unittest.mock import Mock, patch
 
 import pytest
-from transformers import TextIteratorStreamer
 
 from semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion import HuggingFaceTextCompletion
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
@@ -123,27 +123,16 @@ async def test_text_completion_throws():
     ids=["text2text-generation", "text-generation"],
 )
 async def test_text_completion_streaming(model_name, task, input_str):
-    ret = {"summary_text": "test"} if task == "summarization" else {"generated_text": "test"}
-    mock_pipeline = Mock(return_value=ret)
+    def generate(prompt, streamer, **kwargs):
+        streamer.on_finalized_text("mocked_text")
+        streamer.on_finalized_text("", stream_end=True)
 
-    mock_streamer = MagicMock(spec=TextIteratorStreamer)
-    mock_streamer.__iter__.return_value = iter(["mocked_text"])
+    mock_pipeline = Mock(side_effect=generate)
 
-    with (
-        patch(
-            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
-            return_value=mock_pipeline,
-        ),
-        patch(
-            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.Thread",
-            side_effect=Mock(spec=Thread),
-        ),
-        patch(
-            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.TextIteratorStreamer",
-            return_value=mock_streamer,
-        ) as mock_stream,
+    with patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
+        return_value=mock_pipeline,
     ):
-        mock_stream.return_value = mock_streamer
         service = HuggingFaceTextCompletion(service_id=model_name, ai_model_id=model_name, task=task)
         prompt = "test prompt"
         exec_settings = PromptExecutionSettings(service_id=model_name, extension_data={"max_new_tokens": 25})
@@ -152,8 +141,9 @@ async def test_text_completion_streaming(model_name, task, input_str):
         async for content in service.get_streaming_text_contents(prompt, exec_settings):
             result.append(content)
 
-        assert len(result) == 1
+        assert len(result) == 2
         assert result[0][0].inner_content == "mocked_text"
+        assert mock_pipeline.call_args.args[0] == prompt
 
 
 @pytest.mark.asyncio
@@ -170,27 +160,16 @@ async def test_text_completion_streaming(model_name, task, input_str):
     ids=["text2text-generation", "text-generation"],
 )
 async def test_text_completion_streaming_throws(model_name, task, input_str):
-    ret = {"summary_text": "test"} if task == "summarization" else {"generated_text": "test"}
-    mock_pipeline = Mock(return_value=ret)
+    def generate(prompt, streamer, **kwargs):
+        streamer.on_finalized_text("mocked_text")
+        raise Exception("Test exception")
 
-    mock_streamer = MagicMock(spec=TextIteratorStreamer)
-    mock_streamer.__iter__.return_value = Exception()
+    mock_pipeline = Mock(side_effect=generate)
 
-    with (
-        patch(
-            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
-            return_value=mock_pipeline,
-        ),
-        patch(
-            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.Thread",
-            side_effect=Exception(),
-        ),
-        patch(
-            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.TextIteratorStreamer",
-            return_value=mock_streamer,
-        ) as mock_stream,
+    with patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
+        return_value=mock_pipeline,
     ):
-        mock_stream.return_value = mock_streamer
         service = HuggingFaceTextCompletion(service_id=model_name, ai_model_id=model_name, task=task)
         prompt = "test prompt"
         exec_settings = PromptExecutionSettings(service_id=model_name, extension_data={"max_new_tokens": 25})
@@ -200,6 +179,55 @@ async def test_text_completion_streaming_throws(model_name, task, input_str):
                 pass
 
 
+@pytest.mark.asyncio
+async def test_text_completion_streaming_loads_tokenizer_once():
+    mock_pipeline = Mock(side_effect=lambda prompt, streamer, **kwargs: streamer.end())
+    mock_pipeline.tokenizer = None
+
+    with (
+        patch(
+            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
+            return_value=mock_pipeline,
+        ),
+        patch(
+            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.AutoTokenizer.from_pretrained"
+        ) as mock_from_pretrained,
+    ):
+        service = HuggingFaceTextCompletion(service_id="test", ai_model_id="test-model", task="text-generation")
+        for _ in range(3):
+            async for _ in service.get_streaming_text_contents("test prompt", PromptExecutionSettings()):
+                pass
+
+        mock_from_pretrained.assert_called_once_with("test-model")
+
+
+@pytest.mark.asyncio
+async def test_text_completion_does_not_block_the_event_loop():
+    def generate(prompt, **kwargs):
+        time.sleep(0.2)
+        return {"generated_text": "test"}
+
+    with patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
+        return_value=Mock(side_effect=generate),
+    ):
+        service = HuggingFaceTextCompletion(service_id="test", ai_model_id="test-model", task="text-generation")
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        result = await service.get_text_contents("test prompt", PromptExecutionSettings())
+        ticker.cancel()
+
+        assert result[0].text == "test"
+        assert ticks > 5
+
+
 def test_hugging_face_text_completion_init():
     with (
         patch("semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline") as patched_pipeline,
@@ -0,0 +1,231 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+from pytest import fixture, mark, raises
+
+from semantic_kernel.connectors.memory.postgres import AsyncPostgresMemoryStore
+from semantic_kernel.exceptions import ServiceResourceNotFoundError, ServiceResponseException
+from semantic_kernel.memory.memory_record import MemoryRecord
+
+BASE_PATH = "semantic_kernel.connectors.memory.postgres.async_postgres_memory_store"
+
+
+class FakeCursor:
+    """Records the statements, answers the collections query and returns the configured rows."""
+
+    def __init__(self, rows=None, delay: float = 0.0):
+        self.rows = rows or []
+        self.delay = delay
+        self.statements = []
+        self.copy_rows = []
+        self.copy_types = None
+        self.rowcount = 0
+        self._last = None
+
+    async def execute(self, query, params=None):
+        await asyncio.sleep(self.delay)
+        text = query if isinstance(query, str) else repr(query)
+        self.statements.append((text, params))
+        self._last = text
+        if "INSERT INTO" in text:
+            self.rowcount = len({row[1] for row in self.copy_rows}) if self.copy_rows else 1
+
+    async def fetchall(self):
+        if "information_schema" in self._last:
+            return [("test_collection",)]
+        return self.rows
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    @asynccontextmanager
+    async def copy(self, statement):
+        self.statements.append((statement, None))
+        copy = MagicMock()
+        copy.set_types = lambda types: setattr(self, "copy_types", types)
+
+        async def write_row(row):
+            self.copy_rows.append(row)
+
+        copy.write_row = write_row
+        yield copy
+
+
+class FakePool:
+    def __init__(self, cursor_factory):
+        self.cursor_factory = cursor_factory
+        self.cursors = []
+        self.open = AsyncMock()
+        self.close = AsyncMock()
+
+    @asynccontextmanager
+    async def connection(self):
+        cursor = self.cursor_factory()
+        self.cursors.append(cursor)
+
+        @asynccontextmanager
+        async def cursor_context():
+            yield cursor
+
+        @asynccontextmanager
+        async def transaction():
+            yield
+
+        conn = MagicMock()
+        conn.cursor = cursor_context
+        conn.transaction = transaction
+        yield conn
+
+
+def create_store(cursor_factory=FakeCursor):
+    pool = FakePool(cursor_factory)
+    with patch(f"{BASE_PATH}.AsyncConnectionPool", return_value=pool):
+        store = AsyncPostgresMemoryStore("postgresql://localhost/test", 2, 1, 5)
+    return store, pool
+
+
+@fixture
+def records():
+    return [
+        MemoryRecord.local_record(
+            id=f"id{index}",
+            text=f"text{index}",
+            description="description",
+            additional_metadata="metadata",
+            embedding=np.array([0.5, index]),
+            timestamp=datetime(2024, 1, 1),
+        )
+        for index in range(3)
+    ]
+
+
+def test_constructor_does_not_open_the_pool():
+    with patch(f"{BASE_PATH}.AsyncConnectionPool") as pool:
+        AsyncPostgresMemoryStore("postgresql://localhost/test", 2, 1, 5)
+    assert pool.call_args.kwargs["open"] is False
+
+
+@mark.asyncio
+async def test_upsert_batch_copies_records(records):
+    store, pool = create_store()
+
+    keys = await store.upsert_batch("test_collection", records)
+
+    assert keys == ["id0", "id1", "id2"]
+    pool.open.assert_awaited()
+    cursor = pool.cursors[0]
+    statements = [statement for statement, _ in cursor.statements]
+    assert "CREATE TEMPORARY TABLE" in statements[1]
+    assert "FORMAT BINARY" in statements[2]
+    assert "INSERT INTO" in statements[3] and "ON CONFLICT" in statements[3]
+    assert cursor.copy_types == ["int4", "text", "text", "jsonb", "timestamp"]
+    assert cursor.copy_rows[1] == (
+        1,
+        "id1",
+        "[0.5,1.0]",
+        {"text": "text1", "description": "description", "additional_metadata": "metadata"},
+        datetime(2024, 1, 1),
+    )
+
+
+@mark.asyncio
+async def test_upsert_batch_with_timezone_aware_timestamps(records):
+    records[0]._timestamp = datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+    records[1]._timestamp = None
+    store, pool = create_store()
+
+    await store.upsert_batch("test_collection", records)
+
+    timestamps = [row[4] for row in pool.cursors[0].copy_rows]
+    assert timestamps == [datetime(2024, 1, 1, 10), None, datetime(2024, 1, 1)]
+    assert all(timestamp is None or timestamp.tzinfo is None for timestamp in timestamps)
+
+
+@mark.asyncio
+async def test_upsert_batch_with_duplicate_keys(records):
+    store, pool = create_store()
+
+    keys = await store.upsert_batch("test_collection", [records[0], records[1], records[0]])
+
+    assert keys == ["id0", "id1", "id0"]
+    assert [row[0] for row in pool.cursors[0].copy_rows] == [0, 1, 2]
+
+
+@mark.asyncio
+async def test_upsert_batch_fails(records):
+    class FailingCursor(FakeCursor):
+        async def execute(self, query, params=None):
+            await super().execute(query, params)
+            self.rowcount = 0
+
+    store, _ = create_store(FailingCursor)
+
+    with raises(ServiceResponseException):
+        await store.upsert_batch("test_collection", records)
+
+
+@mark.asyncio
+async def test_upsert_batch_empty():
+    store, pool = create_store()
+
+    assert await store.upsert_batch("test_collection", []) == []
+    assert pool.cursors == []
+
+
+@mark.asyncio
+async def test_missing_collection(records):
+    store, _ = create_store()
+
+    with raises(ServiceResourceNotFoundError):
+        await store.upsert_batch("other_collection", records)
+
+
+@mark.asyncio
+async def test_get_nearest_matches():
+    metadata = {"text": "text", "description": "description", "additional_metadata": "metadata"}
+    store, pool = create_store(lambda: FakeCursor(rows=[("id0", "[0.5,1.0]", metadata, datetime(2024, 1, 1), 0.9)]))
+
+    results = await store.get_nearest_matches("test_collection", np.array([0.5, 1.0]), limit=2, with_embeddings=True)
+
+    assert len(results) == 1
+    record, score = results[0]
+    assert record._id == "id0"
+    assert record._text == "text"
+    assert np.array_equal(record.embedding, np.array([0.5, 1.0]))
+    assert score == 0.9
+    _, params = pool.cursors[0].statements[-1]
+    assert params == {"embedding": "[0.5,1.0]", "min_relevance_score": 0.0, "limit": 2}
+
+
+@mark.asyncio
+async def test_get_nearest_match_not_found():
+    store, _ = create_store()
+
+    with raises(ServiceResourceNotFoundError):
+        await store.get_nearest_match("test_collection", np.array([0.5, 1.0]))
+
+
+@mark.asyncio
+async def test_concurrent_queries_overlap():
+    store, _ = create_store(lambda: FakeCursor(delay=0.1))
+
+    start = asyncio.get_running_loop().time()
+    await asyncio.gather(*(store.get_nearest_matches("test_collection", np.array([0.5, 1.0]), 1) for _ in range(5)))
+
+    # two statements of 0.1 seconds per query, the five queries run at the same time
+    assert asyncio.get_running_loop().time() - start < 0.5
+
+
+@mark.asyncio
+async def test_close():
+    store, pool = create_store()
+
+    async with store:
+        pass
+
+    pool.close.assert_awaited_once()
@@ -0,0 +1,94 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from pytest import fixture, mark, raises
+
+from semantic_kernel.connectors.memory.chroma import ChromaMemoryStore
+from semantic_kernel.exceptions import ServiceResourceNotFoundError
+from semantic_kernel.memory.memory_record import MemoryRecord
+
+
+@fixture
+def chromadb():
+    """Replaces the chromadb package, which is an optional dependency, with a mock."""
+    chromadb = MagicMock()
+    with patch.dict(sys.modules, {"chromadb": chromadb, "chromadb.config": chromadb.config}):
+        yield chromadb
+
+
+@fixture
+def client(chromadb):
+    client = chromadb.Client.return_value
+    client.get_max_batch_size.return_value = 2
+    return client
+
+
+def create_records(count: int) -> list[MemoryRecord]:
+    return [
+        MemoryRecord.local_record(
+            id=f"id{index}", text=f"text{index}", description=None, additional_metadata=None, embedding=np.ones(2)
+        )
+        for index in range(count)
+    ]
+
+
+@mark.asyncio
+async def test_upsert_batch_sends_one_upsert_per_chunk(client):
+    store = ChromaMemoryStore()
+    await store.create_collection("test_collection")
+    collection = client.create_collection.return_value
+
+    keys = await store.upsert_batch("test_collection", create_records(5))
+
+    assert keys == ["id0", "id1", "id2", "id3", "id4"]
+    assert [call.kwargs["ids"] for call in collection.upsert.call_args_list] == [
+        ["id0", "id1"],
+        ["id2", "id3"],
+        ["id4"],
+    ]
+    assert collection.upsert.call_args_list[2].kwargs["documents"] == ["text4"]
+    assert collection.upsert.call_args_list[2].kwargs["embeddings"] == [[1.0, 1.0]]
+    # the batch size is asked once and the collection handle is cached
+    client.get_max_batch_size.assert_called_once()
+    client.get_collection.assert_not_called()
+
+
+@mark.asyncio
+async def test_max_batch_size_argument_takes_precedence(client):
+    store = ChromaMemoryStore(max_batch_size=3)
+
+    await store.upsert_batch("test_collection", create_records(5))
+
+    collection = client.get_collection.return_value
+    assert [len(call.kwargs["ids"]) for call in collection.upsert.call_args_list] == [3, 2]
+    client.get_max_batch_size.assert_not_called()
+
+
+@mark.asyncio
+async def test_max_batch_size_of_clients_without_get_max_batch_size(client):
+    del client.get_max_batch_size
+    client.max_batch_size = 4
+    store = ChromaMemoryStore()
+
+    await store.upsert_batch("test_collection", create_records(5))
+
+    collection = client.get_collection.return_value
+    assert [len(call.kwargs["ids"]) for call in collection.upsert.call_args_list] == [4, 1]
+
+
+@mark.asyncio
+async def test_delete_collection_invalidates_the_cached_collection(client):
+    store = ChromaMemoryStore()
+    await store.create_collection("test_collection")
+
+    await store.delete_collection("test_collection")
+
+    client.delete_collection.assert_called_once_with(name="test_collection")
+    client.get_collection.side_effect = ValueError("collection does not exist")
+    assert not await store.does_collection_exist("test_collection")
+    with raises(ServiceResourceNotFoundError):
+        await store.upsert_batch("test_collection", create_records(1))
+    client.create_collection.return_value.upsert.assert_not_called()
@@ -1,6 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 from pytest import fixture, mark, raises
@@ -17,6 +17,7 @@ from semantic_kernel.exceptions.memory_connector_exceptions import (
 BASE_PATH = "redis.asyncio.client.Redis"
 BASE_PATH_FT = "redis.commands.search.AsyncSearch"
 BASE_PATH_JSON = "redis.commands.json.commands.JSONCommands"
+BASE_PATH_PIPELINE = "redis.asyncio.client.Pipeline"
 
 
 @fixture
@@ -114,6 +115,27 @@ def mock_get_hash():
         yield mock_get
 
 
+@fixture(autouse=True)
+def mock_execute_pipeline():
+    with patch(f"{BASE_PATH_PIPELINE}.execute", new=AsyncMock()) as mock_execute:
+        mock_execute.return_value = [
+            {
+                b"metadata": b'{"content": "content"}',
+                b"vector": np.array([1.0, 2.0, 3.0]).tobytes(),
+            }
+        ]
+        yield mock_execute
+
+
+@fixture
+def mock_pipeline():
+    pipeline = MagicMock()
+    pipeline.__aenter__.return_value = pipeline
+    pipeline.execute = AsyncMock(side_effect=lambda: [{b"metadata": b"{}"}] * len(pipeline.hgetall.call_args_list))
+    with patch(f"{BASE_PATH}.pipeline", return_value=pipeline) as mock_pipeline:
+        yield mock_pipeline
+
+
 @fixture(autouse=True)
 def mock_get_json():
     with patch(f"{BASE_PATH_JSON}.mget", new=AsyncMock()) as mock_get:
@@ -303,6 +325,56 @@ async def test_delete(collection_hash, collection_json, type_):
     await collection._inner_delete(["id1"])
 
 
+@mark.asyncio
+@mark.parametrize("transaction", [True, False])
+async def test_upsert_hash_pipelined(redis_unit_test_env, data_model_definition, mock_pipeline, transaction):
+    collection = RedisHashsetCollection(
+        data_model_type=dict,
+        collection_name="test",
+        data_model_definition=data_model_definition,
+        pipeline_chunk_size=2,
+        pipeline_transaction=transaction,
+    )
+    records = [{"id": f"id{i}", "content": "content", "vector": [float(i), 2.0, 3.0]} for i in range(5)]
+
+    ids = await collection.upsert_batch(records)
+
+    assert ids == [f"id{i}" for i in range(5)]
+    assert mock_pipeline.call_count == 3
+    mock_pipeline.assert_called_with(transaction=transaction)
+    pipeline = mock_pipeline.return_value
+    assert pipeline.execute.await_count == 3
+    assert [call.kwargs["name"] for call in pipeline.hset.call_args_list] == [f"id{i}" for i in range(5)]
+    assert pipeline.hset.call_args_list[4].kwargs["mapping"]["vector"] == np.array([4.0, 2.0, 3.0]).tobytes()
+
+
+@mark.asyncio
+async def test_get_hash_pipelined(collection_with_prefix_hash, mock_pipeline):
+    records = await collection_with_prefix_hash._inner_get(["id1", "id2"])
+
+    assert len(records) == 2
+    assert mock_pipeline.call_count == 1
+    pipeline = mock_pipeline.return_value
+    assert [call.args[0] for call in pipeline.hgetall.call_args_list] == ["test:id1", "test:id2"]
+
+
+@mark.asyncio
+async def test_upsert_and_delete_json_pipelined(collection_with_prefix_json, mock_pipeline):
+    ids = await collection_with_prefix_json.upsert_batch([
+        {"id": "id1", "content": "content", "vector": np.array([1.0, 2.0, 3.0])},
+        {"id": "id2", "content": "content", "vector": np.array([4.0, 5.0, 6.0])},
+    ])
+    assert ids == ["id1", "id2"]
+    json = mock_pipeline.return_value.json.return_value
+    assert [call.args for call in json.set.call_args_list] == [
+        ("test:id1", "$", {"content": "content", "vector": [1.0, 2.0, 3.0]}),
+        ("test:id2", "$", {"content": "content", "vector": [4.0, 5.0, 6.0]}),
+    ]
+
+    await collection_with_prefix_json.delete_batch(["id1", "id2"])
+    assert [call.args[0] for call in json.delete.call_args_list] == ["test:id1", "test:id2"]
+
+
 @mark.asyncio
 async def test_does_collection_exist(collection_hash, mock_does_collection_exist):
     await collection_hash.does_collection_exist()
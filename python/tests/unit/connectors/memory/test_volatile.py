@@ -1,9 +1,20 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from pytest import fixture, mark
+import numpy as np
+import pytest_asyncio
+from pytest import approx, fixture, mark, raises
 
 from semantic_kernel.connectors.memory.volatile.volatile_collection import VolatileCollection
 from semantic_kernel.connectors.memory.volatile.volatile_store import VolatileStore
+from semantic_kernel.data.const import DistanceFunction
+from semantic_kernel.data.vector_search_options import VectorSearchOptions
+from semantic_kernel.data.vector_store_model_definition import VectorStoreRecordDefinition
+from semantic_kernel.data.vector_store_record_fields import (
+    VectorStoreRecordDataField,
+    VectorStoreRecordKeyField,
+    VectorStoreRecordVectorField,
+)
+from semantic_kernel.exceptions.memory_connector_exceptions import MemoryConnectorException
 
 
 @fixture
@@ -74,3 +85,118 @@ async def test_delete_collection(collection):
 @mark.asyncio
 async def test_create_collection(collection):
     await collection.create_collection()
+
+
+@fixture
+def search_definition():
+    return VectorStoreRecordDefinition(
+        fields={
+            "id": VectorStoreRecordKeyField(),
+            "content": VectorStoreRecordDataField(),
+            "category": VectorStoreRecordDataField(is_filterable=True),
+            "vector": VectorStoreRecordVectorField(dimensions=2),
+        }
+    )
+
+
+@pytest_asyncio.fixture
+async def search_collection(search_definition):
+    collection = VolatileCollection("test", dict, search_definition)
+    await collection.upsert_batch([
+        {"id": "a", "content": "a", "category": "x", "vector": [1.0, 0.0]},
+        {"id": "b", "content": "b", "category": "y", "vector": [0.8, 0.6]},
+        {"id": "c", "content": "c", "category": "x", "vector": [0.0, 1.0]},
+        {"id": "d", "content": "d", "category": "y", "vector": [-1.0, 0.0]},
+    ])
+    return collection
+
+
+@mark.asyncio
+async def test_vectorized_search(search_collection):
+    results = await search_collection.vectorized_search([1.0, 0.0], VectorSearchOptions(top=2))
+    assert [result.record["id"] for result in results] == ["a", "b"]
+    assert results[0].score == approx(1.0)
+    assert results[1].score == approx(0.8)
+    assert results[0].record["vector"] is None
+
+
+@mark.asyncio
+async def test_vectorized_search_include_vectors(search_collection):
+    results = await search_collection.vectorized_search(
+        np.array([0.0, 1.0]), VectorSearchOptions(top=1, include_vectors=True)
+    )
+    assert results[0].record == {"id": "c", "content": "c", "category": "x", "vector": [0.0, 1.0]}
+
+
+@mark.asyncio
+async def test_vectorized_search_filter(search_collection):
+    results = await search_collection.vectorized_search([1.0, 0.0], VectorSearchOptions(filter={"category": "y"}))
+    assert [result.record["id"] for result in results] == ["b", "d"]
+
+    await search_collection.upsert({"id": "b", "content": "b", "category": "x", "vector": [0.8, 0.6]})
+    await search_collection.delete("d")
+    results = await search_collection.vectorized_search([1.0, 0.0], VectorSearchOptions(filter={"category": "y"}))
+    assert results == []
+    results = await search_collection.vectorized_search([1.0, 0.0], VectorSearchOptions(filter={"category": "x"}))
+    assert [result.record["id"] for result in results] == ["a", "b", "c"]
+
+
+@mark.asyncio
+async def test_vectorized_search_filter_not_filterable(search_collection):
+    with raises(MemoryConnectorException):
+        await search_collection.vectorized_search([1.0, 0.0], VectorSearchOptions(filter={"content": "a"}))
+
+
+@mark.asyncio
+async def test_vectorized_search_wrong_dimensions(search_collection):
+    with raises(MemoryConnectorException):
+        await search_collection.vectorized_search([1.0, 0.0, 0.0])
+
+
+@mark.asyncio
+async def test_upsert_unindexable_vector_is_stored(search_collection):
+    record = {"id": "e", "content": "e", "category": "x", "vector": [1.0, 0.0, 0.0]}
+    await search_collection.upsert(record)
+    assert await search_collection.get("e") == record
+    results = await search_collection.vectorized_search([1.0, 0.0], VectorSearchOptions(filter={"category": "x"}))
+    assert [result.record["id"] for result in results] == ["a", "c"]
+
+    # replacing an indexed vector with one that cannot be indexed removes it from the index
+    await search_collection.upsert({"id": "a", "content": "a", "category": "x", "vector": ["not", "numbers"]})
+    results = await search_collection.vectorized_search([1.0, 0.0], VectorSearchOptions(filter={"category": "x"}))
+    assert [result.record["id"] for result in results] == ["c"]
+
+
+@mark.asyncio
+@mark.parametrize(
+    "distance_function, expected_ids, expected_score",
+    [
+        (DistanceFunction.COSINE, ["c", "b"], 0.98639),
+        (DistanceFunction.DOT_PROD, ["c", "b"], 3.0),
+        (DistanceFunction.EUCLIDEAN, ["c", "b"], 2.06155),
+        (DistanceFunction.MANHATTAN, ["c", "b"], 2.5),
+    ],
+)
+async def test_vectorized_search_distance_functions(distance_function, expected_ids, expected_score):
+    definition = VectorStoreRecordDefinition(
+        fields={
+            "id": VectorStoreRecordKeyField(),
+            "vector": VectorStoreRecordVectorField(distance_function=distance_function),
+        }
+    )
+    collection = VolatileCollection("test", dict, definition)
+    await collection.upsert_batch([
+        {"id": "a", "vector": [1.0, 0.0]},
+        {"id": "b", "vector": [0.8, 0.6]},
+        {"id": "c", "vector": [0.0, 1.0]},
+        {"id": "d", "vector": [-1.0, 0.0]},
+    ])
+    results = await collection.vectorized_search([0.5, 3.0], VectorSearchOptions(top=2))
+    assert [result.record["id"] for result in results] == expected_ids
+    assert results[0].score == approx(expected_score, rel=1e-4)
+
+
+@mark.asyncio
+async def test_vectorized_search_after_delete_collection(search_collection):
+    await search_collection.delete_collection()
+    assert await search_collection.vectorized_search([1.0, 0.0]) == []
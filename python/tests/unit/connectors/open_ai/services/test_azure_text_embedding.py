@@ -9,6 +9,7 @@ from openai.resources.embeddings import AsyncEmbeddings
 from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
 from semantic_kernel.connectors.ai.open_ai.services.azure_text_embedding import AzureTextEmbedding
 from semantic_kernel.exceptions.service_exceptions import ServiceInitializationError
+from semantic_kernel.utils.rate_limiter import RateLimiter
 
 
 def test_azure_text_embedding_init(azure_openai_unit_test_env) -> None:
@@ -65,9 +66,15 @@ def test_azure_text_embedding_init_with_from_dict(azure_openai_unit_test_env) ->
         "api_key": azure_openai_unit_test_env["AZURE_OPENAI_API_KEY"],
         "api_version": azure_openai_unit_test_env["AZURE_OPENAI_API_VERSION"],
         "default_headers": default_headers,
+        "binary_embeddings": True,
+        "max_concurrent_requests": 4,
+        "rate_limiter": RateLimiter(requests_per_minute=100),
     }
 
     azure_text_embedding = AzureTextEmbedding.from_dict(settings=settings)
+    assert azure_text_embedding.binary_embeddings
+    assert azure_text_embedding.max_concurrent_requests == 4
+    assert azure_text_embedding.rate_limiter is settings["rate_limiter"]
 
     assert azure_text_embedding.client is not None
     assert isinstance(azure_text_embedding.client, AsyncAzureOpenAI)
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 from copy import deepcopy
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -13,6 +14,7 @@ from openai.types.chat.chat_completion_chunk import ChoiceDelta as ChunkChoiceDe
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
 from semantic_kernel.connectors.ai.function_call_behavior import FunctionCallBehavior
+from semantic_kernel.connectors.ai.function_calling_utils import update_settings_from_function_call_configuration
 from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
 from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
     OpenAIChatPromptExecutionSettings,
@@ -23,8 +25,10 @@ from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion impo
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.contents import StreamingChatMessageContent
 from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
 from semantic_kernel.contents.streaming_text_content import StreamingTextContent
 from semantic_kernel.contents.text_content import TextContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
 from semantic_kernel.exceptions.service_exceptions import (
     ServiceInvalidExecutionSettingsError,
     ServiceInvalidResponseError,
@@ -699,6 +703,68 @@ async def test_scmc_run_out_of_auto_invoke_loop(
     mock_create.call_count == 6
 
 
+def tool_call_chunk(tool_call: dict | None = None, finish_reason: str | None = None) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="test_id",
+        choices=[
+            ChunkChoice(
+                index=0,
+                finish_reason=finish_reason,
+                delta=ChunkChoiceDelta(role="assistant", tool_calls=[tool_call] if tool_call else None),
+            )
+        ],
+        created=0,
+        model="test",
+        object="chat.completion.chunk",
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncChatCompletions, "create", new_callable=AsyncMock)
+async def test_scmc_dispatch_tool_calls_while_streaming(
+    mock_create: MagicMock,
+    kernel: Kernel,
+    chat_history: ChatHistory,
+    mock_streaming_chat_completion_response: AsyncStream[ChatCompletionChunk],
+    openai_unit_test_env,
+):
+    invoked: list[str] = []
+    kernel.add_function("test", kernel_function(lambda key: invoked.append(key) or "result", name="test"))
+    tool_call_stream = MagicMock(spec=AsyncStream)
+    tool_call_stream.__aiter__.return_value = [
+        tool_call_chunk({"index": 0, "id": "call_0", "function": {"name": "test-test", "arguments": '{"key": '}}),
+        tool_call_chunk({"index": 0, "function": {"arguments": '"first"}'}}),
+        tool_call_chunk({"index": 1, "id": "call_1", "function": {"name": "test-test", "arguments": '{"key": '}}),
+        tool_call_chunk({"index": 1, "function": {"arguments": '"second"}'}}),
+        tool_call_chunk(finish_reason="tool_calls"),
+    ]
+    mock_create.side_effect = [tool_call_stream, mock_streaming_chat_completion_response]
+    chat_history.add_user_message("hello world")
+    settings = OpenAIChatPromptExecutionSettings(
+        service_id="test_service_id",
+        function_choice_behavior=FunctionChoiceBehavior.Auto(tool_call_scheduler={"dispatch_while_streaming": True}),
+    )
+
+    invoked_while_streaming: list[list[str]] = []
+    async for _ in OpenAIChatCompletion().get_streaming_chat_message_contents(
+        chat_history=chat_history, settings=settings, kernel=kernel, arguments=KernelArguments()
+    ):
+        await asyncio.sleep(0.01)
+        invoked_while_streaming.append(list(invoked))
+
+    # the first tool call runs as soon as the second one starts streaming
+    assert invoked_while_streaming[2] == ["first"]
+    assert invoked == ["first", "second"]
+    assert [message.role for message in chat_history.messages] == [
+        AuthorRole.USER,
+        AuthorRole.ASSISTANT,
+        AuthorRole.TOOL,
+        AuthorRole.TOOL,
+    ]
+    assert {message.items[0].id for message in chat_history.messages[2:]} == {"call_0", "call_1"}
+    assert mock_create.call_count == 2
+
+
 @pytest.mark.asyncio
 @patch.object(AsyncChatCompletions, "create", new_callable=AsyncMock)
 async def test_scmc_no_stream(
@@ -853,3 +919,103 @@ async def test_scmc_terminate_through_filter(
     ]
     # call count should be 1 here because we terminate
     mock_create.call_count == 1
+
+
+# endregion
+# region Request preparation
+
+
+def test_update_settings_reuses_serialized_messages(kernel: Kernel, chat_history: ChatHistory, openai_unit_test_env):
+    kernel.add_function("test", kernel_function(lambda key: "test", name="test"))
+    chat_history.add_user_message("hello world")
+    settings = OpenAIChatPromptExecutionSettings(function_choice_behavior="auto")
+    openai_chat_completion = OpenAIChatCompletion()
+    message_cache: dict = {}
+
+    with (
+        patch.object(ChatMessageContent, "to_dict", autospec=True, side_effect=ChatMessageContent.to_dict) as to_dict,
+        patch(
+            "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_base."
+            "update_settings_from_function_call_configuration",
+            wraps=update_settings_from_function_call_configuration,
+        ) as update_tools,
+    ):
+        openai_chat_completion._update_settings(settings, chat_history, kernel=kernel, message_cache=message_cache)
+        tools = settings.tools
+        chat_history.add_assistant_message("hi there")
+        openai_chat_completion._update_settings(settings, chat_history, kernel=kernel, message_cache=message_cache)
+
+    # the first message is serialized once, the second message once
+    assert to_dict.call_count == 2
+    assert update_tools.call_count == 1
+    assert settings.messages == openai_chat_completion._prepare_chat_history_for_request(chat_history)
+    assert settings.tools == tools
+    assert settings.tool_choice == "auto"
+
+    kernel.add_function("test", kernel_function(lambda key: "other", name="other"))
+    openai_chat_completion._update_settings(settings, chat_history, kernel=kernel)
+    assert [tool["function"]["name"] for tool in settings.tools] == ["test-test", "test-other"]
+
+
+def test_update_settings_serializes_replaced_messages(chat_history: ChatHistory, openai_unit_test_env):
+    chat_history.add_user_message("hello world")
+    settings = OpenAIChatPromptExecutionSettings()
+    openai_chat_completion = OpenAIChatCompletion()
+    message_cache: dict = {}
+    openai_chat_completion._update_settings(settings, chat_history, message_cache=message_cache)
+
+    chat_history.messages[0] = ChatMessageContent(role=AuthorRole.USER, content="replaced")
+    openai_chat_completion._update_settings(settings, chat_history, message_cache=message_cache)
+
+    assert settings.messages == [{"role": "user", "content": "replaced"}]
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncChatCompletions, "create", new_callable=AsyncMock)
+async def test_messages_changed_between_calls_are_serialized_again(
+    mock_create,
+    kernel: Kernel,
+    chat_history: ChatHistory,
+    mock_chat_completion_response: ChatCompletion,
+    openai_unit_test_env,
+):
+    mock_create.return_value = mock_chat_completion_response
+    kernel.add_function("test", kernel_function(lambda key: "test", name="test"))
+    chat_history.add_user_message("my password is secret")
+    settings = OpenAIChatPromptExecutionSettings(function_choice_behavior="auto")
+    openai_chat_completion = OpenAIChatCompletion()
+
+    await openai_chat_completion.get_chat_message_contents(chat_history=chat_history, settings=settings, kernel=kernel)
+    chat_history.messages[0].content = "redacted"
+    await openai_chat_completion.get_chat_message_contents(chat_history=chat_history, settings=settings, kernel=kernel)
+
+    assert mock_create.call_args.kwargs["messages"][0] == {"role": "user", "content": "redacted"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("function_choice_behavior", [None, "auto"])
+async def test_overridden_prepare_chat_history_for_request_is_used(
+    kernel: Kernel,
+    chat_history: ChatHistory,
+    mock_chat_completion_response: ChatCompletion,
+    openai_unit_test_env,
+    function_choice_behavior: str | None,
+):
+    class CustomChatCompletion(OpenAIChatCompletion):
+        def _prepare_chat_history_for_request(self, chat_history, role_key="role", content_key="content"):
+            return [{"role": "user", "content": "custom"}]
+
+    kernel.add_function("test", kernel_function(lambda key: "test", name="test"))
+    chat_history.add_user_message("hello world")
+    settings = OpenAIChatPromptExecutionSettings(function_choice_behavior=function_choice_behavior)
+
+    with patch.object(AsyncChatCompletions, "create", new_callable=AsyncMock) as mock_create:
+        mock_create.return_value = mock_chat_completion_response
+        await CustomChatCompletion().get_chat_message_contents(
+            chat_history=chat_history, settings=settings, kernel=kernel
+        )
+
+    assert mock_create.call_args.kwargs["messages"] == [{"role": "user", "content": "custom"}]
+
+
+# endregion
@@ -1,10 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import base64
+from unittest.mock import AsyncMock, call, patch
 
+import httpx
+import numpy as np
 import pytest
-from openai import AsyncClient
+from openai import AsyncClient, RateLimitError
 from openai.resources.embeddings import AsyncEmbeddings
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
 
 from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
     OpenAIEmbeddingPromptExecutionSettings,
@@ -12,6 +18,8 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_pro
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_embedding import OpenAITextEmbedding
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.exceptions.service_exceptions import ServiceInitializationError, ServiceResponseException
+from semantic_kernel.reliability.resilience_policy import ResiliencePolicy
+from semantic_kernel.utils.rate_limiter import RateLimiter
 
 
 def test_init(openai_unit_test_env):
@@ -36,8 +44,12 @@ def test_init_to_from_dict(openai_unit_test_env):
         "ai_model_id": openai_unit_test_env["OPENAI_EMBEDDING_MODEL_ID"],
         "api_key": openai_unit_test_env["OPENAI_API_KEY"],
         "default_headers": default_headers,
+        "max_concurrent_requests": 4,
+        "rate_limiter": RateLimiter(requests_per_minute=100),
     }
     text_embedding = OpenAITextEmbedding.from_dict(settings)
+    assert text_embedding.max_concurrent_requests == 4
+    assert text_embedding.rate_limiter is settings["rate_limiter"]
     dumped_settings = text_embedding.to_dict()
     assert dumped_settings["ai_model_id"] == settings["ai_model_id"]
     assert dumped_settings["api_key"] == settings["api_key"]
@@ -128,3 +140,158 @@ async def test_embedding_pes(mock_create, openai_unit_test_env) -> None:
         model=ai_model_id,
         dimensions=embedding_dimensions,
     )
+
+
+@pytest.mark.asyncio
+async def test_embedding_batches_concurrently_in_order(openai_unit_test_env) -> None:
+    running = 0
+    max_running = 0
+
+    async def create(input, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # later batches finish first, the output order should still follow the input
+        await asyncio.sleep(0.01 * (10 - int(input[0])))
+        running -= 1
+        return CreateEmbeddingResponse(
+            data=[Embedding(embedding=[float(text)], index=i, object="embedding") for i, text in enumerate(input)],
+            model="test_model_id",
+            object="list",
+            usage=Usage(prompt_tokens=1, total_tokens=1),
+        )
+
+    texts = [str(i) for i in range(10)]
+    settings = OpenAIEmbeddingPromptExecutionSettings(dimensions=1536)
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id", max_concurrent_requests=3)
+
+    with patch.object(AsyncEmbeddings, "create", new=AsyncMock(side_effect=create)) as mock_create:
+        embeddings = await openai_text_embedding.generate_raw_embeddings(texts, settings, batch_size=2)
+
+    assert embeddings == [[float(i)] for i in range(10)]
+    assert mock_create.await_count == 5
+    assert max_running == 3
+    assert settings.input is None
+    assert settings.ai_model_id is None
+
+
+@pytest.mark.asyncio
+async def test_embedding_batches_stop_after_a_failure(openai_unit_test_env) -> None:
+    started: list[str] = []
+    cancelled: list[str] = []
+    second_started = asyncio.Event()
+
+    async def create(input, **kwargs):
+        started.append(input[0])
+        if input[0] == "0":
+            await second_started.wait()
+            raise Exception("failed")
+        second_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(input[0])
+            raise
+
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id", max_concurrent_requests=2)
+
+    with (
+        patch.object(AsyncEmbeddings, "create", new=AsyncMock(side_effect=create)),
+        pytest.raises(ServiceResponseException),
+    ):
+        await openai_text_embedding.generate_raw_embeddings([str(i) for i in range(6)], batch_size=1)
+
+    # the failure frees a slot, but none of the waiting batches is sent anymore
+    assert started == ["0", "1"]
+    assert cancelled == ["1"]
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock)
+async def test_embedding_batches_use_rate_limiter(mock_create, openai_unit_test_env) -> None:
+    openai_text_embedding = OpenAITextEmbedding(
+        ai_model_id="test_model_id", rate_limiter=RateLimiter(requests_per_minute=100)
+    )
+    openai_text_embedding.rate_limiter.acquire = AsyncMock()
+
+    await openai_text_embedding.generate_raw_embeddings(["a" * 40, "b", "c"], batch_size=2)
+
+    assert openai_text_embedding.rate_limiter.acquire.await_args_list == [call(tokens=12), call(tokens=1)]
+    assert mock_create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_binary_embeddings_are_decoded_into_one_matrix(openai_unit_test_env) -> None:
+    async def create(input, **kwargs):
+        return CreateEmbeddingResponse.construct(
+            data=[
+                Embedding.construct(
+                    embedding=base64.b64encode(np.array([float(text), 0.5, -1.0], dtype="<f4").tobytes()).decode(),
+                    index=i,
+                    object="embedding",
+                )
+                for i, text in enumerate(input)
+            ],
+            model="test_model_id",
+            object="list",
+            usage=Usage(prompt_tokens=1, total_tokens=1),
+        )
+
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id", binary_embeddings=True)
+    assert openai_text_embedding.binary_embeddings
+
+    with patch.object(AsyncEmbeddings, "create", new=AsyncMock(side_effect=create)) as mock_create:
+        embeddings = await openai_text_embedding.generate_embeddings(["1", "2", "3"], batch_size=2)
+
+    assert embeddings.dtype == np.float32
+    np.testing.assert_array_equal(embeddings, [[1.0, 0.5, -1.0], [2.0, 0.5, -1.0], [3.0, 0.5, -1.0]])
+    assert mock_create.await_count == 2
+    assert mock_create.await_args.kwargs["encoding_format"] == "base64"
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock)
+async def test_binary_embeddings_respect_float_encoding(mock_create, openai_unit_test_env) -> None:
+    mock_create.return_value = CreateEmbeddingResponse(
+        data=[Embedding(embedding=[1.0, 2.0], index=0, object="embedding")],
+        model="test_model_id",
+        object="list",
+        usage=Usage(prompt_tokens=1, total_tokens=1),
+    )
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id", binary_embeddings=True)
+
+    embeddings = await openai_text_embedding.generate_raw_embeddings(["a"], encoding_format="float")
+
+    assert embeddings == [[1.0, 2.0]]
+    assert mock_create.await_args.kwargs["encoding_format"] == "float"
+
+
+def test_decode_empty_binary_embeddings() -> None:
+    assert OpenAITextEmbedding._decode_base64_embeddings([]).shape == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_embedding_requests_use_the_resilience_policy(openai_unit_test_env) -> None:
+    response = httpx.Response(
+        429, headers={"retry-after-ms": "1"}, request=httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    )
+    embeddings_response = CreateEmbeddingResponse(
+        data=[Embedding(embedding=[1.0], index=0, object="embedding")],
+        model="test_model_id",
+        object="list",
+        usage=Usage(prompt_tokens=1, total_tokens=1),
+    )
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    openai_text_embedding.resilience_policy = ResiliencePolicy()
+
+    with patch.object(
+        AsyncEmbeddings,
+        "create",
+        new=AsyncMock(side_effect=[RateLimitError("rate limited", response=response, body=None), embeddings_response]),
+    ) as mock_create:
+        embeddings = await openai_text_embedding.generate_raw_embeddings(["a"])
+
+    assert embeddings == [[1.0]]
+    assert mock_create.await_count == 2
+    assert openai_text_embedding.resilience_policy.metrics.retries == 1
+    assert "resilience_policy" not in openai_text_embedding.to_dict()
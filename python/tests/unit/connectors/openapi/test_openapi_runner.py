@@ -3,11 +3,13 @@
 from collections import OrderedDict
 from unittest.mock import AsyncMock, MagicMock, Mock
 
+import httpx
 import pytest
 
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_operation import RestApiOperation
 from semantic_kernel.connectors.openapi_plugin.models.rest_api_operation_payload import RestApiOperationPayload
 from semantic_kernel.connectors.openapi_plugin.openapi_manager import OpenApiRunner
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
 from semantic_kernel.exceptions import FunctionExecutionException
 
 
@@ -305,3 +307,30 @@ async def test_run_operation():
 
     result = await runner.run_operation(operation, arguments, options)
     assert result == "response text"
+
+
+@pytest.mark.asyncio
+async def test_run_operation_uses_pooled_client():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text="pooled response")
+
+    pool = HttpClientPool(transport=httpx.MockTransport(handler))
+    runner = OpenApiRunner({}, http_client_pool=pool)
+    operation = MagicMock()
+    options = MagicMock()
+    options.server_url_override = None
+    options.api_host_url = None
+    operation.build_headers.return_value = {}
+    operation.method = "GET"
+    operation.responses = OrderedDict()
+    runner.build_operation_url = MagicMock(return_value="http://example.com/items")
+    runner.build_operation_payload = MagicMock(return_value=(None, None))
+
+    assert await runner.run_operation(operation, {}, options) == "pooled response"
+    assert await runner.run_operation(operation, {}, options) == "pooled response"
+    assert len(requests) == 2
+    assert not pool.get_client("http://example.com").is_closed
+    await pool.close()
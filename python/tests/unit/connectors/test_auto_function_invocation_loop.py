@@ -0,0 +1,224 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from semantic_kernel.connectors.ai.auto_function_invocation_loop import (
+    AutoFunctionInvocationLoop,
+    prepare_messages_with_cache,
+)
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.connectors.ai.tool_call_scheduler import ToolCallScheduler
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.contents.utils.finish_reason import FinishReason
+from semantic_kernel.exceptions import ServiceInvalidExecutionSettingsError
+from semantic_kernel.kernel import Kernel
+
+
+def response(*names: str) -> list[ChatMessageContent]:
+    items = [FunctionCallContent(id=f"call_{index}", name=name, arguments="{}") for index, name in enumerate(names)]
+    return [ChatMessageContent(role=AuthorRole.ASSISTANT, items=items, content=None if names else "done")]
+
+
+def chunk(*items: FunctionCallContent, finish_reason: FinishReason | None = None) -> list[StreamingChatMessageContent]:
+    return [
+        StreamingChatMessageContent(
+            role=AuthorRole.ASSISTANT, choice_index=0, items=list(items), finish_reason=finish_reason
+        )
+    ]
+
+
+class FakeClient:
+    """Returns the scripted responses, recording the number of messages sent with each request."""
+
+    def __init__(self, responses=None, streams=None):
+        self.responses = list(responses or [])
+        self.streams = list(streams or [])
+        self.requests: list[int] = []
+        self.message_caches: list[dict | None] = []
+        self.chunks = 0
+
+    async def _send_chat_request(self, chat_history, settings, message_cache=None):
+        self.requests.append(len(chat_history.messages))
+        self.message_caches.append(message_cache)
+        return self.responses.pop(0) if self.responses else response()
+
+    async def _send_chat_streaming_request(self, chat_history, settings, message_cache=None):
+        self.requests.append(len(chat_history.messages))
+        self.message_caches.append(message_cache)
+        for messages in self.streams.pop(0) if self.streams else [chunk()]:
+            self.chunks += 1
+            yield messages
+            await asyncio.sleep(0.01)
+
+
+class FakeInvoker:
+    """Invokes tool calls like Kernel.invoke_function_call, recording the streamed chunks at the start of each call."""
+
+    def __init__(self, client: FakeClient, terminate: set[str] | None = None):
+        self.client = client
+        self.terminate = terminate or set()
+        self.calls: list[tuple[str, int]] = []
+        self.started: list[int] = []
+
+    async def invoke(self, function_call, chat_history, request_index, function_behavior, **kwargs):
+        self.calls.append((function_call.name, request_index))
+        self.started.append(self.client.chunks)
+        frc = FunctionResultContent.from_function_call_content_and_result(function_call, "result")
+        chat_history.add_message(message=frc.to_chat_message_content())
+        return MagicMock(terminate=function_call.name in self.terminate)
+
+
+def settings(maximum_auto_invoke_attempts: int = 5, **scheduler_kwargs) -> PromptExecutionSettings:
+    return PromptExecutionSettings(
+        function_choice_behavior=FunctionChoiceBehavior.Auto(
+            maximum_auto_invoke_attempts=maximum_auto_invoke_attempts,
+            tool_call_scheduler=ToolCallScheduler(**scheduler_kwargs),
+        )
+    )
+
+
+def user_history() -> ChatHistory:
+    chat_history = ChatHistory()
+    chat_history.add_user_message("hello")
+    return chat_history
+
+
+@pytest.mark.asyncio
+async def test_loop_invokes_tool_calls_until_a_response_without_calls():
+    client = FakeClient(responses=[response("p-a", "p-b"), response("p-c"), response()])
+    invoker = FakeInvoker(client)
+    update_settings = MagicMock()
+    chat_history = user_history()
+    loop = AutoFunctionInvocationLoop(
+        client, settings(), Kernel(), invoke_function_call=invoker.invoke, update_settings=update_settings
+    )
+
+    result = await loop.get_chat_message_contents(chat_history)
+
+    assert result[0].content == "done"
+    assert client.requests == [1, 4, 6]
+    assert invoker.calls == [("p-a", 0), ("p-b", 0), ("p-c", 1)]
+    assert update_settings.call_count == 2
+    assert chat_history.messages[-1] is result[0]
+
+
+@pytest.mark.asyncio
+async def test_loop_sends_a_final_request_after_the_maximum_attempts():
+    client = FakeClient(responses=[response("p-a"), response("p-a"), response("p-a")])
+    invoker = FakeInvoker(client)
+    chat_history = user_history()
+    loop = AutoFunctionInvocationLoop(client, settings(2), Kernel(), invoke_function_call=invoker.invoke)
+
+    result = await loop.get_chat_message_contents(chat_history)
+
+    assert len(client.requests) == 3
+    assert len(invoker.calls) == 2
+    # the tool calls of the final response are not invoked nor added to the chat history
+    assert result[0].items[0].name == "p-a"
+    assert chat_history.messages[-1].role == AuthorRole.TOOL
+
+
+@pytest.mark.asyncio
+async def test_loop_stops_when_a_call_terminates():
+    client = FakeClient(responses=[response("p-stop"), response()])
+    invoker = FakeInvoker(client, terminate={"p-stop"})
+    loop = AutoFunctionInvocationLoop(client, settings(), Kernel(), invoke_function_call=invoker.invoke)
+
+    result = await loop.get_chat_message_contents(user_history())
+
+    assert client.requests == [1]
+    assert result[0].items[0].name == "p-stop"
+
+
+def test_loop_requires_kernel_and_function_choice_behavior():
+    with pytest.raises(ServiceInvalidExecutionSettingsError):
+        AutoFunctionInvocationLoop(FakeClient(), settings(), None)
+    with pytest.raises(ServiceInvalidExecutionSettingsError):
+        AutoFunctionInvocationLoop(FakeClient(), PromptExecutionSettings(), Kernel())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dispatch_while_streaming", [False, True])
+async def test_streaming_loop(dispatch_while_streaming: bool):
+    first_stream = [
+        chunk(FunctionCallContent(id="call_0", index=0, name="p-a", arguments="{}")),
+        chunk(FunctionCallContent(id="call_1", index=1, name="p-b", arguments="{}")),
+        chunk(),
+        chunk(),
+        chunk(finish_reason=FinishReason.TOOL_CALLS),
+    ]
+    client = FakeClient(streams=[first_stream, [chunk(), chunk(finish_reason=FinishReason.STOP)]])
+    invoker = FakeInvoker(client)
+    chat_history = user_history()
+    loop = AutoFunctionInvocationLoop(
+        client,
+        settings(dispatch_while_streaming=dispatch_while_streaming),
+        Kernel(),
+        invoke_function_call=invoker.invoke,
+    )
+
+    streamed = [messages async for messages in loop.get_streaming_chat_message_contents(chat_history)]
+
+    assert len(streamed) == 7
+    assert client.requests == [1, 4]
+    assert sorted(invoker.calls) == [("p-a", 0), ("p-b", 0)]
+    if dispatch_while_streaming:
+        # the first call starts when the second call starts streaming, before the response is complete
+        assert min(invoker.started) < len(first_stream)
+    else:
+        assert invoker.started == [len(first_stream)] * 2
+    assert [message.role for message in chat_history.messages] == [
+        AuthorRole.USER,
+        AuthorRole.ASSISTANT,
+        AuthorRole.TOOL,
+        AuthorRole.TOOL,
+    ]
+
+
+def test_prepare_messages_with_cache_converts_only_new_messages():
+    chat_history = ChatHistory()
+    chat_history.add_system_message("system")
+    chat_history.add_user_message("hello")
+    message_cache: dict = {}
+    converted: list[str] = []
+
+    def prepare_message(message: ChatMessageContent) -> str | None:
+        converted.append(message.content)
+        return None if message.role == AuthorRole.SYSTEM else message.content
+
+    assert prepare_messages_with_cache(chat_history, message_cache, prepare_message) == ["hello"]
+    chat_history.add_assistant_message("hi")
+    assert prepare_messages_with_cache(chat_history, message_cache, prepare_message) == ["hello", "hi"]
+    assert converted == ["system", "hello", "hi"]
+
+    # a replaced message is converted again
+    chat_history.messages[1] = ChatMessageContent(role=AuthorRole.USER, content="hello again")
+    assert prepare_messages_with_cache(chat_history, message_cache, prepare_message) == ["hello again", "hi"]
+    assert converted == ["system", "hello", "hi", "hello again"]
+
+
+@pytest.mark.asyncio
+async def test_each_run_of_the_loop_has_its_own_message_cache():
+    client = FakeClient(responses=[response("p-a"), response(), response()])
+    invoker = FakeInvoker(client)
+    execution_settings = settings()
+
+    await AutoFunctionInvocationLoop(
+        client, execution_settings, Kernel(), invoke_function_call=invoker.invoke
+    ).get_chat_message_contents(user_history())
+    await AutoFunctionInvocationLoop(
+        client, execution_settings, Kernel(), invoke_function_call=invoker.invoke
+    ).get_chat_message_contents(user_history())
+
+    first_run, second_run = client.message_caches[:2], client.message_caches[2:]
+    assert first_run[0] is first_run[1]
+    assert second_run[0] is not first_run[0]
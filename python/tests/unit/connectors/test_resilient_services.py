@@ -0,0 +1,149 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.connectors.ai.resilient_services import (
+    ResilientChatCompletion,
+    ResilientEmbeddingGenerator,
+    ResilientTextCompletion,
+)
+from semantic_kernel.connectors.ai.text_completion_client_base import TextCompletionClientBase
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.text_content import TextContent
+from semantic_kernel.reliability.resilience_policy import ResiliencePolicy
+
+
+class FlakyChat(ChatCompletionClientBase):
+    failures: int = 1
+    calls: int = 0
+    delay: float = 0.0
+
+    async def get_chat_message_contents(self, chat_history, settings, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.calls <= self.failures:
+            raise TimeoutError
+        return [ChatMessageContent(role="assistant", content="hello")]
+
+    async def get_streaming_chat_message_contents(self, chat_history, settings, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError
+        for text in ["a", "b"]:
+            yield [ChatMessageContent(role="assistant", content=text)]
+
+
+class FlakyText(TextCompletionClientBase):
+    calls: int = 0
+
+    async def get_text_contents(self, prompt, settings):
+        self.calls += 1
+        if self.calls == 1:
+            raise TimeoutError
+        return [TextContent(text=prompt)]
+
+    async def get_streaming_text_contents(self, prompt, settings):
+        self.calls += 1
+        if False:
+            yield []
+
+
+class FlakyEmbeddings(EmbeddingGeneratorBase):
+    calls: int = 0
+
+    async def generate_embeddings(self, texts, settings=None, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            raise TimeoutError
+        return np.ones((len(texts), 2))
+
+
+@pytest.fixture
+def policy() -> ResiliencePolicy:
+    return ResiliencePolicy(initial_backoff=0)
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_is_retried(policy):
+    inner = FlakyChat(service_id="chat", ai_model_id="model")
+    service = ResilientChatCompletion(inner, policy)
+    assert service.service_id == "chat"
+    assert service.ai_model_id == "model"
+
+    result = await service.get_chat_message_content(ChatHistory(), PromptExecutionSettings())
+
+    assert result.content == "hello"
+    assert inner.calls == 2
+    assert service.policy.metrics.retries == 1
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_is_hedged():
+    inner = FlakyChat(service_id="chat", ai_model_id="model", failures=0, delay=0.05)
+    service = ResilientChatCompletion(inner, ResiliencePolicy(hedge_after=0.01))
+
+    await service.get_chat_message_contents(ChatHistory(), PromptExecutionSettings())
+
+    assert service.policy.metrics.hedges == 1
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_with_auto_invoke_is_not_retried(policy):
+    inner = FlakyChat(service_id="chat", ai_model_id="model", failures=2)
+    service = ResilientChatCompletion(inner, policy)
+    settings = PromptExecutionSettings(function_choice_behavior=FunctionChoiceBehavior.Auto())
+
+    with pytest.raises(TimeoutError):
+        await service.get_chat_message_contents(ChatHistory(), settings)
+    with pytest.raises(ConnectionError):
+        async for _ in service.get_streaming_chat_message_contents(ChatHistory(), settings):
+            pass
+
+    assert inner.calls == 2
+    assert service.policy.metrics.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_streaming_chat_completion_is_retried_until_the_first_chunk(policy):
+    inner = FlakyChat(service_id="chat", ai_model_id="model")
+    service = ResilientChatCompletion(inner, policy)
+
+    chunks = [
+        chunk[0].content
+        async for chunk in service.get_streaming_chat_message_contents(ChatHistory(), PromptExecutionSettings())
+    ]
+
+    assert chunks == ["a", "b"]
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_text_completion_is_retried(policy):
+    inner = FlakyText(service_id="text", ai_model_id="model")
+    service = ResilientTextCompletion(inner, policy)
+
+    result = await service.get_text_content("prompt", PromptExecutionSettings())
+    empty = [chunk async for chunk in service.get_streaming_text_contents("prompt", PromptExecutionSettings())]
+
+    assert result.text == "prompt"
+    assert empty == []
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_retried(policy):
+    inner = FlakyEmbeddings(service_id="embed", ai_model_id="model")
+    service = ResilientEmbeddingGenerator(inner, policy)
+
+    result = await service.generate_embeddings(["a", "b"])
+
+    assert result.shape == (2, 2)
+    assert inner.calls == 2
+    assert service.get_prompt_execution_settings_class() == PromptExecutionSettings
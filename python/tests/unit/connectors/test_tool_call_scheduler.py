@@ -0,0 +1,340 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
+from semantic_kernel.connectors.ai.tool_call_scheduler import ToolCallScheduler
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.contents.utils.finish_reason import FinishReason
+
+
+def function_calls(*names: str) -> list[FunctionCallContent]:
+    return [FunctionCallContent(id=f"call_{index}", name=name, arguments="{}") for index, name in enumerate(names)]
+
+
+class Recorder:
+    def __init__(self, delays: dict[str, float] | None = None, terminate: set[str] | None = None):
+        self.delays = delays or {}
+        self.terminate = terminate or set()
+        self.running: dict[str | None, int] = {}
+        self.max_running: dict[str | None, int] = {}
+        self.max_total = 0
+        self.finished: list[str] = []
+
+    async def invoke(self, function_call: FunctionCallContent):
+        plugin = function_call.plugin_name
+        self.running[plugin] = self.running.get(plugin, 0) + 1
+        self.max_running[plugin] = max(self.max_running.get(plugin, 0), self.running[plugin])
+        self.max_total = max(self.max_total, sum(self.running.values()))
+        try:
+            await asyncio.sleep(self.delays.get(function_call.name, 0.01))
+        finally:
+            self.running[plugin] -= 1
+        self.finished.append(function_call.id)
+        return MagicMock(terminate=function_call.name in self.terminate)
+
+
+@pytest.mark.asyncio
+async def test_default_runs_all_calls_concurrently():
+    recorder = Recorder()
+    calls = function_calls(*(["a-f"] * 5))
+
+    results = await ToolCallScheduler().invoke_function_calls(calls, recorder.invoke, ChatHistory())
+
+    assert len(results) == 5
+    assert recorder.max_total == 5
+
+
+@pytest.mark.asyncio
+async def test_global_and_plugin_concurrency_limits():
+    recorder = Recorder()
+    calls = function_calls(*(["a-f"] * 6 + ["b-f"] * 6 + ["c-f"] * 6))
+    scheduler = ToolCallScheduler(max_concurrency=4, max_concurrency_per_plugin=2, plugin_concurrency={"c": 1})
+
+    results = await scheduler.invoke_function_calls(calls, recorder.invoke, ChatHistory())
+
+    assert len(results) == 18
+    assert len(recorder.finished) == 18
+    assert recorder.max_total <= 4
+    assert recorder.max_running == {"a": 2, "b": 2, "c": 1}
+
+
+@pytest.mark.asyncio
+async def test_timed_out_call_returns_error_result():
+    recorder = Recorder(delays={"slow-f": 10})
+    chat_history = ChatHistory()
+    scheduler = ToolCallScheduler(timeout=5, function_timeouts={"slow-f": 0.05})
+
+    results = await asyncio.wait_for(
+        scheduler.invoke_function_calls(function_calls("fast-f", "slow-f"), recorder.invoke, chat_history), timeout=1
+    )
+
+    assert results[0] is not None
+    assert results[1] is None
+    assert recorder.finished == ["call_0"]
+    assert len(chat_history.messages) == 1
+    result = chat_history.messages[0].items[0]
+    assert isinstance(result, FunctionResultContent)
+    assert result.id == "call_1"
+    assert "timed out after 0.05 seconds" in result.result
+
+
+@pytest.mark.asyncio
+async def test_return_on_terminate_cancels_remaining_calls():
+    recorder = Recorder(delays={"stop-f": 0.01, "slow-f": 10}, terminate={"stop-f"})
+    scheduler = ToolCallScheduler(return_on_terminate=True)
+    chat_history = ChatHistory()
+
+    results = await asyncio.wait_for(
+        scheduler.invoke_function_calls(function_calls("slow-f", "stop-f", "slow-f"), recorder.invoke, chat_history),
+        timeout=1,
+    )
+
+    assert results[0] is None
+    assert results[1].terminate
+    assert results[2] is None
+    assert recorder.finished == ["call_1"]
+    assert recorder.running == {"slow": 0, "stop": 0}
+    # the cancelled calls are answered with an error result
+    cancelled = sorted(message.items[0].id for message in chat_history.messages)
+    assert cancelled == ["call_0", "call_2"]
+    assert all("was cancelled" in message.items[0].result for message in chat_history.messages)
+
+
+@pytest.mark.asyncio
+async def test_return_on_terminate_answers_calls_waiting_for_a_slot():
+    recorder = Recorder(terminate={"stop-f"})
+    scheduler = ToolCallScheduler(return_on_terminate=True, max_concurrency=1)
+    chat_history = ChatHistory()
+
+    results = await scheduler.invoke_function_calls(
+        function_calls("stop-f", "a-f", "a-f"), recorder.invoke, chat_history
+    )
+
+    assert results[0].terminate
+    assert results[1:] == [None, None]
+    assert recorder.finished == ["call_0"]
+    assert sorted(message.items[0].id for message in chat_history.messages) == ["call_1", "call_2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("return_on_terminate", [False, True])
+async def test_cancelled_caller_does_not_add_results(return_on_terminate: bool):
+    started = asyncio.Event()
+    cancelled: list[str] = []
+
+    async def invoke(function_call: FunctionCallContent):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(function_call.id)
+            raise
+
+    scheduler = ToolCallScheduler(return_on_terminate=return_on_terminate, max_concurrency=1)
+    chat_history = ChatHistory()
+    task = asyncio.ensure_future(scheduler.invoke_function_calls(function_calls("a-f", "a-f"), invoke, chat_history))
+    await started.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cancelled == ["call_0"]
+    assert chat_history.messages == []
+
+
+@pytest.mark.asyncio
+async def test_terminate_waits_for_all_calls_by_default():
+    recorder = Recorder(terminate={"stop-f"})
+
+    results = await ToolCallScheduler().invoke_function_calls(
+        function_calls("a-f", "stop-f"), recorder.invoke, ChatHistory()
+    )
+
+    assert [result.terminate for result in results] == [False, True]
+    assert len(recorder.finished) == 2
+
+
+@pytest.mark.asyncio
+async def test_exception_is_raised():
+    async def fail(function_call: FunctionCallContent):
+        raise ValueError("failed")
+
+    for scheduler in [ToolCallScheduler(), ToolCallScheduler(return_on_terminate=True)]:
+        with pytest.raises(ValueError, match="failed"):
+            await scheduler.invoke_function_calls(function_calls("a-f"), fail, ChatHistory())
+
+
+def chunk(*items: FunctionCallContent, finish_reason: FinishReason | None = None) -> StreamingChatMessageContent:
+    return StreamingChatMessageContent(
+        role=AuthorRole.ASSISTANT, choice_index=0, items=list(items), finish_reason=finish_reason
+    )
+
+
+class StreamRecorder:
+    """Invokes tool calls like Kernel.invoke_function_call, recording how many chunks had streamed at the start."""
+
+    def __init__(self, terminate: set[str] | None = None):
+        self.terminate = terminate or set()
+        self.chunks = 0
+        self.started: dict[str, int] = {}
+        self.counts: dict[str, int] = {}
+        self.arguments: dict[str, object] = {}
+
+    async def invoke(self, function_call: FunctionCallContent, chat_history: ChatHistory, function_call_count: int):
+        self.started[function_call.id] = self.chunks
+        self.counts[function_call.id] = function_call_count
+        self.arguments[function_call.id] = function_call.parse_arguments()
+        await asyncio.sleep(0.01)
+        frc = FunctionResultContent.from_function_call_content_and_result(function_call, "done")
+        chat_history.add_message(message=frc.to_chat_message_content())
+        return MagicMock(terminate=function_call.name in self.terminate)
+
+    async def stream(self, tracker, chunks: list[StreamingChatMessageContent]) -> None:
+        for message in chunks:
+            self.chunks += 1
+            tracker.add(message)
+            await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_tracker_dispatches_calls_while_streaming():
+    recorder = StreamRecorder()
+    chat_history = ChatHistory()
+    chat_history.add_user_message("hello")
+    scheduler = ToolCallScheduler(dispatch_while_streaming=True)
+    tracker = scheduler.track_stream(recorder.invoke, chat_history)
+    chunks = [
+        chunk(FunctionCallContent(id="call_0", index=0, name="p-f", arguments='{"a": ')),
+        chunk(FunctionCallContent(index=0, arguments="1}")),
+        chunk(FunctionCallContent(id="call_1", index=1, name="p-f", arguments='{"b": 2}')),
+        chunk(FunctionCallContent(id="call_2", index=2, name="p-f", arguments="")),
+        chunk(finish_reason=FinishReason.TOOL_CALLS),
+    ]
+
+    await recorder.stream(tracker, chunks)
+    # the service would add the combined response before finishing
+    chat_history.add_message(message=StreamingChatMessageContent(role=AuthorRole.ASSISTANT, choice_index=0, items=[]))
+    calls = [
+        FunctionCallContent(id="call_0", index=0, name="p-f", arguments='{"a": 1}'),
+        FunctionCallContent(id="call_1", index=1, name="p-f", arguments='{"b": 2}'),
+        FunctionCallContent(id="call_2", index=2, name="p-f", arguments="{}"),
+    ]
+    results = await tracker.finish(calls)
+
+    assert len(results) == 3
+    assert tracker.dispatched == 3
+    # each call starts when the next one starts, the last one when the finish reason arrives
+    assert recorder.started == {"call_0": 3, "call_1": 4, "call_2": 5}
+    assert recorder.counts == {"call_0": 2, "call_1": 3, "call_2": 3}
+    assert recorder.arguments == {"call_0": {"a": 1}, "call_1": {"b": 2}, "call_2": {}}
+    assert [message.role for message in chat_history.messages] == [
+        AuthorRole.USER,
+        AuthorRole.ASSISTANT,
+        AuthorRole.TOOL,
+        AuthorRole.TOOL,
+        AuthorRole.TOOL,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tracker_waits_for_incomplete_arguments():
+    recorder = StreamRecorder()
+    tracker = ToolCallScheduler().track_stream(recorder.invoke, ChatHistory())
+
+    await recorder.stream(
+        tracker,
+        [
+            chunk(FunctionCallContent(id="call_0", index=0, name="p-f", arguments='{"a": ')),
+            chunk(FunctionCallContent(id="call_1", index=1, name="p-f", arguments="{}")),
+        ],
+    )
+    assert tracker.dispatched == 0
+
+    results = await tracker.finish([
+        FunctionCallContent(id="call_0", index=0, name="p-f", arguments='{"a": 1}'),
+        FunctionCallContent(id="call_1", index=1, name="p-f", arguments="{}"),
+    ])
+
+    assert len(results) == 2
+    assert recorder.arguments == {"call_0": {"a": 1}, "call_1": {}}
+
+
+@pytest.mark.asyncio
+async def test_tracker_without_index_uses_the_id():
+    recorder = StreamRecorder()
+    tracker = ToolCallScheduler().track_stream(recorder.invoke, ChatHistory())
+
+    await recorder.stream(
+        tracker,
+        [
+            chunk(FunctionCallContent(id="f_0", name="p-f", arguments={"a": 1})),
+            chunk(FunctionCallContent(id="g_0", name="p-g", arguments={"b": 2}), finish_reason=FinishReason.STOP),
+        ],
+    )
+
+    assert recorder.started == {"f_0": 2, "g_0": 2}
+
+
+@pytest.mark.asyncio
+async def test_tracker_return_on_terminate_and_cancel():
+    recorder = StreamRecorder(terminate={"p-stop"})
+    scheduler = ToolCallScheduler(return_on_terminate=True)
+    tracker = scheduler.track_stream(recorder.invoke, ChatHistory())
+    calls = [
+        FunctionCallContent(id="call_0", index=0, name="p-stop", arguments="{}"),
+        FunctionCallContent(id="call_1", index=1, name="p-f", arguments="{}"),
+    ]
+
+    await recorder.stream(tracker, [chunk(*calls, finish_reason=FinishReason.TOOL_CALLS)])
+    results = await tracker.finish(calls)
+
+    assert results[0].terminate
+    assert recorder.started == {"call_0": 1, "call_1": 1}
+
+    tracker = scheduler.track_stream(recorder.invoke, ChatHistory())
+    tracker.add(chunk(*calls, finish_reason=FinishReason.TOOL_CALLS))
+    tracker.cancel()
+    await asyncio.sleep(0.05)
+    assert all(task.cancelled() for task in tracker._tasks.values())
+
+
+@pytest.mark.asyncio
+async def test_tracker_cancelled_caller_does_not_add_results():
+    recorder = StreamRecorder()
+    chat_history = ChatHistory()
+    chat_history.add_user_message("hello")
+    tracker = ToolCallScheduler(return_on_terminate=True).track_stream(recorder.invoke, chat_history)
+    calls = [
+        FunctionCallContent(id="call_0", index=0, name="p-f", arguments="{}"),
+        FunctionCallContent(id="call_1", index=1, name="p-f", arguments="{}"),
+    ]
+    tracker.add(chunk(*calls, finish_reason=FinishReason.TOOL_CALLS))
+
+    task = asyncio.ensure_future(tracker.finish(calls))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert [message.role for message in chat_history.messages] == [AuthorRole.USER]
+    assert all(task.cancelled() for task in tracker._tasks.values())
+
+
+def test_function_choice_behavior_from_dict():
+    behavior = FunctionChoiceBehavior.from_dict({
+        "type": "auto",
+        "tool_call_scheduler": {"max_concurrency": 2, "timeout": 30, "return_on_terminate": True},
+    })
+
+    assert behavior.tool_call_scheduler.max_concurrency == 2
+    assert behavior.tool_call_scheduler.timeout == 30
+    assert behavior.tool_call_scheduler.return_on_terminate
+    assert FunctionChoiceBehavior.Auto().tool_call_scheduler == ToolCallScheduler()
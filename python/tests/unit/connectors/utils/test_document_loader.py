@@ -3,9 +3,10 @@
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from httpx import AsyncClient, HTTPStatusError, RequestError
+from httpx import AsyncClient, HTTPStatusError, MockTransport, Request, RequestError, Response
 
 from semantic_kernel.connectors.utils.document_loader import DocumentLoader
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
 from semantic_kernel.exceptions import ServiceInvalidRequestError
 from semantic_kernel.utils.telemetry.user_agent import HTTP_USER_AGENT
 
@@ -106,3 +107,36 @@ async def test_from_uri_general_exception(mock_get, http_client):
     with pytest.raises(ServiceInvalidRequestError, match="An unexpected error occurred while getting the document."):
         await DocumentLoader.from_uri(url, http_client, None)
     mock_get.assert_awaited_once_with(url, headers={"User-Agent": HTTP_USER_AGENT})
+
+
+@pytest.mark.asyncio
+async def test_from_uri_uses_pooled_client():
+    def handler(request):
+        return Response(200, text=f"Document from {request.url.host}")
+
+    pool = HttpClientPool(transport=MockTransport(handler))
+
+    result = await DocumentLoader.from_uri("https://example.com/document", http_client_pool=pool)
+
+    assert result == "Document from example.com"
+    assert not pool.get_client("https://example.com").is_closed
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_from_uri_with_auth_callback_does_not_use_pooled_client():
+    pool = HttpClientPool(transport=MockTransport(lambda request: Response(200, text="pooled")))
+    clients = []
+
+    def auth_callback(client, url):
+        clients.append(client)
+
+    with patch("httpx.AsyncClient.get", return_value=Response(200, text="new client", request=Request("GET", "x"))):
+        result = await DocumentLoader.from_uri(
+            "https://example.com/document", None, auth_callback, http_client_pool=pool
+        )
+
+    assert result == "new client"
+    assert clients[0] is not pool.get_client("https://example.com")
+    assert clients[0].is_closed
+    await pool.close()
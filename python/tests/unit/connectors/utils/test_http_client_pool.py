@@ -0,0 +1,60 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+
+import httpx
+import pytest
+
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
+
+
+def test_init():
+    pool = HttpClientPool(max_connections=10, max_keepalive_connections=5, keepalive_expiry=5.0, http2=False)
+    assert pool.limits == httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=5.0)
+    assert not pool.http2
+
+
+@pytest.mark.asyncio
+async def test_get_client_per_host():
+    pool = HttpClientPool(http2=False)
+    client = pool.get_client("https://example.com/a")
+    assert pool.get_client("https://example.com/b?c=d") is client
+    assert pool.get_client("http://example.com/a") is not client
+    assert pool.get_client("https://other.example.com/a") is not client
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_close():
+    async with HttpClientPool(http2=False) as pool:
+        client = pool.get_client("https://example.com")
+    assert client.is_closed
+    new_client = pool.get_client("https://example.com")
+    assert new_client is not client
+    await pool.close()
+
+
+def test_get_client_per_event_loop():
+    pool = HttpClientPool(http2=False)
+
+    async def get_client() -> httpx.AsyncClient:
+        return pool.get_client("https://example.com")
+
+    assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+
+@pytest.mark.asyncio
+async def test_cookies_of_responses_are_not_stored():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, headers={"Set-Cookie": "session=tenantA; Path=/"})
+
+    async with HttpClientPool(transport=httpx.MockTransport(handler), cookies={"consent": "yes"}) as pool:
+        client = pool.get_client("https://example.com")
+        await client.get("https://example.com/a")
+        await client.get("https://example.com/b")
+
+    assert [request.headers.get("Cookie") for request in requests] == ["consent=yes", "consent=yes"]
+    assert "session" not in client.cookies
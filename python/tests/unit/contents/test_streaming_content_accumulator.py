@@ -0,0 +1,132 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from functools import reduce
+
+import pytest
+
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.streaming_content_accumulator import StreamingContentAccumulator
+from semantic_kernel.contents.streaming_text_content import StreamingTextContent
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.contents.utils.finish_reason import FinishReason
+from semantic_kernel.exceptions import ContentAdditionException
+
+
+def tool_call_stream() -> list[StreamingChatMessageContent]:
+    chunks = [StreamingChatMessageContent(choice_index=0, role=AuthorRole.ASSISTANT, content="Let me ")]
+    chunks.append(StreamingChatMessageContent(choice_index=0, role=AuthorRole.ASSISTANT, content="check."))
+    for index, (id, name) in enumerate([("call_1", "math-Add"), ("call_2", "time-Now")]):
+        chunks.append(
+            StreamingChatMessageContent(
+                choice_index=0,
+                role=AuthorRole.ASSISTANT,
+                items=[FunctionCallContent(id=id, index=index, name=name, arguments="")],
+                inner_content=f"chunk-{id}",
+            )
+        )
+        for fragment in ['{"a', '": 1', ', "b": ', "2}"]:
+            chunks.append(
+                StreamingChatMessageContent(
+                    choice_index=0,
+                    role=AuthorRole.ASSISTANT,
+                    items=[FunctionCallContent(index=index, arguments=fragment)],
+                )
+            )
+    chunks.append(
+        StreamingChatMessageContent(
+            choice_index=0, role=AuthorRole.ASSISTANT, items=[], finish_reason=FinishReason.TOOL_CALLS
+        )
+    )
+    return chunks
+
+
+def test_combine_matches_add():
+    expected = reduce(lambda x, y: x + y, tool_call_stream())
+    combined = StreamingContentAccumulator.combine(tool_call_stream())
+
+    assert isinstance(combined, StreamingChatMessageContent)
+    assert combined.content == expected.content == "Let me check."
+    assert combined.finish_reason == expected.finish_reason == FinishReason.TOOL_CALLS
+    assert combined.inner_content == expected.inner_content
+    function_calls = [item for item in combined.items if isinstance(item, FunctionCallContent)]
+    expected_calls = [item for item in expected.items if isinstance(item, FunctionCallContent)]
+    assert [(fc.id, fc.name, fc.arguments) for fc in function_calls] == [
+        (fc.id, fc.name, fc.arguments) for fc in expected_calls
+    ]
+    assert function_calls[1].parse_arguments() == {"a": 1, "b": 2}
+
+
+def test_combine_does_not_mutate_chunks():
+    chunks = tool_call_stream()
+    StreamingContentAccumulator.combine(chunks)
+    assert chunks[0].content == "Let me "
+    assert chunks[0].inner_content is None
+
+
+def test_combine_empty_and_single():
+    assert StreamingContentAccumulator.combine([]) is None
+    message = StreamingChatMessageContent(choice_index=0, role=AuthorRole.USER, content="Hello")
+    assert StreamingContentAccumulator.combine([message]) is message
+
+
+def test_combine_streaming_text_content():
+    combined = StreamingContentAccumulator.combine([
+        StreamingTextContent(choice_index=0, text="Hello, "),
+        StreamingTextContent(choice_index=0, text="world!"),
+    ])
+    assert isinstance(combined, StreamingTextContent)
+    assert combined.text == "Hello, world!"
+
+
+def test_combine_dict_arguments():
+    combined = StreamingContentAccumulator.combine([
+        StreamingChatMessageContent(
+            choice_index=0, role=AuthorRole.ASSISTANT, items=[FunctionCallContent(id="1", name="f", arguments={"a": 1})]
+        ),
+        StreamingChatMessageContent(
+            choice_index=0, role=AuthorRole.ASSISTANT, items=[FunctionCallContent(id="1", arguments={"b": 2})]
+        ),
+    ])
+    assert combined.items[0].arguments == {"a": 1, "b": 2}
+
+
+@pytest.mark.parametrize(
+    "items1, items2",
+    [
+        ([StreamingTextContent(choice_index=0, text="Hello, ")], [FunctionResultContent(id="t", name="t", result="t")]),
+        ([FunctionCallContent(id="test1", name="test")], [FunctionCallContent(id="test2", name="test")]),
+        ([StreamingTextContent(text="Hello, ", choice_index=0)], [StreamingTextContent(text="world!", choice_index=1)]),
+        (
+            [StreamingTextContent(text="Hello, ", choice_index=0, encoding="utf-8")],
+            [StreamingTextContent(text="world!", choice_index=0, encoding="utf-16")],
+        ),
+    ],
+    ids=["different_types", "different_fccs", "different_text_content_choice_index", "different_text_content_encoding"],
+)
+def test_combine_keeps_different_items_apart(items1, items2):
+    combined = StreamingContentAccumulator.combine([
+        StreamingChatMessageContent(choice_index=0, role=AuthorRole.USER, items=items1),
+        StreamingChatMessageContent(choice_index=0, role=AuthorRole.USER, items=items2),
+    ])
+    assert len(combined.items) == 2
+
+
+@pytest.mark.parametrize(
+    "message2",
+    [
+        StreamingChatMessageContent(choice_index=0, role=AuthorRole.ASSISTANT, content="world!"),
+        StreamingChatMessageContent(choice_index=1, role=AuthorRole.USER, content="world!"),
+        StreamingChatMessageContent(choice_index=0, role=AuthorRole.USER, content="world!", ai_model_id="5678"),
+        StreamingChatMessageContent(choice_index=0, role=AuthorRole.USER, content="world!", encoding="utf-16"),
+        ChatMessageContent(role=AuthorRole.USER, content="world!"),
+    ],
+    ids=["different_roles", "different_index", "different_model", "different_encoding", "different_type"],
+)
+def test_add_exception(message2):
+    accumulator = StreamingContentAccumulator()
+    accumulator.add(StreamingChatMessageContent(choice_index=0, role=AuthorRole.USER, content="Hello, "))
+    with pytest.raises(ContentAdditionException):
+        accumulator.add(message2)
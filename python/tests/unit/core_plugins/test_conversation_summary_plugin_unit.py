@@ -45,3 +45,26 @@ async def test_summarize_conversation(kernel: Kernel):
     await kernel.invoke(plugin_name="summarizer", function_name="SummarizeConversation", arguments=args)
     args["summary"] == "Hello world"
     service.get_chat_message_contents.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_summarize_long_conversation_hierarchically(kernel: Kernel):
+    service = AsyncMock(spec=ChatCompletionClientBase)
+    service.service_id = "default"
+    service.get_chat_message_contents = AsyncMock(
+        return_value=[ChatMessageContent(role="assistant", content="Hello World!")]
+    )
+    service.get_prompt_execution_settings_class = Mock(return_value=PromptExecutionSettings)
+    kernel.add_service(service)
+    config = PromptTemplateConfig(
+        name="test", description="test", execution_settings={"default": PromptExecutionSettings()}
+    )
+    kernel.add_plugin(ConversationSummaryPlugin(config, reduce_batch_size=4), "summarizer")
+    transcript = "\n".join(f"Speaker {i % 3}: this is line number {i} of a long meeting." for i in range(2_000))
+    args = KernelArguments(input=transcript)
+
+    await kernel.invoke(plugin_name="summarizer", function_name="SummarizeConversation", arguments=args)
+
+    assert args["summary"] == "Hello World!"
+    assert args["input"] == transcript
+    assert service.get_chat_message_contents.await_count > 1
@@ -1,15 +1,34 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import json
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from semantic_kernel import Kernel
+from semantic_kernel.connectors.utils.http_client_pool import HttpClientPool
 from semantic_kernel.core_plugins.http_plugin import HttpPlugin
 from semantic_kernel.exceptions import FunctionExecutionException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 
 
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def plugin(requests: list[httpx.Request]) -> HttpPlugin:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, text=f"Hello {request.method}")
+
+    return HttpPlugin(http_client_pool=HttpClientPool(transport=httpx.MockTransport(handler)))
+
+
 @pytest.mark.asyncio
 async def test_it_can_be_instantiated():
     plugin = HttpPlugin()
@@ -27,15 +46,17 @@ async def test_it_can_be_imported():
     assert kernel.get_function(plugin_name="http", function_name="postAsync") is not None
 
 
-@patch("aiohttp.ClientSession.get")
 @pytest.mark.asyncio
-async def test_get(mock_get):
-    mock_get.return_value.__aenter__.return_value.text.return_value = "Hello"
-    mock_get.return_value.__aenter__.return_value.status = 200
-
-    plugin = HttpPlugin()
+async def test_get(plugin: HttpPlugin, requests: list[httpx.Request]):
     response = await plugin.get("https://example.org/get")
-    assert response == "Hello"
+    assert response == "Hello GET"
+    assert requests[0].method == "GET"
+
+
+@pytest.mark.asyncio
+async def test_get_raises_for_status(plugin: HttpPlugin):
+    with pytest.raises(httpx.HTTPStatusError):
+        await plugin.get("https://example.org/missing")
 
 
 @pytest.mark.asyncio
@@ -43,7 +64,7 @@ async def test_get(mock_get):
 async def test_fail_no_url(method):
     plugin = HttpPlugin()
     with pytest.raises(FunctionExecutionException):
-        await getattr(plugin, method)(url='')
+        await getattr(plugin, method)(url="")
 
 
 @pytest.mark.asyncio
@@ -53,61 +74,67 @@ async def test_get_none_url():
         await plugin.get(None)
 
 
-@patch("aiohttp.ClientSession.post")
 @pytest.mark.asyncio
-async def test_post(mock_post):
-    mock_post.return_value.__aenter__.return_value.text.return_value = "Hello World !"
-    mock_post.return_value.__aenter__.return_value.status = 200
+@pytest.mark.parametrize("method", ["post", "put"])
+@pytest.mark.parametrize("body", [{"message": "Hello, world!"}, None])
+async def test_send_body(plugin: HttpPlugin, requests: list[httpx.Request], method: str, body):
+    arguments = KernelArguments(url=f"https://example.org/{method}")
+    if body is not None:
+        arguments["body"] = body
+    response = await getattr(plugin, method)(**arguments)
+    assert response == f"Hello {method.upper()}"
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert json.loads(requests[0].content) == (body if body is not None else {})
 
-    plugin = HttpPlugin()
-    arguments = KernelArguments(url="https://example.org/post", body="{message: 'Hello, world!'}")
-    response = await plugin.post(**arguments)
-    assert response == "Hello World !"
 
-
-@patch("aiohttp.ClientSession.post")
 @pytest.mark.asyncio
-async def test_post_nobody(mock_post):
-    mock_post.return_value.__aenter__.return_value.text.return_value = "Hello World !"
-    mock_post.return_value.__aenter__.return_value.status = 200
+async def test_delete(plugin: HttpPlugin, requests: list[httpx.Request]):
+    response = await plugin.delete(url="https://example.org/delete")
+    assert response == "Hello DELETE"
+    assert requests[0].method == "DELETE"
 
-    plugin = HttpPlugin()
-    arguments = KernelArguments(url="https://example.org/post")
-    response = await plugin.post(**arguments)
-    assert response == "Hello World !"
+
+@pytest.mark.asyncio
+async def test_requests_reuse_the_pooled_client(plugin: HttpPlugin):
+    await plugin.get("https://example.org/get")
+    client = plugin.http_client_pool.get_client("https://example.org/other")
+    await plugin.delete("https://example.org/delete")
+    assert plugin.http_client_pool.get_client("https://example.org") is client
+    await plugin.http_client_pool.close()
+    assert client.is_closed
 
 
-@patch("aiohttp.ClientSession.put")
 @pytest.mark.asyncio
-async def test_put(mock_put):
-    mock_put.return_value.__aenter__.return_value.text.return_value = "Hello World !"
-    mock_put.return_value.__aenter__.return_value.status = 200
+async def test_without_pool_a_client_is_created_per_request():
+    clients: list[httpx.AsyncClient] = []
 
-    plugin = HttpPlugin()
-    arguments = KernelArguments(url="https://example.org/put", body="{message: 'Hello, world!'}")
-    response = await plugin.put(**arguments)
-    assert response == "Hello World !"
+    class Client(httpx.AsyncClient):
+        def __init__(self, **kwargs):
+            super().__init__(transport=httpx.MockTransport(lambda request: httpx.Response(200, text="Hello")), **kwargs)
+            clients.append(self)
+
+    with patch("semantic_kernel.core_plugins.http_plugin.httpx.AsyncClient", Client):
+        assert await HttpPlugin().get("https://example.org/get") == "Hello"
+        assert await HttpPlugin().get("https://example.org/get") == "Hello"
+
+    assert len(clients) == 2
+    assert all(client.is_closed for client in clients)
 
 
-@patch("aiohttp.ClientSession.put")
 @pytest.mark.asyncio
-async def test_put_nobody(mock_put):
-    mock_put.return_value.__aenter__.return_value.text.return_value = "Hello World !"
-    mock_put.return_value.__aenter__.return_value.status = 200
+async def test_follows_redirects():
+    requests: list[httpx.Request] = []
 
-    plugin = HttpPlugin()
-    arguments = KernelArguments(url="https://example.org/put")
-    response = await plugin.put(**arguments)
-    assert response == "Hello World !"
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/old":
+            return httpx.Response(302, headers={"Location": "https://example.org/new"})
+        return httpx.Response(200, text=f"Hello {request.url.path}")
 
+    plugin = HttpPlugin(http_client_pool=HttpClientPool(transport=httpx.MockTransport(handler)))
 
-@patch("aiohttp.ClientSession.delete")
-@pytest.mark.asyncio
-async def test_delete(mock_delete):
-    mock_delete.return_value.__aenter__.return_value.text.return_value = "Hello World !"
-    mock_delete.return_value.__aenter__.return_value.status = 200
+    response = await plugin.get("https://example.org/old")
 
-    plugin = HttpPlugin()
-    arguments = KernelArguments(url="https://example.org/delete")
-    response = await plugin.delete(**arguments)
-    assert response == "Hello World !"
+    assert response == "Hello /new"
+    assert [request.url.path for request in requests] == ["/old", "/new"]
+    assert requests[0].extensions["timeout"] == {"connect": 30.0, "read": 300.0, "write": 300.0, "pool": 300.0}
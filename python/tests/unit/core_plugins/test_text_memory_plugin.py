@@ -2,11 +2,12 @@
 
 
 from numpy import array
-from pytest import fixture, mark
+from pytest import fixture, mark, raises
 
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
 from semantic_kernel.core_plugins.text_memory_plugin import TextMemoryPlugin
+from semantic_kernel.exceptions import FunctionExecutionException
 from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
 from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
 
@@ -74,3 +75,27 @@ async def test_can_recall_no_result(memory: SemanticTextMemory):
     text_plugin = TextMemoryPlugin(memory)
     result = await text_plugin.recall(ask="hello world")
     assert result == ""
+
+
+@mark.asyncio
+async def test_can_save_batch(kernel: Kernel):
+    class RowEmbeddings(EmbeddingGeneratorBase):
+        async def generate_embeddings(self, texts, **kwargs):
+            return array([[float(len(text)), 1.0] for text in texts])
+
+    memory = SemanticTextMemory(VolatileMemoryStore(), RowEmbeddings(service_id="embed", ai_model_id="mock"))
+    kernel.add_plugin(TextMemoryPlugin(memory), "memory_plugin")
+    result = await kernel.invoke(
+        function_name="save_batch",
+        plugin_name="memory_plugin",
+        items='[{"key": "1", "text": "hello"}, {"key": "2", "text": "world"}]',
+    )
+    assert str(result) == "2"
+    assert memory._storage._store["generic"]["2"].text == "world"
+
+
+@mark.asyncio
+@mark.parametrize("items", ['[{"key": "1"}]', '{"key": "1", "text": "hello"}', '["hello"]', "not json"])
+async def test_save_batch_with_invalid_items(memory: SemanticTextMemory, items: str):
+    with raises(FunctionExecutionException, match="items must be a JSON array"):
+        await TextMemoryPlugin(memory).save_batch(items)
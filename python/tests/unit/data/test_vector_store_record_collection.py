@@ -7,6 +7,8 @@ import numpy as np
 from pandas import DataFrame
 from pytest import fixture, mark, raises
 
+from semantic_kernel.data.vector_search_options import VectorSearchOptions
+from semantic_kernel.data.vector_search_result import VectorSearchResult
 from semantic_kernel.data.vector_store_record_collection import VectorStoreRecordCollection
 from semantic_kernel.exceptions.memory_connector_exceptions import (
     MemoryConnectorException,
@@ -433,6 +435,23 @@ def test_deserialize_dict_data_model_shortcut(DictVectorStoreRecordCollection, d
     assert record == {"id": "test_id", "content": "test_content", "vector": [1.0, 2.0, 3.0]}
 
 
+def test_deserialize_dict_data_model_skips_deserialize_function_for_none(
+    DictVectorStoreRecordCollection, data_model_type_vector_array
+):
+    vector_store_record_collection = DictVectorStoreRecordCollection(
+        collection_name="test",
+        data_model_type=data_model_type_vector_array,
+    )
+    record = vector_store_record_collection._deserialize_dict_to_data_model(
+        {"id": "test_id", "content": "test_content", "vector": None}
+    )
+    assert record.vector is None
+    record = vector_store_record_collection._deserialize_dict_to_data_model(
+        {"id": "test_id", "content": "test_content", "vector": [1.0, 2.0, 3.0]}
+    )
+    assert isinstance(record.vector, np.ndarray)
+
+
 @mark.asyncio
 @mark.parametrize("vector_store_record_collection", ["type_pydantic"], indirect=True)
 async def test_pydantic_fail(vector_store_record_collection):
@@ -557,3 +576,29 @@ async def test_upsert_with_vectorizing(vector_store_record_collection):
 
 
 # TODO (eavanvalkenburg): pandas container test
+
+
+@mark.asyncio
+async def test_vectorized_search_not_implemented(vector_store_record_collection):
+    with raises(NotImplementedError):
+        await vector_store_record_collection.vectorized_search([1.0, 2.0, 3.0])
+
+
+@mark.asyncio
+async def test_vectorized_search_invalid_options(vector_store_record_collection):
+    with raises(MemoryConnectorException, match="not a vector field"):
+        await vector_store_record_collection.vectorized_search(
+            [1.0, 2.0, 3.0], VectorSearchOptions(vector_field_name="content")
+        )
+    with raises(MemoryConnectorException, match="not a filterable data field"):
+        await vector_store_record_collection.vectorized_search(
+            [1.0, 2.0, 3.0], VectorSearchOptions(filter={"content": "test"})
+        )
+
+
+@mark.asyncio
+async def test_vectorized_search_deserializes_results(vector_store_record_collection):
+    record = {"id": "test_id", "content": "test_content", "vector": None}
+    vector_store_record_collection._inner_vectorized_search = AsyncMock(return_value=[(record, 0.5)])
+    results = await vector_store_record_collection.vectorized_search([1.0, 2.0, 3.0])
+    assert results == [VectorSearchResult(record=record, score=0.5)]
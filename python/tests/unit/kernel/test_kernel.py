@@ -654,6 +654,38 @@ def test_import_plugin_from_openapi(kernel: Kernel):
     assert plugin.functions.get("SetSecret") is not None
 
 
+@patch("semantic_kernel.functions.kernel_plugin.create_functions_from_openapi", return_value=[])
+def test_add_plugin_from_openapi_uses_the_http_client_pool_of_the_kernel(mock_create_functions, kernel: Kernel):
+    kernel.add_plugin_from_openapi(plugin_name="default", openapi_document_path="openapi.yaml")
+    settings = OpenAIFunctionExecutionParameters(server_url_override="http://localhost")
+    kernel.add_plugin_from_openapi(
+        plugin_name="settings", openapi_document_path="openapi.yaml", execution_settings=settings
+    )
+    client = httpx.AsyncClient()
+    kernel.add_plugin_from_openapi(
+        plugin_name="client",
+        openapi_document_path="openapi.yaml",
+        execution_settings=OpenAIFunctionExecutionParameters(http_client=client),
+    )
+
+    default, with_settings, with_client = (
+        call.kwargs["execution_settings"] for call in mock_create_functions.call_args_list
+    )
+    assert default.http_client_pool is kernel.http_client_pool
+    assert with_settings.http_client_pool is kernel.http_client_pool
+    assert with_settings.server_url_override == "http://localhost"
+    assert settings.http_client_pool is None
+    assert with_client.http_client is client
+    assert with_client.http_client_pool is None
+
+
+@pytest.mark.asyncio
+async def test_close_closes_the_http_client_pool():
+    async with Kernel() as kernel:
+        client = kernel.http_client_pool.get_client("https://example.com")
+    assert client.is_closed
+
+
 def test_get_plugin(kernel: Kernel):
     kernel.add_plugin(KernelPlugin(name="TestPlugin"))
     plugin = kernel.get_plugin("TestPlugin")
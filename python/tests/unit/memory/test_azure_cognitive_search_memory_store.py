@@ -1,13 +1,21 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import json
+import re
 from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pytest
 from azure.core.credentials import AzureKeyCredential
 from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import AsyncHttpTransport
+from azure.core.rest._http_response_impl_async import AsyncHttpResponseImpl
 from azure.search.documents.indexes.models import SearchIndex, SearchResourceEncryptionKey
 
 from semantic_kernel.connectors.memory.azure_cognitive_search import AzureCognitiveSearchMemoryStore
+from semantic_kernel.connectors.memory.azure_cognitive_search.utils import encode_id
+from semantic_kernel.exceptions import MemoryConnectorResourceNotFound
+from semantic_kernel.memory.memory_record import MemoryRecord
 
 
 @pytest.fixture
@@ -78,3 +86,121 @@ async def test_create_collection_with_encryption_key(
     created_index: SearchIndex = args[0]
 
     assert created_index.encryption_key == mock_encryption_key, "Encryption key was not set correctly"
+
+
+class MockTransport(AsyncHttpTransport):
+    """A transport that records the requests and answers them with the documents in an index."""
+
+    def __init__(self, documents: list[dict] | None = None):
+        self.documents = documents or []
+        self.requests: list = []
+        self.opened = 0
+        self.closed = 0
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def open(self):
+        self.opened += 1
+
+    async def close(self):
+        self.closed += 1
+
+    async def send(self, request, **kwargs):
+        self.requests.append(request)
+        if "docs/search.post.search" in request.url:
+            body = json.loads(request.body)
+            ids = re.search(r"search\.in\(Id, '([^']*)', ','\)", body["filter"]).group(1).split(",")
+            content = {"value": [{**doc, "@search.score": 1.0} for doc in self.documents if doc["Id"] in ids]}
+        else:
+            actions = json.loads(request.body)["value"]
+            content = {"value": [{"key": action["Id"], "status": True, "statusCode": 200} for action in actions]}
+        response = AsyncHttpResponseImpl(
+            request=request,
+            internal_response=None,
+            status_code=200,
+            headers={"Content-Type": "application/json"},
+            reason="OK",
+            content_type="application/json",
+            stream_download_generator=None,
+        )
+        response._content = json.dumps(content).encode()
+        response._is_closed = True
+        return response
+
+
+def search_document(key: str) -> dict:
+    return {
+        "Id": encode_id(key),
+        "Text": f"text {key}",
+        "ExternalSourceName": "",
+        "Description": "",
+        "AdditionalMetadata": "",
+        "IsReference": False,
+    }
+
+
+@pytest.fixture
+def mock_transport():
+    return MockTransport(documents=[search_document(key) for key in ["a", "b", "c"]])
+
+
+@pytest.fixture
+def store_with_transport(azure_ai_search_unit_test_env, mock_transport):
+    return AzureCognitiveSearchMemoryStore(
+        1536,
+        "https://test.search.windows.net",
+        azure_credentials=AzureKeyCredential("test_key"),
+        transport=mock_transport,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_batch_uses_one_search_request(store_with_transport, mock_transport):
+    records = await store_with_transport.get_batch("TestIndex", ["c", "a"])
+
+    assert [record._id for record in records] == ["c", "a"]
+    assert [record._text for record in records] == ["text c", "text a"]
+    assert len(mock_transport.requests) == 1
+    assert "/indexes('testindex')/docs/search.post.search" in mock_transport.requests[0].url
+
+
+@pytest.mark.asyncio
+async def test_get_batch_raises_for_missing_record(store_with_transport):
+    with pytest.raises(MemoryConnectorResourceNotFound):
+        await store_with_transport.get_batch("testindex", ["a", "missing"])
+
+
+@pytest.mark.asyncio
+async def test_remove_batch_uses_one_delete_request(store_with_transport, mock_transport):
+    await store_with_transport.remove_batch("testindex", ["a", "b"])
+
+    assert len(mock_transport.requests) == 1
+    actions = json.loads(mock_transport.requests[0].body)["value"]
+    assert actions == [
+        {"@search.action": "delete", "Id": encode_id("a")},
+        {"@search.action": "delete", "Id": encode_id("b")},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_clients_are_cached_and_share_the_transport(store_with_transport, mock_transport):
+    record = MemoryRecord.local_record(id="d", text="text d", description=None, additional_metadata=None, embedding=[])
+    record._embedding = np.array([0.1, 0.2])
+
+    await store_with_transport.upsert("testindex", record)
+    await store_with_transport.get_batch("testindex", ["a"])
+    await store_with_transport.remove("testindex", "a")
+
+    assert list(store_with_transport._search_clients) == ["testindex"]
+    assert len(mock_transport.requests) == 3
+    assert mock_transport.closed == 0
+
+    await store_with_transport.close()
+
+    assert store_with_transport._search_clients == {}
+    assert mock_transport.closed == 1
@@ -0,0 +1,121 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from unittest.mock import AsyncMock, patch
+
+from numpy import array
+from pytest import fixture, mark, raises
+
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.memory.memory_ingestion import MemoryInformation, MemoryReference
+from semantic_kernel.memory.null_memory import NullMemory
+from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+
+class CountingEmbeddings(EmbeddingGeneratorBase):
+    calls: list[list[str]] = []
+
+    async def generate_embeddings(self, texts, settings=None, **kwargs):
+        self.calls.append(list(texts))
+        return array([[float(len(text)), 1.0] for text in texts])
+
+
+@fixture
+def embeddings() -> CountingEmbeddings:
+    return CountingEmbeddings(service_id="embed", ai_model_id="mock", calls=[])
+
+
+@fixture
+def store() -> VolatileMemoryStore:
+    return VolatileMemoryStore()
+
+
+@fixture
+def memory(store: VolatileMemoryStore, embeddings: CountingEmbeddings) -> SemanticTextMemory:
+    return SemanticTextMemory(store, embeddings)
+
+
+@mark.asyncio
+async def test_save_information_batch(memory: SemanticTextMemory, store, embeddings):
+    items = [MemoryInformation(id=str(i), text="x" * i, description=f"item {i}") for i in range(1, 6)]
+
+    with patch.object(store, "upsert_batch", wraps=store.upsert_batch) as upsert_batch:
+        stats = await memory.save_information_batch("test", items, batch_size=2)
+
+    assert embeddings.calls == [["x", "xx"], ["xxx", "xxxx"], ["xxxxx"]]
+    assert upsert_batch.call_count == 3
+    assert stats.items == 5
+    assert stats.batches == 3
+    assert stats.seconds > 0
+    assert stats.items_per_second > 0
+    record = await store.get("test", "3", with_embedding=True)
+    assert record.text == "xxx"
+    assert record.description == "item 3"
+    assert list(record.embedding) == [3.0, 1.0]
+
+
+@mark.asyncio
+async def test_save_references_batch_from_async_iterable(memory: SemanticTextMemory, store, embeddings):
+    async def references():
+        for i in range(3):
+            yield MemoryReference(external_id=f"ref-{i}", external_source_name="docs", text=f"text {i}")
+
+    stats = await memory.save_references_batch("refs", references(), batch_size=10)
+
+    assert embeddings.calls == [["text 0", "text 1", "text 2"]]
+    assert stats.items == 3
+    assert stats.batches == 1
+    record = await store.get("refs", "ref-1")
+    assert record._is_reference
+    assert record._external_source_name == "docs"
+
+
+@mark.asyncio
+async def test_empty_batch(memory: SemanticTextMemory, store, embeddings):
+    stats = await memory.save_information_batch("test", [])
+
+    assert stats.items == 0
+    assert stats.items_per_second == 0.0
+    assert embeddings.calls == []
+    assert await store.does_collection_exist("test")
+
+
+@mark.asyncio
+async def test_known_collections_are_checked_once(memory: SemanticTextMemory, store):
+    with patch.object(store, "does_collection_exist", AsyncMock(return_value=False)) as exists:
+        await memory.save_information("test", "hello", "1")
+        await memory.save_information("test", "world", "2")
+        await memory.save_information_batch("test", [MemoryInformation(id="3", text="batch")])
+
+    exists.assert_awaited_once_with(collection_name="test")
+    assert len(await store.get_batch("test", ["1", "2", "3"])) == 3
+
+
+@mark.asyncio
+async def test_deleted_collection_is_created_again(memory: SemanticTextMemory, store):
+    await memory.save_information("test", "hello", "1")
+    await store.delete_collection("test")
+    await memory.save_reference("test", "world", "2", "docs")
+    await store.delete_collection("test")
+    await memory.save_information_batch("test", [MemoryInformation(id="3", text="batch")])
+
+    assert [record._id for record in await store.get_batch("test", ["1", "2", "3"])] == ["3"]
+    await memory.save_information("test", "again", "4")
+    assert len(await store.get_batch("test", ["3", "4"])) == 2
+
+
+@mark.asyncio
+async def test_failed_upsert_is_raised(memory: SemanticTextMemory, store):
+    items = [MemoryInformation(id=str(i), text="text") for i in range(4)]
+
+    with (
+        patch.object(store, "upsert_batch", AsyncMock(side_effect=ValueError("failed"))),
+        raises(ValueError, match="failed"),
+    ):
+        await memory.save_information_batch("test", items, batch_size=2)
+
+
+@mark.asyncio
+async def test_null_memory_batch():
+    stats = await NullMemory().save_information_batch("test", [MemoryInformation(id="1", text="text")])
+    assert stats.items == 0
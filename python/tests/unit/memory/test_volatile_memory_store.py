@@ -3,7 +3,9 @@
 import numpy as np
 from pytest import mark, raises
 
+from semantic_kernel.exceptions import ServiceInvalidRequestError
 from semantic_kernel.memory import VolatileMemoryStore
+from semantic_kernel.memory.memory_record import MemoryRecord
 
 
 @mark.asyncio
@@ -51,3 +53,100 @@ async def test_cosine_similarity_partial_zero_collection():
     expected_scores = np.array([1.0, -1.0])
     scores = volatile_memory_store.compute_similarity_scores(query_embedding, collection_embeddings)
     assert np.allclose(expected_scores, scores)
+
+
+def _record(id: str, embedding: list[float]) -> MemoryRecord:
+    return MemoryRecord.local_record(
+        id=id, text=f"text {id}", description=None, additional_metadata=None, embedding=np.array(embedding)
+    )
+
+
+@mark.asyncio
+async def test_get_nearest_matches_top_k():
+    store = VolatileMemoryStore()
+    await store.create_collection("test")
+    await store.upsert_batch(
+        "test",
+        [
+            _record("a", [1, 0, 0]),
+            _record("b", [1, 1, 0]),
+            _record("c", [0, 1, 0]),
+            _record("d", [0, 0, 0]),
+        ],
+    )
+
+    results = await store.get_nearest_matches("test", np.array([1, 0, 0]), limit=2, min_relevance_score=0.0)
+
+    assert [record._id for record, _ in results] == ["a", "b"]
+    np.testing.assert_allclose([score for _, score in results], [1.0, np.sqrt(0.5)], rtol=1e-6)
+    assert all(record._embedding is None for record, _ in results)
+    assert (await store.get("test", "a", with_embedding=True))._embedding is not None
+
+
+@mark.asyncio
+async def test_get_nearest_matches_min_relevance_and_with_embeddings():
+    store = VolatileMemoryStore()
+    await store.create_collection("test")
+    await store.upsert_batch("test", [_record("a", [1, 0]), _record("b", [0, 1]), _record("c", [-1, 0])])
+
+    results = await store.get_nearest_matches(
+        "test", np.array([[1, 0]]), limit=10, min_relevance_score=0.5, with_embeddings=True
+    )
+
+    assert len(results) == 1
+    assert results[0][0]._id == "a"
+    assert results[0][0]._embedding is not None
+
+
+@mark.asyncio
+async def test_get_nearest_matches_after_upsert_and_remove():
+    store = VolatileMemoryStore()
+    await store.create_collection("test")
+    await store.upsert_batch("test", [_record(str(i), [1, i]) for i in range(40)])
+    await store.remove_batch("test", [str(i) for i in range(0, 40, 2)])
+    await store.remove("test", "1")
+    await store.upsert("test", _record("3", [0, 1]))
+    await store.upsert("test", _record("new", [1, 0]))
+
+    results = await store.get_nearest_matches("test", np.array([1, 0]), limit=2)
+    assert len(results) == 2
+    assert results[0][0]._id == "new"
+
+    results = await store.get_nearest_matches("test", np.array([0, 1]), limit=1)
+    assert results[0][0]._id == "3"
+    assert (await store.get_nearest_match("test", np.array([0, 1])))[0]._id == "3"
+
+    all_results = await store.get_nearest_matches("test", np.array([1, 1]), limit=100, min_relevance_score=-1.0)
+    assert sorted(record._id for record, _ in all_results) == sorted([str(i) for i in range(3, 40, 2)] + ["new"])
+
+
+@mark.asyncio
+async def test_get_nearest_matches_empty_and_missing_collection():
+    store = VolatileMemoryStore()
+    await store.create_collection("test")
+
+    assert await store.get_nearest_matches("test", np.array([1, 0]), limit=3) == []
+    assert await store.get_nearest_matches("missing", np.array([1, 0]), limit=3) == []
+
+
+@mark.asyncio
+async def test_get_nearest_matches_batch():
+    store = VolatileMemoryStore()
+    await store.create_collection("test")
+    await store.upsert_batch("test", [_record("a", [1, 0, 0]), _record("b", [0, 1, 0]), _record("c", [0, 0, 1])])
+
+    results = await store.get_nearest_matches_batch(
+        "test", np.array([[0, 0, 2], [0, 3, 0], [1, 0, 0]]), limit=1, min_relevance_score=0.5
+    )
+
+    assert [[record._id for record, _ in matches] for matches in results] == [["c"], ["b"], ["a"]]
+
+
+@mark.asyncio
+async def test_upsert_dimension_mismatch():
+    store = VolatileMemoryStore()
+    await store.create_collection("test")
+    await store.upsert("test", _record("a", [1, 0]))
+
+    with raises(ServiceInvalidRequestError):
+        await store.upsert("test", _record("b", [1, 0, 0]))
@@ -1,5 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 from pytest import mark
 
@@ -10,13 +13,18 @@ from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.function_result_content import FunctionResultContent
 from semantic_kernel.exceptions import HandlebarsTemplateRenderException, HandlebarsTemplateSyntaxError
 from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
 from semantic_kernel.kernel import Kernel
-from semantic_kernel.prompt_template.handlebars_prompt_template import HandlebarsPromptTemplate
+from semantic_kernel.prompt_template.handlebars_prompt_template import (
+    PYBARS_BUILTIN_HELPER_NAMES,
+    PYBARS_BUILTIN_HELPERS,
+    HandlebarsPromptTemplate,
+)
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
 
 
 def create_handlebars_prompt_template(
-    template: str, allow_dangerously_set_content: bool = False
+    template: str, allow_dangerously_set_content: bool = False, enable_async: bool = False
 ) -> HandlebarsPromptTemplate:
     return HandlebarsPromptTemplate(
         prompt_template_config=PromptTemplateConfig(
@@ -26,6 +34,7 @@ def create_handlebars_prompt_template(
             template_format="handlebars",
         ),
         allow_dangerously_set_content=allow_dangerously_set_content,
+        enable_async=enable_async,
     )
 
 
@@ -366,3 +375,117 @@ async def test_helpers_chat_history_not_chat_history(kernel: Kernel):
     chat_history = "this is not a chathistory object"
     rendered = await target.render(kernel, KernelArguments(chat_history=chat_history))
     assert rendered.strip() == ""
+
+
+def test_pybars_builtin_helpers():
+    assert sorted(PYBARS_BUILTIN_HELPERS) == sorted(PYBARS_BUILTIN_HELPER_NAMES)
+    assert all(callable(helper) for helper in PYBARS_BUILTIN_HELPERS.values())
+
+
+class SlowPlugin:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    @kernel_function(name="echo")
+    async def echo(self, value: str) -> str:
+        self.calls.append(value)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.active -= 1
+        return value
+
+    @kernel_function(name="upper")
+    async def upper(self, value: str) -> str:
+        self.calls.append(f"upper {value}")
+        return value.upper()
+
+
+@mark.asyncio
+async def test_enable_async_renders_kernel_functions(kernel: Kernel, decorated_native_function):
+    kernel.add_function(plugin_name="plug", function=decorated_native_function)
+    template = "Function: {{plug-getLightStatus}} {{plug-getLightStatus arg1='other'}}"
+    target = create_handlebars_prompt_template(template, enable_async=True)
+
+    with patch("nest_asyncio.apply") as apply:
+        rendered = await target.render(kernel, KernelArguments(arg1="test"))
+    assert rendered == "Function: test test"
+    apply.assert_not_called()
+
+
+@mark.asyncio
+async def test_enable_async_resolves_calls_concurrently(kernel: Kernel):
+    plugin = SlowPlugin()
+    kernel.add_plugin(plugin, "slow")
+    template = "{{slow-echo value='a'}} {{slow-echo value='b'}} {{slow-echo value='c'}} {{slow-echo value='a'}}"
+    target = create_handlebars_prompt_template(template, enable_async=True)
+
+    rendered = await target.render(kernel)
+
+    assert rendered == "a b c a"
+    assert sorted(plugin.calls) == ["a", "b", "c"]
+    # the three distinct calls ran at the same time, the repeated call is resolved once
+    assert plugin.max_active == 3
+
+
+@mark.asyncio
+async def test_enable_async_resolves_nested_calls(kernel: Kernel):
+    plugin = SlowPlugin()
+    kernel.add_plugin(plugin, "slow")
+    template = "{{set name='greeting' value=(slow-echo value='hi')}}{{slow-upper value=(get 'greeting')}}"
+    target = create_handlebars_prompt_template(template, enable_async=True)
+    arguments = KernelArguments()
+
+    rendered = await target.render(kernel, arguments)
+
+    assert rendered == "HI"
+    assert plugin.calls == ["hi", "upper hi"]
+    assert "greeting" not in arguments
+
+
+class GuardedPlugin:
+    def __init__(self, allowed: str):
+        self.allowed = allowed
+        self.calls: list[str] = []
+
+    @kernel_function(name="check")
+    async def check(self) -> str:
+        self.calls.append("check")
+        return self.allowed
+
+    @kernel_function(name="delete")
+    async def delete(self) -> str:
+        self.calls.append("delete")
+        return "deleted"
+
+    @kernel_function(name="keep")
+    async def keep(self) -> str:
+        self.calls.append("keep")
+        return "kept"
+
+
+@mark.asyncio
+@mark.parametrize(
+    "template",
+    [
+        "{{#if (p-check)}}{{p-delete}}{{else}}{{p-keep}}{{/if}}",
+        "{{#unless (p-check)}}{{p-keep}}{{/unless}}{{#if (p-check)}}{{p-delete}}{{/if}}",
+        "{{set name='allowed' value=(p-check)}}{{#if (get 'allowed')}}{{p-delete}}{{else}}{{p-keep}}{{/if}}",
+        "{{#if (equals (p-check) 'yes')}}{{p-delete}}{{else}}{{p-keep}}{{/if}}",
+    ],
+)
+@mark.parametrize("allowed, expected", [("", "keep"), ("yes", "delete")])
+async def test_enable_async_does_not_invoke_functions_in_branches_that_do_not_run(
+    kernel: Kernel, template: str, allowed: str, expected: str
+):
+    plugin = GuardedPlugin(allowed)
+    kernel.add_plugin(plugin, "p")
+    target = create_handlebars_prompt_template(template, enable_async=True)
+
+    rendered = await target.render(kernel)
+
+    assert rendered == ("deleted" if expected == "delete" else "kept")
+    assert plugin.calls == ["check", expected]
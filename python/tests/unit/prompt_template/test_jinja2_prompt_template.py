@@ -1,5 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import gc
+import weakref
+from unittest.mock import patch
+
 import pytest
 from pytest import mark
 
@@ -10,6 +15,7 @@ from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.function_result_content import FunctionResultContent
 from semantic_kernel.exceptions.template_engine_exceptions import Jinja2TemplateRenderException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
 from semantic_kernel.kernel import Kernel
 from semantic_kernel.prompt_template.jinja2_prompt_template import Jinja2PromptTemplate
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
@@ -359,3 +365,70 @@ async def test_helpers_chat_history_messages_non(kernel: Kernel):
     chat_history = "text instead of a chat_history object"
     rendered = await target.render(kernel, KernelArguments(chat_history=chat_history))
     assert rendered.strip() == ""
+
+
+@mark.asyncio
+async def test_template_is_compiled_once(kernel: Kernel):
+    target = create_jinja2_prompt_template("{{ bar }}")
+    with patch.object(target._env, "from_string", wraps=target._env.from_string) as from_string:
+        assert await target.render(kernel, KernelArguments(bar="Bar")) == "Bar"
+        assert await target.render(kernel, KernelArguments(bar="Baz")) == "Baz"
+    from_string.assert_not_called()
+
+    target.prompt_template_config.template = "{{ bar }}!"
+    assert await target.render(kernel, KernelArguments(bar="Bar")) == "Bar!"
+
+
+@kernel_function(name="getLightStatus")
+def echo(arg1: str) -> str:
+    return arg1
+
+
+@mark.asyncio
+async def test_helpers_are_cached(kernel: Kernel):
+    kernel.add_function(plugin_name="plug", function=echo)
+    target = create_jinja2_prompt_template("{{ plug_getLightStatus() }}")
+
+    assert await target.render(kernel, KernelArguments(arg1="on")) == "on"
+    helpers = target._get_helpers(kernel, False)
+    assert await target.render(kernel, KernelArguments(arg1="off")) == "off"
+    assert target._get_helpers(kernel, False) is helpers
+
+    other_kernel = Kernel()
+    other_kernel.add_function(plugin_name="plug", function=echo)
+    assert await target.render(other_kernel, KernelArguments(arg1="other")) == "other"
+    assert await target.render(kernel, KernelArguments(arg1="on")) == "on"
+
+
+@mark.asyncio
+async def test_helpers_do_not_keep_the_kernel_alive():
+    target = create_jinja2_prompt_template("{{ plug_getLightStatus() }}")
+    kernels: list[weakref.ref[Kernel]] = []
+
+    for index in range(3):
+        kernel = Kernel()
+        kernel.add_function(plugin_name="plug", function=echo)
+        kernels.append(weakref.ref(kernel))
+        assert await target.render(kernel, KernelArguments(arg1=str(index))) == str(index)
+    del kernel
+    gc.collect()
+
+    assert [ref() for ref in kernels] == [None, None, None]
+
+
+@mark.asyncio
+async def test_helpers_are_recreated_when_plugins_change(kernel: Kernel):
+    target = create_jinja2_prompt_template("{% if plug_getLightStatus %}{{ plug_getLightStatus() }}{% endif %}")
+    assert await target.render(kernel, KernelArguments(arg1="on")) == ""
+
+    kernel.add_function(plugin_name="plug", function=echo)
+    assert await target.render(kernel, KernelArguments(arg1="on")) == "on"
+
+
+@mark.asyncio
+async def test_concurrent_renders_use_their_own_arguments(kernel: Kernel):
+    kernel.add_function(plugin_name="plug", function=echo)
+    target = create_jinja2_prompt_template("{{ plug_getLightStatus() }}")
+
+    rendered = await asyncio.gather(*[target.render(kernel, KernelArguments(arg1=str(i))) for i in range(10)])
+    assert rendered == [str(i) for i in range(10)]
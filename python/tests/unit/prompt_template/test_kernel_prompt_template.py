@@ -1,5 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+
 import pytest
 
 from semantic_kernel.exceptions.template_engine_exceptions import TemplateRenderException
@@ -141,3 +143,89 @@ async def test_it_renders_code_error(kernel: Kernel):
     target = create_kernel_prompt_template(template, allow_dangerously_set_content=True)
     with pytest.raises(TemplateRenderException):
         await target.render(kernel, arguments)
+
+
+class ConcurrencyProbe:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+
+    @kernel_function(name="slow")
+    async def slow(self, value: str) -> str:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01 * (3 - int(value)))
+        self.active -= 1
+        return f"<{value}>"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "enable_concurrent_rendering, max_concurrent_blocks, expected_max_active",
+    [(False, None, 1), (True, None, 3), (True, 2, 2)],
+)
+async def test_it_renders_code_blocks_concurrently(
+    kernel: Kernel, enable_concurrent_rendering: bool, max_concurrent_blocks: int | None, expected_max_active: int
+):
+    probe = ConcurrencyProbe()
+    kernel.add_plugin(probe, "probe")
+    target = KernelPromptTemplate(
+        prompt_template_config=PromptTemplateConfig(
+            name="test", description="test", template="a {{probe.slow '0'}} b {{probe.slow '1'}} {{probe.slow '2'}}"
+        ),
+        enable_concurrent_rendering=enable_concurrent_rendering,
+        max_concurrent_blocks=max_concurrent_blocks,
+    )
+
+    result = await target.render(kernel, KernelArguments())
+
+    assert result == "a &lt;0&gt; b &lt;1&gt; &lt;2&gt;"
+    assert probe.max_active == expected_max_active
+
+
+@pytest.mark.asyncio
+async def test_it_renders_code_error_concurrently(kernel: Kernel):
+    @kernel_function(name="function")
+    def my_function() -> str:
+        raise ValueError("Error")
+
+    kernel.add_function("test", KernelFunction.from_method(my_function, "test"))
+    target = KernelPromptTemplate(
+        prompt_template_config=PromptTemplateConfig(name="test", description="test", template="{{test.function}}"),
+        enable_concurrent_rendering=True,
+    )
+    with pytest.raises(TemplateRenderException):
+        await target.render(kernel, KernelArguments())
+
+
+@pytest.mark.asyncio
+async def test_code_error_cancels_the_other_code_blocks(kernel: Kernel):
+    started = asyncio.Event()
+    cancelled: list[str] = []
+
+    @kernel_function(name="wait")
+    async def wait() -> str:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append("wait")
+            raise
+        return ""  # pragma: no cover
+
+    @kernel_function(name="fail")
+    async def fail() -> str:
+        await started.wait()
+        raise ValueError("Error")
+
+    kernel.add_functions("test", [wait, fail])
+    target = KernelPromptTemplate(
+        prompt_template_config=PromptTemplateConfig(
+            name="test", description="test", template="{{test.wait}} {{test.fail}}"
+        ),
+        enable_concurrent_rendering=True,
+    )
+
+    with pytest.raises(TemplateRenderException, match="Error"):
+        await target.render(kernel, KernelArguments())
+    assert cancelled == ["wait"]
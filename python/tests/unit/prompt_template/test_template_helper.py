@@ -3,10 +3,14 @@
 import pytest
 
 from semantic_kernel.functions import kernel_function
+from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.functions.kernel_function_from_method import KernelFunctionFromMethod
 from semantic_kernel.kernel import Kernel
 from semantic_kernel.prompt_template.const import JINJA2_TEMPLATE_FORMAT_NAME
-from semantic_kernel.prompt_template.utils.template_function_helpers import create_template_helper_from_function
+from semantic_kernel.prompt_template.utils.template_function_helpers import (
+    bind_template_arguments,
+    create_template_helper_from_function,
+)
 
 
 def test_create_helpers(kernel: Kernel):
@@ -52,3 +56,25 @@ async def test_create_helpers_fail(kernel: Kernel, template_format: str, enable_
         assert int(str(res)) == 2
     else:
         assert int(str(result(x=1))) == 2
+
+
+@pytest.mark.asyncio
+async def test_create_helpers_with_bound_arguments(kernel: Kernel):
+    function = KernelFunctionFromMethod(kernel_function(lambda x: x + 1, name="test"), plugin_name="test")
+    result = create_template_helper_from_function(function, kernel, None, JINJA2_TEMPLATE_FORMAT_NAME, False, True)
+
+    with bind_template_arguments(KernelArguments(x=1)):
+        assert int(str(await result())) == 2
+    with bind_template_arguments(KernelArguments(x=2)):
+        assert int(str(await result())) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_helpers_with_bound_kernel(kernel: Kernel):
+    function = KernelFunctionFromMethod(kernel_function(lambda x: x + 1, name="test"), plugin_name="test")
+    result = create_template_helper_from_function(function, None, None, JINJA2_TEMPLATE_FORMAT_NAME, False, True)
+
+    with bind_template_arguments(KernelArguments(x=1), kernel):
+        assert int(str(await result())) == 2
+    with pytest.raises(ValueError):
+        await result(x=1)
@@ -0,0 +1,193 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from semantic_kernel.exceptions import ServiceResponseException, ServiceUnavailableError
+from semantic_kernel.reliability.pass_through_without_retry import PassThroughWithoutRetry
+from semantic_kernel.reliability.resilience_policy import CircuitState, ResiliencePolicy
+
+
+class Response:
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None) -> None:
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = Response(status_code, headers)
+
+
+def service_error(status_code: int, headers: dict[str, str] | None = None) -> ServiceResponseException:
+    """A service error wrapped the way the connectors wrap them."""
+    inner = StatusError(status_code, headers)
+    try:
+        raise ServiceResponseException("The service failed", inner) from inner
+    except ServiceResponseException as exc:
+        return exc
+
+
+@pytest.fixture
+def sleep():
+    with patch("semantic_kernel.reliability.resilience_policy.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        yield sleep
+
+
+@pytest.mark.asyncio
+async def test_pass_through_awaits_the_action():
+    assert await PassThroughWithoutRetry().execute_with_retry(AsyncMock(return_value="result")) == "result"
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried_with_jittered_backoff(sleep):
+    action = AsyncMock(side_effect=[service_error(503), service_error(500), "result"])
+    policy = ResiliencePolicy(initial_backoff=1.0, backoff_multiplier=2.0)
+
+    assert await policy.execute_with_retry(action) == "result"
+
+    assert action.await_count == 3
+    assert policy.metrics.retries == 2
+    assert policy.metrics.attempts == 3
+    assert policy.metrics.failures == 0
+    assert 0 <= sleep.await_args_list[0].args[0] <= 1.0
+    assert 0 <= sleep.await_args_list[1].args[0] <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honored(sleep):
+    action = AsyncMock(
+        side_effect=[service_error(429, {"retry-after": "7"}), service_error(429, {"retry-after-ms": "250"}), "ok"]
+    )
+    policy = ResiliencePolicy()
+
+    assert await policy.execute(action) == "ok"
+
+    assert [call.args[0] for call in sleep.await_args_list] == [7.0, 0.25]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_capped(sleep):
+    action = AsyncMock(side_effect=[service_error(429, {"retry-after": "600"}), "ok"])
+
+    await ResiliencePolicy(max_retry_after=10).execute(action)
+
+    sleep.assert_awaited_once_with(10)
+
+
+@pytest.mark.asyncio
+async def test_non_transient_errors_are_not_retried(sleep):
+    action = AsyncMock(side_effect=service_error(400))
+    policy = ResiliencePolicy()
+
+    with pytest.raises(ServiceResponseException):
+        await policy.execute(action)
+
+    assert action.await_count == 1
+    assert policy.metrics.failures == 1
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_retries_are_limited(sleep):
+    action = AsyncMock(side_effect=TimeoutError())
+    policy = ResiliencePolicy(max_retries=2, failure_threshold=None)
+
+    with pytest.raises(TimeoutError):
+        await policy.execute(action)
+
+    assert action.await_count == 3
+    assert policy.metrics.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_custom_retryable_check(sleep):
+    action = AsyncMock(side_effect=[ValueError("flaky"), "ok"])
+
+    assert await ResiliencePolicy(is_retryable=lambda exc: isinstance(exc, ValueError)).execute(action) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_and_recovers(sleep):
+    policy = ResiliencePolicy(max_retries=0, failure_threshold=2, recovery_time=30)
+    failing = AsyncMock(side_effect=service_error(503))
+
+    with patch("semantic_kernel.reliability.resilience_policy.time") as time:
+        time.monotonic.return_value = 100.0
+        time.perf_counter.return_value = 0.0
+        for _ in range(2):
+            with pytest.raises(ServiceResponseException):
+                await policy.execute(failing)
+        assert policy.circuit_state == CircuitState.OPEN
+        assert policy.metrics.circuit_opened == 1
+
+        with pytest.raises(ServiceUnavailableError):
+            await policy.execute(AsyncMock(return_value="ok"))
+        assert policy.metrics.rejected == 1
+        assert failing.await_count == 2
+
+        # after the recovery time a failed probe opens the circuit again
+        time.monotonic.return_value = 131.0
+        with pytest.raises(ServiceResponseException):
+            await policy.execute(failing)
+        assert policy.circuit_state == CircuitState.OPEN
+
+        time.monotonic.return_value = 162.0
+        assert await policy.execute(AsyncMock(return_value="ok")) == "ok"
+        assert policy.circuit_state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged():
+    calls = 0
+
+    async def action():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1.0 if calls == 1 else 0.01)
+        return calls
+
+    policy = ResiliencePolicy(hedge_after=0.02)
+
+    assert await asyncio.wait_for(policy.execute(action), timeout=0.5) == 2
+    assert policy.metrics.hedges == 1
+    assert policy.metrics.hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_request_is_not_hedged():
+    policy = ResiliencePolicy(hedge_after=1.0)
+    action = AsyncMock(return_value="ok")
+
+    assert await policy.execute(action) == "ok"
+    assert action.await_count == 1
+    assert policy.metrics.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_follows_the_latency_percentile():
+    policy = ResiliencePolicy(hedge_percentile=50, hedge_min_samples=10, latency_window=10)
+    assert policy._get_hedge_delay() is None
+
+    policy._latencies.extend(float(i) for i in range(1, 11))
+    assert policy._get_hedge_delay() == 6.0
+
+    # only the latest latencies count
+    policy._latencies.extend(float(i) for i in range(11, 21))
+    assert policy._get_hedge_delay() == 16.0
+
+
+@pytest.mark.asyncio
+async def test_hedging_can_be_disabled_per_call():
+    policy = ResiliencePolicy(hedge_after=0.01)
+
+    async def action():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    assert await policy.execute(action, hedge=False) == "ok"
+    assert policy.metrics.hedges == 0
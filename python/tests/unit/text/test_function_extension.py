@@ -1,5 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+
 import pytest
 
 from semantic_kernel import Kernel
@@ -35,3 +37,70 @@ async def test_aggregate_results():
     result = await aggregate_chunked_results(func, chunked, kernel, KernelArguments())
     print(result)
     assert result == "\n".join(chunked)
+
+
+@pytest.mark.asyncio
+async def test_aggregate_results_concurrently_with_argument_copies():
+    kernel = Kernel()
+    running = 0
+    max_running = 0
+
+    @kernel_function(name="func")
+    async def function(input: str) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # later chunks finish first, the results should still follow the chunks
+        await asyncio.sleep(0.01 * (10 - int(input)))
+        running -= 1
+        return f"<{input}>"
+
+    func = KernelFunction.from_method(method=function, plugin_name="test")
+    arguments = KernelArguments(input="original")
+
+    result = await aggregate_chunked_results(func, [str(i) for i in range(10)], kernel, arguments, max_concurrency=3)
+
+    assert result == "\n".join(f"<{i}>" for i in range(10))
+    assert max_running == 3
+    assert arguments["input"] == "original"
+
+
+@pytest.mark.asyncio
+async def test_aggregate_results_hierarchically():
+    kernel = Kernel()
+    calls: list[str] = []
+
+    @kernel_function(name="map")
+    def map_function(input: str) -> str:
+        return input.upper()
+
+    @kernel_function(name="reduce")
+    def reduce_function(input: str) -> str:
+        calls.append(input)
+        return input.replace("\n", "+")
+
+    map_func = KernelFunction.from_method(method=map_function, plugin_name="test")
+    reduce_func = KernelFunction.from_method(method=reduce_function, plugin_name="test")
+
+    result = await aggregate_chunked_results(
+        map_func, list("abcde"), kernel, KernelArguments(), reduce_function=reduce_func, reduce_batch_size=2
+    )
+
+    assert result == "A+B+C+D+E"
+    # three levels: 5 results -> 3 -> 2 -> 1
+    assert len(calls) == 6
+
+
+@pytest.mark.asyncio
+async def test_aggregate_results_invalid_options():
+    kernel = Kernel()
+
+    @kernel_function(name="func")
+    def function(input: str) -> str:
+        return input
+
+    func = KernelFunction.from_method(method=function, plugin_name="test")
+    with pytest.raises(ValueError):
+        await aggregate_chunked_results(func, ["a"], kernel, KernelArguments(), max_concurrency=0)
+    with pytest.raises(ValueError):
+        await aggregate_chunked_results(func, ["a"], kernel, KernelArguments(), reduce_batch_size=1)
@@ -0,0 +1,69 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+
+import pytest
+
+from semantic_kernel.utils.async_utils import gather_or_cancel
+
+
+async def _value(value: int, steps: int = 0) -> int:
+    for _ in range(steps):
+        await asyncio.sleep(0)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_results_are_in_order():
+    assert await gather_or_cancel(_value(1, steps=3), _value(2), _value(3, steps=1)) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_no_awaitables():
+    assert await gather_or_cancel() == []
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_the_others():
+    started = asyncio.Event()
+    cancelled: list[str] = []
+
+    async def wait_forever() -> int:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append("wait_forever")
+            raise
+        return 0  # pragma: no cover
+
+    async def fail() -> int:
+        await started.wait()
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        await gather_or_cancel(wait_forever(), fail())
+    assert cancelled == ["wait_forever"]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_caller_cancels_the_awaitables():
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def wait_forever() -> int:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 0  # pragma: no cover
+
+    task = asyncio.create_task(gather_or_cancel(wait_forever()))
+    await started.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cancelled.is_set()
@@ -0,0 +1,66 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from unittest.mock import patch
+
+import pytest
+
+from semantic_kernel.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with (
+        patch("semantic_kernel.utils.rate_limiter.time.monotonic", clock.monotonic),
+        patch("semantic_kernel.utils.rate_limiter.asyncio.sleep", clock.sleep),
+    ):
+        yield clock
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_minute=0)
+    with pytest.raises(ValueError):
+        RateLimiter(tokens_per_minute=-1)
+
+
+@pytest.mark.asyncio
+async def test_unlimited(clock):
+    limiter = RateLimiter()
+    for _ in range(100):
+        await limiter.acquire(tokens=1000)
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_requests_per_minute(clock):
+    limiter = RateLimiter(requests_per_minute=2)
+    await limiter.acquire()
+    await limiter.acquire()
+    assert clock.sleeps == []
+    await limiter.acquire()
+    assert clock.sleeps == [pytest.approx(30.0)]
+
+
+@pytest.mark.asyncio
+async def test_tokens_per_minute(clock):
+    limiter = RateLimiter(tokens_per_minute=600)
+    await limiter.acquire(tokens=500)
+    await limiter.acquire(tokens=200)
+    assert clock.sleeps == [pytest.approx(10.0)]
+    # a request larger than the budget waits for a full bucket
+    await limiter.acquire(tokens=1000)
+    assert sum(clock.sleeps) == pytest.approx(70.0)
@@ -0,0 +1,109 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from semantic_kernel.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    # patch the module the cache uses, the event loop keeps the real clock
+    with patch("semantic_kernel.utils.ttl_cache.time") as time:
+        time.monotonic = clock.monotonic
+        yield clock
+
+
+def test_entries_expire(clock):
+    cache: TTLCache[str, int] = TTLCache(ttl=10)
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    assert "a" in cache
+
+    clock.now = 10.0
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache: TTLCache[str, int] = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidate_and_clear(clock):
+    cache: TTLCache[str, int] = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_or_add_shares_one_call(clock):
+    cache: TTLCache[str, int] = TTLCache(ttl=10)
+    calls = 0
+
+    async def factory() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(cache.get_or_add("a", factory) for _ in range(5)))
+    assert results == [1] * 5
+    assert await cache.get_or_add("a", factory) == 1
+    assert calls == 1
+
+    clock.now = 10
+    assert await cache.get_or_add("a", factory) == 2
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_add_does_not_cache_exceptions(clock):
+    cache: TTLCache[str, int] = TTLCache()
+
+    async def fail() -> int:
+        raise ValueError("not found")
+
+    async def succeed() -> int:
+        return 1
+
+    with pytest.raises(ValueError, match="not found"):
+        await cache.get_or_add("a", fail)
+    assert "a" not in cache
+    assert await cache.get_or_add("a", succeed) == 1
+
+
+@pytest.mark.parametrize(("ttl", "max_size"), [(0, 1), (1, 0)])
+def test_invalid_arguments(ttl, max_size):
+    with pytest.raises(ValueError):
+        TTLCache(ttl=ttl, max_size=max_size)